@@ -7,13 +7,29 @@ and background scheduling for automatic birthday celebrations.
 Features: AI messages/images, timezone-aware celebrations, multiple personalities,
 admin system, automatic backups, component-specific logging.
 Uses Slack Bolt, OpenAI API, and background scheduling.
+
+SLACK_RUNTIME=async serves events on the asyncio runtime (handlers/async_runtime.py)
+instead of the threaded SocketModeHandler; listeners are registered on the sync
+App either way.
 """
 
+import os
+import sys
+import threading
+
+# `python app.py --profile-startup` times every import and startup step below,
+# prints the report and exits before connecting to Slack
+from utils import startup_profile
+
+PROFILE_STARTUP = "--profile-startup" in sys.argv
+if PROFILE_STARTUP:
+    startup_profile.start()
+
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 # Import configuration
-from config import logger
+from config import METRICS_HOST, METRICS_PORT, SLACK_API_URL, SLACK_RUNTIME, logger
 from handlers.app_home_handler import register_app_home_handlers
 
 # Import event handlers
@@ -25,15 +41,30 @@ from services.birthday import simple_daily_check, timezone_aware_check
 
 # Import services
 from services.scheduler import run_now, setup_scheduler
+from slack.client import instrument_app_clients
 from storage.settings import initialize_config
 from storage.special_days import initialize_special_days_cache
+from utils.heartbeat import disable_socket_mode, set_connection_probe, start_heartbeat
+from utils.metrics import start_metrics_server
+
+startup_profile.checkpoint("imports")
 
 # Initialize configuration from storage files
 initialize_config()
+startup_profile.checkpoint("initialize_config")
 
 # Initialize Slack app with error handling
-app = App()
+if SLACK_API_URL:
+    from slack_sdk import WebClient
+
+    # Local Web API emulator (tests/benchmarks/slack_emulator.py) instead of slack.com
+    app = App(client=WebClient(token=os.environ.get("SLACK_BOT_TOKEN"), base_url=SLACK_API_URL))
+    logger.info(f"INIT: Using Slack Web API at {SLACK_API_URL}")
+else:
+    app = App()
+instrument_app_clients(app)
 logger.info("INIT: App initialized")
+startup_profile.checkpoint("slack_app (auth.test)")
 
 # Register event handlers
 register_event_handlers(app)
@@ -43,6 +74,7 @@ register_mention_handlers(app)
 register_slash_commands(app)
 register_modal_handlers(app)
 register_app_home_handlers(app)
+startup_profile.checkpoint("register_handlers")
 
 
 def _check_deploy_notification(app):
@@ -98,12 +130,34 @@ def _check_deploy_notification(app):
 
 # Start the app
 if __name__ == "__main__":
-    handler = SocketModeHandler(app)
-    logger.info("INIT: Handler initialized, starting app")
+    if PROFILE_STARTUP:
+        startup_profile.stop()
+        profile_report = startup_profile.report()
+        print(profile_report)
+        logger.info(f"INIT: Startup profile\n{profile_report}")
+        sys.exit(0)
+
+    if SLACK_API_URL:
+        # The emulator has no Socket Mode endpoint, so no SLACK_APP_TOKEN is needed
+        handler = None
+        logger.info("INIT: No Socket Mode handler for SLACK_API_URL, starting app")
+    else:
+        handler = SocketModeHandler(app) if SLACK_RUNTIME != "async" else None
+        logger.info(f"INIT: Handler initialized ({SLACK_RUNTIME} runtime), starting app")
     try:
+        # Local Prometheus endpoint (no-op unless METRICS_PORT is set)
+        start_metrics_server(METRICS_HOST, METRICS_PORT)
+
         # Set up the scheduler with direct birthday check functions
         setup_scheduler(app, timezone_aware_check, simple_daily_check)
 
+        # Heartbeat file read by the container healthcheck (python -m utils.heartbeat)
+        if SLACK_API_URL:
+            disable_socket_mode()  # Readiness must not wait for a connection that never comes
+        elif handler is not None:
+            set_connection_probe(handler.client.is_connected)
+        start_heartbeat()
+
         # Initialize special days caches if stale or missing
         initialize_special_days_cache()
 
@@ -114,6 +168,15 @@ if __name__ == "__main__":
         run_now()
 
         # Start the app
-        handler.start()
+        if SLACK_API_URL:
+            # The emulator has no Socket Mode endpoint: serve scheduled jobs only
+            logger.info("INIT: Socket Mode skipped for SLACK_API_URL; running scheduled jobs only")
+            threading.Event().wait()
+        elif handler is None:
+            from handlers.async_runtime import run_async_runtime
+
+            run_async_runtime(app)
+        else:
+            handler.start()
     except Exception as e:
         logger.critical(f"CRITICAL: Error starting app: {e}")
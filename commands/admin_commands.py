@@ -2,7 +2,8 @@
 Admin command handlers for BrightDayBot.
 
 Handles admin-only operations: stats, config, announcements, model management,
-cache management, status checks, backup/restore, personality, and timezone settings.
+cache management, status checks, celebration traces, backup/restore, personality,
+and timezone settings.
 """
 
 from calendar import month_name
@@ -541,7 +542,7 @@ def handle_cache_command(parts, user_id, say, app):
     if specific_date:
         say(f"✅ Cleared web search cache for date: {specific_date}")
     else:
-        say(f"✅ Cleared all web search cache ({count} files)")
+        say(f"✅ Cleared all web search cache ({count} entries)")
 
     logger.info(
         f"ADMIN: {username} ({user_id}) cleared {'date-specific ' if specific_date else ''}web search cache"
@@ -580,6 +581,32 @@ def handle_status_command(parts, user_id, say, app):
     )
 
 
+def handle_traces_command(args, user_id, say, app, username):
+    """
+    Show per-stage timings of the most recent celebrations.
+
+    Args:
+        args: Command arguments (optional number of celebrations, default 5)
+        user_id: Slack user ID for logging
+        say: Slack say function for sending messages
+        app: Slack app instance
+        username: Admin username for logging
+    """
+    from slack.blocks import build_trace_summary_blocks
+    from utils.tracing import get_recent_traces
+
+    limit = 5
+    if args:
+        if not args[0].isdigit() or not 1 <= int(args[0]) <= 20:
+            say("Usage: `admin traces [N]` - Stage timings of the last N celebrations (1-20)")
+            return
+        limit = int(args[0])
+
+    blocks, fallback = build_trace_summary_blocks(get_recent_traces(limit))
+    say(blocks=blocks, text=fallback)
+    logger.info(f"ADMIN: {username} ({user_id}) viewed the last {limit} celebration traces")
+
+
 def handle_timezone_command(args, user_id, say, app, username):
     """
     Manage timezone-aware birthday announcement settings.
@@ -594,6 +621,7 @@ def handle_timezone_command(args, user_id, say, app, username):
         app: Slack app instance for timezone data
         username: Display name of requesting user for logging
     """
+    from services.scheduler import refresh_schedule
     from storage.settings import load_timezone_settings, save_timezone_settings
     from utils.date_utils import format_timezone_schedule
 
@@ -628,10 +656,11 @@ def handle_timezone_command(args, user_id, say, app, username):
     elif args[0].lower() == "enable":
         # Enable timezone-aware announcements
         if save_timezone_settings(enabled=True):
+            refresh_schedule()
             say(
                 f"✅ Timezone-aware announcements ENABLED\n\n"
                 f"Birthday announcements will now be sent at `{TIMEZONE_CELEBRATION_TIME.strftime('%H:%M')}` in each user's timezone. "
-                f"The scheduler will check hourly for birthdays.\n\n"
+                f"The scheduler triggers the celebration when the first person reaches that time.\n\n"
                 f"Change takes effect immediately."
             )
             logger.info(f"ADMIN: {username} ({user_id}) ENABLED timezone-aware announcements")
@@ -641,6 +670,7 @@ def handle_timezone_command(args, user_id, say, app, username):
     elif args[0].lower() == "disable":
         # Disable timezone-aware announcements
         if save_timezone_settings(enabled=False):
+            refresh_schedule()
             say(
                 f"✅ Timezone-aware announcements DISABLED\n\n"
                 f"All birthday announcements will now be sent at `{DAILY_CHECK_TIME.strftime('%H:%M')}` server time, "
@@ -327,7 +327,6 @@ def handle_admin_special_command(args, user_id, say, app):
     """Handle admin special days commands (non-add commands only)"""
     from config import CALENDARIFIC_API_KEY, CALENDARIFIC_ENABLED
     from integrations.calendarific import get_calendarific_client
-    from services.special_day import generate_special_day_message
     from storage.special_days import (
         get_special_days_for_date,
         load_all_special_days,
@@ -424,7 +423,7 @@ def handle_admin_special_command(args, user_id, say, app):
             say(f"🧪 Testing special day announcement for {test_date_str}...")
 
             from config import SPECIAL_DAY_CONSOLIDATED_ENABLED, SPECIAL_DAYS_PERSONALITY
-            from services.special_day import generate_special_day_details
+            from services.special_day import generate_special_day_content
             from slack.messaging import send_message
 
             # Consolidated mode for multiple observances
@@ -438,32 +437,13 @@ def handle_admin_special_command(args, user_id, say, app):
 
                 intro = generate_consolidated_intro_message(special_days, app=app)
 
-                from config import run_parallel
-
-                def _generate_for_sd(sd):
-                    teaser = generate_special_day_message(
-                        [sd],
-                        test_mode=True,
-                        app=app,
-                        use_teaser=True,
-                        suppress_mention=True,
-                        test_date=test_date,
-                    )
-                    details = generate_special_day_details([sd], app=app, test_date=test_date)
-                    return teaser or "", details or ""
-
-                results = run_parallel(_generate_for_sd, special_days)
-
-                teasers = {}
-                detailed_contents = {}
-                for sd, result in results.items():
-                    if result:
-                        teasers[sd.name] = result[0]
-                        detailed_contents[sd.name] = result[1]
-                    else:
-                        logger.error(f"SPECIAL_DAYS: Failed to generate for {sd.name}")
-                        teasers[sd.name] = ""
-                        detailed_contents[sd.name] = ""
+                generated = generate_special_day_content(
+                    special_days, app=app, test_date=test_date, suppress_mention=True
+                )
+                teasers = {name: teaser or "" for name, (teaser, _) in generated.items()}
+                detailed_contents = {
+                    name: details or "" for name, (_, details) in generated.items()
+                }
 
                 blocks, fallback_text = build_consolidated_special_day_blocks(
                     special_days,
@@ -483,29 +463,8 @@ def handle_admin_special_command(args, user_id, say, app):
             elif len(special_days) >= 1:
                 say(f"📋 Sending {len(special_days)} separate test announcement(s)")
 
-                # Pre-generate all AI content
-                from config import run_parallel
-
-                def _generate_individual(sd):
-                    teaser = generate_special_day_message(
-                        [sd],
-                        test_mode=True,
-                        app=app,
-                        use_teaser=True,
-                        test_date=test_date,
-                    )
-                    details = generate_special_day_details([sd], app=app, test_date=test_date)
-                    return teaser, details
-
-                results = run_parallel(_generate_individual, special_days)
-
-                generated = {}
-                for sd, result in results.items():
-                    if result:
-                        generated[sd.name] = result
-                    else:
-                        logger.error(f"SPECIAL_DAYS: Failed to generate for {sd.name}")
-                        generated[sd.name] = (None, None)
+                # Pre-generate all AI content (batched AI calls)
+                generated = generate_special_day_content(special_days, app=app, test_date=test_date)
 
                 # Send sequentially
                 from slack.blocks import build_special_day_blocks
@@ -576,6 +535,7 @@ def handle_admin_special_command(args, user_id, say, app):
     elif subcommand == "mode":
         # Switch between daily and weekly announcement modes
         from config import WEEKDAY_NAMES
+        from services.scheduler import refresh_schedule
         from storage.special_days import (
             get_pending_mode_transition,
             get_special_days_mode,
@@ -613,6 +573,7 @@ In daily mode, individual announcements are posted each day with observances."""
         elif args[1].lower() == "daily":
             # Switch to daily mode
             if set_special_days_mode("daily"):
+                refresh_schedule()
                 say(
                     "✅ Switched to *daily* mode. Individual announcements will be posted each day.\n\n"
                     "Change takes effect immediately."
@@ -642,6 +603,7 @@ In daily mode, individual announcements are posted each day with observances."""
             day_name = WEEKDAY_NAMES[weekly_day].capitalize()
 
             if set_special_days_mode("weekly", weekly_day):
+                refresh_schedule()
                 # Check if transition is deferred
                 pending = get_pending_mode_transition()
                 if pending:
@@ -28,11 +28,16 @@ TRACKING_DIR = os.path.join(DATA_DIR, "tracking")
 TRACKED_THREADS_FILE = os.path.join(STORAGE_DIR, "tracked_threads.json")
 ANNOUNCEMENTS_FILE = os.path.join(STORAGE_DIR, "announcements.json")
 SCHEDULER_STATS_FILE = os.path.join(STORAGE_DIR, "scheduler_stats.json")
+LEADER_LEASE_FILE = os.path.join(STORAGE_DIR, "scheduler_lease.json")
+OPENAI_USAGE_FILE = os.path.join(STORAGE_DIR, "openai_usage.json")
 THREAD_TRACKING_TTL_DAYS = int(os.getenv("THREAD_TRACKING_TTL_DAYS", "60"))
 BACKUP_DIR = os.path.join(DATA_DIR, "backups")
 MAX_BACKUPS = int(os.getenv("MAX_BACKUPS", "10"))
 CACHE_DIR = os.path.join(DATA_DIR, "cache")
-CLEANUP_LOG_FILE = os.path.join(CACHE_DIR, "cleanup_log.json")
+# Web search facts: single SQLite file, one table per year (expiry = DROP TABLE)
+FACTS_CACHE_FILE = os.path.join(CACHE_DIR, "facts_cache.db")
+# Per-celebration artifacts (message, images, titles, progress) so retries resume
+CELEBRATION_ARTIFACTS_DIR = os.path.join(CACHE_DIR, "celebrations")
 MESSAGES_CACHE_DIR = os.path.join(CACHE_DIR, "messages")
 
 # ----- FEATURE FLAGS -----
@@ -63,7 +68,10 @@ CANVAS_WARNINGS_TTL_HOURS = 24
 SPECIAL_DAY_DETAILS_CACHE_TTL_DAYS = (
     60  # How long cached details stay valid (matches thread tracking TTL)
 )
-SPECIAL_DAY_DETAILS_CACHE_FILE = os.path.join(CACHE_DIR, "special_day_details.json")
+# "View Details" payloads: SQLite keyed by action_id (O(1) reads, indexed TTL expiry)
+SPECIAL_DAY_DETAILS_DB_FILE = os.path.join(CACHE_DIR, "special_day_details.db")
+SPECIAL_DAY_DETAILS_MAX_ENTRIES = 5000  # Oldest entries beyond this are evicted on write
+SPECIAL_DAY_DETAILS_LRU_SIZE = 256  # Recent details kept in memory for repeated clicks
 
 # ----- EMOJI CONSTANTS -----
 
@@ -358,6 +366,9 @@ TIMEOUTS = {
     "confirmation_minutes": 5,  # Admin command confirmation timeout
     "file_poll_sleep": 1,  # Seconds between Slack file processing polls
 }
+# Log any storage lock held longer than this (seconds) with the acquiring stack;
+# 0 disables. Waits/holds per lock are always shown in health and the canvas.
+LOCK_HOLD_WARN_SECONDS = float(os.getenv("LOCK_HOLD_WARN_SECONDS", "0"))
 
 # Parallel AI generation
 AI_MAX_WORKERS = int(
@@ -399,9 +410,143 @@ def run_parallel(fn, items, max_workers=None):
     return results
 
 
+# OpenAI-compatible API base URL, e.g. http://127.0.0.1:8766/v1 for the local stub
+# (python -m tests.benchmarks.openai_stub); empty uses api.openai.com
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "")
+
+# Client-side OpenAI traffic control (integrations/openai_guard.py)
+# Consecutive transient failures (429/timeout/connection/5xx) before a circuit opens
+OPENAI_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("OPENAI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+# Seconds an open circuit fails fast before a half-open probe is allowed
+OPENAI_CIRCUIT_COOLDOWN_SECONDS = int(os.getenv("OPENAI_CIRCUIT_COOLDOWN_SECONDS", "60"))
+# Upper bound for the adaptive (AIMD) in-flight limit per operation
+OPENAI_CONCURRENCY_MAX = int(os.getenv("OPENAI_CONCURRENCY_MAX", str(AI_MAX_WORKERS)))
+OPENAI_SLOT_WAIT_SECONDS = 120  # Max wait for an in-flight slot before failing fast
+# Calls slower than this (seconds) halve the operation's concurrency limit
+OPENAI_LATENCY_TARGETS = {
+    "text": 45,
+    "vision": 30,
+    "web_search": 90,
+    "image": 180,
+}
+# Batched multi-item calls (integrations/openai.py complete_batch)
+# Max items packed into one structured-output request; larger sets are split
+OPENAI_BATCH_MAX_ITEMS = int(os.getenv("OPENAI_BATCH_MAX_ITEMS", "12"))
+# Output token ceiling for one batched request (also bounds items per request)
+OPENAI_BATCH_MAX_OUTPUT_TOKENS = 32000
+
+# OpenAI usage ledger (integrations/openai_usage.py): per-context daily rollups
+OPENAI_USAGE_RETENTION_DAYS = int(os.getenv("OPENAI_USAGE_RETENTION_DAYS", "30"))
+OPENAI_USAGE_FLUSH_SECONDS = 300  # Max age of in-memory counters before they are persisted
+# Latency histogram bucket upper bounds (seconds); the last bucket is open-ended
+OPENAI_USAGE_LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 45, 90, 180)
+# Approximate list prices in USD per 1M tokens (input, output) for dashboard cost
+# estimates. Looked up by longest model-name prefix; unknown models cost 0.
+OPENAI_PRICING_PER_MILLION = {
+    "gpt-5": (1.25, 10.00),
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-5-nano": (0.05, 0.40),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-image": (5.00, 40.00),
+    "gpt-image-1-mini": (2.00, 8.00),
+}
+
+# Ack-first work queue for slow Slack handlers (utils/work_queue.py)
+# Handlers ack, then enqueue LLM/Slack work on a lane; a full lane sheds new work
+# with a polite "busy" fallback instead of tying up Bolt's listener threads
+WORK_QUEUE_LANES = {
+    # Mentions, special-day detail buttons, modal submissions, thread replies
+    "interactive": {
+        "workers": int(os.getenv("WORK_QUEUE_INTERACTIVE_WORKERS", "4")),
+        "max_depth": 50,
+    },
+    # Fire-and-forget work nobody waits on (canvas refreshes)
+    "background": {
+        "workers": int(os.getenv("WORK_QUEUE_BACKGROUND_WORKERS", "2")),
+        "max_depth": 100,
+    },
+}
+
+# Slack runtime: "sync" (Bolt App, a thread per in-flight event) or "async"
+# (AsyncApp over aiohttp Socket Mode; needs the `async` extra). In async mode hot
+# handlers are coroutines and remaining blocking work (storage, prompt context,
+# sync-only listeners) shares ASYNC_BLOCKING_WORKERS threads.
+SLACK_RUNTIME = os.getenv("SLACK_RUNTIME", "sync").lower()
+ASYNC_BLOCKING_WORKERS = int(os.getenv("ASYNC_BLOCKING_WORKERS", "16"))
+# Web API base URL override, e.g. http://127.0.0.1:8765/api/ for the local emulator
+# (python -m tests.benchmarks.slack_emulator). Socket Mode is skipped when set, so
+# only scheduled jobs run; empty talks to slack.com
+SLACK_API_URL = os.getenv("SLACK_API_URL", "")
+
 # Scheduler timing constants
-SCHEDULER_CHECK_INTERVAL_SECONDS = 60  # How often scheduler checks for birthdays
-HEARTBEAT_STALE_THRESHOLD_SECONDS = 120  # When to consider scheduler unhealthy (2 min)
+# The scheduler sleeps until the next job is due; this cap only re-checks the wall
+# clock periodically so NTP/DST adjustments cannot delay a job indefinitely
+SCHEDULER_MAX_SLEEP_SECONDS = 900
+# Timezone mode replans the day's celebration trigger this long after a birthday,
+# membership or profile change, so bursts of changes coalesce into one replan
+SCHEDULER_BIRTHDAY_REPLAN_DELAY_SECONDS = 30
+# After a celebration trigger runs, anyone still uncelebrated (e.g. the
+# celebration failed) is retried no sooner than this - the old hourly sweep
+SCHEDULER_BIRTHDAY_RETRY_SECONDS = 3600
+HEARTBEAT_STALE_THRESHOLD_SECONDS = 120  # A job overdue by more than this = unhealthy
+# Scheduled jobs run on bounded worker pools so a slow cache refresh or scrape
+# never delays a birthday check: {pool: worker threads}
+SCHEDULER_WORKER_POOLS = {
+    "birthday": 1,  # Celebration triggers, planning, bot birthday, special days
+    "maintenance": 2,  # Cache refreshes (observances, Calendarific, ICS) and canvas
+}
+# Seconds a job may run before it is reported as failed and abandoned
+SCHEDULER_JOB_TIMEOUTS = {
+    "birthday_trigger": 1800,
+    "birthday_daily": 1800,
+    "failover_check": 1800,
+    "observances_monthly": 1800,  # crawl4ai browser scraping
+    "calendarific_weekly": 900,
+    "ics_refresh": 600,
+    "canvas_refresh": 300,
+}
+SCHEDULER_DEFAULT_JOB_TIMEOUT_SECONDS = 600
+# Slack Web API calls a job may make per run before a warning is logged (catches
+# N+1 lookups creeping into scheduled checks); jobs not listed have no budget.
+# Celebration checks scale with the number of people celebrated at once.
+SLACK_CALL_BUDGET_CELEBRATION = int(os.getenv("SLACK_CALL_BUDGET_CELEBRATION", "150"))
+SLACK_CALL_BUDGETS = {
+    "birthday_trigger": SLACK_CALL_BUDGET_CELEBRATION,
+    "birthday_daily": SLACK_CALL_BUDGET_CELEBRATION,
+    "startup_check": SLACK_CALL_BUDGET_CELEBRATION,
+    "failover_check": SLACK_CALL_BUDGET_CELEBRATION,
+    "birthday_plan": 20,
+    "birthday_replan": 20,
+    "canvas_refresh": 30,
+}
+# Cache refreshes missed during downtime are replayed after startup, this far apart
+SCHEDULER_CATCHUP_STAGGER_SECONDS = 120
+# Replicas sharing the data volume elect one leader (lease in LEADER_LEASE_FILE) to
+# run scheduled jobs; every replica still serves Slack events. A dead leader is
+# replaced within LEADER_LEASE_SECONDS.
+LEADER_ELECTION_ENABLED = os.getenv("LEADER_ELECTION_ENABLED", "true").lower() == "true"
+LEADER_LEASE_SECONDS = int(os.getenv("LEADER_LEASE_SECONDS", "30"))
+
+# Prometheus text metrics (Slack/OpenAI latency, lock waits, pipeline stages) served
+# on http://METRICS_HOST:METRICS_PORT/metrics; port 0 disables the endpoint
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# The running bot rewrites HEARTBEAT_FILE (scheduler state, Socket Mode connection,
+# last error) this often; the Docker healthcheck only reads it (python -m utils.heartbeat).
+# With METRICS_PORT set the same checks are served at /livez and /readyz.
+HEARTBEAT_FILE = os.path.join(DATA_DIR, "heartbeat.json")
+HEARTBEAT_INTERVAL_SECONDS = int(os.getenv("HEARTBEAT_INTERVAL_SECONDS", "15"))
+
+# Celebration traces (per-stage spans, Slack/OpenAI calls) appended to TRACE_FILE as
+# OTLP-JSON lines for `admin traces`; rotated to TRACE_FILE.1 past the size limit
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+TRACE_FILE = os.path.join(LOGS_DIR, "traces.jsonl")
+TRACE_FILE_MAX_BYTES = 5 * 1024 * 1024
 
 # Lookahead windows for upcoming events
 UPCOMING_DAYS_DEFAULT = int(os.getenv("UPCOMING_DAYS_DEFAULT", "7"))
@@ -413,6 +558,7 @@ CACHE_RETENTION_DAYS = {
     "images_generated": 365,  # AI-generated birthday images (keep longer)
     "profile_photos": 7,  # Temporary profile photos (clean more aggressively)
     "calendarific": 30,  # Calendarific holiday cache cleanup
+    "celebration_artifacts": 7,  # Persisted celebration artifacts (resume after failure)
 }
 
 # Emoji generation parameters for AI messages
@@ -819,7 +965,6 @@ SLACK_FILE_TITLE_MIN_LENGTH = 3  # Minimum chars for Slack file titles
 MAX_RECENT_PERSONALITIES = 3  # Track this many recent personalities to avoid repetition
 
 # Scheduler settings
-SCHEDULER_STATS_SAVE_INTERVAL = 10  # Save stats every N scheduler loop executions
 
 # Deduplication settings (for special days matching)
 DEDUP_SIGNIFICANT_WORD_MIN_LENGTH = 4  # Minimum word length to consider significant
@@ -839,7 +984,12 @@ BOT_PERSONALITIES = PERSONALITIES
 # Initialize logging system
 from utils.log_setup import setup_logging
 
-setup_logging(LOGS_DIR)
+# Component loggers only enqueue; one listener thread writes the files.
+# LOG_FORMAT=json writes one JSON object per line for machine analysis.
+LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "true").lower() == "true"
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+setup_logging(LOGS_DIR, queued=LOG_QUEUE_ENABLED, json_format=LOG_FORMAT == "json")
 
 # Get the main logger
 from utils.log_setup import get_logger
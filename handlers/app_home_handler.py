@@ -659,7 +659,16 @@ def _get_birthday_statistics(birthdays, channel_member_set, reference_date=None)
 
 def _publish_fallback_view(client, user_id):
     """Publish a minimal fallback view when the main view fails."""
-    fallback_view = {
+    try:
+        client.views_publish(user_id=user_id, view=_fallback_view())
+        logger.info(f"APP_HOME: Published fallback view for {user_id}")
+    except Exception as e:
+        logger.error(f"APP_HOME_ERROR: Failed to publish fallback view: {e}")
+
+
+def _fallback_view():
+    """Minimal Home view shown when the main view fails to build or publish."""
+    return {
         "type": "home",
         "blocks": [
             {"type": "header", "text": {"type": "plain_text", "text": "BrightDayBot"}},
@@ -692,9 +701,3 @@ def _publish_fallback_view(client, user_id):
             },
         ],
     }
-
-    try:
-        client.views_publish(user_id=user_id, view=fallback_view)
-        logger.info(f"APP_HOME: Published fallback view for {user_id}")
-    except Exception as e:
-        logger.error(f"APP_HOME_ERROR: Failed to publish fallback view: {e}")
@@ -0,0 +1,260 @@
+"""
+Optional asyncio runtime for BrightDayBot (SLACK_RUNTIME=async).
+
+Events arrive over Bolt's aiohttp Socket Mode adapter and go to an AsyncApp
+first. The hot listeners registered here are coroutines, so an event waiting on
+Slack or OpenAI holds no thread:
+
+- app_mention: answered with AsyncOpenAI, replies via async say
+- message (channels): celebration reactions and tracked-thread replies
+- app_home_opened: view built on the blocking pool, published asynchronously
+- special_day_details_* buttons
+
+Blocking code they still need (JSON storage, context built with the sync
+client) runs through run_blocking() on ASYNC_BLOCKING_WORKERS threads. Anything
+the AsyncApp does not handle (slash commands, modals, DMs, admin buttons,
+membership events) is dispatched to the sync App on that pool, so behaviour
+matches the sync runtime. Scheduled jobs keep using the sync App.
+
+Requires the `async` extra (aiohttp).
+
+Key functions: start_async_runtime(), create_async_app(), dispatch_hybrid()
+"""
+
+import asyncio
+import logging
+import re
+from time import time
+
+from slack_sdk.errors import SlackApiError
+
+from config import ASYNC_BLOCKING_WORKERS, get_logger
+from utils.heartbeat import set_connection_probe
+from utils.work_queue import run_blocking
+
+logger = get_logger("events")
+
+# Unmatched requests are expected (the sync App handles them), so keep Bolt's
+# "Unhandled request" warnings for the AsyncApp out of the logs
+_bolt_logger = logging.getLogger("brightdaybot.async_bolt")
+_bolt_logger.setLevel(logging.ERROR)
+
+
+def create_async_app(app):
+    """
+    Build the AsyncApp with async versions of the hot listeners.
+
+    Args:
+        app: The sync Slack app (used for blocking lookups and fallback dispatch)
+
+    Returns:
+        AsyncApp
+    """
+    from slack_bolt.async_app import AsyncApp
+    from slack_sdk.web.async_client import AsyncWebClient
+
+    from slack.client import instrument_app_clients
+
+    # Same token and Web API endpoint as the sync App (the emulator under SLACK_API_URL)
+    async_app = AsyncApp(
+        client=AsyncWebClient(token=app.client.token, base_url=app.client.base_url),
+        logger=_bolt_logger,
+    )
+    instrument_app_clients(async_app)
+    _register_mention(async_app, app)
+    _register_channel_messages(async_app, app)
+    _register_app_home(async_app, app)
+    _register_special_day_details(async_app, app)
+    return async_app
+
+
+def _register_mention(async_app, app):
+    from config import MENTION_QA_ENABLED
+
+    if not MENTION_QA_ENABLED:
+        return
+
+    from handlers.mention_handler import ahandle_mention
+
+    @async_app.event("app_mention")
+    async def handle_app_mention(event, say):
+        result = await ahandle_mention(app, event, say)
+        if result.get("error"):
+            logger.debug(f"MENTION: Failed to respond - {result.get('error')}")
+
+
+def _register_channel_messages(async_app, app):
+    """Channel messages only; DMs fall through to the sync command handler."""
+    from handlers.event_handler import _celebration_reaction
+
+    async def is_channel_message(event):
+        return event.get("channel_type") != "im" and not event.get("bot_id")
+
+    @async_app.event("message", matchers=[is_channel_message])
+    async def handle_channel_message(event, client):
+        channel = event.get("channel")
+        thread_ts = event.get("thread_ts")
+
+        if thread_ts:
+            await _handle_thread_reply(app, client, event, channel, thread_ts)
+            return
+
+        try:
+            reaction = _celebration_reaction(event, channel)
+            if reaction:
+                await client.reactions_add(channel=channel, timestamp=event["ts"], name=reaction)
+        except SlackApiError as e:
+            if "already_reacted" not in str(e):
+                logger.debug(f"CHANNEL_MESSAGE: Could not add reaction: {e}")
+        except Exception as e:
+            logger.debug(f"CHANNEL_MESSAGE: Error handling channel message: {e}")
+
+
+async def _handle_thread_reply(app, client, event, channel, thread_ts):
+    """Async counterpart of event_handler._handle_thread_reply."""
+    try:
+        from config import THREAD_ENGAGEMENT_ENABLED
+
+        if not THREAD_ENGAGEMENT_ENABLED:
+            return
+
+        from handlers.thread_handler import (
+            ahandle_special_day_thread_reply,
+            handle_thread_reply,
+        )
+        from storage.thread_tracking import get_thread_tracker
+
+        tracked_thread = await run_blocking(get_thread_tracker().get_thread, channel, thread_ts)
+        user_id = event.get("user")
+        message_ts = event.get("ts")
+        if not tracked_thread or not user_id or not message_ts:
+            return
+
+        if tracked_thread.is_birthday_thread():
+            await run_blocking(
+                handle_thread_reply,
+                app=app,
+                channel=channel,
+                thread_ts=thread_ts,
+                message_ts=message_ts,
+                user_id=user_id,
+                text=event.get("text", ""),
+                thread_engagement_enabled=THREAD_ENGAGEMENT_ENABLED,
+            )
+        elif tracked_thread.is_special_day_thread():
+            await ahandle_special_day_thread_reply(
+                app=app,
+                client=client,
+                channel=channel,
+                thread_ts=thread_ts,
+                message_ts=message_ts,
+                user_id=user_id,
+                text=event.get("text", ""),
+                tracked_thread=tracked_thread,
+            )
+    except Exception as e:
+        logger.warning(f"THREAD_REPLY: Error handling thread reply: {e}")
+
+
+def _register_app_home(async_app, app):
+    from handlers.app_home_handler import _build_home_view, _fallback_view
+
+    @async_app.event("app_home_opened")
+    async def handle_app_home_opened(event, client):
+        user_id = event["user"]
+        logger.info(f"APP_HOME: User {user_id} opened App Home")
+
+        try:
+            view = await run_blocking(_build_home_view, user_id, app)
+            await client.views_publish(user_id=user_id, view=view)
+            logger.info(f"APP_HOME: Published home view for {user_id}")
+        except Exception as e:
+            logger.error(f"APP_HOME_ERROR: Failed to publish home view: {e}")
+            try:
+                await client.views_publish(user_id=user_id, view=_fallback_view())
+            except Exception as fallback_error:
+                logger.error(f"APP_HOME_ERROR: Failed to publish fallback view: {fallback_error}")
+
+
+def _register_special_day_details(async_app, app):
+    from handlers.event_handler import _show_special_day_details
+
+    @async_app.action(re.compile("^special_day_details_"))
+    async def handle_special_day_details(ack, body, action):
+        await ack()
+        await run_blocking(_show_special_day_details, app, body, action, app.client)
+
+
+async def dispatch_hybrid(async_app, app, req):
+    """
+    Run a Socket Mode request on the AsyncApp, or on the sync App (on the
+    blocking pool) when no async listener matched it.
+
+    Args:
+        async_app: AsyncApp from create_async_app()
+        app: The sync Slack app
+        req: SocketModeRequest
+
+    Returns:
+        BoltResponse to acknowledge the envelope with
+    """
+    from slack_bolt.adapter.socket_mode.async_internals import run_async_bolt_app
+    from slack_bolt.adapter.socket_mode.internals import run_bolt_app
+
+    bolt_resp = await run_async_bolt_app(async_app, req)
+    if bolt_resp.status == 404:
+        bolt_resp = await run_blocking(run_bolt_app, app, req)
+    return bolt_resp
+
+
+def create_socket_mode_handler(app, async_app=None, app_token=None):
+    """
+    Build the aiohttp Socket Mode handler that serves the hybrid runtime.
+
+    Must be called with an event loop running (the aiohttp client binds to it).
+
+    Args:
+        app: The sync Slack app, already configured with every listener
+        async_app: AsyncApp to try first (default: create_async_app(app))
+        app_token: App-level token (default: SLACK_APP_TOKEN)
+
+    Returns:
+        AsyncSocketModeHandler whose handle() uses dispatch_hybrid()
+    """
+    from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
+    from slack_bolt.adapter.socket_mode.async_internals import send_async_response
+
+    class HybridSocketModeHandler(AsyncSocketModeHandler):
+        """AsyncApp first; requests it has no listener for go to the sync App."""
+
+        async def handle(self, client, req):
+            start = time()
+            bolt_resp = await dispatch_hybrid(self.app, app, req)
+            await send_async_response(client, req, bolt_resp, start)
+
+    return HybridSocketModeHandler(async_app or create_async_app(app), app_token=app_token)
+
+
+async def start_async_runtime(app):
+    """
+    Serve Socket Mode events on the asyncio runtime until the process exits.
+
+    Args:
+        app: The sync Slack app, already configured with every listener
+    """
+    handler = create_socket_mode_handler(app)
+    client = handler.client
+    set_connection_probe(
+        lambda: not client.closed
+        and client.current_session is not None
+        and not client.current_session.closed
+    )
+    logger.info(
+        f"INIT: Async Socket Mode runtime starting ({ASYNC_BLOCKING_WORKERS} blocking workers)"
+    )
+    await handler.start_async()
+
+
+def run_async_runtime(app):
+    """Blocking entry point used by app.py when SLACK_RUNTIME=async."""
+    asyncio.run(start_async_runtime(app))
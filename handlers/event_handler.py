@@ -12,13 +12,27 @@ import re
 
 from config import BIRTHDAY_CHANNEL, get_logger
 from services.dispatcher import handle_command, handle_dm_date
-from slack.client import get_channel_mention, get_user_mention, get_username
+from slack.client import (
+    get_channel_mention,
+    get_user_mention,
+    get_username,
+    invalidate_channel_members,
+)
 from slack.messaging import send_message
 from utils.date_utils import extract_date
+from utils.work_queue import submit
 
 events_logger = get_logger("events")
 
 
+def _birthday_membership_changed(user_id):
+    """Birthday channel membership changed: drop cached members and replan today's trigger."""
+    from services.scheduler import invalidate_birthday_plan
+
+    invalidate_channel_members(BIRTHDAY_CHANNEL)
+    invalidate_birthday_plan(f"membership change for {user_id}")
+
+
 def _try_nlp_date_parsing(text_lower: str, original_text: str):
     """
     Try NLP-based date parsing when regex fails.
@@ -108,24 +122,33 @@ def _handle_thread_reply(app, event, channel, thread_ts):
                 )
 
         elif tracked_thread.is_special_day_thread():
-            # Handle special day thread replies (intelligent responses)
+            # Handle special day thread replies (LLM responses, on the interactive lane)
             from handlers.thread_handler import handle_special_day_thread_reply
 
-            result = handle_special_day_thread_reply(
-                app=app,
-                channel=channel,
-                thread_ts=thread_ts,
-                message_ts=message_ts,
-                user_id=user_id,
-                text=text,
-                tracked_thread=tracked_thread,
-            )
+            def respond():
+                result = handle_special_day_thread_reply(
+                    app=app,
+                    channel=channel,
+                    thread_ts=thread_ts,
+                    message_ts=message_ts,
+                    user_id=user_id,
+                    text=text,
+                    tracked_thread=tracked_thread,
+                )
 
-            if result.get("response_sent"):
-                events_logger.debug(
-                    f"THREAD_REPLY: Sent response to special day thread reply in {thread_ts}"
+                if result.get("response_sent"):
+                    events_logger.debug(
+                        f"THREAD_REPLY: Sent response to special day thread reply in {thread_ts}"
+                    )
+
+            def busy():
+                # A reaction instead of a reply keeps a busy thread from filling with notices
+                app.client.reactions_add(
+                    channel=channel, timestamp=message_ts, name="hourglass_flowing_sand"
                 )
 
+            submit("interactive", respond, on_overflow=busy, label="special_day_thread_reply")
+
     except ImportError:
         # Config not available yet - skip silently
         pass
@@ -145,58 +168,233 @@ def _handle_channel_message(app, event, channel):
         channel: Channel ID
     """
     try:
-        from config import THREAD_ENGAGEMENT_ENABLED
-
-        # Only react to messages in the birthday channel
-        if channel != BIRTHDAY_CHANNEL:
+        reaction = _celebration_reaction(event, channel)
+        if not reaction:
             return
 
-        if not THREAD_ENGAGEMENT_ENABLED:
-            return
+        try:
+            app.client.reactions_add(
+                channel=channel,
+                timestamp=event.get("ts"),
+                name=reaction,
+            )
+            events_logger.debug(
+                f"CHANNEL_MESSAGE: Added :{reaction}: to celebratory message from {event.get('user')}"
+            )
+        except Exception as react_error:
+            if "already_reacted" not in str(react_error):
+                events_logger.debug(f"CHANNEL_MESSAGE: Could not add reaction: {react_error}")
 
-        text = event.get("text", "").lower()
-        message_ts = event.get("ts")
-        user_id = event.get("user")
+    except ImportError:
+        events_logger.warning("CHANNEL_MESSAGE: Could not import thread reaction handler")
+    except Exception as e:
+        events_logger.debug(f"CHANNEL_MESSAGE: Error handling channel message: {e}")
+
+
+def _celebration_reaction(event, channel):
+    """
+    Pick the reaction for a celebratory top-level birthday channel message.
 
-        if not text or not message_ts or not user_id:
+    Returns:
+        str or None: Reaction name, or None when the message gets no reaction
+    """
+    from config import THREAD_ENGAGEMENT_ENABLED
+
+    # Only react to messages in the birthday channel
+    if channel != BIRTHDAY_CHANNEL:
+        return None
+
+    if not THREAD_ENGAGEMENT_ENABLED:
+        return None
+
+    text = event.get("text", "").lower()
+    message_ts = event.get("ts")
+    user_id = event.get("user")
+
+    if not text or not message_ts or not user_id:
+        return None
+
+    # Check if message contains birthday/celebration keywords
+    celebration_keywords = (
+        "happy birthday",
+        "birthday",
+        "congrat",
+        "celebrate",
+        "🎂",
+        "🎉",
+        "🎈",
+        "🥳",
+        "wish",
+    )
+
+    if not any(keyword in text for keyword in celebration_keywords):
+        return None
+
+    # Select appropriate reaction
+    from handlers.thread_handler import get_reaction_for_message
+
+    return get_reaction_for_message(text)
+
+
+def _show_special_day_details(app, body, action, client):
+    """Post the full description behind a special day View Details button."""
+    try:
+        from slack.blocks.special_day import get_special_day_details
+
+        action_id = action.get("action_id", "")
+        button_value = action.get("value", "")
+
+        # Try cache first (new flow), fall back to button value (legacy)
+        cached = get_special_day_details(action_id)
+        if cached:
+            description = cached["content"]
+            observance_name = cached.get("name") or button_value or "Special Day"
+            source = cached.get("source")
+            url = cached.get("url")
+        elif "\n---\n" in button_value:
+            # Legacy consolidated format
+            observance_name, description = button_value.split("\n---\n", 1)
+            source = None
+            url = None
+        else:
+            # Legacy single-observance format (details in button value)
+            description = button_value if len(button_value) > 50 else "No details available"
+            observance_name = button_value if len(button_value) <= 50 else "Special Day"
+            # Try header block for name
+            msg_blocks = body.get("message", {}).get("blocks", [])
+            if msg_blocks:
+                first = msg_blocks[0]
+                if isinstance(first, dict):
+                    header_text = first.get("text", {}).get("text", "")
+                    if header_text and len(header_text) < 100:
+                        observance_name = header_text.removeprefix("🌍 ")
+            source = None
+            url = None
+
+        # Safely extract channel and user IDs
+        channel_id = body.get("channel", {}).get("id")
+        user_id = body.get("user", {}).get("id")
+
+        if not channel_id or not user_id:
+            events_logger.error(
+                f"SPECIAL_DAY_DETAILS_ERROR: Missing channel_id ({channel_id}) or user_id ({user_id})"
+            )
             return
 
-        # Check if message contains birthday/celebration keywords
-        celebration_keywords = (
-            "happy birthday",
-            "birthday",
-            "congrat",
-            "celebrate",
-            "🎂",
-            "🎉",
-            "🎈",
-            "🥳",
-            "wish",
+        events_logger.info(
+            f"SPECIAL_DAY_DETAILS: User {user_id} clicked View Details for {observance_name}"
         )
 
-        if any(keyword in text for keyword in celebration_keywords):
-            # Select appropriate reaction
-            from handlers.thread_handler import get_reaction_for_message
+        channel_type = body.get("channel", {}).get("type", "unknown")
 
-            reaction = get_reaction_for_message(text)
+        # Build rich ephemeral display
+        blocks = [
+            {
+                "type": "header",
+                "text": {"type": "plain_text", "text": f"📖 {observance_name}"},
+            },
+        ]
 
-            try:
-                app.client.reactions_add(
-                    channel=channel,
-                    timestamp=message_ts,
-                    name=reaction,
-                )
-                events_logger.debug(
-                    f"CHANNEL_MESSAGE: Added :{reaction}: to celebratory message from {user_id}"
-                )
-            except Exception as react_error:
-                if "already_reacted" not in str(react_error):
-                    events_logger.debug(f"CHANNEL_MESSAGE: Could not add reaction: {react_error}")
+        # Source context
+        context_elements = []
+        if source:
+            context_elements.append({"type": "mrkdwn", "text": f"📋 *Source:* {source}"})
+        if context_elements:
+            blocks.append({"type": "context", "elements": context_elements})
+
+        blocks.append({"type": "divider"})
+
+        # Split long content across section blocks (Slack limit per block)
+        from config import SLACK_SECTION_TEXT_MAX_LENGTH
+
+        remaining = description
+        while remaining:
+            if len(remaining) <= SLACK_SECTION_TEXT_MAX_LENGTH:
+                blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": remaining}})
+                break
+            # Find a paragraph or line boundary within the safe range
+            limit = SLACK_SECTION_TEXT_MAX_LENGTH
+            split_pos = remaining.rfind("\n\n", 0, limit)
+            if split_pos == -1:
+                split_pos = remaining.rfind("\n", 0, limit)
+            if split_pos == -1:
+                split_pos = limit
+            blocks.append(
+                {"type": "section", "text": {"type": "mrkdwn", "text": remaining[:split_pos]}}
+            )
+            remaining = remaining[split_pos:].lstrip()
+
+        # Official source button at the bottom
+        if url:
+            blocks.append(
+                {
+                    "type": "actions",
+                    "elements": [
+                        {
+                            "type": "button",
+                            "text": {"type": "plain_text", "text": "🔗 Official Source"},
+                            "action_id": f"link_details_{action_id}",
+                            "url": url,
+                        }
+                    ],
+                }
+            )
+
+        fallback = f"📖 {observance_name} - Details"
+
+        if channel_type == "im":
+            send_message(app, channel_id, fallback, blocks=blocks)
+            events_logger.info(f"SPECIAL_DAY_DETAILS: Sent to DM for user {user_id}")
+        else:
+            client.chat_postEphemeral(
+                channel=channel_id, user=user_id, blocks=blocks, text=fallback
+            )
+            events_logger.info(f"SPECIAL_DAY_DETAILS: Sent ephemeral for user {user_id}")
 
-    except ImportError:
-        events_logger.warning("CHANNEL_MESSAGE: Could not import thread reaction handler")
     except Exception as e:
-        events_logger.debug(f"CHANNEL_MESSAGE: Error handling channel message: {e}")
+        events_logger.error(
+            f"SPECIAL_DAY_DETAILS_ERROR: Failed: {e} "
+            f"(user={body.get('user', {}).get('id')}, "
+            f"action_id={action.get('action_id')})"
+        )
+
+        # Try to send error message to user
+        try:
+            # Safely extract IDs for error recovery
+            error_channel_id = body.get("channel", {}).get("id")
+            error_user_id = body.get("user", {}).get("id")
+
+            if not error_channel_id:
+                events_logger.error("SPECIAL_DAY_DETAILS_ERROR: Cannot send error - no channel_id")
+                return
+
+            error_blocks = [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": "⚠️ Sorry, I couldn't load the details for this special day. Please try again later.",
+                    },
+                }
+            ]
+            channel_type = body.get("channel", {}).get("type", "unknown")
+            if channel_type == "im":
+                # For DMs, send regular message
+                send_message(app, error_channel_id, "⚠️ Error loading details", blocks=error_blocks)
+            elif error_user_id:
+                # For channels, send ephemeral (requires user_id)
+                client.chat_postEphemeral(
+                    channel=error_channel_id,
+                    user=error_user_id,
+                    blocks=error_blocks,
+                    text="⚠️ Error loading details",  # Fallback
+                )
+            else:
+                events_logger.error("SPECIAL_DAY_DETAILS_ERROR: Cannot send ephemeral - no user_id")
+        except Exception as error_send_error:
+            events_logger.error(
+                f"SPECIAL_DAY_DETAILS_ERROR: Could not send error message: {error_send_error}"
+            )
 
 
 def register_event_handlers(app):
@@ -222,171 +420,25 @@ def register_event_handlers(app):
         ack()
         events_logger.info("BUTTON_CLICKED: Acknowledged interaction")
 
-        try:
-            from slack.blocks.special_day import get_special_day_details
-
-            action_id = action.get("action_id", "")
-            button_value = action.get("value", "")
-
-            # Try cache first (new flow), fall back to button value (legacy)
-            cached = get_special_day_details(action_id)
-            if cached:
-                description = cached["content"]
-                observance_name = cached.get("name") or button_value or "Special Day"
-                source = cached.get("source")
-                url = cached.get("url")
-            elif "\n---\n" in button_value:
-                # Legacy consolidated format
-                observance_name, description = button_value.split("\n---\n", 1)
-                source = None
-                url = None
-            else:
-                # Legacy single-observance format (details in button value)
-                description = button_value if len(button_value) > 50 else "No details available"
-                observance_name = button_value if len(button_value) <= 50 else "Special Day"
-                # Try header block for name
-                msg_blocks = body.get("message", {}).get("blocks", [])
-                if msg_blocks:
-                    first = msg_blocks[0]
-                    if isinstance(first, dict):
-                        header_text = first.get("text", {}).get("text", "")
-                        if header_text and len(header_text) < 100:
-                            observance_name = header_text.removeprefix("🌍 ")
-                source = None
-                url = None
-
-            # Safely extract channel and user IDs
-            channel_id = body.get("channel", {}).get("id")
+        def busy():
             user_id = body.get("user", {}).get("id")
-
-            if not channel_id or not user_id:
-                events_logger.error(
-                    f"SPECIAL_DAY_DETAILS_ERROR: Missing channel_id ({channel_id}) or user_id ({user_id})"
-                )
-                return
-
-            events_logger.info(
-                f"SPECIAL_DAY_DETAILS: User {user_id} clicked View Details for {observance_name}"
-            )
-
-            channel_type = body.get("channel", {}).get("type", "unknown")
-
-            # Build rich ephemeral display
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {"type": "plain_text", "text": f"📖 {observance_name}"},
-                },
-            ]
-
-            # Source context
-            context_elements = []
-            if source:
-                context_elements.append({"type": "mrkdwn", "text": f"📋 *Source:* {source}"})
-            if context_elements:
-                blocks.append({"type": "context", "elements": context_elements})
-
-            blocks.append({"type": "divider"})
-
-            # Split long content across section blocks (Slack limit per block)
-            from config import SLACK_SECTION_TEXT_MAX_LENGTH
-
-            remaining = description
-            while remaining:
-                if len(remaining) <= SLACK_SECTION_TEXT_MAX_LENGTH:
-                    blocks.append(
-                        {"type": "section", "text": {"type": "mrkdwn", "text": remaining}}
-                    )
-                    break
-                # Find a paragraph or line boundary within the safe range
-                limit = SLACK_SECTION_TEXT_MAX_LENGTH
-                split_pos = remaining.rfind("\n\n", 0, limit)
-                if split_pos == -1:
-                    split_pos = remaining.rfind("\n", 0, limit)
-                if split_pos == -1:
-                    split_pos = limit
-                blocks.append(
-                    {"type": "section", "text": {"type": "mrkdwn", "text": remaining[:split_pos]}}
-                )
-                remaining = remaining[split_pos:].lstrip()
-
-            # Official source button at the bottom
-            if url:
-                blocks.append(
-                    {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {"type": "plain_text", "text": "🔗 Official Source"},
-                                "action_id": f"link_details_{action_id}",
-                                "url": url,
-                            }
-                        ],
-                    }
-                )
-
-            fallback = f"📖 {observance_name} - Details"
-
-            if channel_type == "im":
-                send_message(app, channel_id, fallback, blocks=blocks)
-                events_logger.info(f"SPECIAL_DAY_DETAILS: Sent to DM for user {user_id}")
-            else:
+            channel_id = body.get("channel", {}).get("id")
+            if user_id and channel_id:
                 client.chat_postEphemeral(
-                    channel=channel_id, user=user_id, blocks=blocks, text=fallback
+                    channel=channel_id,
+                    user=user_id,
+                    text="⏳ Lots of requests right now - please click View Details again in a minute.",
                 )
-                events_logger.info(f"SPECIAL_DAY_DETAILS: Sent ephemeral for user {user_id}")
-
-        except Exception as e:
-            events_logger.error(
-                f"SPECIAL_DAY_DETAILS_ERROR: Failed: {e} "
-                f"(user={body.get('user', {}).get('id')}, "
-                f"action_id={action.get('action_id')})"
-            )
 
-            # Try to send error message to user
-            try:
-                # Safely extract IDs for error recovery
-                error_channel_id = body.get("channel", {}).get("id")
-                error_user_id = body.get("user", {}).get("id")
-
-                if not error_channel_id:
-                    events_logger.error(
-                        "SPECIAL_DAY_DETAILS_ERROR: Cannot send error - no channel_id"
-                    )
-                    return
-
-                error_blocks = [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": "⚠️ Sorry, I couldn't load the details for this special day. Please try again later.",
-                        },
-                    }
-                ]
-                channel_type = body.get("channel", {}).get("type", "unknown")
-                if channel_type == "im":
-                    # For DMs, send regular message
-                    send_message(
-                        app, error_channel_id, "⚠️ Error loading details", blocks=error_blocks
-                    )
-                elif error_user_id:
-                    # For channels, send ephemeral (requires user_id)
-                    client.chat_postEphemeral(
-                        channel=error_channel_id,
-                        user=error_user_id,
-                        blocks=error_blocks,
-                        text="⚠️ Error loading details",  # Fallback
-                    )
-                else:
-                    events_logger.error(
-                        "SPECIAL_DAY_DETAILS_ERROR: Cannot send ephemeral - no user_id"
-                    )
-            except Exception as error_send_error:
-                events_logger.error(
-                    f"SPECIAL_DAY_DETAILS_ERROR: Could not send error message: {error_send_error}"
-                )
+        submit(
+            "interactive",
+            _show_special_day_details,
+            app,
+            body,
+            action,
+            client,
+            on_overflow=busy,
+        )
 
     events_logger.info("EVENT_HANDLER: Button action handler registered successfully")
 
@@ -725,6 +777,7 @@ def register_event_handlers(app):
 
         # Send welcome message if they joined the birthday channel
         if channel == BIRTHDAY_CHANNEL:
+            _birthday_membership_changed(user)
             try:
                 username = get_username(app, user)
 
@@ -758,7 +811,29 @@ def register_event_handlers(app):
                 f"CHANNEL_JOIN: User {user} joined non-birthday channel {channel} - no action taken"
             )
 
+    @app.event("member_left_channel")
+    def handle_member_left_channel(event, logger):
+        """Leaving the birthday channel opts a user out of today's celebration"""
+        if event.get("channel") == BIRTHDAY_CHANNEL:
+            events_logger.debug(f"CHANNEL_LEAVE: User {event.get('user')} left birthday channel")
+            _birthday_membership_changed(event.get("user"))
+
+    @app.event("user_change")
+    def handle_user_change(event, logger):
+        """Replan the celebration trigger when someone in today's planned cohort changes timezone"""
+        from services.birthday import get_planned_timezone
+
+        user = event.get("user") or {}
+        user_id = user.get("id")
+        planned_tz = get_planned_timezone(user_id) if user_id else None
+        if planned_tz is None or planned_tz == (user.get("tz") or "UTC"):
+            return
+
+        from services.scheduler import invalidate_birthday_plan
+
+        invalidate_birthday_plan(f"timezone change for {user_id}: {planned_tz} -> {user.get('tz')}")
+
     # Final confirmation that all handlers are registered
     events_logger.info(
-        "EVENT_HANDLER: All event handlers registered successfully (message, member_joined_channel, button actions)"
+        "EVENT_HANDLER: All event handlers registered successfully (message, member_joined_channel, member_left_channel, user_change, button actions)"
     )
@@ -17,6 +17,7 @@ from typing import Dict, Tuple
 from slack_sdk.errors import SlackApiError
 
 from config import get_logger
+from utils.work_queue import submit
 
 logger = get_logger("events")
 
@@ -147,6 +148,66 @@ def classify_question(text: str) -> str:
     return "general"
 
 
+def _prepare_mention(event: dict, result: dict):
+    """
+    Validate, rate-limit and classify a mention (shared by the sync and async paths).
+
+    Returns:
+        Dict with user_id, channel, thread_ts, clean_text and rate_limit_text (a
+        notice to post instead of answering), or None when there is nothing to do
+    """
+    from config import MENTION_QA_ENABLED
+
+    if not MENTION_QA_ENABLED:
+        logger.debug("MENTION: Q&A is disabled")
+        return None
+
+    user_id = event.get("user")
+    text = event.get("text", "")
+    # Always reply in a thread to avoid channel clutter:
+    # - If mention is in a thread, reply in that thread (thread_ts)
+    # - If mention is in main channel, start a new thread from the mention (ts)
+    mention = {
+        "user_id": user_id,
+        "channel": event.get("channel"),
+        "thread_ts": event.get("thread_ts") or event.get("ts"),
+        "clean_text": None,
+        "rate_limit_text": None,
+    }
+
+    if not user_id or not text:
+        return None
+
+    # Check rate limit
+    rate_limiter = get_rate_limiter()
+    is_allowed, seconds_until_reset = rate_limiter.is_allowed(user_id)
+
+    if not is_allowed:
+        # Rate limited - send a gentle message
+        mention["rate_limit_text"] = (
+            f"Whoa there! Please wait {seconds_until_reset} seconds before asking me another question."
+        )
+        result["error"] = "rate_limited"
+        return mention
+
+    # Remove bot mention from text
+    # Pattern: <@BOTID> or <@BOTID|botname>
+    clean_text = re.sub(r"<@[A-Z0-9]+(\|[^>]+)?>", "", text).strip()
+
+    if not clean_text:
+        # Just a mention with no question - provide help
+        clean_text = "help"
+
+    # Classify the question
+    result["question_type"] = classify_question(clean_text)
+    mention["clean_text"] = clean_text
+
+    logger.info(
+        f"MENTION: User {user_id} asked '{clean_text[:50]}...' (type: {result['question_type']})"
+    )
+    return mention
+
+
 def handle_mention(app, event: dict, say) -> dict:
     """
     Handle an @-mention of the bot.
@@ -162,69 +223,89 @@ def handle_mention(app, event: dict, say) -> dict:
     result = {"responded": False, "question_type": None, "error": None}
 
     try:
-        from config import MENTION_QA_ENABLED
-
-        if not MENTION_QA_ENABLED:
-            logger.debug("MENTION: Q&A is disabled")
+        mention = _prepare_mention(event, result)
+        if mention is None:
             return result
 
-        user_id = event.get("user")
-        text = event.get("text", "")
-        channel = event.get("channel")
-        # Always reply in a thread to avoid channel clutter:
-        # - If mention is in a thread, reply in that thread (thread_ts)
-        # - If mention is in main channel, start a new thread from the mention (ts)
-        thread_ts = event.get("thread_ts") or event.get("ts")
-
-        if not user_id or not text:
+        if mention["rate_limit_text"]:
+            try:
+                say(text=mention["rate_limit_text"], thread_ts=mention["thread_ts"])
+            except SlackApiError as e:
+                logger.debug(f"MENTION: Could not send rate limit message: {e}")
             return result
 
-        # Check rate limit
-        rate_limiter = get_rate_limiter()
-        is_allowed, seconds_until_reset = rate_limiter.is_allowed(user_id)
+        # Generate response
+        from services.mention_responder import generate_mention_response
+
+        response = generate_mention_response(
+            app=app,
+            question_text=mention["clean_text"],
+            question_type=result["question_type"],
+            user_id=mention["user_id"],
+        )
 
-        if not is_allowed:
-            # Rate limited - send a gentle message
+        if response:
+            # Reply in thread (using say() with explicit thread_ts to ensure threading)
             try:
-                say(
-                    text=f"Whoa there! Please wait {seconds_until_reset} seconds before asking me another question.",
-                    thread_ts=thread_ts,
-                )
+                say(text=response, thread_ts=mention["thread_ts"])
+                result["responded"] = True
+                logger.info(f"MENTION: Responded to {mention['user_id']} in {mention['channel']}")
             except SlackApiError as e:
-                logger.debug(f"MENTION: Could not send rate limit message: {e}")
-            result["error"] = "rate_limited"
-            return result
+                logger.error(f"MENTION: Failed to send response: {e}")
+                result["error"] = str(e)
+        else:
+            result["error"] = "no_response_generated"
 
-        # Remove bot mention from text
-        # Pattern: <@BOTID> or <@BOTID|botname>
-        clean_text = re.sub(r"<@[A-Z0-9]+(\|[^>]+)?>", "", text).strip()
+    except ImportError as e:
+        logger.debug(f"MENTION: Config not available: {e}")
+    except Exception as e:
+        logger.error(f"MENTION: Error handling mention: {e}")
+        result["error"] = str(e)
 
-        if not clean_text:
-            # Just a mention with no question - provide help
-            clean_text = "help"
+    return result
 
-        # Classify the question
-        question_type = classify_question(clean_text)
-        result["question_type"] = question_type
 
-        logger.info(f"MENTION: User {user_id} asked '{clean_text[:50]}...' (type: {question_type})")
+async def ahandle_mention(app, event: dict, say) -> dict:
+    """
+    handle_mention() for the async runtime: say is Bolt's async say and the
+    answer is generated with agenerate_mention_response().
 
-        # Generate response
-        from services.mention_responder import generate_mention_response
+    Args:
+        app: Sync Slack app instance (for context lookups on the blocking pool)
+        event: The app_mention event
+        say: Async say function for responding
 
-        response = generate_mention_response(
+    Returns:
+        Dict with results: {"responded": bool, "question_type": str, "error": str or None}
+    """
+    result = {"responded": False, "question_type": None, "error": None}
+
+    try:
+        mention = _prepare_mention(event, result)
+        if mention is None:
+            return result
+
+        if mention["rate_limit_text"]:
+            try:
+                await say(text=mention["rate_limit_text"], thread_ts=mention["thread_ts"])
+            except SlackApiError as e:
+                logger.debug(f"MENTION: Could not send rate limit message: {e}")
+            return result
+
+        from services.mention_responder import agenerate_mention_response
+
+        response = await agenerate_mention_response(
             app=app,
-            question_text=clean_text,
-            question_type=question_type,
-            user_id=user_id,
+            question_text=mention["clean_text"],
+            question_type=result["question_type"],
+            user_id=mention["user_id"],
         )
 
         if response:
-            # Reply in thread (using say() with explicit thread_ts to ensure threading)
             try:
-                say(text=response, thread_ts=thread_ts)
+                await say(text=response, thread_ts=mention["thread_ts"])
                 result["responded"] = True
-                logger.info(f"MENTION: Responded to {user_id} in {channel}")
+                logger.info(f"MENTION: Responded to {mention['user_id']} in {mention['channel']}")
             except SlackApiError as e:
                 logger.error(f"MENTION: Failed to send response: {e}")
                 result["error"] = str(e)
@@ -259,14 +340,24 @@ def register_mention_handlers(app):
 
     @app.event("app_mention")
     def handle_app_mention(event, say, client, logger):
-        """Handle @-mentions of the bot."""
-        result = handle_mention(app, event, say)
+        """Handle @-mentions of the bot (answered on the interactive work lane)."""
 
-        if result.get("responded"):
-            logger.debug(
-                f"MENTION: Successfully responded to mention (type: {result.get('question_type')})"
+        def answer():
+            result = handle_mention(app, event, say)
+
+            if result.get("responded"):
+                logger.debug(
+                    f"MENTION: Successfully responded to mention (type: {result.get('question_type')})"
+                )
+            elif result.get("error"):
+                logger.debug(f"MENTION: Failed to respond - {result.get('error')}")
+
+        def busy():
+            say(
+                text="I'm answering a lot of questions right now - please ask me again in a minute! 🙏",
+                thread_ts=event.get("thread_ts") or event.get("ts"),
             )
-        elif result.get("error"):
-            logger.debug(f"MENTION: Failed to respond - {result.get('error')}")
+
+        submit("interactive", answer, on_overflow=busy, label="app_mention")
 
     logger.info("MENTION: Registered app_mention event handler")
@@ -13,10 +13,148 @@ from slack.client import get_username
 from slack.messaging import send_message
 from storage.birthdays import save_birthday, trigger_external_backup
 from utils.date_utils import check_if_birthday_today
+from utils.work_queue import submit
 
 logger = get_logger("commands")
 
 
+def _process_birthday_submission(app, client, body, view):
+    """Validate a birthday modal submission, save it and confirm to the user."""
+    user_id = body["user"]["id"]
+    username = get_username(app, user_id)
+
+    # Extract values from modal
+    values = view.get("state", {}).get("values", {})
+
+    # Get month and day from dropdowns (with safe access)
+    month_block = values.get("birthday_month_block", {})
+    month_input = month_block.get("birthday_month", {})
+    month_option = month_input.get("selected_option")
+
+    day_block = values.get("birthday_day_block", {})
+    day_input = day_block.get("birthday_day", {})
+    day_option = day_input.get("selected_option")
+
+    # Validate that required fields are present
+    if not month_option or not day_option:
+        logger.error(f"MODAL: Missing required fields - month: {month_option}, day: {day_option}")
+        _send_modal_error(app, user_id, "Please select both a month and day for your birthday.")
+        return
+
+    month_value = month_option.get("value")
+    day_value = day_option.get("value")
+
+    if not month_value or not day_value:
+        logger.error(f"MODAL: Invalid field values - month: {month_value}, day: {day_value}")
+        _send_modal_error(app, user_id, "Invalid month or day selection. Please try again.")
+        return
+
+    # Get optional year from text input
+    year_block = values.get("birth_year_block", {})
+    year_input = year_block.get("birth_year", {})
+    year_value = year_input.get("value")
+
+    # Get preferences from checkboxes
+    prefs_block = values.get("preferences_block", {})
+    prefs_input = prefs_block.get("preferences", {})
+    selected_options = prefs_input.get("selected_options", [])
+    # Safely extract values from options, handling non-dict items
+    selected_values = [opt.get("value") for opt in selected_options if isinstance(opt, dict)]
+
+    # Get celebration style from dropdown
+    style_block = values.get("celebration_style_block", {})
+    style_input = style_block.get("celebration_style", {})
+    style_option = style_input.get("selected_option", {})
+    celebration_style = style_option.get("value", "standard") if style_option else "standard"
+
+    # Preserve existing pause state if user has one
+    # This is important: we don't want to accidentally un-pause a user who
+    # explicitly paused their celebrations via /birthday pause
+    from storage.birthdays import DEFAULT_PREFERENCES, get_user_preferences, load_birthdays
+
+    existing_prefs = get_user_preferences(user_id)
+
+    # Defensive check: if user has an existing birthday entry but get_user_preferences
+    # returned None/empty, log a warning - this might indicate data corruption
+    birthdays = load_birthdays()
+    user_has_existing_birthday = user_id in birthdays
+
+    if user_has_existing_birthday and not existing_prefs:
+        logger.warning(
+            f"MODAL_WARNING: User {user_id} has birthday entry but no preferences - "
+            f"data may be corrupted. Using defaults but preserving raw active state if present."
+        )
+        # Try to get active state directly from raw birthday data as fallback
+        raw_prefs = birthdays.get(user_id, {}).get("preferences", {})
+        existing_active = raw_prefs.get("active", DEFAULT_PREFERENCES["active"])
+    else:
+        existing_prefs = existing_prefs or {}
+        existing_active = existing_prefs.get("active", DEFAULT_PREFERENCES["active"])
+
+    # Build preferences dict (preserve active state from pause/resume commands)
+    preferences = {
+        "image_enabled": "image_enabled" in selected_values,
+        "show_age": "show_age" in selected_values,
+        "active": existing_active,  # Preserve pause state from /birthday pause
+        "celebration_style": celebration_style,
+    }
+
+    logger.info(
+        f"MODAL: Received birthday submission from {username}: "
+        f"month={month_value}, day={day_value}, year={year_value}, prefs={preferences}"
+    )
+
+    try:
+        # Construct DD/MM format and validate using datetime
+        # Use leap year 2000 to allow Feb 29 for leap year birthdays
+        date_ddmm = f"{day_value}/{month_value}"
+        try:
+            datetime.strptime(f"{date_ddmm}/2000", "%d/%m/%Y")
+        except ValueError:
+            # Get month name for error message using calendar module
+            month_int = int(month_value)
+            day_int = int(day_value)
+            _send_modal_error(
+                client,
+                user_id,
+                f"Invalid date: {month_name[month_int]} doesn't have {day_int} days.",
+            )
+            return
+
+        # Validate and parse year if provided
+        birth_year = None
+        if year_value and year_value.strip():
+            year_int = int(year_value.strip())
+            current_year = datetime.now().year
+            if MIN_BIRTH_YEAR <= year_int <= current_year:
+                birth_year = year_int
+            else:
+                _send_modal_error(
+                    client,
+                    user_id,
+                    f"Invalid year. Please enter a year between {MIN_BIRTH_YEAR} and {current_year}.",
+                )
+                return
+
+        # Save birthday with preferences using existing function
+        updated = save_birthday(date_ddmm, user_id, birth_year, username, preferences)
+
+        # Send external backup with user_id for preferences lookup
+        trigger_external_backup(updated, username, app, user_id=user_id)
+
+        # Check if birthday is today
+        if check_if_birthday_today(date_ddmm):
+            _send_birthday_today_message(app, user_id, username, date_ddmm, birth_year, updated)
+        else:
+            _send_modal_confirmation(app, user_id, date_ddmm, birth_year, updated)
+
+        logger.info(f"MODAL: Birthday {'updated' if updated else 'saved'} for {username}")
+
+    except ValueError as e:
+        logger.error(f"MODAL_ERROR: Invalid input from {username}: {e}")
+        _send_modal_error(app, user_id, "Invalid input. Please try again.")
+
+
 def register_modal_handlers(app):
     """Register modal submission handlers."""
 
@@ -25,146 +163,27 @@ def register_modal_handlers(app):
         """
         Handle birthday modal form submission.
 
-        Validates input and saves to storage, reusing existing logic.
+        Acks immediately; validation and saving run on the interactive work lane.
         """
         ack()  # Acknowledge immediately
 
-        user_id = body["user"]["id"]
-        username = get_username(app, user_id)
-
-        # Extract values from modal
-        values = view.get("state", {}).get("values", {})
-
-        # Get month and day from dropdowns (with safe access)
-        month_block = values.get("birthday_month_block", {})
-        month_input = month_block.get("birthday_month", {})
-        month_option = month_input.get("selected_option")
-
-        day_block = values.get("birthday_day_block", {})
-        day_input = day_block.get("birthday_day", {})
-        day_option = day_input.get("selected_option")
-
-        # Validate that required fields are present
-        if not month_option or not day_option:
-            logger.error(
-                f"MODAL: Missing required fields - month: {month_option}, day: {day_option}"
-            )
-            _send_modal_error(app, user_id, "Please select both a month and day for your birthday.")
-            return
-
-        month_value = month_option.get("value")
-        day_value = day_option.get("value")
-
-        if not month_value or not day_value:
-            logger.error(f"MODAL: Invalid field values - month: {month_value}, day: {day_value}")
-            _send_modal_error(app, user_id, "Invalid month or day selection. Please try again.")
-            return
-
-        # Get optional year from text input
-        year_block = values.get("birth_year_block", {})
-        year_input = year_block.get("birth_year", {})
-        year_value = year_input.get("value")
-
-        # Get preferences from checkboxes
-        prefs_block = values.get("preferences_block", {})
-        prefs_input = prefs_block.get("preferences", {})
-        selected_options = prefs_input.get("selected_options", [])
-        # Safely extract values from options, handling non-dict items
-        selected_values = [opt.get("value") for opt in selected_options if isinstance(opt, dict)]
-
-        # Get celebration style from dropdown
-        style_block = values.get("celebration_style_block", {})
-        style_input = style_block.get("celebration_style", {})
-        style_option = style_input.get("selected_option", {})
-        celebration_style = style_option.get("value", "standard") if style_option else "standard"
-
-        # Preserve existing pause state if user has one
-        # This is important: we don't want to accidentally un-pause a user who
-        # explicitly paused their celebrations via /birthday pause
-        from storage.birthdays import DEFAULT_PREFERENCES, get_user_preferences, load_birthdays
-
-        existing_prefs = get_user_preferences(user_id)
-
-        # Defensive check: if user has an existing birthday entry but get_user_preferences
-        # returned None/empty, log a warning - this might indicate data corruption
-        birthdays = load_birthdays()
-        user_has_existing_birthday = user_id in birthdays
-
-        if user_has_existing_birthday and not existing_prefs:
-            logger.warning(
-                f"MODAL_WARNING: User {user_id} has birthday entry but no preferences - "
-                f"data may be corrupted. Using defaults but preserving raw active state if present."
+        def busy():
+            _send_modal_error(
+                app,
+                body["user"]["id"],
+                "I'm handling a lot of requests right now - please submit your birthday again in a minute.",
             )
-            # Try to get active state directly from raw birthday data as fallback
-            raw_prefs = birthdays.get(user_id, {}).get("preferences", {})
-            existing_active = raw_prefs.get("active", DEFAULT_PREFERENCES["active"])
-        else:
-            existing_prefs = existing_prefs or {}
-            existing_active = existing_prefs.get("active", DEFAULT_PREFERENCES["active"])
-
-        # Build preferences dict (preserve active state from pause/resume commands)
-        preferences = {
-            "image_enabled": "image_enabled" in selected_values,
-            "show_age": "show_age" in selected_values,
-            "active": existing_active,  # Preserve pause state from /birthday pause
-            "celebration_style": celebration_style,
-        }
 
-        logger.info(
-            f"MODAL: Received birthday submission from {username}: "
-            f"month={month_value}, day={day_value}, year={year_value}, prefs={preferences}"
+        submit(
+            "interactive",
+            _process_birthday_submission,
+            app,
+            client,
+            body,
+            view,
+            on_overflow=busy,
         )
 
-        try:
-            # Construct DD/MM format and validate using datetime
-            # Use leap year 2000 to allow Feb 29 for leap year birthdays
-            date_ddmm = f"{day_value}/{month_value}"
-            try:
-                datetime.strptime(f"{date_ddmm}/2000", "%d/%m/%Y")
-            except ValueError:
-                # Get month name for error message using calendar module
-                month_int = int(month_value)
-                day_int = int(day_value)
-                _send_modal_error(
-                    client,
-                    user_id,
-                    f"Invalid date: {month_name[month_int]} doesn't have {day_int} days.",
-                )
-                return
-
-            # Validate and parse year if provided
-            birth_year = None
-            if year_value and year_value.strip():
-                year_int = int(year_value.strip())
-                current_year = datetime.now().year
-                if MIN_BIRTH_YEAR <= year_int <= current_year:
-                    birth_year = year_int
-                else:
-                    _send_modal_error(
-                        client,
-                        user_id,
-                        f"Invalid year. Please enter a year between {MIN_BIRTH_YEAR} and {current_year}.",
-                    )
-                    return
-
-            # Save birthday with preferences using existing function
-            updated = save_birthday(date_ddmm, user_id, birth_year, username, preferences)
-
-            # Send external backup with user_id for preferences lookup
-            trigger_external_backup(updated, username, app, user_id=user_id)
-
-            # Check if birthday is today
-            if check_if_birthday_today(date_ddmm):
-                _send_birthday_today_message(app, user_id, username, date_ddmm, birth_year, updated)
-            else:
-                _send_modal_confirmation(app, user_id, date_ddmm, birth_year, updated)
-
-            logger.info(f"MODAL: Birthday {'updated' if updated else 'saved'} for {username}")
-
-        except ValueError as e:
-            logger.error(f"MODAL_ERROR: Invalid input from {username}: {e}")
-            _send_modal_error(app, user_id, "Invalid input. Please try again.")
-
     @app.action("open_birthday_modal")
     def handle_open_modal_button(ack, body, client):
         """Handle button click to open birthday modal."""
@@ -19,7 +19,6 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
-from icalendar import Calendar
 
 from config import (
     ICS_CACHE_DIR,
@@ -459,6 +458,7 @@ class ICSFeedClient:
     def _parse_ics(self, content: str, sub: ICSSubscription) -> List[dict]:
         """Parse ICS content into event dicts for the current year."""
         import recurring_ical_events
+        from icalendar import Calendar
 
         cal = Calendar.from_ical(content)
         current_year = datetime.now().year
@@ -3,23 +3,42 @@ Unified OpenAI API interface.
 
 Provides centralized client management, Responses API wrapper, and usage logging.
 Benefits: 40-80% better cache utilization, lower latency, simpler interface.
+All requests run under integrations/openai_guard.py (circuit breaker + adaptive
+concurrency limit) and raise OpenAIUnavailableError when OpenAI is shedding load.
 
 Key functions:
 - get_openai_client(): Get configured OpenAI client singleton
 - complete(): Generate completion using Responses API
+- acomplete(): complete() for coroutines (async Socket Mode runtime)
 - complete_with_usage(): Generate completion with usage stats
+- complete_structured(): Generate completion constrained to a JSON schema
+- complete_batch(): Pack many items into one structured call, per-item fallback
 - analyze_image(): Analyze image using Vision capabilities
+- analyze_images(): Analyze several images in one structured vision request
 - log_*_usage(): Usage logging for different API operations
+
+Token, latency and cost accounting per context: integrations/openai_usage.py
+
+The openai SDK takes about a second to import, so it is imported inside the
+functions that use it rather than at module import.
 """
 
 import base64
+import json
 import os
 import threading
 from datetime import datetime
 
-from openai import APIConnectionError, APIError, APITimeoutError, OpenAI, RateLimitError
-
-from config import get_logger, supports_reasoning
+from config import (
+    OPENAI_BASE_URL,
+    OPENAI_BATCH_MAX_ITEMS,
+    OPENAI_BATCH_MAX_OUTPUT_TOKENS,
+    get_logger,
+    run_parallel,
+    supports_reasoning,
+)
+from integrations.openai_guard import OpenAIUnavailableError, async_guard, guard
+from integrations.openai_usage import track_usage
 from storage.settings import get_configured_openai_model
 
 logger = get_logger("ai")
@@ -38,7 +57,8 @@ def get_openai_client():
     Get configured OpenAI client singleton (thread-safe).
 
     Uses OPENAI_API_KEY from environment and supports dynamic model
-    configuration via config.py.
+    configuration via config.py. OPENAI_BASE_URL points it at another
+    OpenAI-compatible server (e.g. the local stub in tests/benchmarks).
 
     Returns:
         OpenAI: Configured client instance
@@ -46,6 +66,8 @@ def get_openai_client():
     Raises:
         ValueError: If OPENAI_API_KEY environment variable is not set
     """
+    from openai import OpenAI
+
     global _client
 
     # Double-checked locking pattern for thread safety
@@ -57,12 +79,43 @@ def get_openai_client():
                     logger.error("OPENAI_ERROR: OPENAI_API_KEY not found in environment")
                     raise ValueError("OPENAI_API_KEY environment variable not set")
 
-                _client = OpenAI(api_key=api_key)
-                logger.info("OPENAI: Client initialized successfully")
+                _client = OpenAI(api_key=api_key, base_url=OPENAI_BASE_URL or None)
+                logger.info(
+                    "OPENAI: Client initialized successfully"
+                    + (f" (base URL {OPENAI_BASE_URL})" if OPENAI_BASE_URL else "")
+                )
 
     return _client
 
 
+_async_client = None
+
+
+def get_async_openai_client():
+    """
+    Get the AsyncOpenAI client singleton used by the async Socket Mode runtime.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY environment variable is not set
+    """
+    from openai import AsyncOpenAI
+
+    global _async_client
+
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    logger.error("OPENAI_ERROR: OPENAI_API_KEY not found in environment")
+                    raise ValueError("OPENAI_API_KEY environment variable not set")
+
+                _async_client = AsyncOpenAI(api_key=api_key, base_url=OPENAI_BASE_URL or None)
+                logger.info("OPENAI: Async client initialized successfully")
+
+    return _async_client
+
+
 # =============================================================================
 # Responses API Wrapper
 # =============================================================================
@@ -154,38 +207,86 @@ def complete(
     logger.info(f"AI_{context}: Calling Responses API with model={model}")
 
     try:
-        response = client.responses.create(**params)
+        with track_usage(context, "text", model) as call, guard("text"):
+            response = call.response = client.responses.create(**params)
+        return _text_output(response, context)
+    except Exception as e:
+        _log_text_error(e, context)
+        raise
 
-        if hasattr(response, "usage") and response.usage:
-            usage = response.usage
-            logger.info(
-                f"AI_{context}_USAGE: "
-                f"input={getattr(usage, 'input_tokens', 'N/A')}, "
-                f"output={getattr(usage, 'output_tokens', 'N/A')}, "
-                f"total={getattr(usage, 'total_tokens', 'N/A')}"
-            )
 
-        text = response.output_text or ""
-        if not text:
-            logger.warning(
-                f"AI_{context}: Empty output_text — likely reasoning consumed entire budget"
-            )
-        return text
+async def acomplete(
+    messages=None,
+    input_text=None,
+    instructions=None,
+    model=None,
+    max_tokens=None,
+    temperature=None,
+    context=None,
+    reasoning_effort=None,
+):
+    """
+    complete() for coroutines: same parameters, guard and usage accounting, but
+    the request awaits AsyncOpenAI instead of holding a thread.
 
-    except RateLimitError as e:
-        logger.error(f"AI_{context}_ERROR: Rate limit exceeded: {e}")
-        raise
-    except APITimeoutError as e:
-        logger.error(f"AI_{context}_ERROR: API request timed out: {e}")
-        raise
-    except APIConnectionError as e:
-        logger.error(f"AI_{context}_ERROR: Connection failed: {e}")
-        raise
-    except APIError as e:
-        logger.error(f"AI_{context}_ERROR: API error: {e}")
+    Returns:
+        str: The generated text response
+
+    Raises:
+        Exception: If API call fails
+    """
+    client = get_async_openai_client()
+    model = model or get_configured_openai_model()
+    context = context or "COMPLETION"
+
+    params = _build_api_params(
+        messages, input_text, instructions, model, max_tokens, temperature, reasoning_effort
+    )
+
+    logger.info(f"AI_{context}: Calling Responses API (async) with model={model}")
+
+    try:
+        with track_usage(context, "text", model) as call:
+            async with async_guard("text"):
+                response = call.response = await client.responses.create(**params)
+        return _text_output(response, context)
+    except Exception as e:
+        _log_text_error(e, context)
         raise
 
 
+def _text_output(response, context):
+    """Log token usage and return the response text."""
+    if hasattr(response, "usage") and response.usage:
+        usage = response.usage
+        logger.info(
+            f"AI_{context}_USAGE: "
+            f"input={getattr(usage, 'input_tokens', 'N/A')}, "
+            f"output={getattr(usage, 'output_tokens', 'N/A')}, "
+            f"total={getattr(usage, 'total_tokens', 'N/A')}"
+        )
+
+    text = response.output_text or ""
+    if not text:
+        logger.warning(f"AI_{context}: Empty output_text — likely reasoning consumed entire budget")
+    return text
+
+
+def _log_text_error(error, context):
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+
+    if isinstance(error, OpenAIUnavailableError):
+        logger.warning(f"AI_{context}_SKIPPED: {error}")
+    elif isinstance(error, RateLimitError):
+        logger.error(f"AI_{context}_ERROR: Rate limit exceeded: {error}")
+    elif isinstance(error, APITimeoutError):
+        logger.error(f"AI_{context}_ERROR: API request timed out: {error}")
+    elif isinstance(error, APIConnectionError):
+        logger.error(f"AI_{context}_ERROR: Connection failed: {error}")
+    elif isinstance(error, APIError):
+        logger.error(f"AI_{context}_ERROR: API error: {error}")
+
+
 def complete_with_usage(
     messages=None,
     input_text=None,
@@ -216,7 +317,8 @@ def complete_with_usage(
 
     logger.info(f"AI_{context}: Calling Responses API with model={model}")
 
-    response = client.responses.create(**params)
+    with track_usage(context, "text", model) as call, guard("text"):
+        response = call.response = client.responses.create(**params)
 
     usage_dict = {}
     if hasattr(response, "usage") and response.usage:
@@ -239,11 +341,222 @@ def complete_with_usage(
     return text, usage_dict
 
 
+# =============================================================================
+# Structured Output and Batching
+# =============================================================================
+
+
+def complete_structured(
+    schema,
+    schema_name="result",
+    messages=None,
+    input_text=None,
+    instructions=None,
+    model=None,
+    max_tokens=None,
+    temperature=None,
+    context=None,
+    reasoning_effort=None,
+):
+    """
+    Generate a completion constrained to a JSON schema and return the parsed object.
+
+    Args:
+        schema: JSON schema (strict mode: every property required, no additionalProperties)
+        schema_name: Schema name reported to the API
+        Other args: Same as complete()
+
+    Returns:
+        dict: Parsed JSON response
+
+    Raises:
+        ValueError: If the response is empty or not valid JSON
+        Exception: API errors propagate as in complete()
+    """
+    from openai import APIError
+
+    client = get_openai_client()
+    model = model or get_configured_openai_model()
+    context = context or "STRUCTURED"
+
+    params = _build_api_params(
+        messages, input_text, instructions, model, max_tokens, temperature, reasoning_effort
+    )
+    params["text"] = {
+        "format": {"type": "json_schema", "name": schema_name, "schema": schema, "strict": True}
+    }
+
+    logger.info(f"AI_{context}: Calling Responses API (structured) with model={model}")
+
+    try:
+        with track_usage(context, "text", model) as call, guard("text"):
+            response = call.response = client.responses.create(**params)
+    except OpenAIUnavailableError as e:
+        logger.warning(f"AI_{context}_SKIPPED: {e}")
+        raise
+    except APIError as e:
+        logger.error(f"AI_{context}_ERROR: API error: {e}")
+        raise
+
+    if hasattr(response, "usage") and response.usage:
+        usage = response.usage
+        logger.info(
+            f"AI_{context}_USAGE: "
+            f"input={getattr(usage, 'input_tokens', 'N/A')}, "
+            f"output={getattr(usage, 'output_tokens', 'N/A')}, "
+            f"total={getattr(usage, 'total_tokens', 'N/A')}"
+        )
+
+    text = response.output_text or ""
+    if not text:
+        raise ValueError("Empty output_text — likely reasoning consumed entire budget")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Response is not valid JSON: {e}") from e
+
+
+def _batch_schema(item_ids, fields):
+    """JSON schema for {"results": [{"id": <item id>, <field>: str, ...}, ...]}."""
+    properties = {"id": {"type": "string", "enum": list(item_ids)}}
+    properties.update({field: {"type": "string"} for field in fields})
+    return {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": ["id", *fields],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    }
+
+
+def complete_batch(
+    items,
+    fields,
+    instructions,
+    task,
+    fallback,
+    max_tokens_per_item,
+    shared_context=None,
+    validate=None,
+    model=None,
+    temperature=None,
+    context=None,
+    reasoning_effort=None,
+):
+    """
+    Generate results for many items with as few requests as possible.
+
+    Items are packed (up to OPENAI_BATCH_MAX_ITEMS per request, bounded by
+    OPENAI_BATCH_MAX_OUTPUT_TOKENS) into one structured-output call that returns
+    one object per item ID. Results are split and validated per item; only items
+    that are missing, invalid, or in a failed request go through fallback(item_id).
+
+    Args:
+        items: Dict mapping item ID (str) to that item's prompt text
+        fields: Tuple of string fields each item result must contain
+        instructions: System instructions shared by all items
+        task: Shared task description placed before the items
+        fallback: Callable(item_id) -> dict or None, used for failed items
+        max_tokens_per_item: Output token budget per item
+        shared_context: Optional context that applies to every item (sent once)
+        validate: Optional callable(item_id, result_dict) -> bool for extra checks
+        model, temperature, context, reasoning_effort: As in complete()
+
+    Returns:
+        dict: {item_id: result dict (or fallback result)}
+    """
+    context = context or "BATCH"
+    item_ids = list(items)
+    per_call = max(
+        1,
+        min(OPENAI_BATCH_MAX_ITEMS, OPENAI_BATCH_MAX_OUTPUT_TOKENS // max(1, max_tokens_per_item)),
+    )
+
+    results = {}
+    for start in range(0, len(item_ids), per_call):
+        chunk = item_ids[start : start + per_call]
+        sections = [f"### ITEM id={item_id}\n{items[item_id]}" for item_id in chunk]
+        prompt = (
+            f"{task}\n\n"
+            f"Return a JSON object with a `results` array containing exactly one entry per "
+            f"item below, using the item's id. Each item is independent - follow its own "
+            f"requirements.\n\n"
+        )
+        if shared_context:
+            prompt += f"SHARED CONTEXT (applies to every item):\n{shared_context}\n\n"
+        prompt += "\n\n".join(sections)
+
+        try:
+            data = complete_structured(
+                _batch_schema(chunk, fields),
+                schema_name=f"{context.lower()}_batch",
+                messages=[
+                    {"role": "system", "content": instructions},
+                    {"role": "user", "content": prompt},
+                ],
+                model=model,
+                max_tokens=max_tokens_per_item * len(chunk),
+                temperature=temperature,
+                context=context,
+                reasoning_effort=reasoning_effort,
+            )
+            entries = data.get("results", []) if isinstance(data, dict) else []
+        except Exception as e:
+            logger.warning(
+                f"AI_{context}: Batch of {len(chunk)} failed, falling back per item: {e}"
+            )
+            entries = []
+
+        for entry in entries:
+            item_id = entry.get("id") if isinstance(entry, dict) else None
+            if item_id not in chunk or item_id in results:
+                continue
+            if not all(isinstance(entry.get(f), str) and entry[f].strip() for f in fields):
+                continue
+            result = {f: entry[f].strip() for f in fields}
+            if validate and not validate(item_id, result):
+                continue
+            results[item_id] = result
+
+    failed = [item_id for item_id in item_ids if item_id not in results]
+    logger.info(
+        f"AI_{context}: {len(item_ids) - len(failed)}/{len(item_ids)} item(s) from "
+        f"{-(-len(item_ids) // per_call)} batched call(s)"
+        + (f", {len(failed)} falling back individually" if failed else "")
+    )
+    if failed:
+        results.update(run_parallel(fallback, failed))
+
+    return results
+
+
 # =============================================================================
 # Vision API Wrapper
 # =============================================================================
 
 
+def _image_data_url(image_path):
+    """Read an image file and return it as a base64 data URL."""
+    with open(image_path, "rb") as f:
+        image_data = base64.b64encode(f.read()).decode("utf-8")
+
+    # Determine image type from extension
+    ext = image_path.lower().split(".")[-1]
+    mime_type = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg"}.get(
+        ext, "image/png"
+    )
+    return f"data:{mime_type};base64,{image_data}"
+
+
 def analyze_image(
     image_path: str,
     prompt: str,
@@ -265,41 +578,36 @@ def analyze_image(
     Returns:
         str: The analysis result text, or None if analysis fails
     """
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+
     client = get_openai_client()
     model = get_configured_openai_model()
 
     try:
-        # Read and encode image to base64
-        with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
-
-        # Determine image type from extension
-        ext = image_path.lower().split(".")[-1]
-        mime_type = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg"}.get(
-            ext, "image/png"
-        )
+        image_url = _image_data_url(image_path)
 
         logger.info(f"AI_{context}: Calling Responses API with vision, model={model}")
 
         # Use Responses API with multimodal input
         # Format verified from OpenAI docs: input_image with base64 image_url
-        response = client.responses.create(
-            model=model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": prompt},
-                        {
-                            "type": "input_image",
-                            "image_url": f"data:{mime_type};base64,{image_data}",
-                            "detail": "low",  # 512x512, 85 tokens - efficient for analysis
-                        },
-                    ],
-                }
-            ],
-            max_output_tokens=max_tokens,
-        )
+        with track_usage(context, "vision", model) as call, guard("vision"):
+            response = call.response = client.responses.create(
+                model=model,
+                input=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "input_text", "text": prompt},
+                            {
+                                "type": "input_image",
+                                "image_url": image_url,
+                                "detail": "low",  # 512x512, 85 tokens - efficient for analysis
+                            },
+                        ],
+                    }
+                ],
+                max_output_tokens=max_tokens,
+            )
 
         # Log usage
         if hasattr(response, "usage") and response.usage:
@@ -315,6 +623,9 @@ def analyze_image(
     except FileNotFoundError:
         logger.error(f"AI_{context}_ERROR: Image file not found: {image_path}")
         return None
+    except OpenAIUnavailableError as e:
+        logger.warning(f"AI_{context}_SKIPPED: {e}")
+        return None
     except RateLimitError as e:
         logger.error(f"AI_{context}_ERROR: Rate limit exceeded: {e}")
         return None
@@ -332,6 +643,94 @@ def analyze_image(
         return None
 
 
+def analyze_images(
+    image_paths: dict,
+    prompt: str,
+    max_tokens_per_image: int = 100,
+    context: str = "IMAGE_ANALYSIS",
+) -> dict:
+    """
+    Analyze several images in one vision request with a JSON schema response.
+
+    Each image is labelled with its ID and the model returns one description per
+    ID. Images missing from the response are simply absent from the result, so
+    callers can fall back to analyze_image() for those only.
+
+    Args:
+        image_paths: Dict mapping image ID (str) to image file path
+        prompt: Analysis instructions applied to every image
+        max_tokens_per_image: Output token budget per image
+        context: Optional context string for logging
+
+    Returns:
+        dict: {image_id: analysis text} for images analyzed successfully
+    """
+    if not image_paths:
+        return {}
+
+    client = get_openai_client()
+    model = get_configured_openai_model()
+
+    try:
+        content = [
+            {
+                "type": "input_text",
+                "text": (
+                    f"{prompt}\n\nThere are {len(image_paths)} images, each preceded by its id. "
+                    f"Return one result per image id."
+                ),
+            }
+        ]
+        for image_id, image_path in image_paths.items():
+            content.append({"type": "input_text", "text": f"Image id={image_id}:"})
+            content.append(
+                {"type": "input_image", "image_url": _image_data_url(image_path), "detail": "low"}
+            )
+
+        logger.info(
+            f"AI_{context}: Calling Responses API with vision for {len(image_paths)} images, "
+            f"model={model}"
+        )
+
+        with track_usage(context, "vision", model) as call, guard("vision"):
+            response = call.response = client.responses.create(
+                model=model,
+                input=[{"role": "user", "content": content}],
+                max_output_tokens=max_tokens_per_image * len(image_paths),
+                text={
+                    "format": {
+                        "type": "json_schema",
+                        "name": "image_analysis_batch",
+                        "schema": _batch_schema(list(image_paths), ("description",)),
+                        "strict": True,
+                    }
+                },
+            )
+
+        if hasattr(response, "usage") and response.usage:
+            usage = response.usage
+            logger.info(
+                f"AI_{context}_USAGE: "
+                f"input={getattr(usage, 'input_tokens', 'N/A')}, "
+                f"output={getattr(usage, 'output_tokens', 'N/A')}"
+            )
+
+        entries = json.loads(response.output_text or "{}").get("results", [])
+        results = {}
+        for entry in entries:
+            if entry.get("id") in image_paths and (entry.get("description") or "").strip():
+                results.setdefault(entry["id"], entry["description"].strip())
+        logger.info(f"AI_{context}: Batched analysis returned {len(results)}/{len(image_paths)}")
+        return results
+
+    except OpenAIUnavailableError as e:
+        logger.warning(f"AI_{context}_SKIPPED: {e}")
+        return {}
+    except Exception as e:
+        logger.error(f"AI_{context}_ERROR: Batched image analysis failed: {e}")
+        return {}
+
+
 # =============================================================================
 # Usage Logging Functions
 # =============================================================================
@@ -0,0 +1,397 @@
+"""
+Client-side traffic control for all OpenAI calls.
+
+Every OpenAI request (text, image, vision, web search) runs inside guard(),
+which applies two shared per-operation controls:
+
+- Circuit breaker: after OPENAI_CIRCUIT_FAILURE_THRESHOLD consecutive transient
+  failures (429, timeout, connection, 5xx) the circuit opens and calls fail fast
+  with OpenAIUnavailableError for OPENAI_CIRCUIT_COOLDOWN_SECONDS, then a single
+  half-open probe decides whether to close it again.
+- AIMD concurrency limit: in-flight requests are capped by an adaptive limit that
+  grows by ~1 per window of successful fast calls and halves on 429s or calls
+  slower than OPENAI_LATENCY_TARGETS, so worker pools stop piling on a struggling API.
+
+Latency and rejections are recorded in utils/metrics (openai_request_seconds,
+openai_rejected_total), and each request inside a celebration trace becomes an
+"openai.<operation>" span (utils/tracing).
+
+Callers already fall back on any exception (BACKUP_MESSAGES, profile-photo
+images, static titles); OpenAIUnavailableError just makes that fallback immediate.
+
+Key functions: guard(), async_guard(), is_available(), get_traffic_status()
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+from config import (
+    OPENAI_CIRCUIT_COOLDOWN_SECONDS,
+    OPENAI_CIRCUIT_FAILURE_THRESHOLD,
+    OPENAI_CONCURRENCY_MAX,
+    OPENAI_LATENCY_TARGETS,
+    OPENAI_SLOT_WAIT_SECONDS,
+    get_logger,
+)
+from utils.metrics import inc, observe
+from utils.tracing import SPAN_KIND_CLIENT, span
+
+logger = get_logger("openai")
+
+# Minimum seconds between two multiplicative decreases (one burst of 429s = one cut)
+_DECREASE_COOLDOWN_SECONDS = 2.0
+
+
+class OpenAIUnavailableError(Exception):
+    """Raised instead of calling OpenAI when the circuit is open or no slot frees up."""
+
+    def __init__(self, operation, reason):
+        super().__init__(f"OpenAI {operation} unavailable: {reason}")
+        self.operation = operation
+        self.reason = reason
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, operation, failure_threshold, cooldown_seconds):
+        self.operation = operation
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.open_count = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a request may proceed (claims the probe when half-open)."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+                logger.info(f"OPENAI_GUARD: {self.operation} circuit half-open, probing")
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def is_open(self):
+        """Non-mutating check used to skip expensive preparation work."""
+        with self._lock:
+            return (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at < self.cooldown_seconds
+            )
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"OPENAI_GUARD: {self.operation} circuit closed after probe success")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            should_open = (
+                self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold
+            )
+            if not should_open or self.state == self.OPEN:
+                return False
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.open_count += 1
+        logger.error(
+            f"OPENAI_GUARD: {self.operation} circuit OPEN for {self.cooldown_seconds}s "
+            f"after {self.consecutive_failures} consecutive failures (last: {error})"
+        )
+        return True
+
+    def release_probe(self):
+        """Free the half-open probe after a call that was neither success nor failure."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "open_count": self.open_count,
+            }
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit: additive increase on fast success, halve on overload."""
+
+    def __init__(self, operation, max_limit, latency_target):
+        self.operation = operation
+        self.max_limit = max(1, max_limit)
+        self.latency_target = latency_target
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.rate_limited = 0
+        self.slow_calls = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout):
+        """Wait for an in-flight slot. Returns False if none frees up within timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self.in_flight += 1
+            return True
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def on_success(self, latency):
+        with self._cond:
+            if latency > self.latency_target:
+                self.slow_calls += 1
+                self._decrease(f"latency {latency:.1f}s > {self.latency_target}s")
+            elif self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+                self._cond.notify_all()
+
+    def on_overload(self, reason):
+        with self._cond:
+            self.rate_limited += 1
+            self._decrease(reason)
+
+    def _decrease(self, reason):
+        now = time.monotonic()
+        if now - self._last_decrease < _DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(1.0, self.limit / 2)
+        if int(previous) != int(self.limit):
+            logger.warning(
+                f"OPENAI_GUARD: {self.operation} concurrency limit {int(previous)} -> "
+                f"{int(self.limit)} ({reason})"
+            )
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "max_limit": self.max_limit,
+                "in_flight": self.in_flight,
+                "rate_limited": self.rate_limited,
+                "slow_calls": self.slow_calls,
+            }
+
+
+_registry_lock = threading.Lock()
+_breakers = {}
+_limiters = {}
+
+
+def _get_controls(operation):
+    """Get (breaker, limiter) for an operation, creating them on first use."""
+    with _registry_lock:
+        if operation not in _breakers:
+            _breakers[operation] = CircuitBreaker(
+                operation, OPENAI_CIRCUIT_FAILURE_THRESHOLD, OPENAI_CIRCUIT_COOLDOWN_SECONDS
+            )
+            _limiters[operation] = AdaptiveLimiter(
+                operation,
+                OPENAI_CONCURRENCY_MAX,
+                OPENAI_LATENCY_TARGETS.get(operation, OPENAI_LATENCY_TARGETS["text"]),
+            )
+        return _breakers[operation], _limiters[operation]
+
+
+def _is_transient(error):
+    """Errors that indicate OpenAI itself is struggling (vs. a bad request)."""
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+    return isinstance(
+        error, (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    )
+
+
+def _admit(operation):
+    """Check the breaker; returns (breaker, limiter) or raises OpenAIUnavailableError."""
+    breaker, limiter = _get_controls(operation)
+    if not breaker.allow():
+        inc("openai_rejected_total", operation=operation, reason="circuit_open")
+        raise OpenAIUnavailableError(operation, "circuit open")
+    return breaker, limiter
+
+
+def _no_slot(operation, breaker):
+    breaker.release_probe()
+    inc("openai_rejected_total", operation=operation, reason="no_slot")
+    return OpenAIUnavailableError(
+        operation, f"no concurrency slot within {OPENAI_SLOT_WAIT_SECONDS}s"
+    )
+
+
+def _record_failure(operation, breaker, limiter, error, latency):
+    observe("openai_request_seconds", latency, operation=operation, outcome="error")
+    if _is_transient(error):
+        from openai import APITimeoutError, RateLimitError
+
+        if isinstance(error, (RateLimitError, APITimeoutError)):
+            limiter.on_overload(type(error).__name__)
+        if breaker.record_failure(error):
+            from slack.canvas import safe_record_warning
+
+            safe_record_warning(f"OpenAI {operation} circuit opened: {type(error).__name__}")
+    else:
+        breaker.release_probe()
+
+
+def _record_success(operation, breaker, limiter, latency):
+    observe("openai_request_seconds", latency, operation=operation, outcome="ok")
+    breaker.record_success()
+    limiter.on_success(latency)
+
+
+async def _acquire_slot(limiter):
+    """
+    Take a limiter slot for async_guard, waiting on a thread only when none is free.
+
+    The waiting thread cannot be interrupted, so if the awaiting coroutine is
+    cancelled, whichever side finishes last gives back a slot the thread won.
+    """
+    if limiter.acquire(0):
+        return True
+    lock = threading.Lock()
+    handoff = {"abandoned": False, "acquired": False}
+
+    def wait():
+        acquired = limiter.acquire(OPENAI_SLOT_WAIT_SECONDS)
+        with lock:
+            if acquired and handoff["abandoned"]:
+                limiter.release()
+                return False
+            handoff["acquired"] = acquired
+        return acquired
+
+    try:
+        return await asyncio.to_thread(wait)
+    except asyncio.CancelledError:
+        with lock:
+            handoff["abandoned"] = True
+            if handoff["acquired"]:
+                limiter.release()
+        raise
+
+
+@contextmanager
+def guard(operation):
+    """
+    Run one OpenAI request under the operation's circuit breaker and concurrency limit.
+
+    Usage:
+        with guard("text"):
+            response = client.responses.create(**params)
+
+    Raises:
+        OpenAIUnavailableError: Circuit open, or no slot within OPENAI_SLOT_WAIT_SECONDS
+    """
+    breaker, limiter = _admit(operation)
+    if not limiter.acquire(OPENAI_SLOT_WAIT_SECONDS):
+        raise _no_slot(operation, breaker)
+
+    started = time.monotonic()
+    try:
+        with span(f"openai.{operation}", kind=SPAN_KIND_CLIENT):
+            yield
+    except Exception as e:
+        _record_failure(operation, breaker, limiter, e, time.monotonic() - started)
+        raise
+    except BaseException:
+        # Cancelled or interrupted: neither an OpenAI success nor a failure
+        breaker.release_probe()
+        raise
+    else:
+        _record_success(operation, breaker, limiter, time.monotonic() - started)
+    finally:
+        limiter.release()
+
+
+@asynccontextmanager
+async def async_guard(operation):
+    """
+    guard() for coroutines (AsyncOpenAI calls), sharing the same breaker and limit.
+
+    A free slot is taken without blocking the event loop; only when the limit is
+    reached does the wait move to a thread.
+    """
+    breaker, limiter = _admit(operation)
+    try:
+        acquired = await _acquire_slot(limiter)
+    except BaseException:
+        breaker.release_probe()
+        raise
+    if not acquired:
+        raise _no_slot(operation, breaker)
+
+    started = time.monotonic()
+    try:
+        with span(f"openai.{operation}", kind=SPAN_KIND_CLIENT):
+            yield
+    except Exception as e:
+        _record_failure(operation, breaker, limiter, e, time.monotonic() - started)
+        raise
+    except BaseException:
+        # Cancelled or interrupted: neither an OpenAI success nor a failure
+        breaker.release_probe()
+        raise
+    else:
+        _record_success(operation, breaker, limiter, time.monotonic() - started)
+    finally:
+        limiter.release()
+
+
+def is_available(operation):
+    """False while the operation's circuit is open (lets callers skip prep work)."""
+    breaker, _ = _get_controls(operation)
+    return not breaker.is_open()
+
+
+def get_traffic_status():
+    """
+    Snapshot of breaker and limiter state for every operation used so far.
+
+    Returns:
+        dict: {operation: {"state", "consecutive_failures", "open_count", "limit", ...}}
+    """
+    with _registry_lock:
+        operations = list(_breakers)
+    status = {}
+    for operation in operations:
+        breaker, limiter = _get_controls(operation)
+        status[operation] = {**breaker.snapshot(), **limiter.snapshot()}
+    return status
+
+
+def reset_traffic_control():
+    """Drop all breaker and limiter state (used by tests and admin resets)."""
+    with _registry_lock:
+        _breakers.clear()
+        _limiters.clear()
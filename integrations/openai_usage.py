@@ -0,0 +1,341 @@
+"""
+In-process usage ledger for OpenAI calls.
+
+Every OpenAI request runs inside track_usage(context, operation), which records
+per operation context (BIRTHDAY_MESSAGE, IMAGE_TITLE_GEN, WEB_SEARCH_QUERY, ...):
+call and error counts, input/output tokens, generated images, estimated cost
+(OPENAI_PRICING_PER_MILLION) and a latency histogram (OPENAI_USAGE_LATENCY_BUCKETS).
+
+Counters accumulate in memory and are merged into daily rollups in
+OPENAI_USAGE_FILE at most every OPENAI_USAGE_FLUSH_SECONDS (and on each canvas
+refresh), keeping OPENAI_USAGE_RETENTION_DAYS days of history.
+
+Key functions: track_usage(), record_call(), flush_usage(), get_usage_summary()
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from config import (
+    OPENAI_PRICING_PER_MILLION,
+    OPENAI_USAGE_FILE,
+    OPENAI_USAGE_FLUSH_SECONDS,
+    OPENAI_USAGE_LATENCY_BUCKETS,
+    OPENAI_USAGE_RETENTION_DAYS,
+    get_logger,
+)
+from integrations.openai_guard import OpenAIUnavailableError
+from utils.locks import file_lock
+
+logger = get_logger("openai")
+
+OPENAI_USAGE_LOCK_FILE = OPENAI_USAGE_FILE + ".lock"
+
+_lock = threading.Lock()
+_pending = {}  # {date: {context: stats}} not yet persisted
+_last_flush = time.monotonic()
+
+
+def _empty_stats(operation):
+    return {
+        "operation": operation,
+        "calls": 0,
+        "errors": 0,
+        "skipped": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "images": 0,
+        "cost_usd": 0.0,
+        "latency_total": 0.0,
+        "latency_max": 0.0,
+        "latency_buckets": [0] * (len(OPENAI_USAGE_LATENCY_BUCKETS) + 1),
+        "models": {},
+    }
+
+
+def _merge_stats(into, stats):
+    """Add one stats dict into another (in place)."""
+    for key in ("calls", "errors", "skipped", "input_tokens", "output_tokens", "images"):
+        into[key] += stats.get(key, 0)
+    into["cost_usd"] = round(into["cost_usd"] + stats.get("cost_usd", 0.0), 6)
+    into["latency_total"] = round(into["latency_total"] + stats.get("latency_total", 0.0), 3)
+    into["latency_max"] = max(into["latency_max"], stats.get("latency_max", 0.0))
+    buckets = stats.get("latency_buckets") or []
+    if len(buckets) == len(into["latency_buckets"]):
+        into["latency_buckets"] = [a + b for a, b in zip(into["latency_buckets"], buckets)]
+    for model, count in stats.get("models", {}).items():
+        into["models"][model] = into["models"].get(model, 0) + count
+
+
+def _merge_days(into, days):
+    """Merge {date: {context: stats}} into another mapping of the same shape."""
+    for date, contexts in days.items():
+        day = into.setdefault(date, {})
+        for context, stats in contexts.items():
+            if context not in day:
+                day[context] = _empty_stats(stats.get("operation", "text"))
+            _merge_stats(day[context], stats)
+
+
+def _today():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def estimate_cost(model, input_tokens, output_tokens):
+    """
+    Estimate USD cost from OPENAI_PRICING_PER_MILLION (longest model-name prefix match).
+
+    Returns:
+        float: Estimated cost, 0.0 for models without a price entry
+    """
+    if not model:
+        return 0.0
+    matches = [prefix for prefix in OPENAI_PRICING_PER_MILLION if model.startswith(prefix)]
+    if not matches:
+        return 0.0
+    input_price, output_price = OPENAI_PRICING_PER_MILLION[max(matches, key=len)]
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def _as_int(value):
+    return value if isinstance(value, int) else 0
+
+
+def _response_counts(response, operation):
+    """Extract (input_tokens, output_tokens, images) from any OpenAI response object."""
+    usage = getattr(response, "usage", None)
+    input_tokens = output_tokens = images = 0
+    if usage is not None:
+        input_tokens = _as_int(getattr(usage, "input_tokens", None)) or _as_int(
+            getattr(usage, "prompt_tokens", None)
+        )
+        output_tokens = _as_int(getattr(usage, "output_tokens", None)) or _as_int(
+            getattr(usage, "completion_tokens", None)
+        )
+    if operation == "image":
+        data = getattr(response, "data", None)
+        images = len(data) if isinstance(data, list) else 0
+    return input_tokens, output_tokens, images
+
+
+def record_call(
+    context,
+    operation,
+    latency=None,
+    model=None,
+    input_tokens=0,
+    output_tokens=0,
+    images=0,
+    error=None,
+):
+    """
+    Record one OpenAI call in the ledger.
+
+    Args:
+        context: Operation context (e.g. "BIRTHDAY_MESSAGE")
+        operation: Guard operation ("text", "vision", "image", "web_search")
+        latency: Seconds spent in the request (None for calls that never ran)
+        model: Model used, for cost estimation and the per-model breakdown
+        input_tokens, output_tokens: Token counts from the response
+        images: Number of images generated
+        error: Exception raised by the call, if any
+    """
+    global _last_flush
+
+    stats = _empty_stats(operation)
+    if isinstance(error, OpenAIUnavailableError):
+        stats["skipped"] = 1
+    else:
+        stats["calls"] = 1
+        stats["errors"] = 1 if error is not None else 0
+        stats["input_tokens"] = input_tokens
+        stats["output_tokens"] = output_tokens
+        stats["images"] = images
+        stats["cost_usd"] = estimate_cost(model, input_tokens, output_tokens)
+        if model:
+            stats["models"][model] = 1
+    if latency is not None and not stats["skipped"]:
+        stats["latency_total"] = latency
+        stats["latency_max"] = latency
+        bucket = sum(1 for bound in OPENAI_USAGE_LATENCY_BUCKETS if latency > bound)
+        stats["latency_buckets"][bucket] = 1
+
+    with _lock:
+        _merge_days(_pending, {_today(): {context: stats}})
+        due = time.monotonic() - _last_flush >= OPENAI_USAGE_FLUSH_SECONDS
+        if due:
+            _last_flush = time.monotonic()
+    if due:
+        flush_usage()
+
+
+class _CallRecord:
+    """Handle yielded by track_usage(); set .response once the API call returns."""
+
+    __slots__ = ("response", "model")
+
+    def __init__(self, model):
+        self.response = None
+        self.model = model
+
+
+@contextmanager
+def track_usage(context, operation, model=None):
+    """
+    Time one OpenAI request and record its usage when the block exits.
+
+    Usage:
+        with track_usage(context, "text", model) as call, guard("text"):
+            call.response = client.responses.create(**params)
+
+    Exceptions propagate unchanged; OpenAIUnavailableError counts as skipped.
+    """
+    call = _CallRecord(model)
+    started = time.monotonic()
+    error = None
+    try:
+        yield call
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        try:
+            input_tokens, output_tokens, images = _response_counts(call.response, operation)
+            record_call(
+                context,
+                operation,
+                latency=time.monotonic() - started,
+                model=call.model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                images=images,
+                error=error,
+            )
+        except Exception as e:
+            logger.warning(f"OPENAI_USAGE: Failed to record {context} call: {e}")
+
+
+def _load_usage_file():
+    if not os.path.exists(OPENAI_USAGE_FILE):
+        return {"days": {}}
+    with open(OPENAI_USAGE_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.setdefault("days", {})
+    return data
+
+
+def flush_usage():
+    """
+    Merge in-memory counters into the daily rollups file and prune old days.
+
+    Returns:
+        bool: True if the rollups were saved (or nothing was pending)
+    """
+    global _last_flush
+
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    if not pending:
+        return True
+
+    try:
+        with file_lock(OPENAI_USAGE_LOCK_FILE):
+            data = _load_usage_file()
+            _merge_days(data["days"], pending)
+            cutoff = (
+                datetime.now(timezone.utc) - timedelta(days=OPENAI_USAGE_RETENTION_DAYS)
+            ).strftime("%Y-%m-%d")
+            data["days"] = {date: v for date, v in data["days"].items() if date >= cutoff}
+            data["last_saved"] = datetime.now(timezone.utc).isoformat()
+
+            tmp = OPENAI_USAGE_FILE + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp, OPENAI_USAGE_FILE)
+        logger.debug(f"OPENAI_USAGE: Flushed rollups for {', '.join(sorted(pending))}")
+        return True
+    except Exception as e:
+        logger.error(f"OPENAI_USAGE: Failed to save usage rollups: {e}")
+        with _lock:
+            _merge_days(_pending, pending)
+        return False
+
+
+def get_daily_usage(days=7):
+    """
+    Daily rollups (persisted + not yet flushed) for the most recent days.
+
+    Args:
+        days: Number of UTC days to include, counting today
+
+    Returns:
+        dict: {date "YYYY-MM-DD": {context: stats}}
+    """
+    try:
+        with file_lock(OPENAI_USAGE_LOCK_FILE):
+            persisted = _load_usage_file()["days"]
+    except Exception as e:
+        logger.warning(f"OPENAI_USAGE: Failed to load usage rollups: {e}")
+        persisted = {}
+
+    result = {}
+    _merge_days(result, persisted)
+    with _lock:
+        _merge_days(result, copy.deepcopy(_pending))
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    return {date: v for date, v in sorted(result.items()) if date >= cutoff}
+
+
+def get_usage_summary(days=1):
+    """
+    Per-context totals across the most recent days.
+
+    Returns:
+        dict: {context: stats} with calls, errors, skipped, tokens, images,
+              cost_usd, latency_total, latency_max, latency_buckets, models
+    """
+    summary = {}
+    for contexts in get_daily_usage(days).values():
+        for context, stats in contexts.items():
+            if context not in summary:
+                summary[context] = _empty_stats(stats.get("operation", "text"))
+            _merge_stats(summary[context], stats)
+    return summary
+
+
+def latency_percentile(stats, quantile):
+    """
+    Approximate latency percentile from histogram buckets (bucket upper bound).
+
+    Returns:
+        float or None: Seconds (latency_max for the open-ended bucket), None if no calls
+    """
+    buckets = stats.get("latency_buckets") or []
+    total = sum(buckets)
+    if not total:
+        return None
+    target = quantile * total
+    seen = 0
+    for i, count in enumerate(buckets):
+        seen += count
+        if seen >= target:
+            if i < len(OPENAI_USAGE_LATENCY_BUCKETS):
+                return min(float(OPENAI_USAGE_LATENCY_BUCKETS[i]), stats.get("latency_max", 0.0))
+            return stats.get("latency_max", 0.0)
+    return stats.get("latency_max", 0.0)
+
+
+def reset_usage():
+    """Drop in-memory counters (used by tests)."""
+    global _last_flush
+    with _lock:
+        _pending.clear()
+        _last_flush = time.monotonic()
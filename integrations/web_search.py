@@ -9,23 +9,27 @@ Key functions: get_birthday_facts(), process_facts_for_personality().
 
 import json
 import os
+import sqlite3
+import threading
+from contextlib import closing
 from datetime import datetime
 
-from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
-
 from config import (
     CACHE_DIR,
-    CLEANUP_LOG_FILE,
     DATE_FORMAT,
     DEFAULT_IMAGE_PERSONALITY,
     DEFAULT_OPENAI_MODEL,
+    FACTS_CACHE_FILE,
     REASONING_EFFORT,
     TEMPERATURE_SETTINGS,
+    TIMEOUTS,
     TOKEN_LIMITS,
     WEB_SEARCH_CACHE_ENABLED,
     get_logger,
 )
 from integrations.openai import complete, get_openai_client, log_web_search_usage
+from integrations.openai_guard import OpenAIUnavailableError, guard
+from integrations.openai_usage import track_usage
 
 logger = get_logger("web_search")
 
@@ -53,6 +57,8 @@ def process_facts_for_personality(facts_text, formatted_date, personality):
     Returns:
         Processed facts paragraph
     """
+    from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+
     try:
         system_content = ""
         user_content = ""
@@ -100,12 +106,183 @@ def process_facts_for_personality(facts_text, formatted_date, personality):
         )
         return processed_facts
 
-    except (APIError, APIConnectionError, RateLimitError, APITimeoutError) as e:
+    except (
+        APIError,
+        APIConnectionError,
+        RateLimitError,
+        APITimeoutError,
+        OpenAIUnavailableError,
+    ) as e:
         logger.error(f"WEB_SEARCH_ERROR: Failed to process facts for {personality}: {e}")
         # Return a simplified version of the original text if processing fails
         return f"On this day, {formatted_date}, several notable events occurred in history and remarkable individuals were born."
 
 
+# =============================================================================
+# Facts Cache (single SQLite file, one table per year)
+# =============================================================================
+
+# Each year is its own partition table (facts_YYYY) keyed by (date, personality),
+# so a lookup is a primary-key read and expiring a year is a single DROP TABLE.
+# Replaces the old per-date facts_DD_MM_personality_YYYY.json files.
+_FACTS_TABLE_PREFIX = "facts_"
+_LEGACY_CLEANUP_LOG_FILE = os.path.join(CACHE_DIR, "cleanup_log.json")
+
+_facts_db_lock = threading.Lock()
+_facts_db_ready = False
+_facts_partition_year = None  # Year whose partition is known to exist (per process)
+
+
+def _facts_table(year):
+    """Partition table name for a given year."""
+    return f"{_FACTS_TABLE_PREFIX}{int(year)}"
+
+
+def _connect_facts_db():
+    """Open a connection to the facts cache (SQLite handles cross-process locking)."""
+    return sqlite3.connect(FACTS_CACHE_FILE, timeout=TIMEOUTS["file_lock"])
+
+
+def _list_facts_partitions(conn):
+    """Return {year: table_name} for every partition in the cache."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ?",
+        (f"{_FACTS_TABLE_PREFIX}%",),
+    ).fetchall()
+    partitions = {}
+    for (name,) in rows:
+        try:
+            partitions[int(name[len(_FACTS_TABLE_PREFIX) :])] = name
+        except ValueError:
+            continue
+    return partitions
+
+
+def _ensure_facts_partition(conn, year):
+    """
+    Create the partition for `year` if needed and drop partitions from earlier years.
+
+    Runs once per process per year, so the year rollover is the only time
+    expiry work happens - never on an ordinary cache lookup.
+    """
+    global _facts_partition_year
+    if _facts_partition_year == year:
+        return
+
+    table = _facts_table(year)
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table} ("
+        "date TEXT NOT NULL, personality TEXT NOT NULL, data TEXT NOT NULL, "
+        "cached_at TEXT NOT NULL, PRIMARY KEY (date, personality)) WITHOUT ROWID"
+    )
+    for old_year, old_table in _list_facts_partitions(conn).items():
+        if old_year < year:
+            conn.execute(f"DROP TABLE {old_table}")
+            logger.info(f"CACHE: Dropped facts cache partition for {old_year}")
+    _facts_partition_year = year
+
+
+def _migrate_legacy_cache_files(conn, year):
+    """
+    Import current-year facts_*.json files into the database and remove all of them.
+
+    Only runs when the database is first created, so the directory scan is a
+    one-time cost of the upgrade.
+    """
+    imported = removed = 0
+    for filename in os.listdir(CACHE_DIR):
+        if not (filename.startswith("facts_") and filename.endswith(".json")):
+            continue
+        path = os.path.join(CACHE_DIR, filename)
+        # Expected format: facts_DD_MM_personality_YYYY.json (personality may contain "_")
+        parts = filename[: -len(".json")].split("_")
+        try:
+            if len(parts) >= 5 and int(parts[-1]) == year:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                date_str = f"{parts[1]}/{parts[2]}"
+                personality = "_".join(parts[3:-1])
+                _ensure_facts_partition(conn, year)
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {_facts_table(year)} VALUES (?, ?, ?, ?)",
+                    (date_str, personality, json.dumps(data), datetime.now().isoformat()),
+                )
+                imported += 1
+        except (OSError, ValueError) as e:
+            logger.warning(f"CACHE: Skipping unreadable legacy cache file {filename}: {e}")
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+
+    if os.path.exists(_LEGACY_CLEANUP_LOG_FILE):
+        try:
+            os.remove(_LEGACY_CLEANUP_LOG_FILE)
+        except OSError:
+            pass
+
+    if removed:
+        logger.info(
+            f"CACHE: Migrated {imported} legacy facts files into {FACTS_CACHE_FILE} "
+            f"(removed {removed})"
+        )
+
+
+def _ensure_facts_db():
+    """Create the facts database on first use, migrating legacy JSON files."""
+    global _facts_db_ready
+    if _facts_db_ready:
+        return
+    with _facts_db_lock:
+        if _facts_db_ready:
+            return
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        is_new = not os.path.exists(FACTS_CACHE_FILE)
+        with closing(_connect_facts_db()) as conn, conn:
+            if is_new:
+                _migrate_legacy_cache_files(conn, datetime.now().year)
+        _facts_db_ready = True
+
+
+def _read_cached_facts(date_str, personality, year):
+    """Keyed read from the year's partition. Returns the cached dict or None."""
+    try:
+        _ensure_facts_db()
+        with closing(_connect_facts_db()) as conn:
+            row = conn.execute(
+                f"SELECT data FROM {_facts_table(year)} WHERE date = ? AND personality = ?",
+                (date_str, personality),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    except sqlite3.OperationalError as e:
+        # Missing partition simply means nothing has been cached this year yet
+        if "no such table" not in str(e):
+            logger.error(f"CACHE_ERROR: Failed to read cache: {e}")
+        return None
+    except (sqlite3.Error, OSError, json.JSONDecodeError) as e:
+        logger.error(f"CACHE_ERROR: Failed to read cache: {e}")
+        return None
+
+
+def _write_cached_facts(date_str, personality, year, results):
+    """Upsert results into the year's partition. Returns True on success."""
+    global _facts_partition_year
+    try:
+        _ensure_facts_db()
+        with closing(_connect_facts_db()) as conn, conn:
+            _ensure_facts_partition(conn, year)
+            conn.execute(
+                f"INSERT OR REPLACE INTO {_facts_table(year)} VALUES (?, ?, ?, ?)",
+                (date_str, personality, json.dumps(results), datetime.now().isoformat()),
+            )
+        return True
+    except (sqlite3.Error, OSError, TypeError) as e:
+        _facts_partition_year = None  # Re-check the partition on the next write
+        logger.error(f"CACHE_ERROR: Failed to write to cache: {e}")
+        return False
+
+
 def get_birthday_facts(date_str, personality=DEFAULT_IMAGE_PERSONALITY):
     """
     Get interesting facts about a specific date (like notable birthdays, especially in science)
@@ -117,54 +294,15 @@ def get_birthday_facts(date_str, personality=DEFAULT_IMAGE_PERSONALITY):
     Returns:
         Dictionary with interesting facts and sources
     """
-    # Include current year in cache filename so each year gets fresh results
+    # Cache is partitioned by year so each year gets fresh results
     current_year = datetime.now().year
-    cache_file = os.path.join(
-        CACHE_DIR,
-        f"facts_{date_str.replace('/', '_')}_{personality}_{current_year}.json",
-    )
-
-    # Periodically clean up old cache files (only once per day)
-    if WEB_SEARCH_CACHE_ENABLED:
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        should_cleanup = True
-
-        # Check cleanup log to see if we already cleaned today
-        try:
-            if os.path.exists(CLEANUP_LOG_FILE):
-                with open(CLEANUP_LOG_FILE, "r") as f:
-                    cleanup_log = json.load(f)
-                    last_cleanup = cleanup_log.get("last_cleanup", "")
-                    if last_cleanup.startswith(today_str):
-                        should_cleanup = False
-        except (OSError, json.JSONDecodeError):
-            pass  # If we can't read the log, proceed with cleanup
-
-        if should_cleanup:
-            cleared = clear_old_cache_files()
-            if cleared > 0:
-                logger.info(f"CACHE: Auto-cleanup removed {cleared} old cache files")
-            # Update cleanup log
-            try:
-                cleanup_log = {
-                    "last_cleanup": datetime.now().isoformat(),
-                    "files_cleared": cleared,
-                }
-                os.makedirs(CACHE_DIR, exist_ok=True)
-                with open(CLEANUP_LOG_FILE, "w") as f:
-                    json.dump(cleanup_log, f, indent=2, sort_keys=True)
-            except OSError:
-                pass  # Ignore cleanup log errors
 
     # Check cache first if caching is enabled
-    if WEB_SEARCH_CACHE_ENABLED and os.path.exists(cache_file):
-        try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
-                logger.info(f"WEB_SEARCH: Using cached results for {date_str} ({personality})")
-                return cached_data
-        except (OSError, json.JSONDecodeError) as e:
-            logger.error(f"CACHE_ERROR: Failed to read cache: {e}")
+    if WEB_SEARCH_CACHE_ENABLED:
+        cached_data = _read_cached_facts(date_str, personality, current_year)
+        if cached_data:
+            logger.info(f"WEB_SEARCH: Using cached results for {date_str} ({personality})")
+            return cached_data
 
     try:
         # Parse the date using datetime for proper validation
@@ -191,11 +329,15 @@ def get_birthday_facts(date_str, personality=DEFAULT_IMAGE_PERSONALITY):
         logger.info(f"WEB_SEARCH: Searching for facts about {formatted_date} for {personality}")
 
         # Using the new responses.create method with web_search_preview tool
-        response = _get_client().responses.create(
-            model=DEFAULT_OPENAI_MODEL,
-            tools=[{"type": "web_search_preview"}],
-            input=search_query,
-        )
+        with (
+            track_usage("WEB_SEARCH_QUERY", "web_search", DEFAULT_OPENAI_MODEL) as call,
+            guard("web_search"),
+        ):
+            response = call.response = _get_client().responses.create(
+                model=DEFAULT_OPENAI_MODEL,
+                tools=[{"type": "web_search_preview"}],
+                input=search_query,
+            )
 
         # Log usage for monitoring
         log_web_search_usage(response, "WEB_SEARCH_QUERY", logger)
@@ -225,18 +367,14 @@ def get_birthday_facts(date_str, personality=DEFAULT_IMAGE_PERSONALITY):
 
         # Save results to cache if caching is enabled
         if WEB_SEARCH_CACHE_ENABLED and results:
-            try:
-                # Ensure the cache directory exists
-                os.makedirs(CACHE_DIR, exist_ok=True)
-
-                with open(cache_file, "w") as f:
-                    json.dump(results, f, indent=2, sort_keys=True)
-                    logger.info(f"WEB_SEARCH: Cached results for {date_str} ({personality})")
-            except (OSError, TypeError) as e:
-                logger.error(f"CACHE_ERROR: Failed to write to cache: {e}")
+            if _write_cached_facts(date_str, personality, current_year, results):
+                logger.info(f"WEB_SEARCH: Cached results for {date_str} ({personality})")
 
         return results
 
+    except OpenAIUnavailableError as e:
+        logger.warning(f"WEB_SEARCH: Skipping facts for {date_str}: {e}")
+        return None
     except Exception as e:
         logger.error(f"WEB_SEARCH_ERROR: Failed to get birthday facts: {e}")
         import traceback
@@ -247,42 +385,31 @@ def get_birthday_facts(date_str, personality=DEFAULT_IMAGE_PERSONALITY):
 
 def clear_old_cache_files():
     """
-    Clear web search cache files from previous years to prevent accumulation
+    Drop web search cache partitions from previous years
 
     Returns:
-        int: Number of old files cleared
+        int: Number of cached entries cleared
     """
     try:
-        if not os.path.exists(CACHE_DIR):
+        if not os.path.exists(FACTS_CACHE_FILE):
             return 0
 
         current_year = datetime.now().year
         cleared_count = 0
 
-        for filename in os.listdir(CACHE_DIR):
-            if filename.startswith("facts_") and filename.endswith(".json"):
-                # Try to extract year from filename
-                # Expected format: facts_DD_MM_personality_YYYY.json
-                parts = filename.replace(".json", "").split("_")
-                if len(parts) >= 4:
-                    try:
-                        file_year = int(parts[-1])  # Last part should be year
-                        if file_year < current_year:
-                            os.remove(os.path.join(CACHE_DIR, filename))
-                            logger.info(
-                                f"CACHE: Cleared old cache file from {file_year}: {filename}"
-                            )
-                            cleared_count += 1
-                    except ValueError:
-                        # Skip files that don't have year in expected format
-                        continue
+        with closing(_connect_facts_db()) as conn, conn:
+            for year, table in _list_facts_partitions(conn).items():
+                if year < current_year:
+                    cleared_count += conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    conn.execute(f"DROP TABLE {table}")
+                    logger.info(f"CACHE: Dropped facts cache partition for {year}")
 
         if cleared_count > 0:
-            logger.info(f"CACHE: Cleared {cleared_count} old cache files")
+            logger.info(f"CACHE: Cleared {cleared_count} old cache entries")
 
         return cleared_count
 
-    except OSError as e:
+    except sqlite3.Error as e:
         logger.error(f"CACHE_ERROR: Failed to clear old cache files: {e}")
         return 0
 
@@ -296,35 +423,38 @@ def clear_cache(date_str=None):
                  If None, clears all cache
 
     Returns:
-        int: Number of files cleared
+        int: Number of cached entries cleared
     """
+    global _facts_partition_year
     try:
-        if not os.path.exists(CACHE_DIR):
-            logger.info("CACHE: No cache directory exists")
+        if not os.path.exists(FACTS_CACHE_FILE):
+            logger.info("CACHE: No facts cache exists")
             return 0
 
         cleared_count = 0
 
-        if date_str:
-            # Clear specific date (all years and personalities)
-            for filename in os.listdir(CACHE_DIR):
-                if filename.startswith(f"facts_{date_str.replace('/', '_')}"):
-                    os.remove(os.path.join(CACHE_DIR, filename))
-                    logger.info(f"CACHE: Cleared cache for {date_str}")
-                    cleared_count += 1
-        else:
-            # Clear all cache
-            for filename in os.listdir(CACHE_DIR):
-                if filename.startswith("facts_") and filename.endswith(".json"):
-                    os.remove(os.path.join(CACHE_DIR, filename))
-                    cleared_count += 1
+        with closing(_connect_facts_db()) as conn, conn:
+            for table in _list_facts_partitions(conn).values():
+                if date_str:
+                    # Clear specific date (all years and personalities)
+                    cleared_count += conn.execute(
+                        f"DELETE FROM {table} WHERE date = ?", (date_str,)
+                    ).rowcount
+                else:
+                    cleared_count += conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    conn.execute(f"DROP TABLE {table}")
 
-            if cleared_count > 0:
-                logger.info(f"CACHE: Cleared {cleared_count} cached files")
+        if not date_str:
+            _facts_partition_year = None  # Partition must be recreated on next write
+
+        if date_str:
+            logger.info(f"CACHE: Cleared cache for {date_str}")
+        elif cleared_count > 0:
+            logger.info(f"CACHE: Cleared {cleared_count} cached entries")
 
         return cleared_count
 
-    except OSError as e:
+    except sqlite3.Error as e:
         logger.error(f"CACHE_ERROR: Failed to clear cache: {e}")
         return 0
 
@@ -386,12 +516,12 @@ def main():
     # Handle cache clearing
     if args.clear_all_cache:
         count = clear_cache()
-        print(f"Cleared {count} cached files")
+        print(f"Cleared {count} cached entries")
         return
 
     if args.clear_old_cache:
         count = clear_old_cache_files()
-        print(f"Cleared {count} old cached files from previous years")
+        print(f"Cleared {count} old cached entries from previous years")
         return
 
     if args.clear_cache:
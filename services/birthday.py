@@ -8,6 +8,7 @@ integration, and smart consolidation for multiple same-day birthdays.
 Main functions: timezone_aware_check(), simple_daily_check(), send_reminder_to_users().
 """
 
+import logging
 import random
 from datetime import datetime, timezone
 
@@ -49,6 +50,7 @@ from storage.birthdays import (
 from utils.date_utils import (
     check_if_birthday_today,
     date_to_words,
+    get_celebration_instant_utc,
     is_celebration_time_for_user,
 )
 
@@ -441,9 +443,7 @@ def check_and_announce_special_days(app, moment):
         SPECIAL_DAYS_CHECK_TIME,
         SPECIAL_DAYS_ENABLED,
     )
-    from services.special_day import (
-        generate_special_day_message,
-    )
+    from services.special_day import generate_special_day_content
     from storage.special_days import (
         get_announced_special_day_names,
         get_special_days_for_date,
@@ -504,7 +504,6 @@ def check_and_announce_special_days(app, moment):
             return False
 
         from config import SPECIAL_DAY_CONSOLIDATED_ENABLED, SPECIAL_DAYS_PERSONALITY
-        from services.special_day import generate_special_day_details
 
         # Consolidated mode: one message for multiple observances
         if SPECIAL_DAY_CONSOLIDATED_ENABLED and len(special_days) > 1:
@@ -518,28 +517,10 @@ def check_and_announce_special_days(app, moment):
             # Generate intro
             intro = generate_consolidated_intro_message(special_days, app=app)
 
-            # Generate individual teasers and details (parallel if multiple)
-            from config import run_parallel
-
-            def _generate_for_sd(sd):
-                teaser = generate_special_day_message(
-                    [sd], app=app, use_teaser=True, suppress_mention=True
-                )
-                details = generate_special_day_details([sd], app=app)
-                return teaser or "", details or ""
-
-            results = run_parallel(_generate_for_sd, special_days)
-
-            teasers = {}
-            detailed_contents = {}
-            for sd, result in results.items():
-                if result:
-                    teasers[sd.name] = result[0]
-                    detailed_contents[sd.name] = result[1]
-                else:
-                    logger.error(f"SPECIAL_DAYS: Failed to generate for {sd.name}")
-                    teasers[sd.name] = ""
-                    detailed_contents[sd.name] = ""
+            # Generate teasers and details for all observances (batched AI calls)
+            generated = generate_special_day_content(special_days, app=app, suppress_mention=True)
+            teasers = {name: teaser or "" for name, (teaser, _) in generated.items()}
+            detailed_contents = {name: details or "" for name, (_, details) in generated.items()}
 
             # Build and send consolidated message
             blocks, fallback_text = build_consolidated_special_day_blocks(
@@ -592,23 +573,8 @@ def check_and_announce_special_days(app, moment):
         elif len(special_days) >= 1:
             logger.info(f"SPECIAL_DAYS: Sending {len(special_days)} separate announcement(s)")
 
-            # Pre-generate all AI content, then send sequentially
-            from config import run_parallel
-
-            def _generate_individual(sd):
-                teaser = generate_special_day_message([sd], app=app, use_teaser=True)
-                details = generate_special_day_details([sd], app=app)
-                return teaser, details
-
-            results = run_parallel(_generate_individual, special_days)
-
-            generated = {}
-            for sd, result in results.items():
-                if result:
-                    generated[sd.name] = result
-                else:
-                    logger.error(f"SPECIAL_DAYS: Failed to generate for {sd.name}")
-                    generated[sd.name] = (None, None)
+            # Pre-generate all AI content (batched AI calls), then send sequentially
+            generated = generate_special_day_content(special_days, app=app)
 
             # Send messages sequentially (preserves channel order)
             from slack.blocks import build_special_day_blocks
@@ -1028,6 +994,82 @@ def send_channel_announcement(app, announcement_type="general", custom_message=N
         return False
 
 
+# Timezone each member of the last planned cohort was planned with (user_id -> tz)
+_planned_timezones = {}
+
+
+def get_planned_timezone(user_id):
+    """
+    Timezone the last plan_timezone_celebration() used for a user.
+
+    Returns:
+        Timezone string, or None if the user is not in today's planned cohort
+    """
+    return _planned_timezones.get(user_id)
+
+
+def plan_timezone_celebration(app, moment):
+    """
+    Compute when today's timezone-mode celebration should fire.
+
+    Detects today's uncelebrated cohort (same rules as timezone_aware_check) and
+    returns the earliest UTC instant at which any of them reaches
+    TIMEZONE_CELEBRATION_TIME in their own timezone. The scheduler arms a
+    one-shot trigger for that instant instead of sweeping every hour.
+
+    Args:
+        app: Slack app instance
+        moment: Current datetime with timezone info
+
+    Returns:
+        Aware UTC datetime (possibly already past: fire now), or None if nobody
+        is left to celebrate during the current UTC day
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    utc_moment = moment.astimezone(timezone.utc)
+
+    try:
+        channel_members = get_channel_members(app, BIRTHDAY_CHANNEL)
+    except SlackApiError as e:
+        logger.error(f"TIMEZONE_PLAN: Failed to get channel members: {e}")
+        return None
+    if not channel_members:
+        logger.warning("TIMEZONE_PLAN: Could not retrieve birthday channel members")
+        return None
+
+    cohort = _find_birthdays_today(
+        app=app,
+        birthdays=load_birthdays(),
+        channel_member_set=set(channel_members),
+        reference_moment=utc_moment,
+        check_already_celebrated=True,
+        log_prefix="TIMEZONE_PLAN",
+    )
+
+    global _planned_timezones
+    _planned_timezones = {person["user_id"]: person.get("timezone") or "UTC" for person in cohort}
+
+    instants = []
+    for person in cohort:
+        instant = get_celebration_instant_utc(
+            _planned_timezones[person["user_id"]], utc_moment.date(), TIMEZONE_CELEBRATION_TIME
+        )
+        if instant is not None:
+            instants.append(instant)
+
+    if not instants:
+        logger.info(f"TIMEZONE_PLAN: No celebration to schedule for {utc_moment.date()} UTC")
+        return None
+
+    earliest = min(instants)
+    logger.info(
+        f"TIMEZONE_PLAN: {len(cohort)} birthday(s) today, first reaches "
+        f"{TIMEZONE_CELEBRATION_TIME.strftime('%H:%M')} at {earliest.strftime('%Y-%m-%d %H:%M')} UTC"
+    )
+    return earliest
+
+
 def timezone_aware_check(app, moment):
     """
     Run server-independent timezone-aware birthday checks with team consolidation
@@ -1113,7 +1155,7 @@ def timezone_aware_check(app, moment):
             logger.info(
                 f"TIMEZONE: It's {user_current_time.strftime('%H:%M')} in {user_timezone} for {username} - triggering celebration!"
             )
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"TIMEZONE: Not celebration time for {username} in {user_timezone} (waiting for {TIMEZONE_CELEBRATION_TIME.strftime('%H:%M')})"
             )
@@ -1255,7 +1297,7 @@ def celebrate_missed_birthdays(app):
     - Daily mode: won't fire before DAILY_CHECK_TIME (server local time).
     - Timezone mode: uses the same consolidation rule as timezone_aware_check —
       if ANY person's 9 AM has passed, celebrate ALL of them together.
-      If nobody's 9 AM has arrived yet, defer to the hourly scheduler.
+      If nobody's 9 AM has arrived yet, defer to the scheduled celebration trigger.
 
     Args:
         app: Slack app instance
@@ -1312,7 +1354,7 @@ def celebrate_missed_birthdays(app):
 
         # In timezone mode, apply the same consolidation rule as timezone_aware_check:
         # if ANY person's 9 AM has passed, celebrate ALL of them together.
-        # If nobody's 9 AM has passed yet, skip entirely — the hourly scheduler will handle it.
+        # If nobody's 9 AM has passed yet, skip entirely — the scheduled trigger will handle it.
         if tz_enabled and birthday_people_today:
             utc_now = datetime.now(timezone.utc)
             has_trigger = any(
@@ -1324,7 +1366,7 @@ def celebrate_missed_birthdays(app):
             if not has_trigger:
                 logger.info(
                     f"MISSED_BIRTHDAYS: No one's {TIMEZONE_CELEBRATION_TIME.strftime('%H:%M')} "
-                    f"has arrived yet, deferring to hourly scheduler"
+                    f"has arrived yet, deferring to scheduled trigger"
                 )
                 birthday_people_today = []
 
@@ -4,13 +4,18 @@ Birthday celebration utilities and pipeline.
 Consolidated module handling all birthday celebration logic:
 - BirthdayCelebrationPipeline: Main workflow for birthday announcements
 - Pre-posting validation for race condition prevention
+- Durable artifacts so retries resume instead of regenerating AI content
 - Immediate celebration decision logic
 - Bot self-celebration (Ludo's birthday)
 
+Pipeline stages are timed into utils/metrics (celebration_stage_seconds{stage})
+and traced per celebration by utils/tracing (`admin traces` shows the last few).
+
 Key classes: BirthdayCelebrationPipeline
 Key functions: validate_birthday_people_for_posting(), should_celebrate_immediately()
 """
 
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timezone as tz
 
@@ -47,8 +52,15 @@ from storage.birthdays import (
     mark_birthday_announced,
     mark_timezone_birthday_announced,
 )
-from utils.date_utils import check_if_birthday_today, date_to_words
+from storage.celebration_artifacts import CelebrationArtifacts, cleanup_old_artifacts
+from utils.date_utils import (
+    check_if_birthday_today,
+    date_to_words,
+    nearest_birthday_occurrence,
+)
+from utils.metrics import timed
 from utils.sanitization import markdown_to_slack_mrkdwn
+from utils.tracing import current_span, span, start_trace
 
 logger = get_logger("birthday")
 
@@ -58,6 +70,39 @@ logger = get_logger("birthday")
 # =============================================================================
 
 
+@contextmanager
+def _stage(name):
+    """Time one pipeline stage into metrics and the current celebration trace."""
+    with timed("celebration_stage_seconds", stage=name), span(name):
+        yield
+
+
+def _unpack_generation_result(result):
+    """Unpack a generation result that may be a 3-tuple, 2-tuple, or plain string."""
+    if isinstance(result, tuple) and len(result) == 3:
+        message, images, personality = result
+        return message, images or [], personality
+    elif isinstance(result, tuple) and len(result) == 2:
+        message, images = result
+        return message, images or [], DEFAULT_PERSONALITY
+    return result, [], DEFAULT_PERSONALITY
+
+
+def _celebration_date(birthday_people):
+    """
+    YYYY-MM-DD of the birthday being celebrated, used in the celebration ID.
+
+    Triggers fire at local celebration time, so a retry can land on the next
+    UTC day; keying on the cohort's shared birthday keeps it on the same ID.
+    None (today, UTC) if no person carries a DD/MM date.
+    """
+    for person in birthday_people:
+        occurrence = nearest_birthday_occurrence(person.get("date", ""))
+        if occurrence:
+            return occurrence.isoformat()
+    return None
+
+
 class BirthdayCelebrationPipeline:
     """
     Unified pipeline for birthday celebrations with validation and race condition prevention.
@@ -154,6 +199,26 @@ class BirthdayCelebrationPipeline:
                 "error": str or None
             }
         """
+        with start_trace(
+            "celebration", mode=self.mode, people=len(birthday_people or [])
+        ) as trace_span:
+            result = self._celebrate(
+                birthday_people, include_image, test_mode, quality, image_size, processing_duration
+            )
+            if trace_span:
+                trace_span.set(
+                    success=result["success"],
+                    celebrated=len(result["celebrated_people"]),
+                    images_sent=result["images_sent"],
+                )
+                if result["error"]:
+                    trace_span.set(error=result["error"])
+            return result
+
+    def _celebrate(
+        self, birthday_people, include_image, test_mode, quality, image_size, processing_duration
+    ):
+        """Pipeline body of celebrate(), run inside the celebration trace."""
         if not birthday_people:
             logger.warning(f"{self.mode}: No birthday people provided to celebration pipeline")
             return {
@@ -177,9 +242,10 @@ class BirthdayCelebrationPipeline:
             # Pre-filter: skip people already celebrated by another process
             # (cheap check before expensive AI generation)
             if self.mode != "TEST":
-                pre_valid = [
-                    p for p in birthday_people if not is_user_celebrated_today(p["user_id"])
-                ]
+                with _stage("pre_filter"):
+                    pre_valid = [
+                        p for p in birthday_people if not is_user_celebrated_today(p["user_id"])
+                    ]
                 if len(pre_valid) < len(birthday_people):
                     skipped = len(birthday_people) - len(pre_valid)
                     logger.info(
@@ -199,8 +265,20 @@ class BirthdayCelebrationPipeline:
                         "error": "All people already celebrated",
                     }
 
+            # Durable artifacts: a retry of the same cohort resumes from the last
+            # completed stage instead of regenerating message, images and titles
+            artifacts = None
+            if self.mode != "TEST" and not test_mode:
+                artifacts = CelebrationArtifacts.for_cohort(
+                    birthday_people, _celebration_date(birthday_people)
+                )
+                trace_span = current_span()
+                if trace_span:
+                    trace_span.set(celebration_id=artifacts.celebration_id)
+
             # Analyze celebration styles to determine image and mention behavior
-            style_summary = self._analyze_celebration_styles(birthday_people)
+            with _stage("style_analysis"):
+                style_summary = self._analyze_celebration_styles(birthday_people)
 
             # Determine if images should be generated based on celebration styles
             # Skip images if ALL users have "quiet" style
@@ -213,25 +291,36 @@ class BirthdayCelebrationPipeline:
                     f"{self.mode}: All birthday people have 'quiet' style - skipping AI images"
                 )
 
-            # Step 1: Generate consolidated message and images
-            result = create_consolidated_birthday_announcement(
-                birthday_people,
-                app=self.app,
-                include_image=should_include_images,
-                test_mode=test_mode,
-                quality=quality,
-                image_size=image_size,
-                skip_mention=style_summary["all_quiet"],  # Skip <!here> if all quiet
-            )
+            # Step 1: Generate consolidated message and images (or reuse a previous attempt's)
+            with _stage("generation"):
+                result = artifacts.load_generation("generated") if artifacts else None
+                if result:
+                    logger.info(
+                        f"{self.mode}: Resuming celebration {artifacts.celebration_id} "
+                        f"from stage '{artifacts.stage}' - skipping AI generation"
+                    )
+                else:
+                    result = create_consolidated_birthday_announcement(
+                        birthday_people,
+                        app=self.app,
+                        include_image=should_include_images,
+                        test_mode=test_mode,
+                        quality=quality,
+                        image_size=image_size,
+                        skip_mention=style_summary["all_quiet"],  # Skip <!here> if all quiet
+                    )
+                    if artifacts:
+                        artifacts.save_generation("generated", *_unpack_generation_result(result))
 
             # Calculate processing duration if not provided
             if processing_duration is None:
                 processing_duration = (datetime.now(tz.utc) - processing_start).total_seconds()
 
             # Step 2: Validate all people before posting (race condition prevention)
-            validation_result = validate_birthday_people_for_posting(
-                self.app, birthday_people, self.birthday_channel, mode=self.mode
-            )
+            with _stage("validation"):
+                validation_result = validate_birthday_people_for_posting(
+                    self.app, birthday_people, self.birthday_channel, mode=self.mode
+                )
 
             valid_people = validation_result["valid_people"]
             invalid_people = validation_result["invalid_people"]
@@ -260,43 +349,67 @@ class BirthdayCelebrationPipeline:
                 }
 
             # Step 5: Decide whether to regenerate message or filter images
-            final_message, final_images, actual_personality = self._handle_validation_results(
-                result,
-                validation_result,
-                should_include_images,
-                test_mode,
-                quality,
-                image_size,
-                skip_mention=style_summary["all_quiet"],
-            )
+            with _stage("finalize"):
+                valid_ids = [p["user_id"] for p in valid_people]
+                finalized = artifacts.load_generation("finalized", valid_ids) if artifacts else None
+                if finalized:
+                    final_message, final_images, actual_personality = finalized
+                else:
+                    final_message, final_images, actual_personality = (
+                        self._handle_validation_results(
+                            result,
+                            validation_result,
+                            should_include_images,
+                            test_mode,
+                            quality,
+                            image_size,
+                            skip_mention=style_summary["all_quiet"],
+                        )
+                    )
+                    if artifacts:
+                        artifacts.save_generation(
+                            "finalized",
+                            final_message,
+                            final_images,
+                            actual_personality,
+                            user_ids=valid_ids,
+                        )
 
             # Step 6: Post the validated message and images
-            post_result = self._post_celebration(
-                final_message,
-                final_images,
-                should_include_images,
-                valid_people,
-                invalid_people,
-                validation_summary,
-                actual_personality,  # Pass actual personality used for proper attribution
-            )
+            with _stage("posting"):
+                post_result = self._post_celebration(
+                    final_message,
+                    final_images,
+                    should_include_images,
+                    valid_people,
+                    invalid_people,
+                    validation_summary,
+                    actual_personality,  # Pass actual personality used for proper attribution
+                    artifacts=artifacts,
+                )
 
             # Step 7: Track thread for engagement (if enabled and successful)
             message_ts = post_result.get("ts")
             if post_result["message_sent"] and message_ts:
-                self._track_thread_for_engagement(message_ts, valid_people, actual_personality)
+                with _stage("thread_tracking"):
+                    self._track_thread_for_engagement(message_ts, valid_people, actual_personality)
 
-                # Step 7b: Add basic reactions to all birthday messages
-                self._add_basic_reactions(message_ts)
+                with _stage("reactions"):
+                    # Step 7b: Add basic reactions to all birthday messages
+                    self._add_basic_reactions(message_ts)
 
-                # Step 7c: Add epic celebration reactions if any user has epic style
-                self._add_epic_reactions(message_ts, valid_people)
+                    # Step 7c: Add epic celebration reactions if any user has epic style
+                    self._add_epic_reactions(message_ts, valid_people)
 
-                # Step 7d: Add epic thread celebration message
-                self._add_epic_thread_message(message_ts, valid_people)
+                    # Step 7d: Add epic thread celebration message
+                    self._add_epic_thread_message(message_ts, valid_people)
 
             # Step 8: Mark validated people as celebrated
-            self._mark_as_celebrated(valid_people)
+            with _stage("marking"):
+                self._mark_as_celebrated(valid_people)
+            if artifacts:
+                artifacts.mark_stage("completed")
+                cleanup_old_artifacts()
 
             # Step 9: Log final results
             valid_names = [p["username"] for p in valid_people]
@@ -358,18 +471,8 @@ class BirthdayCelebrationPipeline:
         valid_people = validation_result["valid_people"]
         invalid_people = validation_result["invalid_people"]
 
-        def _unpack(r):
-            """Unpack a result that may be a 3-tuple, 2-tuple, or plain string."""
-            if isinstance(r, tuple) and len(r) == 3:
-                msg, imgs, pers = r
-                return msg, imgs or [], pers
-            elif isinstance(r, tuple) and len(r) == 2:
-                msg, imgs = r
-                return msg, imgs or [], DEFAULT_PERSONALITY
-            return r, [], DEFAULT_PERSONALITY
-
         if not invalid_people:
-            return _unpack(result)
+            return _unpack_generation_result(result)
 
         # Some people became invalid - decide action
         if should_regenerate_message(
@@ -381,22 +484,25 @@ class BirthdayCelebrationPipeline:
                 f"(filtered out {len(invalid_people)})"
             )
 
-            regenerated_result = create_consolidated_birthday_announcement(
-                valid_people,
-                app=self.app,
-                include_image=include_images,
-                test_mode=test_mode,
-                quality=quality,
-                image_size=image_size,
-                skip_mention=skip_mention,
-            )
+            with span("regeneration", people=len(valid_people)):
+                regenerated_result = create_consolidated_birthday_announcement(
+                    valid_people,
+                    app=self.app,
+                    include_image=include_images,
+                    test_mode=test_mode,
+                    quality=quality,
+                    image_size=image_size,
+                    skip_mention=skip_mention,
+                )
 
-            final_message, final_images, actual_personality = _unpack(regenerated_result)
+            final_message, final_images, actual_personality = _unpack_generation_result(
+                regenerated_result
+            )
         else:
             # Minor changes (<30% invalid) - use original message but filter images
             logger.info(f"{self.mode}: Filtering {len(invalid_people)} invalid people from images")
 
-            final_message, original_images, actual_personality = _unpack(result)
+            final_message, original_images, actual_personality = _unpack_generation_result(result)
             final_images = filter_images_for_valid_people(original_images, valid_people)
 
         return final_message, final_images, actual_personality
@@ -410,12 +516,15 @@ class BirthdayCelebrationPipeline:
         invalid_people,
         validation_summary,
         actual_personality,
+        artifacts=None,
     ):
         """
         Post the celebration message with images to the channel using Block Kit formatting.
 
         Args:
             actual_personality: The actual personality used (important for "random" personality)
+            artifacts: Optional CelebrationArtifacts; titles, file IDs and the posted ts
+                are persisted there and reused when a previous attempt got that far
 
         Returns:
             dict: {"message_sent": bool, "images_sent": int, "ts": str or None}
@@ -428,10 +537,29 @@ class BirthdayCelebrationPipeline:
 
         # NEW FLOW: Upload images first → Get file IDs → Build blocks with embedded images → Send unified message
 
+        # Already posted by a previous attempt - only the follow-up steps remain
+        posted_ts = artifacts.posted_ts() if artifacts else None
+        if posted_ts:
+            logger.info(f"{self.mode}: Celebration message already posted (ts={posted_ts})")
+            return {
+                "message_sent": True,
+                "images_sent": len(artifacts.uploaded_file_ids() or []),
+                "ts": posted_ts,
+            }
+
         # Step 1: Upload images to get file IDs (if images provided)
-        file_ids = []
-        if images and include_images:
-            from slack.messaging import upload_birthday_images_for_blocks
+        file_ids = (artifacts.uploaded_file_ids() if artifacts else None) or []
+        if file_ids:
+            logger.info(
+                f"{self.mode}: Reusing {len(file_ids)} image(s) uploaded by previous attempt"
+            )
+        elif images and include_images:
+            from slack.messaging import resolve_image_titles, upload_birthday_images_for_blocks
+
+            # Resolve (possibly AI) titles up front so a retried upload reuses them
+            if artifacts:
+                resolve_image_titles(images)
+                artifacts.save_image_titles("finalized", images)
 
             logger.info(
                 f"{self.mode}: Uploading {len(images)} images to get file IDs for Block Kit embedding"
@@ -447,6 +575,8 @@ class BirthdayCelebrationPipeline:
                 logger.info(
                     f"{self.mode}: Successfully uploaded {len(file_ids)} images, got file IDs: {file_ids}"
                 )
+                if artifacts:
+                    artifacts.mark_stage("uploaded", file_ids=file_ids)
             else:
                 logger.warning(
                     f"{self.mode}: Image upload failed or returned no file IDs, proceeding without embedded images"
@@ -506,6 +636,8 @@ class BirthdayCelebrationPipeline:
             )
             success = send_result["success"]
             message_ts = send_result.get("ts")
+            if success and artifacts:
+                artifacts.mark_stage("posted", ts=message_ts)
 
             send_results = {
                 "success": success,
@@ -535,6 +667,8 @@ class BirthdayCelebrationPipeline:
             send_result = send_message(self.app, self.birthday_channel, fallback_text, blocks)
             success = send_result["success"]
             message_ts = send_result.get("ts")
+            if success and artifacts:
+                artifacts.mark_stage("posted", ts=message_ts)
             logger.info(
                 f"{self.mode}: Successfully sent consolidated birthday message with Block Kit formatting{validation_note}"
             )
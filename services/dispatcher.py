@@ -65,6 +65,7 @@ from commands.admin_commands import (
     handle_stats_command,
     handle_status_command,
     handle_timezone_command,
+    handle_traces_command,
 )
 from commands.birthday_commands import (
     handle_check_command,
@@ -743,6 +744,9 @@ def handle_admin_command(
             f"ADMIN: {username} ({user_id}) requested system status {'with details' if is_detailed else ''}"
         )
 
+    elif subcommand == "traces":
+        handle_traces_command(args, user_id, say, app, username)
+
     elif subcommand == "timezone":
         handle_timezone_command(args, user_id, say, app, username)
 
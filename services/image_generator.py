@@ -19,7 +19,6 @@ import re
 from datetime import datetime, timedelta
 
 import requests
-from PIL import Image
 
 from config import (
     CACHE_DIR,
@@ -34,7 +33,14 @@ from config import (
     get_image_model_capabilities,
     get_logger,
 )
-from integrations.openai import analyze_image, get_openai_client, log_image_generation_usage
+from integrations.openai import (
+    analyze_image,
+    analyze_images,
+    get_openai_client,
+    log_image_generation_usage,
+)
+from integrations.openai_guard import guard, is_available
+from integrations.openai_usage import track_usage
 from storage.settings import get_configured_openai_image_model
 
 logger = get_logger("image_generator")
@@ -82,6 +88,11 @@ def generate_birthday_image(
         Dictionary with image URL and metadata, or None if failed
     """
     try:
+        # Fail fast while the image circuit is open - callers fall back to the profile photo
+        if not is_available("image"):
+            logger.warning("IMAGE_GEN: OpenAI image circuit open, skipping AI generation")
+            return None
+
         # Extract user information for personalization
         name = user_profile.get("preferred_name", "Birthday Person")
         title = user_profile.get("title", "")
@@ -184,8 +195,14 @@ def generate_birthday_image(
                     if supports_input_fidelity:
                         edit_params["input_fidelity"] = input_fidelity
 
-                    with open(profile_photo_path, "rb") as image_file:
-                        response = _get_client().images.edit(image=image_file, **edit_params)
+                    with (
+                        open(profile_photo_path, "rb") as image_file,
+                        track_usage("IMAGE_EDIT_REFERENCE", "image", active_image_model) as call,
+                        guard("image"),
+                    ):
+                        response = call.response = _get_client().images.edit(
+                            image=image_file, **edit_params
+                        )
 
                     # Log usage for monitoring
                     log_image_generation_usage(
@@ -272,7 +289,11 @@ def generate_birthday_image(
                         f"{active_image_model} does not support it; generating opaque"
                     )
 
-            response = _get_client().images.generate(**generation_params)
+            with (
+                track_usage("IMAGE_GENERATE_TEXT", "image", active_image_model) as call,
+                guard("image"),
+            ):
+                response = call.response = _get_client().images.generate(**generation_params)
 
             # Log usage for monitoring
             log_image_generation_usage(
@@ -589,22 +610,128 @@ def _is_default_avatar(user_profile, photo_url):
     return False
 
 
-def _get_profile_analysis_cache_path(user_id: str) -> str:
-    """Get the cache file path for profile analysis results."""
+def _get_profiles_dir() -> str:
+    """Get (and create) the profile photo cache directory."""
     profiles_dir = os.path.join(CACHE_DIR, "profiles")
     os.makedirs(profiles_dir, exist_ok=True)
-    return os.path.join(profiles_dir, f"analysis_{user_id}.json")
+    return profiles_dir
+
+
+def _get_profile_analysis_cache_path(content_hash: str) -> str:
+    """Get the cache file path for the vision analysis of a photo content hash."""
+    return os.path.join(_get_profiles_dir(), f"analysis_{content_hash}.json")
+
+
+def _get_processed_photo_path(content_hash: str) -> str:
+    """Get the path of the processed (RGB, <=1024px PNG) photo for a content hash."""
+    return os.path.join(_get_profiles_dir(), f"photo_{content_hash}.png")
+
+
+def _photo_content_hash(photo_path: str) -> str:
+    """
+    Get the content hash a processed photo is keyed on.
+
+    Processed photos are stored as photo_<hash>.png; any other file is hashed directly.
+    """
+    match = re.match(r"^photo_([0-9a-f]{16})\.png$", os.path.basename(photo_path))
+    if match:
+        return match.group(1)
+    with open(photo_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _touch(path: str) -> None:
+    """Refresh mtime so TTL cleanup keeps cache files that are still in use."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+_PROFILE_ANALYSIS_PROMPT = (
+    "Briefly describe the main visual elements in this image in 2-3 phrases. "
+    "Focus on: objects, animals, themes, colors, activities. "
+    "If it's a person, mention distinctive features (glasses, hat, etc). "
+    "Format: comma-separated list. Example: 'golden retriever, beach setting, sunset colors'. "
+    "Keep it under 50 words."
+)
+
+
+def _write_profile_analysis(content_hash: str, elements: str, name: str) -> None:
+    """Cache a vision analysis result under the photo content hash."""
+    try:
+        cache_data = {
+            "content_hash": content_hash,
+            "elements": elements,
+            "analyzed_at": datetime.now().isoformat(),
+        }
+        with open(_get_profile_analysis_cache_path(content_hash), "w") as f:
+            json.dump(cache_data, f)
+        logger.debug(f"PROFILE_ANALYSIS: Cached analysis for {name}")
+    except Exception as cache_error:
+        logger.warning(f"PROFILE_ANALYSIS: Failed to cache analysis for {name}: {cache_error}")
+
+
+def prefetch_profile_analyses(user_profiles: list) -> int:
+    """
+    Analyze all uncached profile photos of a cohort in one batched vision call.
+
+    Runs before per-person image generation so each _analyze_profile_photo()
+    call hits the cache. Photos the batch does not cover are analyzed
+    individually later, as before.
+
+    Args:
+        user_profiles: List of user profile dicts (with photo URLs and preferred_name)
+
+    Returns:
+        Number of analyses added to the cache
+    """
+    if not PROFILE_ANALYSIS_ENABLED or len(user_profiles) < 2:
+        return 0
+    if not is_available("image") or not is_available("vision"):
+        return 0
+
+    pending = {}
+    names = {}
+    for profile in user_profiles:
+        name = profile.get("preferred_name", "Birthday Person")
+        photo_path = download_and_prepare_profile_photo(profile, name)
+        if not photo_path:
+            continue
+        content_hash = _photo_content_hash(photo_path)
+        if content_hash in pending or os.path.exists(
+            _get_profile_analysis_cache_path(content_hash)
+        ):
+            continue
+        pending[content_hash] = photo_path
+        names[content_hash] = name
+
+    if len(pending) < 2:
+        # Nothing to batch - the per-person path handles a single photo as before
+        return 0
+
+    logger.info(f"PROFILE_ANALYSIS: Batch-analyzing {len(pending)} profile photos")
+    results = analyze_images(
+        pending,
+        prompt=_PROFILE_ANALYSIS_PROMPT,
+        max_tokens_per_image=TOKEN_LIMITS.get("profile_analysis", 100),
+        context="PROFILE_ANALYSIS_BATCH",
+    )
+    for content_hash, elements in results.items():
+        _write_profile_analysis(content_hash, elements.strip("\"'"), names[content_hash])
+    return len(results)
 
 
 def _analyze_profile_photo(photo_path: str, user_profile: dict, name: str) -> str:
     """
     Analyze profile photo using Vision API to extract visual elements.
 
-    Uses caching based on photo URL hash to avoid re-analyzing unchanged photos.
+    Results are cached by photo content hash, so an unchanged photo is never
+    re-analyzed and a changed photo is analyzed on first use.
 
     Args:
         photo_path: Path to the downloaded profile photo
-        user_profile: User profile dictionary (contains user_id and photo URLs)
+        user_profile: User profile dictionary (unused for caching, kept for callers)
         name: User's name for logging
 
     Returns:
@@ -618,54 +745,29 @@ def _analyze_profile_photo(photo_path: str, user_profile: dict, name: str) -> st
         logger.debug(f"PROFILE_ANALYSIS: No photo path for {name}")
         return ""
 
-    user_id = user_profile.get("user_id", "")
-    if not user_id:
-        logger.warning(f"PROFILE_ANALYSIS: No user_id for {name}, skipping cache")
-        user_id = hashlib.md5(name.encode()).hexdigest()[:8]
-
-    # Get photo URL for cache invalidation
-    photo_url = (
-        user_profile.get("photo_original")
-        or user_profile.get("photo_512")
-        or user_profile.get("photo_192")
-        or ""
-    )
-    url_hash = hashlib.md5(photo_url.encode()).hexdigest()[:12] if photo_url else ""
-
     # Check cache
-    cache_path = _get_profile_analysis_cache_path(user_id)
+    content_hash = _photo_content_hash(photo_path)
+    cache_path = _get_profile_analysis_cache_path(content_hash)
     if os.path.exists(cache_path):
         try:
             with open(cache_path, "r") as f:
                 cached = json.load(f)
-            # Validate cache by URL hash
-            if cached.get("url_hash") == url_hash and cached.get("elements"):
+            if cached.get("elements"):
+                _touch(cache_path)
                 logger.info(
                     f"PROFILE_ANALYSIS: Using cached analysis for {name}: {cached['elements'][:50]}..."
                 )
                 return cached["elements"]
-            else:
-                logger.info(
-                    f"PROFILE_ANALYSIS: Cache invalid for {name} (photo changed), re-analyzing"
-                )
         except Exception as e:
             logger.warning(f"PROFILE_ANALYSIS: Failed to read cache for {name}: {e}")
 
     # Perform Vision API analysis
     try:
-        prompt = (
-            "Briefly describe the main visual elements in this image in 2-3 phrases. "
-            "Focus on: objects, animals, themes, colors, activities. "
-            "If it's a person, mention distinctive features (glasses, hat, etc). "
-            "Format: comma-separated list. Example: 'golden retriever, beach setting, sunset colors'. "
-            "Keep it under 50 words."
-        )
-
         logger.info(f"PROFILE_ANALYSIS: Analyzing profile photo for {name}")
 
         elements = analyze_image(
             image_path=photo_path,
-            prompt=prompt,
+            prompt=_PROFILE_ANALYSIS_PROMPT,
             max_tokens=TOKEN_LIMITS.get("profile_analysis", 100),
             context="PROFILE_ANALYSIS",
         )
@@ -675,21 +777,7 @@ def _analyze_profile_photo(photo_path: str, user_profile: dict, name: str) -> st
             elements = elements.strip().strip("\"'")
             logger.info(f"PROFILE_ANALYSIS: Extracted elements for {name}: {elements[:80]}...")
 
-            # Cache the result
-            try:
-                cache_data = {
-                    "url_hash": url_hash,
-                    "elements": elements,
-                    "analyzed_at": datetime.now().isoformat(),
-                }
-                with open(cache_path, "w") as f:
-                    json.dump(cache_data, f)
-                logger.debug(f"PROFILE_ANALYSIS: Cached analysis for {name}")
-            except Exception as cache_error:
-                logger.warning(
-                    f"PROFILE_ANALYSIS: Failed to cache analysis for {name}: {cache_error}"
-                )
-
+            _write_profile_analysis(content_hash, elements, name)
             return elements
         else:
             logger.warning(f"PROFILE_ANALYSIS: Vision API returned empty result for {name}")
@@ -700,10 +788,89 @@ def _analyze_profile_photo(photo_path: str, user_profile: dict, name: str) -> st
         return ""
 
 
+def _load_photo_metadata(meta_path):
+    """Load per-user photo metadata (url, etag, last_modified, content_hash, checked_at)."""
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_photo_metadata(meta_path, metadata):
+    """Persist per-user photo metadata atomically."""
+    try:
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_path, meta_path)
+    except OSError as e:
+        logger.warning(f"PROFILE_PHOTO: Failed to save photo metadata {meta_path}: {e}")
+
+
+def _fetch_profile_photo(photo_url, etag=None, last_modified=None):
+    """
+    Fetch a profile photo, conditionally when validators from a previous fetch are known.
+
+    Returns:
+        tuple: (status, content, headers) - status 304 means the cached copy is current;
+        (None, None, {}) on failure
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        response = requests.get(photo_url, headers=headers, timeout=TIMEOUTS["http_request"])
+        if response.status_code == 304:
+            return 304, None, response.headers
+        response.raise_for_status()
+        return response.status_code, response.content, response.headers
+    except Exception as e:
+        logger.error(f"IMAGE_DOWNLOAD_ERROR: Failed to download profile photo: {e}")
+        return None, None, {}
+
+
+def _process_profile_photo(image_data, file_path):
+    """Decode, flatten to RGB, downscale to 1024px and save a profile photo as PNG."""
+    from PIL import Image  # Deferred: only profile photos need Pillow
+
+    image = Image.open(io.BytesIO(image_data))
+
+    # Convert to RGB if necessary (remove alpha channel)
+    if image.mode in ("RGBA", "LA"):
+        # Create white background
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        if image.mode == "RGBA":
+            background.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
+        else:
+            background.paste(image)
+        image = background
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # Resize to standard size for OpenAI image API (1024x1024 max)
+    max_size = 1024
+    if image.width > max_size or image.height > max_size:
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        logger.info(f"PROFILE_PHOTO: Resized profile photo to {image.size}")
+
+    # Save as PNG for best quality (write-then-rename so readers never see a partial file)
+    tmp_path = file_path + ".tmp"
+    image.save(tmp_path, "PNG", quality=95)
+    os.replace(tmp_path, file_path)
+
+
 def download_and_prepare_profile_photo(user_profile, name):
     """
     Download user's profile photo and prepare it for OpenAI image API reference.
-    Uses user_id-based caching with TTL to avoid duplicate downloads.
+
+    The processed photo is keyed on the downloaded content hash. Per-user metadata
+    records the photo URL and HTTP validators: an unchanged URL checked within the
+    profile photo TTL needs no request at all, and after the TTL a conditional
+    request (ETag/Last-Modified) revalidates without re-downloading. A new URL or
+    new content produces a new hash, which also invalidates the vision analysis.
 
     Args:
         user_profile: User profile dictionary with photo URLs
@@ -742,64 +909,71 @@ def download_and_prepare_profile_photo(user_profile, name):
         else:
             cache_key = user_id
 
-        # Ensure profile photos directory exists
-        profiles_dir = os.path.join(CACHE_DIR, "profiles")
-        os.makedirs(profiles_dir, exist_ok=True)
-
-        # Check for existing cached file with TTL
-        filename = f"profile_{cache_key}.png"
-        file_path = os.path.join(profiles_dir, filename)
+        meta_path = os.path.join(_get_profiles_dir(), f"profile_{cache_key}.json")
+        metadata = _load_photo_metadata(meta_path)
+        cached_path = (
+            _get_processed_photo_path(metadata["content_hash"])
+            if metadata.get("content_hash")
+            else None
+        )
+        have_cached = bool(cached_path) and os.path.exists(cached_path)
+        same_url = metadata.get("url") == photo_url
         ttl_days = CACHE_RETENTION_DAYS["profile_photos"]
 
-        if os.path.exists(file_path):
-            # Check if file is still valid (within TTL)
-            file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-            age_days = (datetime.now() - file_mtime).days
-
+        # Cheap path: same URL, recently validated - no network at all
+        if have_cached and same_url:
+            checked_at = datetime.fromisoformat(metadata.get("checked_at", "1970-01-01"))
+            age_days = (datetime.now() - checked_at).days
             if age_days < ttl_days:
+                _touch(cached_path)
+                _touch(meta_path)
                 logger.info(
                     f"PROFILE_PHOTO: Using cached profile photo for {name} "
-                    f"(age: {age_days} days, TTL: {ttl_days} days)"
-                )
-                return file_path
-            else:
-                logger.info(
-                    f"PROFILE_PHOTO: Cached photo for {name} expired "
-                    f"(age: {age_days} days > TTL: {ttl_days} days), refreshing"
+                    f"(checked {age_days} days ago, TTL: {ttl_days} days)"
                 )
+                return cached_path
 
-        logger.info(f"PROFILE_PHOTO: Downloading profile photo for {name} from {photo_url}")
-
-        # Download the image
-        image_data = download_image(photo_url)
+        # Conditional request only makes sense when revalidating the same URL
+        validators = (
+            (metadata.get("etag"), metadata.get("last_modified"))
+            if have_cached and same_url
+            else (None, None)
+        )
+        logger.info(f"PROFILE_PHOTO: Fetching profile photo for {name} from {photo_url}")
+        status, image_data, headers = _fetch_profile_photo(photo_url, *validators)
+
+        if status == 304:
+            logger.info(f"PROFILE_PHOTO: Profile photo unchanged for {name} (304)")
+            metadata["checked_at"] = datetime.now().isoformat()
+            _save_photo_metadata(meta_path, metadata)
+            _touch(cached_path)
+            return cached_path
         if not image_data:
             return None
 
-        # Open and process the image
-        image = Image.open(io.BytesIO(image_data))
-
-        # Convert to RGB if necessary (remove alpha channel)
-        if image.mode in ("RGBA", "LA"):
-            # Create white background
-            background = Image.new("RGB", image.size, (255, 255, 255))
-            if image.mode == "RGBA":
-                background.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
-            else:
-                background.paste(image)
-            image = background
-        elif image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Resize to standard size for OpenAI image API (1024x1024 max)
-        max_size = 1024
-        if image.width > max_size or image.height > max_size:
-            image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-            logger.info(f"PROFILE_PHOTO: Resized profile photo to {image.size}")
-
-        # Save as PNG for best quality
-        image.save(file_path, "PNG", quality=95)
+        content_hash = hashlib.sha256(image_data).hexdigest()[:16]
+        file_path = _get_processed_photo_path(content_hash)
 
-        logger.info(f"PROFILE_PHOTO: Saved processed profile photo to {file_path}")
+        if os.path.exists(file_path):
+            # Same bytes behind a new URL (or expired validators) - skip decode/resize
+            logger.info(f"PROFILE_PHOTO: Profile photo content unchanged for {name}")
+            _touch(file_path)
+        else:
+            # A superseded photo and its analysis stay: other users may share the
+            # same bytes, and TTL cleanup drops them once nobody touches them
+            _process_profile_photo(image_data, file_path)
+            logger.info(f"PROFILE_PHOTO: Saved processed profile photo to {file_path}")
+
+        _save_photo_metadata(
+            meta_path,
+            {
+                "url": photo_url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "content_hash": content_hash,
+                "checked_at": datetime.now().isoformat(),
+            },
+        )
         return file_path
 
     except Exception as e:
@@ -894,8 +1068,8 @@ def cleanup_old_images(days_to_keep=None):
 
 def cleanup_old_profile_photos(days_to_keep=None):
     """
-    Clean up old downloaded profile photos to save disk space.
-    Also removes legacy duplicate profile photos with timestamps.
+    Clean up unused processed profile photos, vision analyses and per-user photo
+    metadata to save disk space. Also removes legacy per-user photo and analysis files from before content-hash keying.
 
     Args:
         days_to_keep: Number of days to keep profile photos (default: from config)
@@ -914,33 +1088,39 @@ def cleanup_old_profile_photos(days_to_keep=None):
         # Calculate cutoff date
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
 
-        # Find all profile photo files
-        pattern = os.path.join(profiles_dir, "profile_*.png")
-        profile_files = glob.glob(pattern)
+        # Processed photos (photo_<hash>.png), vision analyses (analysis_<hash>.json)
+        # and per-user metadata (profile_<key>.json) are touched or rewritten on every
+        # use, so mtime-based TTL only drops unused entries and departed users
+        cache_files = (
+            glob.glob(os.path.join(profiles_dir, "photo_*.png"))
+            + glob.glob(os.path.join(profiles_dir, "analysis_*.json"))
+            + glob.glob(os.path.join(profiles_dir, "profile_*.json"))
+        )
+        # Pre-hash-keying files: profile_<user>.png and analysis_<user_id>.json
+        legacy_files = glob.glob(os.path.join(profiles_dir, "profile_*.png")) + [
+            path
+            for path in glob.glob(os.path.join(profiles_dir, "analysis_*.json"))
+            if not re.match(r"^analysis_[0-9a-f]{16}\.json$", os.path.basename(path))
+        ]
 
         deleted_count = 0
-        for file_path in profile_files:
+        for file_path in set(cache_files) | set(legacy_files):
             try:
                 filename = os.path.basename(file_path)
 
-                # Check if this is a legacy file with timestamp (e.g., profile_Annie_20251120_123456.png)
-                # New format: profile_U12345678.png (no timestamp)
-                # Legacy format: profile_Name_YYYYMMDD_HHMMSS.png (name may contain underscores)
-                legacy_pattern = r"^profile_.+_\d{8}_\d{6}\.png$"
-                is_legacy = bool(re.match(legacy_pattern, filename))
-
-                if is_legacy:
-                    # Delete all legacy timestamp-based files (duplicates)
+                if file_path in legacy_files:
+                    # Superseded by content-hash keyed files
                     os.remove(file_path)
                     deleted_count += 1
-                    logger.info(f"PROFILE_CLEANUP: Deleted legacy duplicate {filename}")
+                    logger.info(f"PROFILE_CLEANUP: Deleted legacy profile cache file {filename}")
                 else:
-                    # For new user_id-based files, use TTL-based cleanup
                     file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
                     if file_mtime < cutoff_date:
                         os.remove(file_path)
                         deleted_count += 1
-                        logger.info(f"PROFILE_CLEANUP: Deleted expired profile photo {filename}")
+                        logger.info(
+                            f"PROFILE_CLEANUP: Deleted expired profile cache file {filename}"
+                        )
 
             except Exception as e:
                 logger.error(f"PROFILE_CLEANUP_ERROR: Failed to delete {file_path}: {e}")
@@ -948,7 +1128,7 @@ def cleanup_old_profile_photos(days_to_keep=None):
         if deleted_count > 0:
             logger.info(
                 f"PROFILE_CLEANUP: Deleted {deleted_count} profile photos "
-                f"(legacy duplicates + expired > {days_to_keep} days)"
+                f"(legacy + unused > {days_to_keep} days)"
             )
         else:
             logger.debug("PROFILE_CLEANUP: No profile photos found to delete")
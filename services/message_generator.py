@@ -26,7 +26,8 @@ from config import (
     TOKEN_LIMITS,
     get_logger,
 )
-from integrations.openai import complete
+from integrations.openai import complete, complete_batch
+from integrations.openai_guard import OpenAIUnavailableError
 from integrations.web_search import get_birthday_facts
 from slack.client import get_user_mention
 from storage.birthdays import DEFAULT_PREFERENCES
@@ -42,6 +43,7 @@ from utils.sanitization import (
     sanitize_status_text,
     sanitize_username,
 )
+from utils.tracing import bind_context, span
 
 logger = get_logger("llm")
 
@@ -613,6 +615,7 @@ def _generate_birthday_message(
             from services.image_generator import (
                 create_profile_photo_birthday_image,
                 generate_birthday_image,
+                prefetch_profile_analyses,
             )
 
             def _generate_image_for_person(person):
@@ -685,14 +688,33 @@ def _generate_birthday_message(
                     )
                 return None
 
+            def _traced_image_for_person(person):
+                with span("image_generation", user_id=person["user_id"]):
+                    return _generate_image_for_person(person)
+
             # Use parallel execution for multiple people
             if count > 1:
                 from config import AI_MAX_WORKERS
 
+                # One batched vision call for all uncached profile photos instead of one per person
+                prefetch_profile_analyses(
+                    [
+                        person.get("profile", {})
+                        for person in birthday_people
+                        if person.get("preferences", {}).get(
+                            "image_enabled", DEFAULT_PREFERENCES["image_enabled"]
+                        )
+                        and person.get("preferences", {}).get(
+                            "celebration_style", DEFAULT_PREFERENCES["celebration_style"]
+                        )
+                        != "quiet"
+                    ]
+                )
+
                 logger.info(f"IMAGE: Starting parallel generation for {count} people")
                 with ThreadPoolExecutor(max_workers=AI_MAX_WORKERS) as executor:
                     future_to_person = {
-                        executor.submit(_generate_image_for_person, person): person
+                        executor.submit(bind_context(_traced_image_for_person), person): person
                         for person in birthday_people
                     }
                     for future in as_completed(future_to_person):
@@ -707,7 +729,7 @@ def _generate_birthday_message(
                             )
             else:
                 # Single person - no need for thread pool overhead
-                result = _generate_image_for_person(first_person)
+                result = _traced_image_for_person(first_person)
                 if result:
                     generated_images.append(result)
 
@@ -1367,6 +1389,110 @@ def _generate_fallback_consolidated_message(birthday_people):
     return message
 
 
+_TITLE_SYSTEM_PROMPT = "You are a creative title generator for birthday image uploads. STRICT LIMIT: Keep titles 2-8 words and under 100 characters total. CRITICAL: You MUST include the person's name(s) prominently in every title. Be creative but keep it workplace appropriate. Do not include emojis - they will be added separately. Do not use any formatting such as bold, italic, or markdown — output plain text only. Output ONLY the title, nothing else."
+
+
+def _build_title_prompt(name, personality, user_profile, is_multiple_people):
+    """Format the personality-specific image title prompt."""
+    from config.personality import get_personality_config
+
+    personality_config = get_personality_config(personality)
+    title_prompt_template = personality_config.get("image_title_prompt")
+
+    if not title_prompt_template:
+        # Fallback to standard personality if no title prompt found
+        standard_config = get_personality_config("standard")
+        title_prompt_template = standard_config.get("image_title_prompt", "")
+
+    # Extract context from user profile
+    title_context = ""
+    if user_profile and user_profile.get("title"):
+        title_context = f", who works as a {user_profile['title']}"
+
+    return title_prompt_template.format(
+        name=name,
+        title_context=title_context,
+        multiple_context=(
+            " This is for multiple people celebrating together!" if is_multiple_people else ""
+        ),
+    )
+
+
+def _clean_title(ai_title):
+    """Normalize an AI title: Slack formatting, no wrapping quotes or trailing punctuation."""
+    ai_title = markdown_to_slack_mrkdwn(ai_title.strip())
+    return ai_title.strip("\"'").rstrip(".!?")
+
+
+def generate_birthday_image_titles(title_requests):
+    """
+    Generate titles for several birthday images with one batched AI call.
+
+    Titles that come back too short/long or without the person's name are
+    regenerated individually via generate_birthday_image_title().
+
+    Args:
+        title_requests: List of dicts with name, personality, user_profile, is_multiple_people
+
+    Returns:
+        list: Title strings, index-aligned with title_requests
+    """
+    if len(title_requests) < 2:
+        return [generate_birthday_image_title(**request) for request in title_requests]
+
+    items = {
+        str(i): _build_title_prompt(
+            request["name"],
+            request.get("personality", "standard"),
+            request.get("user_profile"),
+            request.get("is_multiple_people", False),
+        )
+        for i, request in enumerate(title_requests)
+    }
+
+    def _validate(item_id, result):
+        request = title_requests[int(item_id)]
+        title = _clean_title(result["title"])
+        return SLACK_FILE_TITLE_MIN_LENGTH <= len(
+            title
+        ) <= SLACK_FILE_TITLE_MAX_LENGTH and _validate_title_contains_names(
+            title, request["name"], request.get("is_multiple_people", False)
+        )
+
+    def _fallback(item_id):
+        title = generate_birthday_image_title(**title_requests[int(item_id)])
+        return {"title": title, "fallback": True}
+
+    results = complete_batch(
+        items,
+        fields=("title",),
+        instructions=_TITLE_SYSTEM_PROMPT,
+        task="Write one birthday image title for each request below.",
+        fallback=_fallback,
+        max_tokens_per_item=TOKEN_LIMITS["image_title_generation"],
+        validate=_validate,
+        temperature=TEMPERATURE_SETTINGS["creative"],
+        context="IMAGE_TITLE_GEN",
+    )
+
+    titles = []
+    for item_id, request in zip(items, title_requests):
+        result = results.get(item_id)
+        if not result:
+            titles.append(
+                get_fallback_title(
+                    request["name"],
+                    request.get("personality", "standard"),
+                    request.get("is_multiple_people", False),
+                )
+            )
+        elif result.get("fallback"):
+            titles.append(result["title"])
+        else:
+            titles.append(_clean_title(result["title"]))
+    return titles
+
+
 def generate_birthday_image_title(
     name,
     personality="standard",
@@ -1403,30 +1529,7 @@ def generate_birthday_image_title(
         name = str(name) if name else "Birthday Person"
 
     try:
-        # Get personality-specific title prompt
-        from config.personality import get_personality_config
-
-        personality_config = get_personality_config(personality)
-        title_prompt_template = personality_config.get("image_title_prompt")
-
-        if not title_prompt_template:
-            # Fallback to standard personality if no title prompt found
-            standard_config = get_personality_config("standard")
-            title_prompt_template = standard_config.get("image_title_prompt", "")
-
-        # Extract context from user profile
-        title_context = ""
-        if user_profile and user_profile.get("title"):
-            title_context = f", who works as a {user_profile['title']}"
-
-        # Format the prompt
-        formatted_prompt = title_prompt_template.format(
-            name=name,
-            title_context=title_context,
-            multiple_context=(
-                " This is for multiple people celebrating together!" if is_multiple_people else ""
-            ),
-        )
+        formatted_prompt = _build_title_prompt(name, personality, user_profile, is_multiple_people)
 
         logger.info(f"TITLE_GEN: Generating AI title for {name} in {personality} style")
 
@@ -1436,23 +1539,14 @@ def generate_birthday_image_title(
             try:
                 ai_title = complete(
                     messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a creative title generator for birthday image uploads. STRICT LIMIT: Keep titles 2-8 words and under 100 characters total. CRITICAL: You MUST include the person's name(s) prominently in every title. Be creative but keep it workplace appropriate. Do not include emojis - they will be added separately. Do not use any formatting such as bold, italic, or markdown — output plain text only. Output ONLY the title, nothing else.",
-                        },
+                        {"role": "system", "content": _TITLE_SYSTEM_PROMPT},
                         {"role": "user", "content": formatted_prompt},
                     ],
                     max_tokens=TOKEN_LIMITS["image_title_generation"],
                     temperature=TEMPERATURE_SETTINGS["creative"],
                     context="IMAGE_TITLE_GEN",
                 )
-                ai_title = ai_title.strip()
-
-                # Fix Slack formatting issues
-                ai_title = markdown_to_slack_mrkdwn(ai_title)
-
-                # Clean up the title (remove quotes, extra punctuation)
-                ai_title = ai_title.strip("\"'").rstrip(".!?")
+                ai_title = _clean_title(ai_title)
 
                 # Validate title length
                 if (
@@ -1486,7 +1580,7 @@ def generate_birthday_image_title(
                 return ai_title
 
             except Exception as e:
-                if attempt < max_retries:
+                if attempt < max_retries and not isinstance(e, OpenAIUnavailableError):
                     logger.warning(f"TITLE_GEN: API error on attempt {attempt + 1}, retrying: {e}")
                     continue
                 else:
@@ -1,27 +1,51 @@
 """
 Background scheduling system for automatic birthday celebrations and cache maintenance.
 
-Manages timezone-aware hourly checks and simple daily announcements in a
+Manages timezone-aware celebration triggers and simple daily announcements in a
 separate daemon thread. Supports startup recovery and dynamic reconfiguration.
 
+Jobs run on a timer heap (utils/timer_scheduler.py): the thread sleeps until
+the next job is due and refresh_schedule() wakes it when settings change. Due
+jobs are dispatched to bounded worker pools (SCHEDULER_WORKER_POOLS) so cache
+refreshes never hold up birthday checks; each job has a timeout
+(SCHEDULER_JOB_TIMEOUTS) and never overlaps itself.
+
+The per-job stats double as a run journal (last successful completion). At
+startup, cache refresh jobs whose window passed while the bot was down are
+replayed in the background, SCHEDULER_CATCHUP_STAGGER_SECONDS apart.
+
+In timezone mode the day's celebration is planned once per UTC day: the earliest
+instant at which anyone celebrating today reaches TIMEZONE_CELEBRATION_TIME gets
+a one-shot trigger. invalidate_birthday_plan() replans after birthday, channel
+membership or timezone changes.
+
 Key functions:
 - setup_scheduler(), run_now(): Scheduler initialization and manual triggers
-- hourly_task(), daily_task(): Birthday check tasks
+- refresh_schedule(): Re-register jobs after mode/timezone settings change
+- plan_birthday_trigger(), invalidate_birthday_plan(): Timezone-mode planning
+- birthday_trigger_task(), daily_task(): Birthday check tasks
 - weekly_calendarific_refresh_task(): Weekly Calendarific cache refresh (Sundays)
 - monthly_observances_refresh_task(): Monthly observances cache refresh (1st of month)
   Refreshes UN, UNESCO, and WHO caches.
 
-Uses schedule library and threading for non-blocking execution.
+Per-job run counts, durations and last success are persisted in SCHEDULER_STATS_FILE.
+Each run also tallies its Slack API calls (slack.client.record_slack_calls) and
+warns when a job exceeds its SLACK_CALL_BUDGETS entry.
+
+With several replicas on a shared data volume, only the holder of the leader
+lease (utils/leader_lease.py) runs scheduled jobs; the others keep serving Slack
+events and forward schedule changes to the leader. A standby replica takes over
+within LEADER_LEASE_SECONDS of the leader dying, replaying anything it missed.
 """
 
+import atexit
+import functools
 import json
 import os
 import threading
 import time
-from datetime import datetime, timezone
-
-import schedule
-from filelock import FileLock
+from datetime import datetime, timedelta, timezone
+from datetime import time as dt_time
 
 from config import (
     CACHE_REFRESH_TIME,
@@ -29,13 +53,35 @@ from config import (
     DAILY_CHECK_TIME,
     HEARTBEAT_STALE_THRESHOLD_SECONDS,
     ICS_SUBSCRIPTIONS_ENABLED,
-    SCHEDULER_CHECK_INTERVAL_SECONDS,
+    LEADER_ELECTION_ENABLED,
+    LEADER_LEASE_FILE,
+    LEADER_LEASE_SECONDS,
+    SCHEDULER_BIRTHDAY_REPLAN_DELAY_SECONDS,
+    SCHEDULER_BIRTHDAY_RETRY_SECONDS,
+    SCHEDULER_CATCHUP_STAGGER_SECONDS,
+    SCHEDULER_DEFAULT_JOB_TIMEOUT_SECONDS,
+    SCHEDULER_JOB_TIMEOUTS,
+    SCHEDULER_MAX_SLEEP_SECONDS,
     SCHEDULER_STATS_FILE,
-    SCHEDULER_STATS_SAVE_INTERVAL,
-    TIMEOUTS,
+    SCHEDULER_WORKER_POOLS,
+    SLACK_CALL_BUDGETS,
+    TIMEZONE_CELEBRATION_TIME,
     get_logger,
 )
 from services.birthday import celebrate_missed_birthdays
+from storage.birthdays import register_birthdays_change_hook
+from utils.leader_lease import LeaderLease
+from utils.locks import file_lock
+from utils.timer_scheduler import (
+    JobExecutor,
+    TimerScheduler,
+    daily_at,
+    daily_at_utc,
+    every_hour_at,
+    monthly_at,
+    once_at,
+    weekly_at,
+)
 
 logger = get_logger("scheduler")
 
@@ -45,6 +91,7 @@ _simple_daily_callback = None
 _app_instance = None
 _timezone_enabled = None
 _check_interval = None
+_trigger_not_before = None  # Naive local time; the trigger never re-arms earlier
 
 # Scheduler health monitoring
 _scheduler_thread = None
@@ -52,10 +99,26 @@ _last_heartbeat = None
 _total_executions = 0
 _failed_executions = 0
 _scheduler_running = False
+_stats_lock = threading.Lock()
+_last_slack_calls = {}  # job name -> SlackCallRecorder.summary() of its last run
+
+# Leader election (None when disabled: this process always runs the jobs)
+_lease = None
+_leader_event = threading.Event()
+_elected_at_startup = False
+_leading = False  # True while run_forever() dispatches jobs for this replica
+_leading_lock = threading.Lock()
 
 # Persistence configuration
 SCHEDULER_STATS_LOCK_FILE = SCHEDULER_STATS_FILE + ".lock"
 
+# Executor pools and priorities (lower runs first when several jobs are due)
+BIRTHDAY_POOL = "birthday"
+MAINTENANCE_POOL = "maintenance"
+PRIORITY_CELEBRATION = 0
+PRIORITY_ANNOUNCEMENT = 1
+PRIORITY_MAINTENANCE = 5
+
 
 def load_scheduler_stats() -> dict:
     """
@@ -63,14 +126,15 @@ def load_scheduler_stats() -> dict:
 
     Returns:
         dict: Scheduler statistics with keys:
-            - total_executions: int
-            - failed_executions: int
+            - total_executions: int (job runs)
+            - failed_executions: int (job runs that raised)
             - last_heartbeat: ISO timestamp string or None
             - started_at: ISO timestamp of first run
             - last_saved: ISO timestamp of last save
+            - jobs: {job name: runs, failures, durations, last_run, last_success}
     """
     try:
-        lock = FileLock(SCHEDULER_STATS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(SCHEDULER_STATS_LOCK_FILE)
         with lock:
             if os.path.exists(SCHEDULER_STATS_FILE):
                 with open(SCHEDULER_STATS_FILE, "r") as f:
@@ -85,19 +149,24 @@ def load_scheduler_stats() -> dict:
         "last_heartbeat": None,
         "started_at": None,
         "last_saved": None,
+        "jobs": {},
     }
 
 
 def save_scheduler_stats(
-    total_executions: int, failed_executions: int, last_heartbeat: datetime | None
+    total_executions: int,
+    failed_executions: int,
+    last_heartbeat: datetime | None,
+    jobs: dict | None = None,
 ) -> bool:
     """
     Save scheduler statistics to persistent storage.
 
     Args:
-        total_executions: Total number of scheduler loop executions
-        failed_executions: Number of failed executions
+        total_executions: Total number of job runs
+        failed_executions: Number of job runs that raised
         last_heartbeat: Last heartbeat datetime
+        jobs: Optional per-job stats {name: snapshot}; kept from the file if omitted
 
     Returns:
         bool: True if save successful, False otherwise
@@ -115,9 +184,10 @@ def save_scheduler_stats(
             "last_heartbeat": last_heartbeat.isoformat() if last_heartbeat else None,
             "started_at": started_at,
             "last_saved": datetime.now(timezone.utc).isoformat(),
+            "jobs": jobs if jobs is not None else existing.get("jobs", {}),
         }
 
-        lock = FileLock(SCHEDULER_STATS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(SCHEDULER_STATS_LOCK_FILE)
         with lock:
             with open(SCHEDULER_STATS_FILE, "w") as f:
                 json.dump(data, f, indent=2, sort_keys=True)
@@ -130,32 +200,119 @@ def save_scheduler_stats(
         return False
 
 
-def hourly_task():
+def birthday_trigger_task():
     """
-    Run the hourly birthday check task for timezone-aware celebrations.
-    This function is called every hour to check for birthdays in different timezones.
-    Checks timezone mode at runtime to allow dynamic mode switching.
+    One-shot task fired at the planned celebration instant (timezone mode).
+
+    Runs the timezone-aware check, then replans so anyone still uncelebrated
+    (e.g. a birthday added after the trigger was armed, or a failed celebration)
+    gets a new trigger, no sooner than SCHEDULER_BIRTHDAY_RETRY_SECONDS later.
     """
     from storage.settings import load_timezone_settings
 
     # Check if timezone mode is enabled at runtime (allows dynamic switching)
     timezone_enabled, _ = load_timezone_settings()
     if not timezone_enabled:
-        logger.debug("SCHEDULER: Timezone mode disabled, skipping hourly check")
+        logger.debug("SCHEDULER: Timezone mode disabled, skipping celebration trigger")
         return
 
     current_time = datetime.now(timezone.utc)
     local_time = datetime.now()
     logger.info(
-        f"SCHEDULER: Running hourly timezone-aware check at {local_time.strftime('%H:%M:%S')} local time ({current_time} UTC)"
+        f"SCHEDULER: Running timezone-aware celebration trigger at {local_time.strftime('%H:%M:%S')} local time ({current_time} UTC)"
     )
 
     if _timezone_aware_callback and _app_instance:
-        _timezone_aware_callback(_app_instance, current_time)
+        global _trigger_not_before
+        # Whoever is still uncelebrated after this run (failed celebration, late
+        # addition) waits for the retry interval instead of re-firing at once
+        _trigger_not_before = local_time + timedelta(seconds=SCHEDULER_BIRTHDAY_RETRY_SECONDS)
+        try:
+            _timezone_aware_callback(_app_instance, current_time)
+        finally:
+            plan_birthday_trigger()
     else:
         logger.error("SCHEDULER: No timezone-aware callback or app instance registered")
 
 
+def plan_birthday_trigger():
+    """
+    Arm (or clear) the one-shot birthday_trigger job for the current UTC day.
+
+    Runs at UTC midnight, after invalidate_birthday_plan() and after each
+    trigger. Idle days leave no trigger, so no birthday work runs at all.
+    """
+    if not _timezone_enabled or not _app_instance:
+        _scheduler.remove_job("birthday_trigger")
+        return
+
+    from services.birthday import plan_timezone_celebration
+
+    instant = plan_timezone_celebration(_app_instance, datetime.now(timezone.utc))
+    if instant is None:
+        if _scheduler.remove_job("birthday_trigger"):
+            logger.info("SCHEDULER: Celebration trigger cleared - nobody left to celebrate today")
+        return
+
+    # The timer heap runs on naive server-local time
+    fire_at = instant.astimezone().replace(tzinfo=None)
+    if _trigger_not_before is not None and fire_at < _trigger_not_before:
+        fire_at = _trigger_not_before
+    _add_job("birthday_trigger", birthday_trigger_task, once_at(fire_at), one_shot=True)
+    logger.info(
+        f"SCHEDULER: Celebration trigger armed for {fire_at.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M')} UTC"
+    )
+
+
+def _plan_new_day():
+    """UTC midnight: yesterday's retry backoff does not delay the new day's cohort."""
+    global _trigger_not_before
+    _trigger_not_before = None
+    plan_birthday_trigger()
+
+
+def invalidate_birthday_plan(reason=""):
+    """
+    Replan today's celebration trigger after birthdays, membership or profiles change.
+
+    The replan runs SCHEDULER_BIRTHDAY_REPLAN_DELAY_SECONDS later so bursts of
+    changes (bulk imports, profile syncs) coalesce into one replan; a pending
+    replan is not postponed. No-op outside timezone mode.
+    """
+    if not is_scheduler_leader():
+        # This replica's mode may be stale; the leader decides whether to replan
+        _notify_leader("birthday_replan")
+        return
+    if not _timezone_enabled:
+        return
+    if _scheduler.get_job("birthday_replan") is not None:
+        return
+    run_at = datetime.now() + timedelta(seconds=SCHEDULER_BIRTHDAY_REPLAN_DELAY_SECONDS)
+    _add_job("birthday_replan", plan_birthday_trigger, once_at(run_at), one_shot=True)
+    logger.debug(f"SCHEDULER: Celebration replan queued{f' ({reason})' if reason else ''}")
+
+
+def _on_birthdays_saved():
+    """Today's cohort may have changed: replan the timezone-mode celebration trigger."""
+    invalidate_birthday_plan("birthdays saved")
+
+
+def timezone_bot_birthday_task():
+    """Daily task (timezone mode) - bot birthday at TIMEZONE_CELEBRATION_TIME server time."""
+    if _app_instance:
+        from services.birthday import celebrate_bot_birthday
+
+        celebrate_bot_birthday(_app_instance, datetime.now(timezone.utc))
+
+
+def timezone_special_days_task():
+    """Daily task (timezone mode) - daily special days at SPECIAL_DAYS_CHECK_TIME."""
+    if _app_instance:
+        from services.birthday import check_and_announce_special_days
+
+        check_and_announce_special_days(_app_instance, datetime.now(timezone.utc))
+
+
 def daily_task():
     """
     Daily task - runs simple daily check for all birthdays at once.
@@ -167,7 +324,7 @@ def daily_task():
     # Check if timezone mode is disabled at runtime (allows dynamic switching)
     timezone_enabled, _ = load_timezone_settings()
     if timezone_enabled:
-        logger.debug("SCHEDULER: Timezone mode enabled, skipping daily check (using hourly)")
+        logger.debug("SCHEDULER: Timezone mode enabled, skipping daily check (using triggers)")
         return
 
     current_time = datetime.now(timezone.utc)
@@ -196,6 +353,7 @@ def weekly_calendarific_refresh_task():
             logger.info(f"SCHEDULER: Calendarific prefetch complete: {results}")
         except Exception as e:
             logger.error(f"SCHEDULER: Failed to refresh Calendarific cache: {e}")
+            raise  # Keep the run journal from recording a success
     else:
         logger.debug("SCHEDULER: Calendarific not enabled, skipping refresh")
 
@@ -231,6 +389,8 @@ def monthly_observances_refresh_task():
     Monthly task - refreshes all observances caches (UN, UNESCO, WHO).
     Runs on the 1st of each month at CACHE_REFRESH_TIME.
     Observances data rarely changes, so monthly refresh is sufficient.
+    Raises after trying every source if any failed, so the run is not journaled
+    as a success and gets replayed after a restart.
     """
     from integrations.observances import get_enabled_sources
 
@@ -241,12 +401,16 @@ def monthly_observances_refresh_task():
         logger.debug("SCHEDULER: No observance sources enabled, skipping refresh")
         return
 
+    failed = []
     for name, refresh_fn, _status_fn in sources:
         try:
             stats = refresh_fn(force=True)
             logger.info(f"SCHEDULER: {name} observances refresh complete: {stats}")
         except Exception as e:
             logger.error(f"SCHEDULER: Failed to refresh {name} observances cache: {e}")
+            failed.append(name)
+    if failed:
+        raise RuntimeError(f"observances refresh failed for {', '.join(failed)}")
 
 
 def daily_ics_refresh_task():
@@ -261,11 +425,16 @@ def daily_ics_refresh_task():
         logger.info(f"SCHEDULER: ICS refresh complete: {total} events")
     except Exception as e:
         logger.error(f"SCHEDULER: ICS refresh failed: {e}")
+        raise  # Keep the run journal from recording a success
 
 
 def canvas_refresh_task():
     """Periodic task to refresh the ops channel canvas dashboard."""
     from config import CANVAS_DASHBOARD_ENABLED, OPS_CHANNEL_ID
+    from integrations.openai_usage import flush_usage
+
+    # Persist pending AI usage counters (record_call also flushes on its own)
+    flush_usage()
 
     if not CANVAS_DASHBOARD_ENABLED or not OPS_CHANNEL_ID or not _app_instance:
         return
@@ -278,51 +447,272 @@ def canvas_refresh_task():
         logger.error(f"SCHEDULER: Canvas refresh failed: {e}")
 
 
-def run_scheduler():
-    """Run the scheduler in a separate thread with health monitoring and stats persistence"""
-    global _last_heartbeat, _total_executions, _failed_executions, _scheduler_running
+def _on_job_done(job):
+    """Update totals and persist per-job stats after every job run."""
+    global _total_executions, _failed_executions, _last_heartbeat
+
+    with _stats_lock:
+        _total_executions += 1
+        if job.last_error is not None:
+            _failed_executions += 1
+            from slack.canvas import safe_record_warning
+
+            safe_record_warning(f"Scheduler job {job.name} failed: {job.last_error}")
+        _last_heartbeat = datetime.now()
+        jobs = {j["name"]: j for j in _scheduler.jobs()}
+        save_scheduler_stats(_total_executions, _failed_executions, _last_heartbeat, jobs)
+
+
+_scheduler = TimerScheduler(
+    on_job_done=_on_job_done,
+    max_sleep=SCHEDULER_MAX_SLEEP_SECONDS,
+    executor=JobExecutor(SCHEDULER_WORKER_POOLS, default_pool=MAINTENANCE_POOL),
+)
 
-    # Load persisted stats on startup
+
+def is_scheduler_leader():
+    """True if this replica runs scheduled jobs (always, with leader election off)."""
+    return _lease is None or _lease.is_leader
+
+
+def _notify_leader(signal):
+    """Forward a schedule change to the leader when another replica holds the lease."""
+    if _lease is not None and not _lease.is_leader:
+        _lease.post_signal(signal)
+
+
+def _on_elected():
+    _leader_event.set()
+
+
+def _on_demoted():
+    # Stop dispatching at once; jobs already running finish on their workers.
+    # A standby that never led has no loop to stop: a stop() there would stay
+    # pending and make run_forever() return right after the next promotion.
+    with _leading_lock:
+        _leader_event.clear()
+        if _leading:
+            _scheduler.stop()
+
+
+def _on_leader_signal(name):
+    """Apply a schedule change posted by a standby replica."""
+    if name == "refresh_schedule":
+        refresh_schedule()
+    elif name == "birthday_replan":
+        invalidate_birthday_plan("change on another replica")
+
+
+def _start_leading(failover):
+    """
+    Prepare to run jobs after winning the lease.
+
+    Job stats come from the shared journal (the previous leader's runs count).
+    On failover the schedule is rebuilt from the shared settings, every next run
+    is recomputed from now (the standby's fire times may be long past) and the
+    startup birthday check is queued, since app startup skipped it on this replica.
+    """
+    global _total_executions, _failed_executions
+
+    if failover:
+        refresh_schedule()
+        _scheduler.reschedule()
+
+    # Load persisted per-job stats (totals are the sum of job runs)
     persisted_stats = load_scheduler_stats()
-    _total_executions = persisted_stats.get("total_executions", 0)
-    _failed_executions = persisted_stats.get("failed_executions", 0)
+    persisted_jobs = persisted_stats.get("jobs") or {}
+    _scheduler.restore_stats(persisted_jobs)
+    _total_executions = sum(j.get("runs", 0) for j in persisted_jobs.values())
+    _failed_executions = sum(j.get("failures", 0) for j in persisted_jobs.values())
     logger.info(
-        f"SCHEDULER_HEALTH: Loaded persisted stats - {_total_executions} total, {_failed_executions} failed"
+        f"SCHEDULER_HEALTH: Loaded persisted stats - {_total_executions} job runs, {_failed_executions} failed"
     )
 
+    # Replay cache refreshes whose window passed while the bot (or leader) was down
+    _scheduler.schedule_missed_runs(SCHEDULER_CATCHUP_STAGGER_SECONDS)
+
+    if failover:
+        _add_job("failover_check", run_now, once_at(datetime.now()), one_shot=True)
+
+
+def run_scheduler():
+    """Run the timer-heap scheduler loop in a separate thread with stats persistence"""
+    global _last_heartbeat, _scheduler_running, _leading
+
     _scheduler_running = True
     logger.info("SCHEDULER_HEALTH: Scheduler thread started and running")
 
-    last_save_count = _total_executions
-
+    failover = not _elected_at_startup
+    leading = False
     while True:
+        if not _leader_event.is_set():
+            logger.info("SCHEDULER: Standing by - another replica holds the leader lease")
+            leading = False
+            _leader_event.wait()
         try:
-            # Update heartbeat
-            _last_heartbeat = datetime.now()
+            if not leading:
+                _start_leading(failover)
+                failover = leading = True
+                _last_heartbeat = datetime.now()
+            with _leading_lock:
+                if not _leader_event.is_set():
+                    continue  # Demoted while preparing: back to standby
+                _leading = True
+            try:
+                _scheduler.run_forever()
+            finally:
+                with _leading_lock:
+                    _leading = False
+            leading = False
+            logger.info("SCHEDULER: Stopped running jobs after losing the leader lease")
+        except Exception as e:
+            logger.error(f"SCHEDULER_HEALTH: Error in scheduler loop: {e}")
+            from slack.canvas import safe_record_warning
+
+            safe_record_warning(f"Scheduler error: {e}")
+            time.sleep(1)  # Avoid a hot loop if the error repeats
 
-            # Run scheduled tasks
-            pending_count = len(schedule.jobs)
-            if pending_count > 0:
-                _total_executions += 1
 
-            schedule.run_pending()
+def _add_job(
+    name,
+    fn,
+    trigger,
+    one_shot=False,
+    pool=BIRTHDAY_POOL,
+    priority=PRIORITY_CELEBRATION,
+    catch_up=False,
+):
+    """Add (or replace) a job with its pool, priority and configured timeout."""
+    timeout = SCHEDULER_JOB_TIMEOUTS.get(name, SCHEDULER_DEFAULT_JOB_TIMEOUT_SECONDS)
+    job_fn = functools.partial(_run_recorded, name, fn)
+    _scheduler.add_job(name, job_fn, trigger, one_shot, pool, priority, timeout, catch_up)
 
-            # Save stats periodically
-            if _total_executions - last_save_count >= SCHEDULER_STATS_SAVE_INTERVAL:
-                save_scheduler_stats(_total_executions, _failed_executions, _last_heartbeat)
-                last_save_count = _total_executions
 
-            time.sleep(SCHEDULER_CHECK_INTERVAL_SECONDS)
+def _run_recorded(name, fn):
+    """Run a job while tallying its Slack API calls against SLACK_CALL_BUDGETS."""
+    from slack.client import record_slack_calls
 
-        except Exception as e:
-            _failed_executions += 1
-            logger.error(f"SCHEDULER_HEALTH: Error in scheduler loop: {e}")
-            from slack.canvas import safe_record_warning
+    with record_slack_calls(name, SLACK_CALL_BUDGETS.get(name)) as recorder:
+        try:
+            return fn()
+        finally:
+            _last_slack_calls[name] = recorder.summary()
+
+
+def _set_job(
+    name,
+    fn,
+    trigger,
+    enabled=True,
+    pool=MAINTENANCE_POOL,
+    priority=PRIORITY_MAINTENANCE,
+    catch_up=False,
+):
+    """Add (or replace) a job when enabled, remove it otherwise."""
+    if enabled:
+        _add_job(name, fn, trigger, pool=pool, priority=priority, catch_up=catch_up)
+    else:
+        _scheduler.remove_job(name)
 
-            safe_record_warning(f"Scheduler error: {e}")
-            # Save stats on error to persist failure count
-            save_scheduler_stats(_total_executions, _failed_executions, _last_heartbeat)
-            time.sleep(SCHEDULER_CHECK_INTERVAL_SECONDS)  # Continue running even after errors
+
+def refresh_schedule():
+    """
+    Register the jobs that apply to the current settings and wake the scheduler.
+
+    Birthday checks follow the timezone mode (planned one-shot trigger vs.
+    daily) and the weekly digest job exists only while weekly mode is
+    configured. Call after changing timezone or special-days mode settings;
+    safe to call before setup_scheduler(). On a standby replica the leader is
+    asked to refresh too.
+    """
+    global _timezone_enabled, _check_interval
+
+    from config import SPECIAL_DAYS_CHECK_TIME, SPECIAL_DAYS_MODE
+    from storage.settings import load_timezone_settings
+    from storage.special_days import load_special_days_config
+
+    _timezone_enabled, _check_interval = load_timezone_settings()
+    weekly_configured = (
+        load_special_days_config().get("announcement_mode", SPECIAL_DAYS_MODE) == "weekly"
+    )
+
+    celebration = {"pool": BIRTHDAY_POOL, "priority": PRIORITY_CELEBRATION}
+    announcement = {"pool": BIRTHDAY_POOL, "priority": PRIORITY_ANNOUNCEMENT}
+    _set_job(
+        "birthday_plan",
+        _plan_new_day,
+        daily_at_utc(dt_time(0, 0)),
+        enabled=_timezone_enabled,
+        **celebration,
+    )
+    _set_job(
+        "bot_birthday_daily",
+        timezone_bot_birthday_task,
+        daily_at(TIMEZONE_CELEBRATION_TIME),
+        enabled=_timezone_enabled,
+        **announcement,
+    )
+    _set_job(
+        "special_days_daily",
+        timezone_special_days_task,
+        daily_at(SPECIAL_DAYS_CHECK_TIME),
+        enabled=_timezone_enabled and not weekly_configured,
+        **announcement,
+    )
+    _set_job(
+        "birthday_daily",
+        daily_task,
+        daily_at(DAILY_CHECK_TIME),
+        enabled=not _timezone_enabled,
+        **celebration,
+    )
+    if _timezone_enabled:
+        invalidate_birthday_plan("schedule refresh")
+    else:
+        _scheduler.remove_job("birthday_replan")
+        _scheduler.remove_job("birthday_trigger")
+
+    cache_time = CACHE_REFRESH_TIME
+    _set_job(
+        "calendarific_weekly",
+        weekly_calendarific_refresh_task,
+        weekly_at(6, cache_time),
+        catch_up=True,
+    )
+    _set_job(
+        "observances_monthly",
+        monthly_observances_refresh_task,
+        monthly_at(1, cache_time),
+        catch_up=True,
+    )
+    # Runs daily while weekly mode is configured; the task checks the digest day
+    # and deferred daily->weekly transitions itself
+    _set_job(
+        "special_days_weekly",
+        weekly_special_days_task,
+        daily_at(SPECIAL_DAYS_CHECK_TIME),
+        enabled=weekly_configured,
+        **announcement,
+    )
+    _set_job(
+        "ics_refresh",
+        daily_ics_refresh_task,
+        daily_at(cache_time),
+        enabled=ICS_SUBSCRIPTIONS_ENABLED,
+        catch_up=True,
+    )
+    _set_job(
+        "canvas_refresh",
+        canvas_refresh_task,
+        every_hour_at(0, 30),
+        enabled=CANVAS_DASHBOARD_ENABLED,
+    )
+
+    logger.info(
+        f"SCHEDULER: {len(_scheduler)} jobs registered - "
+        + ", ".join(f"{j['name']} ({j['trigger']})" for j in _scheduler.jobs())
+    )
+    _notify_leader("refresh_schedule")
 
 
 def setup_scheduler(app, timezone_aware_check, simple_daily_check):
@@ -334,85 +724,45 @@ def setup_scheduler(app, timezone_aware_check, simple_daily_check):
         timezone_aware_check: Function to call for timezone-aware birthday checks
         simple_daily_check: Function to call for simple daily birthday checks
     """
-    global _timezone_aware_callback, _simple_daily_callback, _app_instance, _timezone_enabled, _check_interval, _scheduler_thread
+    global _timezone_aware_callback, _simple_daily_callback, _app_instance, _scheduler_thread
+    global _lease, _elected_at_startup
     _timezone_aware_callback = timezone_aware_check
     _simple_daily_callback = simple_daily_check
     _app_instance = app
 
-    # Load timezone settings for logging current state
-    from storage.settings import load_timezone_settings
-
-    _timezone_enabled, _check_interval = load_timezone_settings()
-
-    # Schedule BOTH hourly and daily tasks - they check mode at runtime
-    # This allows dynamic mode switching without bot restart
-    schedule.every().hour.at(":00").do(hourly_task)
-    schedule.every().day.at(DAILY_CHECK_TIME.strftime("%H:%M")).do(daily_task)
-
-    # Get time zone info for logging
-    local_timezone = datetime.now().astimezone().tzinfo
+    register_birthdays_change_hook(_on_birthdays_saved)
+    refresh_schedule()
 
     # Log current mode for visibility
+    local_timezone = datetime.now().astimezone().tzinfo
     if _timezone_enabled:
         logger.info(
-            "SCHEDULER: Birthday tasks scheduled (current: timezone-aware mode, hourly at :00)"
+            "SCHEDULER: Birthday tasks scheduled (current: timezone-aware mode, planned per UTC day)"
         )
     else:
         logger.info(
             f"SCHEDULER: Birthday tasks scheduled (current: daily mode at {DAILY_CHECK_TIME.strftime('%H:%M')} {local_timezone})"
         )
 
-    # Schedule weekly Calendarific cache refresh (every Sunday)
-    cache_time_str = CACHE_REFRESH_TIME.strftime("%H:%M")
-    schedule.every().sunday.at(cache_time_str).do(weekly_calendarific_refresh_task)
-    logger.info(f"SCHEDULER: Weekly Calendarific refresh scheduled for Sunday {cache_time_str}")
-
-    # Schedule monthly observances cache refresh (1st of each month)
-    # Refreshes UN, UNESCO, and WHO observances caches
-    # Using day 1 check - runs daily but only executes on the 1st
-    def monthly_observances_check():
-        if datetime.now().day == 1:
-            monthly_observances_refresh_task()
-
-    schedule.every().day.at(cache_time_str).do(monthly_observances_check)
-    logger.info(
-        f"SCHEDULER: Monthly observances refresh (UN/UNESCO/WHO) scheduled for 1st of each month at {cache_time_str}"
-    )
-
-    # Schedule weekly special days digest task
-    # Always schedule this - the task itself checks the mode at runtime
-    # This allows mode changes to take effect without bot restart
-    from config import SPECIAL_DAYS_CHECK_TIME, WEEKDAY_NAMES
-    from storage.special_days import get_special_days_mode, get_weekly_day
-
-    special_time_str = SPECIAL_DAYS_CHECK_TIME.strftime("%H:%M")
-
-    # Schedule for all days - the task checks mode and configured day at runtime
-    schedule.every().day.at(special_time_str).do(weekly_special_days_task)
-
-    # Log current mode for visibility
-    special_days_mode = get_special_days_mode()
-    if special_days_mode == "weekly":
-        weekly_day = get_weekly_day()
-        day_name = WEEKDAY_NAMES[weekly_day]
-        logger.info(
-            f"SCHEDULER: Weekly special days task scheduled (current: weekly mode on {day_name.capitalize()})"
+    # Decide leadership before returning so run_now() knows whether to run here
+    if LEADER_ELECTION_ENABLED:
+        _lease = LeaderLease(
+            LEADER_LEASE_FILE,
+            LEADER_LEASE_SECONDS,
+            on_elected=_on_elected,
+            on_demoted=_on_demoted,
+            on_signal=_on_leader_signal,
         )
-    else:
+        _elected_at_startup = _lease.try_acquire()
+        _lease.start()
+        atexit.register(_lease.release)
         logger.info(
-            "SCHEDULER: Weekly special days task scheduled (current: daily mode, task will skip)"
+            f"SCHEDULER: Replica {_lease.instance_id} "
+            + ("holds the leader lease" if _elected_at_startup else "is on standby")
         )
-
-    # Schedule daily ICS subscription refresh
-    if ICS_SUBSCRIPTIONS_ENABLED:
-        schedule.every().day.at(cache_time_str).do(daily_ics_refresh_task)
-        logger.info(f"SCHEDULER: Daily ICS subscription refresh scheduled at {cache_time_str}")
-
-    # Schedule canvas dashboard refresh
-    if CANVAS_DASHBOARD_ENABLED:
-        schedule.every().hour.at(":00").do(canvas_refresh_task)
-        schedule.every().hour.at(":30").do(canvas_refresh_task)
-        logger.info("SCHEDULER: Canvas dashboard refresh scheduled at :00 and :30")
+    else:
+        _leader_event.set()
+        _elected_at_startup = True
 
     # Start the scheduler in a separate thread
     _scheduler_thread = threading.Thread(target=run_scheduler)
@@ -426,7 +776,15 @@ def run_now():
     if not _app_instance:
         logger.error("SCHEDULER: No app instance registered")
         return
+    if not is_scheduler_leader():
+        logger.info("SCHEDULER: Skipping startup birthday check - this replica is on standby")
+        return
+
+    _run_recorded("startup_check", _startup_check)
+
 
+def _startup_check():
+    """Startup catch-up plus today's birthday check (see run_now)."""
     current_time = datetime.now(timezone.utc)
     local_time = datetime.now()
     logger.info(
@@ -485,20 +843,29 @@ def get_scheduler_health():
     # Check if thread is alive
     thread_alive = _scheduler_thread is not None and _scheduler_thread.is_alive()
 
-    # Check heartbeat freshness (should be within threshold)
-    heartbeat_fresh = False
+    # The thread sleeps until the next job is due, so liveness means "no job is
+    # overdue by more than the threshold" rather than "woke up recently"
     heartbeat_age_seconds = None
     if _last_heartbeat:
-        heartbeat_age = now - _last_heartbeat
-        heartbeat_age_seconds = heartbeat_age.total_seconds()
-        heartbeat_fresh = heartbeat_age_seconds < HEARTBEAT_STALE_THRESHOLD_SECONDS
+        heartbeat_age_seconds = (now - _last_heartbeat).total_seconds()
+    next_run_in = _scheduler.seconds_until_next()
+    overdue_seconds = max(0.0, -next_run_in) if next_run_in is not None else 0.0
+    heartbeat_fresh = _last_heartbeat is not None and (
+        overdue_seconds < HEARTBEAT_STALE_THRESHOLD_SECONDS
+    )
 
     # Calculate success rate
     success_rate = None
     if _total_executions > 0:
         success_rate = ((_total_executions - _failed_executions) / _total_executions) * 100
 
-    health_status = "ok" if (thread_alive and heartbeat_fresh and _scheduler_running) else "error"
+    # A standby replica runs no jobs, so only its thread needs to be alive
+    is_leader = is_scheduler_leader()
+    if is_leader:
+        healthy = thread_alive and heartbeat_fresh and _scheduler_running
+    else:
+        healthy = thread_alive and _scheduler_running
+    health_status = "ok" if healthy else "error"
 
     # Get persisted stats for additional info
     persisted_stats = load_scheduler_stats()
@@ -513,7 +880,14 @@ def get_scheduler_health():
         "total_executions": _total_executions,
         "failed_executions": _failed_executions,
         "success_rate_percent": success_rate,
-        "scheduled_jobs": len(schedule.jobs),
+        "scheduled_jobs": len(_scheduler),
+        "next_run_in_seconds": next_run_in,
+        "overdue_seconds": overdue_seconds,
+        "jobs": _scheduler.jobs(),
+        "executor": _scheduler.executor_status(),
+        "role": "leader" if is_leader else "standby",
+        "leader": _lease.status() if _lease is not None else None,
+        "slack_calls": dict(_last_slack_calls),
         "timezone_enabled": _timezone_enabled,
         "check_interval_hours": _check_interval,
         "started_at": persisted_stats.get("started_at"),
@@ -530,18 +904,22 @@ def get_scheduler_summary():
     """
     health = get_scheduler_health()
 
+    if health["status"] == "ok" and health.get("role") == "standby":
+        return f"✅ Scheduler on standby - jobs run on {health['leader']['leader']}"
     if health["status"] == "ok":
-        return f"✅ Scheduler healthy - {health['scheduled_jobs']} jobs, {health['success_rate_percent']:.1f}% success rate"
+        rate = health["success_rate_percent"]
+        runs = "no runs yet" if rate is None else f"{rate:.1f}% success rate"
+        return f"✅ Scheduler healthy - {health['scheduled_jobs']} jobs, {runs}"
     else:
         issues = []
         if not health["thread_alive"]:
             issues.append("thread not running")
         if not health["heartbeat_fresh"]:
             age = health["heartbeat_age_seconds"]
-            if age is not None:
-                issues.append(f"heartbeat stale ({age:.0f}s ago)")
-            else:
+            if age is None:
                 issues.append("no heartbeat recorded")
+            else:
+                issues.append(f"jobs overdue by {health['overdue_seconds']:.0f}s")
         if not health["scheduler_running"]:
             issues.append("not initialized")
 
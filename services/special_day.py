@@ -22,7 +22,7 @@ from config import (
     get_logger,
 )
 from config.personality import get_personality_config
-from integrations.openai import complete
+from integrations.openai import complete, complete_batch
 from integrations.web_search import get_birthday_facts
 from services.image_generator import generate_birthday_image
 from slack.emoji import get_emoji_context_for_ai
@@ -66,6 +66,112 @@ def _fetch_facts_text(date_str, personality):
     return ""
 
 
+def _build_single_day_prompt(
+    day,
+    personality_config,
+    emoji_examples,
+    use_teaser,
+    suppress_mention,
+    today_formatted,
+    day_of_week,
+):
+    """Build the personality prompt for a single observance's teaser or full message."""
+    source_info = _build_source_link(day)
+
+    # Choose prompt based on use_teaser flag
+    if use_teaser:
+        prompt_key = "special_day_teaser"
+        # For teasers, we don't need date/facts complexity
+    else:
+        prompt_key = "special_day_single"
+
+    prompt = personality_config.get(prompt_key, personality_config.get("special_day_single", ""))
+
+    # Fill in template variables including source
+    prompt = prompt.format(
+        day_name=day.name,
+        category=day.category,
+        description=(
+            day.description[:DESCRIPTION_TEASER_LENGTH] if use_teaser else day.description
+        ),  # Truncate for teaser
+        emoji=day.emoji or "",
+        source=source_info if source_info else "UN/WHO observance",
+    )
+
+    if not use_teaser:
+        # Add category-specific emphasis only for full messages
+        category_emphasis = personality_config.get("special_day_category", {}).get(day.category, "")
+        if category_emphasis:
+            prompt += f"\n\n{category_emphasis}"
+
+        # Add date requirement for full messages
+        prompt += f"\n\nTODAY'S DATE: {today_formatted} ({day_of_week})"
+        prompt += "\n\nDATE REQUIREMENT: Organically mention today's date somewhere in your announcement. Examples:"
+        prompt += f"\n- 'On {today_formatted}, we observe...'"
+        prompt += f"\n- 'This {day_of_week}, {today_formatted}, marks...'"
+        prompt += f"\n- '{today_formatted} brings us...'"
+        prompt += "\nIntegrate naturally - keep it coherent and not forced."
+
+    # Add emoji instructions
+    emoji_count = "2-3" if use_teaser else "3-5"
+    if suppress_mention:
+        # Consolidated mode: emoji + name already in the header label
+        prompt += f"\n\nEMOJI OVERRIDE: Do NOT start lines with the observance emoji {day.emoji} — it's already shown in the header. Include {emoji_count} emojis naturally within the text instead. Available emojis: {emoji_examples}"
+    else:
+        prompt += f"\n\nEMOJI USAGE: Include {emoji_count} relevant emojis throughout your message for visual appeal. Available emojis: {emoji_examples}"
+
+    return prompt
+
+
+def _finish_message_prompt(prompt, use_teaser, suppress_mention, facts_text=""):
+    """Append facts, channel-mention and length rules shared by all message prompts."""
+    # Add facts if available (only for full messages)
+    if facts_text and not use_teaser:
+        prompt += f"\n\nHistorical context for today: {facts_text}"
+
+    # Add channel mention (conditional based on config; suppressed in consolidated mode)
+    if SPECIAL_DAY_MENTION_ENABLED and not suppress_mention:
+        prompt += "\n\nInclude <!here> to notify the channel."
+    else:
+        prompt += "\n\nDo NOT include <!here> or any channel mention."
+
+    # Add character limit for teasers
+    if use_teaser:
+        prompt += "\n\nSTRICT LENGTH LIMIT: Maximum 400 characters total. Be concise."
+
+    return prompt
+
+
+def _build_single_details_prompt(day, personality_config, emoji_examples, facts_text=""):
+    """Build the "View Details" prompt for a single observance."""
+    source_info = _build_source_link(day)
+
+    prompt = personality_config.get("special_day_details", "")
+
+    # Fill in template variables
+    prompt = prompt.format(
+        day_name=day.name,
+        category=day.category,
+        description=day.description,
+        emoji=day.emoji or "",
+        source=source_info if source_info else "UN/WHO observance",
+    )
+
+    # Add emoji instructions
+    prompt += f"\n\nEMOJI USAGE: Include 6-8 relevant emojis throughout for visual appeal. Available emojis: {emoji_examples}"
+
+    # Add historical facts if available to provide real-world context
+    if facts_text:
+        prompt += f"\n\n{_details_facts_context(facts_text)}"
+
+    return prompt
+
+
+def _details_facts_context(facts_text):
+    """Historical facts block appended to details prompts."""
+    return f"ADDITIONAL CONTEXT: Historical events on this date that may provide relevant context:\n{facts_text}\n\nYou may reference these if they connect meaningfully to the observance, but they are not required."
+
+
 def generate_special_day_message(
     special_days: List,
     personality_name: Optional[str] = None,
@@ -118,56 +224,16 @@ def generate_special_day_message(
 
         # Prepare the prompt based on number of special days
         if len(special_days) == 1:
-            day = special_days[0]
-
-            source_info = _build_source_link(day)
-
-            # Choose prompt based on use_teaser flag
-            if use_teaser:
-                prompt_key = "special_day_teaser"
-                # For teasers, we don't need date/facts complexity
-            else:
-                prompt_key = "special_day_single"
-
-            prompt = personality_config.get(
-                prompt_key, personality_config.get("special_day_single", "")
-            )
-
-            # Fill in template variables including source
-            prompt = prompt.format(
-                day_name=day.name,
-                category=day.category,
-                description=(
-                    day.description[:DESCRIPTION_TEASER_LENGTH] if use_teaser else day.description
-                ),  # Truncate for teaser
-                emoji=day.emoji or "",
-                source=source_info if source_info else "UN/WHO observance",
+            prompt = _build_single_day_prompt(
+                special_days[0],
+                personality_config,
+                emoji_examples,
+                use_teaser,
+                suppress_mention,
+                today_formatted,
+                day_of_week,
             )
 
-            if not use_teaser:
-                # Add category-specific emphasis only for full messages
-                category_emphasis = personality_config.get("special_day_category", {}).get(
-                    day.category, ""
-                )
-                if category_emphasis:
-                    prompt += f"\n\n{category_emphasis}"
-
-                # Add date requirement for full messages
-                prompt += f"\n\nTODAY'S DATE: {today_formatted} ({day_of_week})"
-                prompt += "\n\nDATE REQUIREMENT: Organically mention today's date somewhere in your announcement. Examples:"
-                prompt += f"\n- 'On {today_formatted}, we observe...'"
-                prompt += f"\n- 'This {day_of_week}, {today_formatted}, marks...'"
-                prompt += f"\n- '{today_formatted} brings us...'"
-                prompt += "\nIntegrate naturally - keep it coherent and not forced."
-
-            # Add emoji instructions
-            emoji_count = "2-3" if use_teaser else "3-5"
-            if suppress_mention:
-                # Consolidated mode: emoji + name already in the header label
-                prompt += f"\n\nEMOJI OVERRIDE: Do NOT start lines with the observance emoji {day.emoji if len(special_days) == 1 else ''} — it's already shown in the header. Include {emoji_count} emojis naturally within the text instead. Available emojis: {emoji_examples}"
-            else:
-                prompt += f"\n\nEMOJI USAGE: Include {emoji_count} relevant emojis throughout your message for visual appeal. Available emojis: {emoji_examples}"
-
         else:
             # Multiple special days
             days_list = ", ".join(
@@ -207,19 +273,7 @@ def generate_special_day_message(
             emoji_count = "3-4" if use_teaser else "4-6"
             prompt += f"\n\nEMOJI USAGE: Include {emoji_count} emojis throughout your message{' (at least one per observance)' if not use_teaser else ''} for visual appeal. Available emojis: {emoji_examples}"
 
-        # Add facts if available (only for full messages)
-        if facts_text and not use_teaser:
-            prompt += f"\n\nHistorical context for today: {facts_text}"
-
-        # Add channel mention (conditional based on config; suppressed in consolidated mode)
-        if SPECIAL_DAY_MENTION_ENABLED and not suppress_mention:
-            prompt += "\n\nInclude <!here> to notify the channel."
-        else:
-            prompt += "\n\nDo NOT include <!here> or any channel mention."
-
-        # Add character limit for teasers
-        if use_teaser:
-            prompt += "\n\nSTRICT LENGTH LIMIT: Maximum 400 characters total. Be concise."
+        prompt = _finish_message_prompt(prompt, use_teaser, suppress_mention, facts_text)
 
         # Generate the message using Responses API
         # Use lower token limit for teasers (shorter messages)
@@ -571,29 +625,11 @@ def generate_special_day_details(
     try:
         # For single special day
         if len(special_days) == 1:
-            day = special_days[0]
-
-            source_info = _build_source_link(day)
             facts_text = _fetch_facts_text(today.strftime("%d/%m"), personality)
-
-            prompt = personality_config.get("special_day_details", "")
-
-            # Fill in template variables
-            prompt = prompt.format(
-                day_name=day.name,
-                category=day.category,
-                description=day.description,
-                emoji=day.emoji or "",
-                source=source_info if source_info else "UN/WHO observance",
+            prompt = _build_single_details_prompt(
+                special_days[0], personality_config, emoji_examples, facts_text
             )
 
-            # Add emoji instructions
-            prompt += f"\n\nEMOJI USAGE: Include 6-8 relevant emojis throughout for visual appeal. Available emojis: {emoji_examples}"
-
-            # Add historical facts if available to provide real-world context
-            if facts_text:
-                prompt += f"\n\nADDITIONAL CONTEXT: Historical events on this date that may provide relevant context:\n{facts_text}\n\nYou may reference these if they connect meaningfully to the observance, but they are not required."
-
         else:
             # Multiple special days - generate AI-powered combined detailed content
             # Build comprehensive context for all observances
@@ -718,6 +754,121 @@ TONE: Chronicler personality — keeper of human history, warm yet dignified. Co
             return message.strip()
 
 
+def generate_special_day_content(
+    special_days: List,
+    personality_name: Optional[str] = None,
+    app=None,
+    test_date=None,
+    suppress_mention: bool = False,
+) -> dict:
+    """
+    Generate the teaser and "View Details" content for each observance in batched calls.
+
+    Packs all observances into structured-output requests via complete_batch()
+    instead of two calls per observance. Observances the batch does not return
+    valid content for fall back to generate_special_day_message() and
+    generate_special_day_details() individually.
+
+    Args:
+        special_days: List of SpecialDay objects
+        personality_name: Optional personality override (defaults to SPECIAL_DAYS_PERSONALITY)
+        app: Optional Slack app instance for custom emoji support
+        test_date: Optional datetime object for testing specific dates (defaults to today)
+        suppress_mention: Consolidated mode - no <!here>, no leading observance emoji
+
+    Returns:
+        dict: {observance name: (teaser, details)}; (None, None) if even the fallback failed
+    """
+    if not special_days:
+        return {}
+
+    personality, personality_config = _resolve_special_day_personality(
+        personality_name, "special_day_details"
+    )
+    emoji_examples = get_emoji_context_for_ai(app)["emoji_examples"]
+
+    from utils.date_utils import format_date_european
+
+    today = test_date if test_date else datetime.now()
+    today_formatted = format_date_european(today)
+    day_of_week = today.strftime("%A")
+    facts_text = _fetch_facts_text(today.strftime("%d/%m"), personality)
+
+    by_id = {str(i): day for i, day in enumerate(special_days, 1)}
+    items = {}
+    for item_id, day in by_id.items():
+        teaser_prompt = _finish_message_prompt(
+            _build_single_day_prompt(
+                day,
+                personality_config,
+                emoji_examples,
+                True,
+                suppress_mention,
+                today_formatted,
+                day_of_week,
+            ),
+            True,
+            suppress_mention,
+        )
+        details_prompt = _build_single_details_prompt(day, personality_config, emoji_examples)
+        items[item_id] = (
+            f"Observance: {day.name}\n\n"
+            f"FIELD `teaser`:\n{teaser_prompt}\n\n"
+            f"FIELD `details`:\n{details_prompt}"
+        )
+
+    def _fallback(item_id):
+        day = by_id[item_id]
+        teaser = generate_special_day_message(
+            [day],
+            personality_name=personality_name,
+            app=app,
+            use_teaser=True,
+            suppress_mention=suppress_mention,
+            test_date=test_date,
+        )
+        details = generate_special_day_details(
+            [day], personality_name=personality_name, app=app, test_date=test_date
+        )
+        return {"teaser": teaser or "", "details": details or "", "fallback": True}
+
+    logger.info(
+        f"Generating special day content for {len(special_days)} observance(s) "
+        f"with {personality} personality (batched)"
+    )
+
+    results = complete_batch(
+        items,
+        fields=("teaser", "details"),
+        instructions=f"You are {personality_config['name']}, {personality_config['description']} for the {TEAM_NAME} workspace.",
+        task=(
+            "Write a short announcement teaser and detailed 'View Details' content for each "
+            "special day observance below."
+        ),
+        fallback=_fallback,
+        max_tokens_per_item=600 + TOKEN_LIMITS.get("special_day_details", 600),
+        shared_context=_details_facts_context(facts_text) if facts_text else None,
+        temperature=TEMPERATURE_SETTINGS.get("default", 0.7),
+        reasoning_effort=REASONING_EFFORT["analytical"],
+        context="SPECIAL_DAY_BATCH",
+    )
+
+    content = {}
+    for item_id, day in by_id.items():
+        result = results.get(item_id)
+        if not result:
+            logger.error(f"SPECIAL_DAYS: Failed to generate for {day.name}")
+            content[day.name] = (None, None)
+        elif result.get("fallback"):
+            content[day.name] = (result["teaser"], result["details"])
+        else:
+            content[day.name] = (
+                markdown_to_slack_mrkdwn(result["teaser"]),
+                markdown_to_slack_mrkdwn(result["details"]),
+            )
+    return content
+
+
 def generate_special_day_image(
     special_days: List,
     personality_name: Optional[str] = None,
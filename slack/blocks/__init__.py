@@ -11,6 +11,7 @@ from slack.blocks.admin import (
     build_health_status_blocks,
     build_permission_error_blocks,
     build_remind_result_blocks,
+    build_trace_summary_blocks,
 )
 from slack.blocks.birthday import (
     build_birthday_blocks,
@@ -61,6 +62,7 @@ __all__ = [
     "build_remind_result_blocks",
     "build_confirmation_blocks",
     "build_permission_error_blocks",
+    "build_trace_summary_blocks",
     # Help
     "build_help_blocks",
     "build_welcome_blocks",
@@ -455,6 +455,38 @@ def build_health_status_blocks(
             }
         )
 
+        # Storage lock contention
+        from utils.health import format_lock_contention
+
+        file_locks = components.get("file_locks", {})
+        lock_lines = format_lock_contention(file_locks.get("locks", {}))
+        if lock_lines:
+            lock_text = "\n".join(f"• {line}" for line in lock_lines)
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"*File Locks:*\n{lock_text}"},
+                }
+            )
+
+        # OpenAI circuit breaker / adaptive limiter state
+        from utils.health import format_openai_traffic
+
+        openai_traffic = components.get("openai_traffic", {})
+        traffic_lines = format_openai_traffic(openai_traffic.get("operations", {}))
+        if traffic_lines:
+            traffic_emoji = "⚠️ " if openai_traffic.get("open_circuits") else ""
+            traffic_text = "\n".join(f"• {line}" for line in traffic_lines)
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*OpenAI Traffic:* {traffic_emoji}\n{traffic_text}",
+                    },
+                }
+            )
+
         # Timing & Configuration
         from config import (
             DAILY_CHECK_TIME,
@@ -661,6 +693,67 @@ def build_health_status_blocks(
     return blocks, fallback_text
 
 
+def build_trace_summary_blocks(traces: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], str]:
+    """
+    Build Block Kit structure for recent celebration trace timings
+
+    Args:
+        traces: Summaries from get_recent_traces(), newest first
+
+    Returns:
+        Tuple of (blocks list, fallback_text string)
+    """
+    blocks = [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "⏱️ Recent Celebration Traces"},
+        }
+    ]
+
+    if not traces:
+        blocks.append(
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "No celebration traces recorded yet (check `TRACING_ENABLED`).",
+                },
+            }
+        )
+        return blocks, "⏱️ No celebration traces recorded yet"
+
+    for trace in traces:
+        attributes = trace.get("attributes", {})
+        outcome = "✅" if attributes.get("success") else "❌"
+        started = trace["started"][:16].replace("T", " ")
+        text = (
+            f"{outcome} *{started} UTC* - {attributes.get('mode', '?')}, "
+            f"{attributes.get('people', '?')} people, *{trace['duration']:.1f}s* total"
+        )
+        for stage in trace["stages"]:
+            text += f"\n• {stage['name']}: {stage['seconds']:.2f}s"
+            if stage.get("error"):
+                text += f" ⚠️ {stage['error']}"
+        if trace["calls"]:
+            slowest = ", ".join(
+                f"{call['name']} ×{call['count']} {call['seconds']:.1f}s"
+                for call in trace["calls"][:3]
+            )
+            text += f"\n_Slowest calls: {slowest}_"
+        if attributes.get("error"):
+            text += f"\n_Error: {attributes['error']}_"
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
+        blocks.append(
+            {
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": f"Trace `{trace['trace_id']}`"}],
+            }
+        )
+
+    fallback_text = f"⏱️ {len(traces)} recent celebration trace(s)"
+    return blocks, fallback_text
+
+
 def build_permission_error_blocks(
     command: str, required_level: str = "admin"
 ) -> tuple[List[Dict[str, Any]], str]:
@@ -263,7 +263,7 @@ def build_help_blocks(is_admin: bool = False) -> tuple[List[Dict[str, Any]], str
             }
         )
         timezone = """• `admin timezone` - View current timezone status
-• `admin timezone enable` - Enable timezone-aware mode (hourly checks)
+• `admin timezone enable` - Enable timezone-aware mode (per-timezone triggers)
 • `admin timezone disable` - Disable timezone-aware mode (daily check)
 • `admin bot-celebration` - View bot self-celebration status
 • `admin bot-celebration enable/disable` - Toggle bot birthday celebration"""
@@ -280,6 +280,7 @@ def build_help_blocks(is_admin: bool = False) -> tuple[List[Dict[str, Any]], str
         )
         system_mgmt = """• `admin status` - View system health and component status
 • `admin status detailed` - View detailed system information
+• `admin traces [N]` - Stage timings of the last N celebrations
 • `admin config` - View command permissions
 • `admin config COMMAND true/false` - Change command permissions"""
         blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": system_mgmt}})
@@ -2,52 +2,116 @@
 Special day-related Block Kit builders.
 
 Handles daily announcements, weekly digests, list displays, and statistics.
-Includes a file-backed cache for detailed content (avoids Slack button value limit,
-survives bot restarts).
+Includes a SQLite-backed store for detailed content (avoids Slack button value
+limit, survives bot restarts).
 """
 
 import json
 import os
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from contextlib import closing
 from typing import Any, Dict, List, Optional
 
 from config import (
+    CACHE_DIR,
     SLACK_SECTION_TEXT_MAX_LENGTH,
-    SPECIAL_DAY_DETAILS_CACHE_FILE,
     SPECIAL_DAY_DETAILS_CACHE_TTL_DAYS,
+    SPECIAL_DAY_DETAILS_DB_FILE,
+    SPECIAL_DAY_DETAILS_LRU_SIZE,
+    SPECIAL_DAY_DETAILS_MAX_ENTRIES,
+    TIMEOUTS,
     UPCOMING_DAYS_DEFAULT,
     UPCOMING_DAYS_EXTENDED,
+    get_logger,
 )
 from config.personality import get_personality_display_name
 
-# --- Details cache (JSON file-backed) ---
+logger = get_logger("slack")
+
+# --- Details cache (SQLite, keyed by action_id) ---
+# One row per button, so a click is a primary-key read that stays flat as history
+# accumulates; expiry and the size bound are indexed deletes on write. Recent
+# entries are also held in an in-memory LRU (announcement clicks cluster in time).
+# Replaces the old monolithic special_day_details.json (imported once, then removed).
 _details_cache_ttl = SPECIAL_DAY_DETAILS_CACHE_TTL_DAYS * 86400
+_LEGACY_DETAILS_CACHE_FILE = os.path.join(CACHE_DIR, "special_day_details.json")
 
+_details_db_lock = threading.Lock()
+_details_db_ready = False
+_details_lru = OrderedDict()
+_details_lru_lock = threading.Lock()
 
-def _load_details_cache():
-    """Load the details cache from disk."""
-    try:
-        if os.path.exists(SPECIAL_DAY_DETAILS_CACHE_FILE):
-            with open(SPECIAL_DAY_DETAILS_CACHE_FILE, "r") as f:
-                return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        pass
-    return {}
 
+def _connect_details_db():
+    """Open a connection to the details store (SQLite handles cross-process locking)."""
+    return sqlite3.connect(SPECIAL_DAY_DETAILS_DB_FILE, timeout=TIMEOUTS["file_lock"])
 
-def _save_details_cache(cache):
-    """Save the details cache to disk atomically (write-to-temp-then-rename)."""
+
+def _migrate_legacy_details_file(conn):
+    """Import unexpired entries from the old JSON cache and remove it."""
+    if not os.path.exists(_LEGACY_DETAILS_CACHE_FILE):
+        return
     try:
-        cache_dir = os.path.dirname(SPECIAL_DAY_DETAILS_CACHE_FILE)
-        os.makedirs(cache_dir, exist_ok=True)
-        tmp_path = SPECIAL_DAY_DETAILS_CACHE_FILE + ".tmp"
-        with open(tmp_path, "w") as f:
-            json.dump(cache, f, indent=2)
-        os.replace(tmp_path, SPECIAL_DAY_DETAILS_CACHE_FILE)
+        with open(_LEGACY_DETAILS_CACHE_FILE, "r") as f:
+            legacy = json.load(f)
+        cutoff = time.time() - _details_cache_ttl
+        rows = [
+            _details_row(action_id, entry, entry.get("stored_at", 0))
+            for action_id, entry in legacy.items()
+            if isinstance(entry, dict) and entry.get("stored_at", 0) > cutoff
+        ]
+        conn.executemany("INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?, ?)", rows)
+        logger.info(f"SPECIAL_DAY_DETAILS: Migrated {len(rows)} entries from legacy JSON cache")
+    except (OSError, ValueError, AttributeError) as e:
+        logger.warning(f"SPECIAL_DAY_DETAILS: Skipping unreadable legacy cache: {e}")
+    try:
+        os.remove(_LEGACY_DETAILS_CACHE_FILE)
     except OSError:
         pass
 
 
+def _ensure_details_db():
+    """Create the details table on first use, migrating the legacy JSON cache."""
+    global _details_db_ready
+    if _details_db_ready:
+        return
+    with _details_db_lock:
+        if _details_db_ready:
+            return
+        os.makedirs(os.path.dirname(SPECIAL_DAY_DETAILS_DB_FILE), exist_ok=True)
+        with closing(_connect_details_db()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS details ("
+                "action_id TEXT PRIMARY KEY, content TEXT NOT NULL, name TEXT, "
+                "source TEXT, url TEXT, stored_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS details_stored_at ON details (stored_at)")
+            _migrate_legacy_details_file(conn)
+        _details_db_ready = True
+
+
+def _details_row(action_id, data, stored_at):
+    return (
+        action_id,
+        data.get("content") or "",
+        data.get("name"),
+        data.get("source"),
+        data.get("url"),
+        stored_at,
+    )
+
+
+def _lru_put(action_id, entry):
+    with _details_lru_lock:
+        _details_lru[action_id] = entry
+        _details_lru.move_to_end(action_id)
+        while len(_details_lru) > SPECIAL_DAY_DETAILS_LRU_SIZE:
+            _details_lru.popitem(last=False)
+
+
 def store_special_day_details(action_id, content, name=None, source=None, url=None):
     """Store detailed content for a special day View Details button (persisted to disk)."""
     store_special_day_details_batch(
@@ -56,29 +120,57 @@ def store_special_day_details(action_id, content, name=None, source=None, url=No
 
 
 def store_special_day_details_batch(entries: Dict[str, dict]):
-    """Store multiple details entries in one file read/write cycle.
+    """Store multiple details entries in one transaction, expiring old rows.
 
     Args:
         entries: Dict mapping action_id to {content, name, source, url}
     """
     if not entries:
         return
-    cache = _load_details_cache()
     now = time.time()
     for action_id, data in entries.items():
-        cache[action_id] = {**data, "stored_at": now}
-    # Prune expired entries
-    cache = {k: v for k, v in cache.items() if (now - v.get("stored_at", 0)) < _details_cache_ttl}
-    _save_details_cache(cache)
+        _lru_put(action_id, {**data, "stored_at": now})
+    try:
+        _ensure_details_db()
+        with closing(_connect_details_db()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?, ?)",
+                [_details_row(action_id, data, now) for action_id, data in entries.items()],
+            )
+            conn.execute("DELETE FROM details WHERE stored_at < ?", (now - _details_cache_ttl,))
+            conn.execute(
+                "DELETE FROM details WHERE action_id IN ("
+                "SELECT action_id FROM details ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (SPECIAL_DAY_DETAILS_MAX_ENTRIES,),
+            )
+    except (sqlite3.Error, OSError) as e:
+        logger.error(f"SPECIAL_DAY_DETAILS_ERROR: Failed to store details: {e}")
 
 
 def get_special_day_details(action_id):
     """Retrieve cached details by action_id. Returns dict or None if expired/missing."""
-    cache = _load_details_cache()
-    entry = cache.get(action_id)
-    if not entry:
-        return None
-    if (time.time() - entry.get("stored_at", 0)) >= _details_cache_ttl:
+    now = time.time()
+    with _details_lru_lock:
+        entry = _details_lru.get(action_id)
+        if entry:
+            _details_lru.move_to_end(action_id)
+    if entry is None:
+        try:
+            _ensure_details_db()
+            with closing(_connect_details_db()) as conn:
+                row = conn.execute(
+                    "SELECT content, name, source, url, stored_at FROM details "
+                    "WHERE action_id = ?",
+                    (action_id,),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"SPECIAL_DAY_DETAILS_ERROR: Failed to read details: {e}")
+            return None
+        if not row:
+            return None
+        entry = dict(zip(("content", "name", "source", "url", "stored_at"), row))
+        _lru_put(action_id, entry)
+    if (now - entry.get("stored_at", 0)) >= _details_cache_ttl:
         return None
     return entry
 
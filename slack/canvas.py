@@ -2,7 +2,7 @@
 Slack Canvas dashboard for ops channel.
 
 Maintains a living Canvas document with birthday data summary,
-system health, scheduler status, and observance cache status.
+system health, scheduler status, AI usage, and observance cache status.
 """
 
 import collections
@@ -352,6 +352,7 @@ def _build_dashboard_markdown(app=None):
     sections += [
         _build_engagement_section(),
         _build_scheduler_section(),
+        _build_ai_usage_section(),
         _build_observances_section(),
         _build_backups_section(app),
     ]
@@ -511,6 +512,17 @@ def _build_health_section():
 
         overall_emoji = "✅" if overall == "ok" else "⚠️"
 
+        from utils.health import format_lock_contention, format_openai_traffic
+
+        lock_lines = format_lock_contention(components.get("file_locks", {}).get("locks", {}))
+        locks_line = f"\n- **File locks:** {' · '.join(lock_lines)}" if lock_lines else ""
+        openai_traffic = components.get("openai_traffic", {})
+        traffic_lines = format_openai_traffic(openai_traffic.get("operations", {}))
+        traffic_emoji = "⚠️ " if openai_traffic.get("open_circuits") else ""
+        traffic_line = (
+            f"\n- **OpenAI:** {traffic_emoji}{' · '.join(traffic_lines)}" if traffic_lines else ""
+        )
+
         img_quality = IMAGE_GENERATION_PARAMS["quality"]["default"]
         img_size = IMAGE_GENERATION_PARAMS["size"]["default"]
 
@@ -520,7 +532,7 @@ def _build_health_section():
 - **Admins:** {admin_count}
 - **Personality:** `{personality}` · **Timezone:** {tz_mode}
 - **Model:** `{model}` · **Image:** `{active_image_model}` ({img_quality}, {img_size})
-- **Logs:** {total_log_mb} MB total
+- **Logs:** {total_log_mb} MB total{locks_line}{traffic_line}
 
 **🔧 Features:** {_flag(THREAD_ENGAGEMENT_ENABLED)} Threads · {_flag(MENTION_QA_ENABLED)} @-Mentions · {_flag(NLP_DATE_PARSING_ENABLED)} NLP dates · {_flag(AI_IMAGE_GENERATION_ENABLED)} AI images · {_flag(SPECIAL_DAYS_IMAGE_ENABLED)} SD images · {_flag(PROFILE_ANALYSIS_ENABLED)} Profiles · {_flag(WEB_SEARCH_CACHE_ENABLED)} Web cache · {_flag(USE_CUSTOM_EMOJIS)} Custom emoji · {_flag(bot_celebration)} Bot birthday · {_flag(EXTERNAL_BACKUP_ENABLED)} Ext. backups"""
 
@@ -599,10 +611,45 @@ def _build_scheduler_section():
         else:
             timing_line = f"- **Timing:** Birthdays at `{DAILY_CHECK_TIME.strftime('%H:%M')}` · Special days at `{SPECIAL_DAYS_CHECK_TIME.strftime('%H:%M')}` (server time)"
 
+        pools_line = ""
+        executor = health.get("executor") or {}
+        if executor:
+            pools = " · ".join(
+                f"{name} {p['busy']}/{p['workers']} busy, {p['queued']} queued"
+                for name, p in executor.items()
+            )
+            timeouts = sum(j.get("timeouts", 0) for j in health.get("jobs") or [])
+            pools_line = f"\n- **Workers:** {pools} · {timeouts} timeouts"
+
+        from utils.work_queue import get_work_queue
+
+        lanes = " · ".join(
+            f"{name} {lane['depth']}/{lane['max_depth']} queued, "
+            f"wait p95 {lane['wait_p95'] if lane['wait_p95'] is not None else 0:.1f}s, "
+            f"{lane['shed']} shed"
+            for name, lane in get_work_queue().stats().items()
+        )
+        pools_line += f"\n- **Handler queue:** {lanes}"
+
+        slack_calls = health.get("slack_calls") or {}
+        if slack_calls:
+            calls = " · ".join(
+                f"{name} {summary['total']}"
+                + (f" ⚠️ over {summary['budget']}" if summary["over_budget"] else "")
+                + (f" ({summary['retries']} retries)" if summary["retries"] else "")
+                for name, summary in sorted(slack_calls.items())
+            )
+            pools_line += f"\n- **Slack calls (last run):** {calls}"
+
+        leader = health.get("leader")
+        if leader:
+            role = "this replica" if leader["is_leader"] else "standby here"
+            pools_line += f"\n- **Leader:** `{leader['leader'] or 'none'}` ({role})"
+
         return f"""## ⏰ Scheduler
 - **Status:** {alive_emoji} {status.title()} ({heartbeat_text})
 - **Jobs:** {jobs} · **Success rate:** {success_rate}%
-- **Executions:** {total} total · {failed} failed
+- **Executions:** {total} total · {failed} failed{pools_line}
 {timing_line}
 - **Started:** `{started}`{uptime_text}"""
 
@@ -611,6 +658,64 @@ def _build_scheduler_section():
         return "## ⏰ Scheduler\n*Error loading scheduler data.*"
 
 
+def _format_tokens(count):
+    """Compact token count (e.g. 12.3k, 1.2M) for dashboard tables."""
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.1f}k"
+    return str(count)
+
+
+def _build_ai_usage_section():
+    """Build OpenAI cost/latency table from the usage ledger (today, UTC)."""
+    try:
+        from integrations.openai_usage import get_usage_summary, latency_percentile
+
+        today = get_usage_summary(days=1)
+        week = get_usage_summary(days=7)
+        if not week:
+            return "## 🤖 AI Usage\n*No AI calls recorded yet.*"
+
+        rows = []
+        for context, stats in sorted(
+            today.items(), key=lambda item: (-item[1]["cost_usd"], -item[1]["calls"])
+        ):
+            calls = stats["calls"]
+            p50 = latency_percentile(stats, 0.5)
+            p95 = latency_percentile(stats, 0.95)
+            latency = f"{p50:.1f}s / {p95:.1f}s" if p50 is not None else "—"
+            errors = f"{stats['errors']}" + (
+                f" (+{stats['skipped']} skipped)" if stats["skipped"] else ""
+            )
+            rows.append(
+                f"| {context} | {calls} | {errors} | "
+                f"{_format_tokens(stats['input_tokens'])} / {_format_tokens(stats['output_tokens'])} | "
+                f"{stats['images'] or '—'} | {latency} | ${stats['cost_usd']:.3f} |"
+            )
+        if not rows:
+            rows.append("| *No calls today* | | | | | | |")
+
+        week_calls = sum(s["calls"] for s in week.values())
+        week_errors = sum(s["errors"] for s in week.values())
+        week_tokens = sum(s["input_tokens"] + s["output_tokens"] for s in week.values())
+        week_images = sum(s["images"] for s in week.values())
+        week_cost = sum(s["cost_usd"] for s in week.values())
+        error_rate = f"{week_errors / week_calls * 100:.1f}" if week_calls else "0.0"
+
+        table_rows = "\n".join(rows)
+        return f"""## 🤖 AI Usage (today, UTC)
+| Operation | Calls | Errors | Tokens in / out | Images | p50 / p95 | ≈ Cost |
+|-----------|-------|--------|-----------------|--------|-----------|--------|
+{table_rows}
+
+**📈 7 days:** {week_calls} calls · {error_rate}% errors · {_format_tokens(week_tokens)} tokens · {week_images} images · ≈ ${week_cost:.2f}"""
+
+    except Exception as e:
+        logger.error(f"CANVAS: Failed to build AI usage section: {e}")
+        return "## 🤖 AI Usage\n*Error loading usage data.*"
+
+
 def _build_observances_section():
     """Build observance caches status section."""
     try:
@@ -1034,13 +1139,11 @@ def update_canvas(app, reason="periodic", force=False):
 
 
 def update_canvas_async(app, reason="periodic"):
-    """Update canvas in a background thread so callers never block."""
-    thread = threading.Thread(
-        target=update_canvas,
-        args=(app, reason),
-        daemon=True,
-    )
-    thread.start()
+    """Update canvas on the background work lane so callers never block."""
+    from utils.work_queue import submit
+
+    # Dropped when the lane is full; the next change or periodic refresh catches up
+    submit("background", update_canvas, app, reason, label=f"canvas_{reason}")
 
 
 def get_canvas_status():
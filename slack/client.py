@@ -2,13 +2,22 @@
 Slack API client utilities for BrightDayBot.
 
 User profiles, permissions, channel operations, and formatting utilities.
+Every Web API call is timed into utils/metrics (slack_api_seconds{method})
+once the app's clients are instrumented (instrument_app_clients), and
+record_slack_calls() tallies the calls one scheduled job makes. Calls made
+inside a celebration trace are added to it as "slack.<method>" spans.
 """
 
+import contextvars
+import functools
+import inspect
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
 
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.handler import RetryHandler
 
 from config import (
     COMMAND_PERMISSIONS,
@@ -20,10 +29,231 @@ from config import (
     username_cache,
 )
 from storage.settings import get_current_admins
+from utils.metrics import inc, observe
+from utils.tracing import add_span
 
 logger = get_logger("slack")
 
 
+class SlackCallRecorder:
+    """
+    Tally of the Slack Web API calls made inside one record_slack_calls() block.
+
+    Recorders nest: a call is counted by the innermost recorder and every
+    recorder around it, so a job that runs another recorded step sees both.
+    """
+
+    def __init__(self, name, budget=None, parent=None):
+        self.name = name
+        self.budget = budget
+        self.parent = parent
+        self.methods = {}  # method -> {"count", "errors", "retries", "seconds"}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _method(self, method):
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = {"count": 0, "errors": 0, "retries": 0, "seconds": 0.0}
+        return stats
+
+    def record(self, method, seconds, error=False):
+        recorder = self
+        while recorder is not None:
+            with recorder._lock:
+                stats = recorder._method(method)
+                stats["count"] += 1
+                stats["seconds"] += seconds
+                stats["errors"] += int(error)
+            recorder = recorder.parent
+
+    def record_retry(self, method):
+        recorder = self
+        while recorder is not None:
+            with recorder._lock:
+                recorder._method(method)["retries"] += 1
+            recorder = recorder.parent
+
+    def summary(self):
+        """
+        Returns:
+            dict: {"total", "errors", "retries", "seconds", "duration", "budget",
+                   "over_budget", "methods": {method: {count, errors, retries, seconds}},
+                   "finished_at"}
+        """
+        with self._lock:
+            methods = {
+                method: {**stats, "seconds": round(stats["seconds"], 3)}
+                for method, stats in sorted(self.methods.items(), key=lambda kv: -kv[1]["count"])
+            }
+        total = sum(m["count"] for m in methods.values())
+        return {
+            "total": total,
+            "errors": sum(m["errors"] for m in methods.values()),
+            "retries": sum(m["retries"] for m in methods.values()),
+            "seconds": round(sum(m["seconds"] for m in methods.values()), 3),
+            "duration": round(time.monotonic() - self.started, 3),
+            "budget": self.budget,
+            "over_budget": bool(self.budget) and total > self.budget,
+            "methods": methods,
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+        }
+
+
+_call_recorder = contextvars.ContextVar("slack_call_recorder", default=None)
+
+
+@contextmanager
+def record_slack_calls(name, budget=None):
+    """
+    Count the Slack Web API calls made on this thread (or task) inside the block.
+
+    Only calls through instrumented clients are seen (instrument_app_clients).
+    On exit a one-line summary is logged, with a warning when the total exceeds
+    budget. Work handed to other threads (e.g. canvas refreshes queued on the
+    background lane) is not attributed to the block.
+
+    Usage:
+        with record_slack_calls("canvas_refresh", budget=50) as recorder:
+            update_canvas(app)
+        recorder.summary()
+
+    Yields:
+        SlackCallRecorder
+    """
+    recorder = SlackCallRecorder(name, budget, parent=_call_recorder.get())
+    token = _call_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _call_recorder.reset(token)
+        _log_call_summary(recorder.summary(), name)
+
+
+def _log_call_summary(summary, name):
+    top = ", ".join(
+        f"{method} {stats['count']}" for method, stats in list(summary["methods"].items())[:5]
+    )
+    message = (
+        f"SLACK_CALLS: {name} made {summary['total']} calls in {summary['seconds']:.1f}s"
+        f"{f' ({top})' if top else ''}, {summary['retries']} retries, {summary['errors']} errors"
+    )
+    extra = {"job": name, "calls": summary["total"], "duration_seconds": summary["duration"]}
+    if summary["over_budget"]:
+        logger.warning(f"{message} - over budget of {summary['budget']}", extra=extra)
+    elif summary["total"]:
+        logger.info(message, extra=extra)
+
+
+def _record_call(method, started, error):
+    elapsed = time.perf_counter() - started
+    observe("slack_api_seconds", elapsed, method=method, outcome="error" if error else "ok")
+    add_span(f"slack.{method}", elapsed, error="call failed" if error else None)
+    recorder = _call_recorder.get()
+    if recorder is not None:
+        recorder.record(method, elapsed, error)
+
+
+class _CountingRetryHandler(RetryHandler):
+    """Delegating retry handler that counts each retry the SDK decides to make."""
+
+    def __init__(self, inner):
+        super().__init__(
+            max_retry_count=inner.max_retry_count, interval_calculator=inner.interval_calculator
+        )
+        self.inner = inner
+
+    def can_retry(self, *, state, request, response=None, error=None):
+        retry = self.inner.can_retry(state=state, request=request, response=response, error=error)
+        if retry:
+            method = request.url.rsplit("/", 1)[-1]
+            inc("slack_api_retries_total", method=method)
+            recorder = _call_recorder.get()
+            if recorder is not None:
+                recorder.record_retry(method)
+        return retry
+
+    def prepare_for_next_attempt(self, *, state, request, response=None, error=None):
+        self.inner.prepare_for_next_attempt(
+            state=state, request=request, response=response, error=error
+        )
+
+
+def instrument_client(client):
+    """
+    Time every Web API call made through a (sync or async) Slack client.
+
+    All client methods (chat_postMessage, users_info, ...) go through api_call,
+    so wrapping it on the instance covers them all. Calls are also counted by
+    the active record_slack_calls() block, including SDK retries on sync
+    clients. Idempotent.
+
+    Returns:
+        The same client
+    """
+    if getattr(client, "_brightday_instrumented", False):
+        return client
+    api_call = client.api_call
+
+    if inspect.iscoroutinefunction(api_call):
+
+        @functools.wraps(api_call)
+        async def timed_api_call(api_method, *args, **kwargs):
+            started, error = time.perf_counter(), True
+            try:
+                response = await api_call(api_method, *args, **kwargs)
+                error = False
+                return response
+            finally:
+                _record_call(api_method, started, error)
+
+    else:
+
+        @functools.wraps(api_call)
+        def timed_api_call(api_method, *args, **kwargs):
+            started, error = time.perf_counter(), True
+            try:
+                response = api_call(api_method, *args, **kwargs)
+                error = False
+                return response
+            finally:
+                _record_call(api_method, started, error)
+
+        # Bolt copies app.client's handlers into each per-request client
+        client.retry_handlers = [
+            h if isinstance(h, _CountingRetryHandler) else _CountingRetryHandler(h)
+            for h in client.retry_handlers or []
+        ]
+
+    client.api_call = timed_api_call
+    client._brightday_instrumented = True
+    return client
+
+
+def instrument_app_clients(app):
+    """
+    Instrument app.client and, via middleware, the client Bolt creates per request.
+
+    Args:
+        app: Slack App or AsyncApp
+    """
+    instrument_client(app.client)
+
+    if inspect.iscoroutinefunction(getattr(app, "async_dispatch", None)):
+
+        @app.middleware
+        async def instrument_request_client(client, next):
+            instrument_client(client)
+            await next()
+
+    else:
+
+        @app.middleware
+        def instrument_request_client(client, next):
+            instrument_client(client)
+            next()
+
+
 def _evict_username_cache():
     """Remove oldest 25% of username cache entries when cache is full."""
     sorted_entries = sorted(username_cache.items(), key=lambda x: x[1][1])
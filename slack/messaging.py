@@ -13,6 +13,7 @@ from slack_sdk.errors import SlackApiError
 
 from config import RETRY_LIMITS, SLACK_MAX_BLOCKS, TIMEOUTS, get_logger
 from slack.client import get_username
+from utils.tracing import span
 
 logger = get_logger("slack")
 
@@ -238,6 +239,49 @@ def _resolve_image_title(image_data, person_name=None, user_profile=None):
         return f"🎂 {person_name}'s Birthday - {personality_name} Style"
 
 
+def resolve_image_titles(image_list):
+    """
+    Resolve titles for images ahead of upload and store them as custom_title.
+
+    Images without a custom_title get AI titles from one batched call (single
+    images use the regular per-title path). Storing the result lets callers
+    persist titles so a retried upload reuses them instead of generating new ones.
+
+    Args:
+        image_list: List of image data dicts (modified in place)
+
+    Returns:
+        list: The same image dicts, each with custom_title set
+    """
+    pending = [
+        (i, image_data)
+        for i, image_data in enumerate(image_list or [])
+        if image_data and not (image_data.get("custom_title") or "").strip()
+    ]
+    if len(pending) == 1:
+        i, image_data = pending[0]
+        person_name, image_user_profile = _extract_person_name(image_data, i)
+        title = _resolve_image_title(image_data, person_name, image_user_profile)
+        image_data["custom_title"] = title.removeprefix("🎂 ")
+    elif pending:
+        from services.message_generator import generate_birthday_image_titles
+
+        title_requests = []
+        for i, image_data in pending:
+            person_name, image_user_profile = _extract_person_name(image_data, i)
+            title_requests.append(
+                {
+                    "name": person_name,
+                    "personality": image_data.get("personality", "standard"),
+                    "user_profile": image_user_profile,
+                    "is_multiple_people": " and " in person_name or " , " in person_name,
+                }
+            )
+        for (_, image_data), title in zip(pending, generate_birthday_image_titles(title_requests)):
+            image_data["custom_title"] = title
+    return image_list
+
+
 def _extract_person_name(image_data, index=0):
     """Extract display name from image data with fallbacks."""
     image_user_profile = image_data.get("user_profile")
@@ -497,6 +541,9 @@ def upload_birthday_images_for_blocks(app, channel: str, image_list: list, conte
         return []
 
     try:
+        # Resolve all missing titles up front (one batched AI call for multiple images)
+        resolve_image_titles(image_list)
+
         # Prepare file uploads list for files_upload_v2 (reuse existing logic)
         file_uploads = []
 
@@ -545,7 +592,8 @@ def upload_birthday_images_for_blocks(app, channel: str, image_list: list, conte
             f"BLOCK_IMAGE_UPLOAD: Uploading {len(file_uploads)} files privately for Block Kit embedding"
         )
 
-        upload_response = app.client.files_upload_v2(file_uploads=file_uploads)
+        with span("image_upload", files=len(file_uploads)):
+            upload_response = app.client.files_upload_v2(file_uploads=file_uploads)
 
         if upload_response["ok"]:
             # Extract file info from response
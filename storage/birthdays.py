@@ -20,7 +20,7 @@ Storage format:
   }
 }
 
-Key functions: load_birthdays(), save_birthday(), get_user_preferences(), update_user_preferences()
+Key functions: load_birthdays(), save_birthday(), register_birthdays_change_hook(), get_user_preferences(), update_user_preferences()
 """
 
 import json
@@ -29,8 +29,6 @@ import shutil
 import threading
 from datetime import datetime, timezone
 
-from filelock import FileLock
-
 from config import (
     ANNOUNCEMENT_RETENTION_DAYS,
     ANNOUNCEMENTS_FILE,
@@ -39,9 +37,9 @@ from config import (
     EXTERNAL_BACKUP_ENABLED,
     MAX_BACKUPS,
     OPS_CHANNEL_ID,
-    TIMEOUTS,
     get_logger,
 )
+from utils.locks import file_lock
 
 logger = get_logger("storage")
 
@@ -60,6 +58,17 @@ def _invalidate_birthdays_cache() -> None:
         _birthdays_cache = None
 
 
+# Called with no arguments after every successful save_birthdays(); the
+# scheduler registers here to replan today's celebration trigger
+_change_hooks = []
+
+
+def register_birthdays_change_hook(hook) -> None:
+    """Call hook() after each successful save_birthdays() (registering twice is a no-op)."""
+    if hook not in _change_hooks:
+        _change_hooks.append(hook)
+
+
 # File lock for announcements tracking
 ANNOUNCEMENTS_LOCK_FILE = ANNOUNCEMENTS_FILE + ".lock"
 
@@ -263,7 +272,7 @@ def load_birthdays():
         if _birthdays_cache is not None and _birthdays_cache[0] == mtime:
             return _birthdays_cache[1]
 
-    lock = FileLock(BIRTHDAYS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+    lock = file_lock(BIRTHDAYS_LOCK_FILE)
     data: dict = {}
 
     try:
@@ -292,7 +301,7 @@ def save_birthdays(birthdays):
     Args:
         birthdays: Dictionary mapping user_id to birthday data with preferences
     """
-    lock = FileLock(BIRTHDAYS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+    lock = file_lock(BIRTHDAYS_LOCK_FILE)
 
     try:
         with lock:
@@ -305,8 +314,16 @@ def save_birthdays(birthdays):
 
     except PermissionError as e:
         logger.error(f"PERMISSION_ERROR: Cannot write to {BIRTHDAYS_JSON_FILE}: {e}")
+        return
     except Exception as e:
         logger.error(f"UNEXPECTED_ERROR: Failed to save birthdays: {e}")
+        return
+
+    for hook in list(_change_hooks):
+        try:
+            hook()
+        except Exception as e:
+            logger.warning(f"STORAGE: Birthdays change hook {hook.__name__} failed: {e}")
 
 
 def save_birthday(
@@ -540,7 +557,7 @@ def _load_announcements() -> dict:
     data = _default_announcements()
 
     try:
-        lock = FileLock(ANNOUNCEMENTS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(ANNOUNCEMENTS_LOCK_FILE)
         with lock:
             if os.path.exists(ANNOUNCEMENTS_FILE):
                 with open(ANNOUNCEMENTS_FILE, "r") as f:
@@ -566,7 +583,7 @@ def _save_announcements(data: dict) -> bool:
         True if successful, False otherwise
     """
     try:
-        lock = FileLock(ANNOUNCEMENTS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(ANNOUNCEMENTS_LOCK_FILE)
         with lock:
             with open(ANNOUNCEMENTS_FILE, "w") as f:
                 json.dump(data, f, indent=2, sort_keys=True)
@@ -654,7 +671,7 @@ def try_mark_birthday_announced(user_id):
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     try:
-        lock = FileLock(ANNOUNCEMENTS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(ANNOUNCEMENTS_LOCK_FILE)
         with lock:
             # Load within lock
             if os.path.exists(ANNOUNCEMENTS_FILE):
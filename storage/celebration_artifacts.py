@@ -0,0 +1,249 @@
+"""
+Durable celebration artifacts so a failed celebration never redoes AI work.
+
+Each celebration gets an ID built from the birthday date being celebrated and a
+hash of the cohort's user IDs. Generated artifacts (message, personality, image
+bytes, image titles) and progress markers (uploaded file IDs, posted message ts) are written under
+CELEBRATION_ARTIFACTS_DIR/<celebration_id>/ as soon as each stage completes.
+When BirthdayCelebrationPipeline.celebrate() is retried - including by
+celebrate_missed_birthdays() - it resumes from the last completed stage.
+
+Layout:
+    <celebration_id>/manifest.json   stage, message, personality, image metadata, file IDs, ts
+    <celebration_id>/<slot>_<n>.png  raw image bytes for each persisted image
+
+Key class: CelebrationArtifacts
+Key functions: celebration_id_for(), cleanup_old_artifacts()
+"""
+
+import base64
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timedelta, timezone
+
+from config import CACHE_RETENTION_DAYS, CELEBRATION_ARTIFACTS_DIR, get_logger
+
+logger = get_logger("storage")
+
+# Ordered pipeline stages; a celebration resumes after the highest one reached
+STAGES = ("generated", "finalized", "uploaded", "posted", "completed")
+
+# Image dict keys rebuilt from the .png on load rather than stored in the manifest
+_BINARY_IMAGE_KEYS = ("image_data", "image_base64")
+
+_write_lock = threading.Lock()
+
+
+def celebration_id_for(birthday_people, date_str=None):
+    """
+    Build the celebration ID for a cohort: date + short hash of sorted user IDs.
+
+    Args:
+        birthday_people: List of birthday person dicts (must contain user_id)
+        date_str: YYYY-MM-DD of the celebrated birthday (defaults to today, UTC);
+            the pipeline passes the cohort's birthday so late retries resume
+
+    Returns:
+        str: e.g. "2026-10-18_3f9a1c0b2d4e"
+    """
+    date_str = date_str or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    cohort = ",".join(sorted(p["user_id"] for p in birthday_people))
+    digest = hashlib.sha256(cohort.encode("utf-8")).hexdigest()[:12]
+    return f"{date_str}_{digest}"
+
+
+class CelebrationArtifacts:
+    """Manifest-backed artifact store for one celebration cohort."""
+
+    def __init__(self, celebration_id):
+        self.celebration_id = celebration_id
+        self.path = os.path.join(CELEBRATION_ARTIFACTS_DIR, celebration_id)
+        self.manifest_file = os.path.join(self.path, "manifest.json")
+        self.manifest = self._load_manifest()
+
+    @classmethod
+    def for_cohort(cls, birthday_people, date_str=None):
+        """Open (or start) the artifact store for a cohort."""
+        return cls(celebration_id_for(birthday_people, date_str))
+
+    # ----- manifest persistence -----
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"stage": None}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"ARTIFACTS: Unreadable manifest for {self.celebration_id}: {e}")
+            return {"stage": None}
+
+    def _save_manifest(self):
+        self.manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        with _write_lock:
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = self.manifest_file + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True, default=str)
+            os.replace(tmp_path, self.manifest_file)
+
+    # ----- stages -----
+
+    @property
+    def stage(self):
+        return self.manifest.get("stage")
+
+    def reached(self, stage):
+        """True if the stored stage is at or beyond `stage`."""
+        current = self.stage
+        return current in STAGES and STAGES.index(current) >= STAGES.index(stage)
+
+    def mark_stage(self, stage, **fields):
+        """Record that `stage` completed, persisting any extra manifest fields."""
+        if not self.reached(stage):
+            self.manifest["stage"] = stage
+        self.manifest.update(fields)
+        try:
+            self._save_manifest()
+            logger.debug(f"ARTIFACTS: {self.celebration_id} reached stage '{stage}'")
+        except OSError as e:
+            # Persistence is best-effort: a failed write costs a regeneration, not a celebration
+            logger.error(f"ARTIFACTS: Failed to persist stage '{stage}': {e}")
+
+    # ----- generated content -----
+
+    def save_generation(self, slot, message, images, personality, user_ids=None):
+        """
+        Persist a generated (message, images, personality) result under a slot.
+
+        Args:
+            slot: "generated" for the first generation, "finalized" for the
+                post-validation message/images actually being posted
+            message: Message text
+            images: List of image dicts (image_data bytes are written to .png files)
+            personality: Personality name used for generation
+            user_ids: Optional user IDs the result is valid for (checked on resume)
+        """
+        stored_images = []
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            for index, image in enumerate(images or []):
+                entry = {k: v for k, v in image.items() if k not in _BINARY_IMAGE_KEYS}
+                image_bytes = image.get("image_data")
+                if image_bytes:
+                    filename = f"{slot}_{index}.png"
+                    with open(os.path.join(self.path, filename), "wb") as f:
+                        f.write(image_bytes)
+                    entry["artifact_file"] = filename
+                stored_images.append(entry)
+        except OSError as e:
+            logger.error(f"ARTIFACTS: Failed to persist images for {self.celebration_id}: {e}")
+            return
+
+        self.mark_stage(
+            slot,
+            **{
+                slot: {
+                    "message": message,
+                    "personality": personality,
+                    "images": stored_images,
+                    "user_ids": sorted(user_ids) if user_ids else None,
+                }
+            },
+        )
+        logger.info(
+            f"ARTIFACTS: Saved {slot} artifacts for {self.celebration_id} "
+            f"({len(stored_images)} image(s))"
+        )
+
+    def load_generation(self, slot, user_ids=None):
+        """
+        Load a persisted generation result.
+
+        Args:
+            slot: "generated" or "finalized"
+            user_ids: If given, only return the result when it was saved for the same users
+
+        Returns:
+            tuple: (message, images, personality) or None if not available
+        """
+        data = self.manifest.get(slot)
+        if not data or not data.get("message"):
+            return None
+        if user_ids is not None and data.get("user_ids") not in (None, sorted(user_ids)):
+            return None
+
+        images = []
+        for entry in data.get("images") or []:
+            image = dict(entry)
+            artifact_file = image.pop("artifact_file", None)
+            if artifact_file:
+                try:
+                    with open(os.path.join(self.path, artifact_file), "rb") as f:
+                        image_bytes = f.read()
+                except OSError as e:
+                    logger.warning(f"ARTIFACTS: Missing image {artifact_file}: {e}")
+                    continue
+                image["image_data"] = image_bytes
+                image["image_base64"] = base64.b64encode(image_bytes).decode("utf-8")
+            images.append(image)
+
+        return data["message"], images, data.get("personality")
+
+    def save_image_titles(self, slot, images):
+        """Persist resolved custom_title values for a slot's images (index-aligned)."""
+        data = self.manifest.get(slot)
+        if not data:
+            return
+        for entry, image in zip(data.get("images") or [], images):
+            if image.get("custom_title"):
+                entry["custom_title"] = image["custom_title"]
+        self.mark_stage(slot)
+
+    # ----- Slack progress -----
+
+    def uploaded_file_ids(self):
+        """Return persisted [(file_id, title), ...] from a previous upload, or None."""
+        if not self.reached("uploaded"):
+            return None
+        return [tuple(item) for item in self.manifest.get("file_ids") or []]
+
+    def posted_ts(self):
+        """Return the ts of an already-posted celebration message, or None."""
+        return self.manifest.get("ts") if self.reached("posted") else None
+
+    def discard(self):
+        """Remove all artifacts for this celebration."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.manifest = {"stage": None}
+
+
+def cleanup_old_artifacts(days_to_keep=None):
+    """
+    Delete celebration artifact directories older than the retention window.
+
+    Args:
+        days_to_keep: Retention in days (defaults to CACHE_RETENTION_DAYS["celebration_artifacts"])
+
+    Returns:
+        int: Number of celebration directories removed
+    """
+    if days_to_keep is None:
+        days_to_keep = CACHE_RETENTION_DAYS["celebration_artifacts"]
+    if not os.path.isdir(CELEBRATION_ARTIFACTS_DIR):
+        return 0
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days_to_keep)).strftime("%Y-%m-%d")
+    removed = 0
+    for name in os.listdir(CELEBRATION_ARTIFACTS_DIR):
+        # Directory names start with YYYY-MM-DD, so string comparison orders by date
+        if name[:10] < cutoff:
+            shutil.rmtree(os.path.join(CELEBRATION_ARTIFACTS_DIR, name), ignore_errors=True)
+            removed += 1
+
+    if removed:
+        logger.info(f"ARTIFACTS: Removed {removed} celebration artifact set(s) older than {cutoff}")
+    return removed
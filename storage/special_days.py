@@ -13,8 +13,6 @@ import threading
 from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
-from filelock import FileLock
-
 # Pre-compiled regex patterns for deduplication (performance optimization)
 _PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
 _WHITESPACE_PATTERN = re.compile(r"\s+")
@@ -40,7 +38,6 @@ from config import (
     SPECIAL_DAYS_MODE,
     SPECIAL_DAYS_PERSONALITY,
     SPECIAL_DAYS_WEEKLY_DAY,
-    TIMEOUTS,
     UN_OBSERVANCES_CACHE_FILE,
     UN_OBSERVANCES_ENABLED,
     UNESCO_OBSERVANCES_CACHE_FILE,
@@ -52,6 +49,7 @@ from config import (
     WHO_OBSERVANCES_ENABLED,
     get_logger,
 )
+from utils.locks import file_lock
 
 # Get dedicated logger for special days
 logger = get_logger("special_days")
@@ -138,7 +136,7 @@ def _load_json_special_days() -> List[SpecialDay]:
         List of SpecialDay objects
     """
     try:
-        lock = FileLock(SPECIAL_DAYS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(SPECIAL_DAYS_LOCK_FILE)
         with lock:
             with open(SPECIAL_DAYS_JSON_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -194,7 +192,7 @@ def _save_json_special_days(special_days: List[SpecialDay]) -> bool:
             "days": [d.to_dict() for d in sorted_days],
         }
 
-        lock = FileLock(SPECIAL_DAYS_LOCK_FILE, timeout=TIMEOUTS["file_lock"])
+        lock = file_lock(SPECIAL_DAYS_LOCK_FILE)
         with lock:
             with open(SPECIAL_DAYS_JSON_FILE, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
@@ -1191,7 +1189,7 @@ def mark_special_day_announced(date: Optional[datetime] = None, names: list = No
     date_str = date.strftime("%Y-%m-%d")
 
     try:
-        lock = FileLock(ANNOUNCEMENTS_LOCK_FILE, timeout=30)
+        lock = file_lock(ANNOUNCEMENTS_LOCK_FILE, timeout=30)
         with lock:
             # Load within lock
             if os.path.exists(ANNOUNCEMENTS_FILE):
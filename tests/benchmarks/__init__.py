@@ -0,0 +1 @@
+"""Synthetic-scale benchmarks for storage and detection hot paths (run via tests.benchmarks.run)."""
@@ -0,0 +1,136 @@
+"""
+Synthetic data for the benchmarks.
+
+Builds a data/ tree under a workspace root with the same layout and file formats
+the bot uses: birthdays.json with N users (mixed years, preferences and
+celebration styles) plus full UN, UNESCO and WHO observance caches and a custom
+special_days.json. Generation is seeded, so every run at a size sees the same data.
+"""
+
+import calendar
+import json
+import os
+import random
+from datetime import datetime, timezone
+
+# Timezones handed out by the stub Slack client (spread across UTC offsets)
+TIMEZONES = [
+    "America/Los_Angeles",
+    "America/New_York",
+    "America/Sao_Paulo",
+    "Europe/London",
+    "Europe/Berlin",
+    "Africa/Nairobi",
+    "Asia/Kolkata",
+    "Asia/Singapore",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+    "Pacific/Auckland",
+]
+
+_STYLES = ["quiet", "standard", "standard", "standard", "epic"]
+_CATEGORIES = ["Global Health", "Tech", "Culture", "Company"]
+
+
+def user_id(i):
+    return f"U{i:09d}"
+
+
+def _birthday_entry(rng, now):
+    month = rng.randint(1, 12)
+    day = rng.randint(1, calendar.monthrange(2024, month)[1])  # Leap year: 29/02 allowed
+    year = rng.randint(1960, 2004) if rng.random() < 0.7 else None
+    return {
+        "date": f"{day:02d}/{month:02d}",
+        "year": year,
+        "preferences": {
+            "active": rng.random() > 0.05,
+            "image_enabled": rng.random() > 0.2,
+            "show_age": year is not None and rng.random() > 0.3,
+            "celebration_style": rng.choice(_STYLES),
+        },
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _observances(rng, source, per_day):
+    days = []
+    for month in range(1, 13):
+        for day in range(1, calendar.monthrange(2024, month)[1] + 1):
+            for n in range(rng.randint(0, per_day)):
+                days.append(
+                    {
+                        "date": f"{day:02d}/{month:02d}",
+                        "name": f"{source} Day of Topic {month}-{day}-{n}",
+                        "category": rng.choice(_CATEGORIES[:3]),
+                        "description": f"An international observance about topic {month}-{day}-{n}.",
+                        "emoji": "🌍",
+                        "source": source,
+                        "url": f"https://example.org/{source.lower()}/{month}/{day}/{n}",
+                    }
+                )
+    return days
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def generate_workspace(root, users, seed=42, channel_share=0.9):
+    """
+    Write a synthetic data/ tree under root.
+
+    Args:
+        root: Workspace directory (the benchmark runs with it as cwd)
+        users: Number of users with birthdays
+        seed: RNG seed
+        channel_share: Fraction of users who are birthday channel members
+
+    Returns:
+        dict: {"members": [user ids in the birthday channel], "users": users}
+    """
+    from config import (
+        BIRTHDAYS_JSON_FILE,
+        SPECIAL_DAYS_JSON_FILE,
+        UN_OBSERVANCES_CACHE_FILE,
+        UNESCO_OBSERVANCES_CACHE_FILE,
+        WHO_OBSERVANCES_CACHE_FILE,
+    )
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).isoformat()
+    birthdays = {user_id(i): _birthday_entry(rng, now) for i in range(users)}
+    members = [uid for uid in birthdays if rng.random() < channel_share]
+
+    _write_json(os.path.join(root, BIRTHDAYS_JSON_FILE), birthdays)
+
+    fresh = datetime.now().isoformat()
+    for path, source, per_day in (
+        (UN_OBSERVANCES_CACHE_FILE, "UN", 2),
+        (UNESCO_OBSERVANCES_CACHE_FILE, "UNESCO", 1),
+        (WHO_OBSERVANCES_CACHE_FILE, "WHO", 1),
+    ):
+        _write_json(
+            os.path.join(root, path),
+            {"last_updated": fresh, "observances": _observances(rng, source, per_day)},
+        )
+
+    custom = [
+        {
+            "date": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}",
+            "name": f"Company Day {i}",
+            "category": "Company",
+            "description": f"Internal celebration number {i}.",
+            "emoji": "🏢",
+            "enabled": True,
+            "source": "Custom",
+            "url": "",
+        }
+        for i in range(40)
+    ]
+    _write_json(os.path.join(root, SPECIAL_DAYS_JSON_FILE), {"days": custom})
+
+    return {"members": members, "users": users}
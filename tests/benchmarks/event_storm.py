@@ -0,0 +1,696 @@
+"""
+Event storm harness: how many events per second the Slack handlers absorb.
+
+Builds a Bolt App with every listener from handlers/ registered (as app.py
+does) against the local Slack Web API emulator and a synthetic workspace, then
+dispatches message, app_mention, app_home_opened and block_actions payloads
+in-process at fixed offered rates. Payloads are generated, or replayed from a
+JSONL file of recorded Events API / interactivity bodies (Socket Mode envelopes
+are unwrapped).
+
+Arrivals are open loop: a pacer queues events on schedule and --concurrency
+dispatcher threads (Socket Mode's default is 10) feed them to the App, so a
+saturated App shows up as growing latency rather than a slower sender.
+
+--runtime async dispatches through the SLACK_RUNTIME=async path instead: the
+AsyncApp from handlers/async_runtime.create_async_app() on an event loop thread,
+with unmatched requests falling back to the same sync App, so the two runtimes
+can be compared on identical traffic. Per event type it measures:
+
+- ack latency: scheduled arrival to Bolt's ack (the 3 s Slack deadline)
+- completion latency: scheduled arrival to the listener returning (async
+  runtime: every task the dispatch spawned finishing)
+- errors: exceptions out of listeners, ERROR logs while they ran, non-200 acks,
+  and listeners still running when the drain timeout ends
+
+Work handed to utils/work_queue lanes is reported from the lane stats (wait
+p95, shed, failed). Each rate step's results, the highest rate that was
+sustained, and Slack call counts go to JSON and a printed table:
+
+    python -m tests.benchmarks.event_storm --rates 10,25,50,100 --duration 10
+    python -m tests.benchmarks.event_storm --replay events.jsonl --rates 20
+    python -m tests.benchmarks.event_storm --runtime async --rates 10,25,50,100
+
+Mentions call OpenAI; without a reachable API they measure the failure path.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from tests.benchmarks.datagen import generate_workspace
+from tests.benchmarks.run import BENCH_CHANNEL, _git_commit, _workspace
+from tests.benchmarks.slack_emulator import BOT_USER_ID, TEAM_ID, SlackEmulator
+
+EVENT_TYPES = ("message", "app_mention", "app_home_opened", "block_actions")
+RUNTIMES = ("sync", "async")
+DEFAULT_MIX = {"message": 4, "app_mention": 1, "app_home_opened": 3, "block_actions": 2}
+DEFAULT_RATES = [10, 25, 50, 100]
+# Slack retries an event that is not acked within this many seconds
+ACK_DEADLINE_SECONDS = 3.0
+# A rate is sustained if this share of offered events completes in the window...
+SUSTAINED_COMPLETION_SHARE = 0.95
+# ...with at most this error rate and p99 ack inside ACK_DEADLINE_SECONDS
+SUSTAINED_MAX_ERROR_RATE = 0.01
+
+_local = threading.local()
+# The event being handled on the async runtime (loop tasks and run_blocking calls)
+_record_var = contextvars.ContextVar("storm_record", default=None)
+_pending_lock = threading.Lock()
+
+
+def _current_record():
+    return getattr(_local, "record", None) or _record_var.get()
+
+
+def _begin(record):
+    with _pending_lock:
+        record["pending"] += 1
+
+
+def _end(record):
+    with _pending_lock:
+        record["pending"] -= 1
+        if record["pending"] == 0:
+            record["done"] = time.perf_counter()
+
+
+# --- Payloads ---
+
+
+class PayloadGenerator:
+    """Seeded Events API and block_actions bodies for workspace members."""
+
+    def __init__(self, members, seed=42):
+        self.members = members
+        self.rng = random.Random(seed)
+        self.seq = 0
+
+    def _ts(self):
+        self.seq += 1
+        return f"{int(time.time())}.{self.seq:06d}"
+
+    def _event_callback(self, event):
+        return {
+            "token": "storm",
+            "team_id": TEAM_ID,
+            "api_app_id": "ASTORM",
+            "type": "event_callback",
+            "event_id": f"Ev{self.seq:010d}",
+            "event_time": int(time.time()),
+            "event": event,
+        }
+
+    def message(self):
+        user = self.rng.choice(self.members)
+        ts = self._ts()
+        roll = self.rng.random()
+        if roll < 0.5:  # Celebratory channel message: gets a reaction
+            event = {"channel": BENCH_CHANNEL, "channel_type": "channel", "text": "Happy birthday!"}
+        elif roll < 0.7:  # Channel chatter: ignored
+            event = {"channel": BENCH_CHANNEL, "channel_type": "channel", "text": "lunch at 1?"}
+        else:  # DM command
+            text = self.rng.choice(["help", "check", "list"])
+            event = {"channel": f"D{user[1:]}", "channel_type": "im", "text": text}
+        return self._event_callback({"type": "message", "user": user, "ts": ts, **event})
+
+    def app_mention(self):
+        question = self.rng.choice(
+            ["what's special today?", "who has a birthday this week?", "when is my birthday?"]
+        )
+        return self._event_callback(
+            {
+                "type": "app_mention",
+                "user": self.rng.choice(self.members),
+                "channel": BENCH_CHANNEL,
+                "text": f"<@{BOT_USER_ID}> {question}",
+                "ts": self._ts(),
+            }
+        )
+
+    def app_home_opened(self):
+        return self._event_callback(
+            {
+                "type": "app_home_opened",
+                "user": self.rng.choice(self.members),
+                "channel": "DHOME",
+                "tab": "home",
+                "event_ts": self._ts(),
+            }
+        )
+
+    def block_actions(self):
+        user = self.rng.choice(self.members)
+        action_id = self.rng.choice(["view_all_birthdays", "pause_birthday", "resume_birthday"])
+        return {
+            "type": "block_actions",
+            "token": "storm",
+            "api_app_id": "ASTORM",
+            "team": {"id": TEAM_ID},
+            "user": {"id": user, "team_id": TEAM_ID},
+            "trigger_id": f"trigger-{self._ts()}",
+            "container": {"type": "view", "view_id": "VHOME"},
+            "actions": [
+                {
+                    "action_id": action_id,
+                    "block_id": "home",
+                    "type": "button",
+                    "action_ts": self._ts(),
+                }
+            ],
+        }
+
+    def next(self, kind):
+        return getattr(self, kind)()
+
+
+def event_kind(body):
+    """Event type used for reporting ('message', 'block_actions', ...)."""
+    if body.get("type") == "event_callback":
+        return body.get("event", {}).get("type", "unknown")
+    return body.get("type", "unknown")
+
+
+def load_replay(path):
+    """Recorded bodies from JSONL (Socket Mode envelopes or Events API bodies)."""
+    bodies = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            body = json.loads(line)
+            bodies.append(body.get("payload", body) if "envelope_id" in body else body)
+    return bodies
+
+
+# --- Instrumented App ---
+
+
+class _TimedExecutor(ThreadPoolExecutor):
+    """Bolt listener executor that records when each event's listeners finish."""
+
+    def submit(self, fn, *args, **kwargs):
+        record = _current_record()
+        if record is None:
+            return super().submit(fn, *args, **kwargs)
+        _begin(record)
+
+        def run():
+            _local.record = record
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _local.record = None
+                _end(record)
+
+        return super().submit(run)
+
+
+class _ErrorLogCounter(logging.Handler):
+    """Marks the event whose listener is running when an ERROR is logged."""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+
+    def emit(self, log_record):
+        record = _current_record()
+        if record is not None and record["error"] is None:
+            record["error"] = log_record.getMessage()[:200]
+
+
+def build_app(emulator, executor_workers=None):
+    """Bolt App with every listener registered, talking to the emulator."""
+    from slack_bolt import App
+    from slack_sdk import WebClient
+
+    from handlers.app_home_handler import register_app_home_handlers
+    from handlers.event_handler import register_event_handlers
+    from handlers.mention_handler import register_mention_handlers
+    from handlers.modal_handler import register_modal_handlers
+    from handlers.slash_handler import register_slash_commands
+    from slack.client import instrument_app_clients
+
+    app = App(
+        client=WebClient(token="xoxb-storm", base_url=emulator.url),
+        request_verification_enabled=False,
+        listener_executor=_TimedExecutor(max_workers=executor_workers),
+        logger=logging.getLogger("brightdaybot.event_storm"),
+    )
+    instrument_app_clients(app)
+    register_event_handlers(app)
+    register_mention_handlers(app)
+    register_slash_commands(app)
+    register_modal_handlers(app)
+    register_app_home_handlers(app)
+
+    @app.error
+    def record_listener_error(error):
+        _record_listener_error(error)
+
+    return app
+
+
+def _record_listener_error(error):
+    record = _current_record()
+    if record is not None:
+        record["error"] = f"{type(error).__name__}: {error}"
+
+
+def _timed_task_factory(loop, coro, context=None):
+    """Task factory counting the tasks each event spawns on the async runtime."""
+    context = context or contextvars.copy_context()
+    task = asyncio.Task(coro, loop=loop, context=context)
+    record = context.get(_record_var)
+    if record is not None:
+        _begin(record)
+        task.add_done_callback(lambda _: _end(record))
+    return task
+
+
+class AsyncRuntime:
+    """
+    The SLACK_RUNTIME=async dispatch path on an event loop thread.
+
+    Requests go through handlers/async_runtime.dispatch_hybrid(): the AsyncApp
+    first, the sync App from build_app() for anything it has no listener for.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_task_factory(_timed_task_factory)
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="storm-loop", daemon=True
+        )
+        self._thread.start()
+        self.async_app = self._call(self._create_async_app())
+
+    async def _create_async_app(self):
+        from handlers.async_runtime import create_async_app
+
+        async_app = create_async_app(self.app)
+
+        @async_app.error
+        async def record_listener_error(error):
+            _record_listener_error(error)
+
+        return async_app
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def dispatch_body(self, body, record):
+        """Dispatch one body as a Socket Mode request; returns the BoltResponse."""
+        from slack_sdk.socket_mode.request import SocketModeRequest
+
+        from handlers.async_runtime import dispatch_hybrid
+
+        req = SocketModeRequest(
+            type="events_api" if body.get("type") == "event_callback" else "interactive",
+            envelope_id=f"storm-{id(record)}",
+            payload=body,
+        )
+
+        async def run():
+            _record_var.set(record)
+            return await dispatch_hybrid(self.async_app, self.app, req)
+
+        return self._call(run())
+
+    def close(self):
+        """Cancel listeners still running after the drain, then stop the loop."""
+
+        async def cancel_pending():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._call(cancel_pending())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self.loop.close()
+
+
+def _dispatch(app, body, record):
+    from slack_bolt import BoltRequest
+
+    _local.record = record
+    try:
+        if isinstance(app, AsyncRuntime):
+            response = app.dispatch_body(body, record)
+        else:
+            response = app.dispatch(BoltRequest(body=body, mode="socket_mode"))
+        record["status"] = response.status
+        if response.status != 200 and record["error"] is None:
+            record["error"] = f"ack status {response.status}"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        _local.record = None
+        record["acked"] = time.perf_counter()
+        with _pending_lock:
+            if record["pending"] == 0 and record["done"] is None:
+                record["done"] = record["acked"]  # No listener matched
+
+
+# --- Storm ---
+
+
+def _percentiles(samples):
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(samples)
+
+    def at(fraction):
+        return round(ordered[int(fraction * (len(ordered) - 1))] * 1000, 1)
+
+    return {"p50": at(0.5), "p95": at(0.95), "p99": at(0.99), "max": round(ordered[-1] * 1000, 1)}
+
+
+def _summarize(records, duration):
+    by_kind = {}
+    for record in records:
+        by_kind.setdefault(record["kind"], []).append(record)
+
+    def stats(group):
+        acked = [r["acked"] - r["scheduled"] for r in group if r["acked"] is not None]
+        done = [r for r in group if r["done"] is not None]
+        errors = sum(1 for r in group if r["error"] is not None or r["done"] is None)
+        in_window = sum(1 for r in done if r["done"] - r["started"] <= duration)
+        return {
+            "sent": len(group),
+            "completed": len(done),
+            "completed_in_window": in_window,
+            "errors": errors,
+            "error_rate": round(errors / len(group), 4) if group else 0.0,
+            "ack_ms": _percentiles(acked),
+            "completion_ms": _percentiles([r["done"] - r["scheduled"] for r in done]),
+        }
+
+    summary = stats(records)
+    summary["by_type"] = {kind: stats(group) for kind, group in sorted(by_kind.items())}
+    summary["error_samples"] = sorted(
+        Counter(r["error"] for r in records if r["error"]).items(), key=lambda kv: -kv[1]
+    )[:5]
+    return summary
+
+
+def run_step(app, source, rate, duration, concurrency, drain=30.0):
+    """
+    Offer `rate` events/s for `duration` seconds and measure every event.
+
+    Args:
+        app: App from build_app(), or an AsyncRuntime wrapping it
+        source: Callable returning the next body
+        rate: Offered events per second
+        duration: Seconds of arrivals
+        concurrency: Dispatcher threads feeding the App
+        drain: Seconds to wait for in-flight listeners after the last arrival
+
+    Returns:
+        dict: Summary with overall and per-type latency percentiles and errors
+    """
+    from utils.work_queue import get_work_queue
+
+    lanes_before = get_work_queue().stats()
+    arrivals = queue.Queue()
+    records = []
+
+    def dispatcher():
+        while True:
+            record = arrivals.get()
+            if record is None:
+                return
+            _dispatch(app, record.pop("body"), record)
+
+    workers = [
+        threading.Thread(target=dispatcher, name=f"storm-{i}", daemon=True)
+        for i in range(concurrency)
+    ]
+    for worker in workers:
+        worker.start()
+
+    started = time.perf_counter()
+    total = max(1, int(rate * duration))
+    for i in range(total):
+        scheduled = started + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        body = source()
+        record = {
+            "kind": event_kind(body),
+            "body": body,
+            "started": started,
+            "scheduled": scheduled,
+            "acked": None,
+            "done": None,
+            "pending": 0,
+            "status": None,
+            "error": None,
+        }
+        records.append(record)
+        arrivals.put(record)
+
+    for _ in workers:
+        arrivals.put(None)
+    for worker in workers:
+        worker.join()
+    deadline = time.perf_counter() + drain
+    while any(r["done"] is None for r in records) and time.perf_counter() < deadline:
+        time.sleep(0.05)
+
+    for record in records:
+        if record["done"] is None and record["error"] is None:
+            record["error"] = f"listener still running after {drain:.0f}s drain"
+
+    summary = _summarize(records, duration)
+    summary["offered_rate"] = rate
+    summary["achieved_rate"] = round(summary["completed_in_window"] / duration, 2)
+    summary["lanes"] = _lane_delta(lanes_before, get_work_queue().stats())
+    return summary
+
+
+def _lane_delta(before, after):
+    lanes = {}
+    for name, stats in after.items():
+        prior = before.get(name, {})
+        lanes[name] = {
+            "submitted": stats["submitted"] - prior.get("submitted", 0),
+            "shed": stats["shed"] - prior.get("shed", 0),
+            "failed": stats["failed"] - prior.get("failed", 0),
+            "high_water": stats["high_water"],
+            "wait_p95": stats["wait_p95"],
+        }
+    return lanes
+
+
+def _sustained(step):
+    return (
+        step["completed_in_window"] >= SUSTAINED_COMPLETION_SHARE * step["sent"]
+        and step["error_rate"] <= SUSTAINED_MAX_ERROR_RATE
+        and (step["ack_ms"]["p99"] or 0) <= ACK_DEADLINE_SECONDS * 1000
+    )
+
+
+def run_storm(
+    rates=None,
+    duration=10.0,
+    concurrency=10,
+    mix=None,
+    replay=None,
+    users=2000,
+    seed=42,
+    slack_latency_ms=50,
+    slack_jitter_ms=30,
+    slack_rate_limits=False,
+    drain=30.0,
+    runtime="sync",
+):
+    """
+    Run every rate step against a fresh synthetic workspace.
+
+    runtime="async" dispatches through the async runtime (requires aiohttp).
+
+    Returns:
+        dict: JSON-ready {"meta", "steps": [summary per rate], "max_sustained_rate", "slack"}
+    """
+    rates = rates or DEFAULT_RATES
+    mix = mix or DEFAULT_MIX
+    from utils.log_setup import add_component_handler, remove_component_handler
+
+    with tempfile.TemporaryDirectory(prefix="storm-") as root:
+        generated = generate_workspace(root, users, seed=seed)
+        emulator = SlackEmulator(
+            members=generated["members"],
+            latency_ms=slack_latency_ms,
+            jitter_ms=slack_jitter_ms,
+            rate_limit_scale=1.0 if slack_rate_limits else 0,
+            seed=seed,
+        )
+        error_counter = _ErrorLogCounter()
+        with (
+            _workspace(root),
+            patch("handlers.event_handler.BIRTHDAY_CHANNEL", BENCH_CHANNEL),
+            emulator,
+        ):
+            add_component_handler(error_counter)
+            app = None
+            try:
+                app = build_app(emulator, executor_workers=concurrency * 2)
+                if runtime == "async":
+                    app = AsyncRuntime(app)
+                generator = PayloadGenerator(generated["members"], seed=seed)
+                if replay:
+                    source = itertools.cycle(load_replay(replay)).__next__
+                else:
+                    kinds, weights = zip(*mix.items())
+                    rng = random.Random(seed)
+                    source = lambda: generator.next(rng.choices(kinds, weights)[0])  # noqa: E731
+
+                # Warm up auth.test, caches and lazy imports outside the measurement
+                for kind in EVENT_TYPES if replay else mix:
+                    _dispatch(app, generator.next(kind), _warmup_record(kind))
+
+                steps = [
+                    run_step(app, source, rate, duration, concurrency, drain) for rate in rates
+                ]
+            finally:
+                if isinstance(app, AsyncRuntime):
+                    app.close()
+                remove_component_handler(error_counter)
+            slack = emulator.stats()
+
+    sustained = [step["offered_rate"] for step in steps if _sustained(step)]
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "runtime": runtime,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "duration": duration,
+            "concurrency": concurrency,
+            "mix": mix if not replay else None,
+            "replay": replay,
+            "users": users,
+            "slack_latency_ms": slack_latency_ms,
+            "slack_jitter_ms": slack_jitter_ms,
+            "slack_rate_limits": slack_rate_limits,
+        },
+        "steps": steps,
+        "max_sustained_rate": max(sustained) if sustained else None,
+        "slack": slack,
+    }
+
+
+def _warmup_record(kind):
+    return {"kind": kind, "acked": None, "done": None, "pending": 0, "status": None, "error": None}
+
+
+def _parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in EVENT_TYPES:
+            raise argparse.ArgumentTypeError(f"unknown event type {kind!r}")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def _print_report(document):
+    for step in document["steps"]:
+        print(
+            f"\n{step['offered_rate']:>6} ev/s offered  {step['achieved_rate']:>7} completed/s"
+            f"  errors {step['errors']}/{step['sent']}"
+        )
+        for kind, s in step["by_type"].items():
+            print(
+                f"  {kind:<16} n {s['sent']:>5}  ack p50/p99 {s['ack_ms']['p50'] or 0:>8.1f}"
+                f" /{s['ack_ms']['p99'] or 0:>8.1f} ms  done p50/p99"
+                f" {s['completion_ms']['p50'] or 0:>8.1f} /{s['completion_ms']['p99'] or 0:>8.1f} ms"
+                f"  err {s['error_rate']:.1%}"
+            )
+        for lane, s in step["lanes"].items():
+            if s["submitted"] or s["shed"]:
+                print(
+                    f"  lane {lane:<11} submitted {s['submitted']}  shed {s['shed']}"
+                    f"  failed {s['failed']}  wait p95 {s['wait_p95']}s"
+                )
+        for error, count in step["error_samples"]:
+            print(f"  ! {count} x {error}")
+    print(
+        f"\nMax sustained rate ({document['meta']['runtime']} runtime): "
+        f"{document['max_sustained_rate'] or 'none'} ev/s"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rates", default=",".join(map(str, DEFAULT_RATES)), help="Events/s")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per rate")
+    parser.add_argument("--concurrency", type=int, default=10, help="Dispatcher threads")
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=DEFAULT_MIX,
+        help="Event weights, e.g. message=4,app_mention=1,app_home_opened=3,block_actions=2",
+    )
+    parser.add_argument("--replay", help="JSONL of recorded event bodies (instead of --mix)")
+    parser.add_argument(
+        "--runtime", choices=RUNTIMES, default="sync", help="async needs the async extra"
+    )
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--slack-latency-ms", type=float, default=50)
+    parser.add_argument("--slack-jitter-ms", type=float, default=30)
+    parser.add_argument(
+        "--slack-rate-limits", action="store_true", help="Apply Slack's tier limits"
+    )
+    parser.add_argument("--drain", type=float, default=30.0, help="Seconds to await stragglers")
+    parser.add_argument("--output", help="JSON path (default bench_results/storm-<commit>.json)")
+    args = parser.parse_args(argv)
+
+    document = run_storm(
+        rates=[float(r) for r in args.rates.split(",") if r],
+        duration=args.duration,
+        concurrency=args.concurrency,
+        mix=args.mix,
+        replay=args.replay,
+        users=args.users,
+        seed=args.seed,
+        slack_latency_ms=args.slack_latency_ms,
+        slack_jitter_ms=args.slack_jitter_ms,
+        slack_rate_limits=args.slack_rate_limits,
+        drain=args.drain,
+        runtime=args.runtime,
+    )
+
+    suffix = "" if args.runtime == "sync" else f"-{args.runtime}"
+    output = args.output or os.path.join(
+        "bench_results", f"storm-{document['meta']['commit']}{suffix}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+    _print_report(document)
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,495 @@
+"""
+Local OpenAI-compatible stub server for pipeline benchmarks.
+
+Answers the endpoints the celebration pipeline calls, over real HTTP so the
+unmodified openai SDK (retries, timeouts, response parsing) talks to it:
+
+- POST /v1/responses: text, structured output (json_schema), vision
+  (input_image) and web search (web_search_preview tool) requests
+- POST /v1/images/generations and /v1/images/edits: a solid-colour PNG of the
+  requested size as b64_json
+
+Replies are scripted: the first rule whose kind and regex match the request
+supplies a text template or an error status, otherwise a default template is
+used. Templates can use {mentions} (every <@U...> in the prompt, so mention
+validation passes), {model}, {call}, {kind} and {prompt}. Structured requests
+get a JSON document generated from their schema (one result per enum ID for
+batch schemas) with strings rendered from the same template.
+
+Latency is drawn per kind from a seeded distribution ("fixed:800",
+"uniform:200,900", "normal:800,150", "lognormal:800,0.4" in ms; lognormal
+takes the median), a share of requests can answer 429 (with Retry-After) or
+hang past the client timeout, and every reply reports token usage estimated
+from its input and output. stats() totals calls, injected faults and tokens.
+
+Point the bot at it with OPENAI_BASE_URL (any OPENAI_API_KEY is accepted):
+
+    python -m tests.benchmarks.openai_stub --port 8766 --latency text=lognormal:900,0.4
+    OPENAI_BASE_URL=http://127.0.0.1:8766/v1 SLACK_API_URL=... python app.py
+"""
+
+import argparse
+import base64
+import itertools
+import json
+import math
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+KINDS = ("text", "structured", "vision", "web_search", "image")
+DEFAULT_TEMPLATE = "{mentions} Happy birthday from the stub! 🎉 (reply {call})"
+# Rough chars-per-token ratio for the usage estimate
+CHARS_PER_TOKEN = 4
+# Input tokens billed for a low-detail input_image
+IMAGE_INPUT_TOKENS = 85
+# Image output tokens for a 1024x1024 image by quality (scaled by pixel count)
+IMAGE_OUTPUT_TOKENS = {"low": 272, "medium": 1056, "high": 4160, "auto": 1056}
+
+_MENTION = re.compile(r"<@[A-Z0-9]+>")
+
+
+def parse_latency(spec):
+    """
+    Sampler for a latency spec in milliseconds.
+
+    Args:
+        spec: "MS", "fixed:MS", "uniform:LO,HI", "normal:MEAN,SD" or
+              "lognormal:MEDIAN,SIGMA"
+
+    Returns:
+        callable: rng -> seconds
+    """
+    name, _, params = str(spec).partition(":")
+    if not params:
+        name, params = "fixed", name
+    values = [float(v) for v in params.split(",")]
+    samplers = {
+        "fixed": lambda rng: values[0],
+        "uniform": lambda rng: rng.uniform(values[0], values[1]),
+        "normal": lambda rng: max(0.0, rng.gauss(values[0], values[1])),
+        "lognormal": lambda rng: rng.lognormvariate(math.log(values[0]), values[1]),
+    }
+    if name not in samplers:
+        raise ValueError(f"Unknown latency distribution {name!r}")
+    sampler = samplers[name]
+    return lambda rng: sampler(rng) / 1000
+
+
+def _png(width, height, rgb=(255, 196, 64)):
+    """Solid-colour PNG (stdlib only)."""
+
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\x00" + bytes(rgb) * width
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _tokens(text):
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class OpenAIStub:
+    """
+    Scripted OpenAI stand-in behind an HTTP server.
+
+    Args:
+        rules: [{"kind": one of KINDS (optional), "match": regex on the prompt
+                (optional), "text": template, or "status": HTTP error code}]
+        latency: {kind: latency spec}; kinds not listed answer immediately
+        rate_limit_rate: Share of requests answered with 429
+        timeout_rate: Share of requests that hang for hang_seconds
+        hang_seconds: How long a "timed out" request hangs before answering 504
+        host, port: Bind address (port 0 picks a free port)
+        seed: RNG seed (latency draws, fault injection, enum choices)
+    """
+
+    def __init__(
+        self,
+        rules=None,
+        latency=None,
+        rate_limit_rate=0.0,
+        timeout_rate=0.0,
+        hang_seconds=30.0,
+        host="127.0.0.1",
+        port=0,
+        seed=42,
+    ):
+        self.rules = [
+            {**rule, "pattern": re.compile(rule["match"], re.S) if rule.get("match") else None}
+            for rule in (rules or [])
+        ]
+        self.latency = {kind: parse_latency(spec) for kind, spec in (latency or {}).items()}
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.calls = Counter()
+        self.faults = Counter()  # "429", "timeout", scripted statuses
+        self.tokens = Counter()  # input_tokens / output_tokens
+        self._ids = itertools.count(1)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pngs = {}
+        self._hanging = threading.Event()  # Set on stop() to release hung requests
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    # --- Server lifecycle ---
+
+    @property
+    def url(self):
+        """SDK base URL (OpenAI(base_url=...) / OPENAI_BASE_URL)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="openai-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._hanging.set()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self):
+        """Calls per kind, injected faults and estimated token totals."""
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "faults": dict(self.faults),
+                "input_tokens": self.tokens["input_tokens"],
+                "output_tokens": self.tokens["output_tokens"],
+            }
+
+    # --- Request handling ---
+
+    def handle(self, path, body):
+        """
+        Answer one API request.
+
+        Args:
+            path: Request path ("/v1/responses", "/v1/images/generations", ...)
+            body: Parsed JSON body (form fields for multipart images/edits)
+
+        Returns:
+            tuple: (HTTP status, headers dict, response dict)
+        """
+        if path.endswith("/responses"):
+            kind, prompt = _classify(body)
+        elif path.endswith(("/images/generations", "/images/edits")):
+            kind, prompt = "image", str(body.get("prompt", ""))
+        else:
+            return 404, {}, _error(f"Unknown endpoint {path}", "not_found")
+
+        with self._lock:
+            call = next(self._ids)
+            self.calls[kind] += 1
+            roll = self._rng.random()
+            delay = self.latency[kind](self._rng) if kind in self.latency else 0.0
+            rule = self._match(kind, prompt)
+
+        if delay:
+            time.sleep(delay)
+        if roll < self.timeout_rate:
+            self._fault("timeout")
+            self._hanging.wait(self.hang_seconds)
+            return 504, {}, _error("Stub timeout", "timeout")
+        if roll < self.timeout_rate + self.rate_limit_rate:
+            self._fault("429")
+            return 429, {"Retry-After": "1"}, _error("Rate limit reached (stub)", "rate_limit")
+        if rule and rule.get("status"):
+            self._fault(str(rule["status"]))
+            return rule["status"], {}, _error(f"Scripted {rule['status']}", "scripted")
+
+        fields = {
+            "mentions": " ".join(dict.fromkeys(_MENTION.findall(prompt))),
+            "model": body.get("model", ""),
+            "call": call,
+            "kind": kind,
+            "prompt": prompt[:200],
+        }
+        template = rule["text"] if rule and "text" in rule else DEFAULT_TEMPLATE
+        if kind == "image":
+            response = self._image_response(body, prompt)
+        else:
+            response = self._responses_response(body, kind, prompt, template.format(**fields))
+        with self._lock:
+            self.tokens["input_tokens"] += response["usage"]["input_tokens"]
+            self.tokens["output_tokens"] += response["usage"]["output_tokens"]
+        return 200, {}, response
+
+    def _match(self, kind, prompt):
+        for rule in self.rules:
+            if rule.get("kind") not in (None, kind):
+                continue
+            if rule["pattern"] is None or rule["pattern"].search(prompt):
+                return rule
+        return None
+
+    def _fault(self, name):
+        with self._lock:
+            self.faults[name] += 1
+
+    def _responses_response(self, body, kind, prompt, text):
+        output = []
+        if kind == "web_search":
+            output.append(
+                {"type": "web_search_call", "id": f"ws_{next(self._ids)}", "status": "completed"}
+            )
+        if kind == "structured":
+            schema = body["text"]["format"]["schema"]
+            with self._lock:
+                text = json.dumps(_from_schema(schema, text, self._rng))
+        output.append(
+            {
+                "type": "message",
+                "id": f"msg_{next(self._ids)}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        )
+        input_tokens = _tokens(prompt) + IMAGE_INPUT_TOKENS * _count_images(body)
+        output_tokens = _tokens(text)
+        return {
+            "id": f"resp_{next(self._ids)}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "status": "completed",
+            "model": body.get("model", ""),
+            "output": output,
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": body.get("tools", []),
+            "usage": {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": output_tokens,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": input_tokens + output_tokens,
+            },
+        }
+
+    def _image_response(self, body, prompt):
+        size = str(body.get("size") or "auto")
+        width, height = (int(v) for v in size.split("x")) if "x" in size else (1024, 1024)
+        with self._lock:
+            png = self._pngs.get((width, height))
+            if png is None:
+                png = self._pngs[(width, height)] = base64.b64encode(_png(width, height)).decode()
+        quality = str(body.get("quality") or "auto")
+        output_tokens = int(
+            IMAGE_OUTPUT_TOKENS.get(quality, IMAGE_OUTPUT_TOKENS["auto"])
+            * width
+            * height
+            / (1024 * 1024)
+        )
+        text_tokens = _tokens(prompt)
+        image_tokens = IMAGE_INPUT_TOKENS if body.get("_has_image") else 0
+        return {
+            "created": int(time.time()),
+            "data": [{"b64_json": png}],
+            "usage": {
+                "input_tokens": text_tokens + image_tokens,
+                "input_tokens_details": {"text_tokens": text_tokens, "image_tokens": image_tokens},
+                "output_tokens": output_tokens,
+                "total_tokens": text_tokens + image_tokens + output_tokens,
+            },
+        }
+
+
+def _error(message, code):
+    return {"error": {"message": message, "type": code, "param": None, "code": code}}
+
+
+def _content_parts(body):
+    """Every content part of a Responses API input (string input counts as text)."""
+    items = body.get("input")
+    if isinstance(items, str):
+        return [{"type": "input_text", "text": items}]
+    parts = []
+    for item in items or []:
+        content = item.get("content") if isinstance(item, dict) else None
+        if isinstance(content, str):
+            parts.append({"type": "input_text", "text": content})
+        elif isinstance(content, list):
+            parts.extend(p for p in content if isinstance(p, dict))
+    return parts
+
+
+def _count_images(body):
+    return sum(1 for part in _content_parts(body) if part.get("type") == "input_image")
+
+
+def _classify(body):
+    """(kind, prompt text) for a Responses API request."""
+    prompt = "\n".join(
+        [body.get("instructions") or ""]
+        + [p.get("text", "") for p in _content_parts(body) if p.get("type") == "input_text"]
+    )
+    if any(tool.get("type", "").startswith("web_search") for tool in body.get("tools") or []):
+        return "web_search", prompt
+    if _count_images(body):
+        # Batched vision requests are structured too; report them as vision
+        return "vision", prompt
+    if (body.get("text") or {}).get("format", {}).get("type") == "json_schema":
+        return "structured", prompt
+    return "text", prompt
+
+
+def _from_schema(schema, text, rng):
+    """A document matching a strict JSON schema; enum-ID arrays get one item per ID."""
+    kind = schema.get("type")
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    if kind == "object":
+        return {key: _from_schema(sub, text, rng) for key, sub in schema["properties"].items()}
+    if kind == "array":
+        items = schema.get("items", {})
+        ids = items.get("properties", {}).get("id", {}).get("enum")
+        if ids:  # Batch result: one entry per requested item
+            return [{**_from_schema(items, text, rng), "id": item_id} for item_id in ids]
+        return [_from_schema(items, text, rng)]
+    if kind in ("integer", "number"):
+        return 1
+    if kind == "boolean":
+        return True
+    return text
+
+
+def _parse_multipart(content_type, body):
+    """Form fields and uploaded file sizes from a multipart/form-data body."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+    )
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        payload = part.get_payload(decode=True) or b""
+        if part.get_filename():
+            fields["_has_image"] = True
+        elif name:
+            fields[name] = payload.decode("utf-8", "replace")
+    return fields
+
+
+def _make_handler(stub):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            content_type = self.headers.get("Content-Type", "")
+            try:
+                if content_type.startswith("multipart/form-data"):
+                    body = _parse_multipart(content_type, raw)
+                else:
+                    body = json.loads(raw or b"{}")
+            except ValueError as e:
+                self._send(400, {}, _error(f"Invalid body: {e}", "invalid_request_error"))
+                return
+            status, headers, response = stub.handle(self.path.split("?")[0], body)
+            self._send(status, headers, response)
+
+        def _send(self, status, headers, response):
+            payload = json.dumps(response).encode("utf-8")
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+            except OSError:
+                pass  # The client gave up (timeout injection)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _parse_latency_arg(text):
+    kind, _, spec = text.partition("=")
+    if kind not in KINDS or not spec:
+        raise argparse.ArgumentTypeError(f"expected KIND=SPEC with KIND in {KINDS}")
+    parse_latency(spec)
+    return kind, spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument(
+        "--latency",
+        type=_parse_latency_arg,
+        action="append",
+        default=[],
+        help="KIND=SPEC, e.g. text=lognormal:900,0.4 or image=normal:12000,3000",
+    )
+    parser.add_argument("--script", help="JSON file with a list of reply rules")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share answered 429")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Share that hang")
+    parser.add_argument("--hang-seconds", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    rules = None
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as f:
+            rules = json.load(f)
+
+    stub = OpenAIStub(
+        rules=rules,
+        latency=dict(args.latency),
+        rate_limit_rate=args.rate_limit_rate,
+        timeout_rate=args.timeout_rate,
+        hang_seconds=args.hang_seconds,
+        host=args.host,
+        port=args.port,
+        seed=args.seed,
+    ).start()
+    print(f"OpenAI stub on {stub.url}")
+    print(f"Run the bot with OPENAI_BASE_URL={stub.url}; Ctrl-C prints call counts")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+        print(json.dumps(stub.stats(), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
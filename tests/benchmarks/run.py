@@ -0,0 +1,272 @@
+"""
+Benchmark runner for storage and detection hot paths.
+
+For each size it generates a synthetic workspace (tests/benchmarks/datagen.py),
+switches into it and times the hot paths against a stub Slack client:
+load_birthdays, _find_birthdays_today, _get_upcoming_birthdays,
+_get_birthday_statistics, get_special_days_for_date, get_upcoming_special_days
+and _build_dashboard_markdown. Calendarific and ICS sources are disabled (they
+need the network); UN/UNESCO/WHO run from full synthetic caches.
+
+Results are written as JSON (default bench_results/<commit>.json) and can be
+compared with an earlier run:
+
+    python -m tests.benchmarks.run --sizes 1000,10000,100000
+    python -m tests.benchmarks.run --compare bench_results/abc1234.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from tests.benchmarks.datagen import generate_workspace
+from tests.benchmarks.stub_slack import StubSlackApp
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+BENCH_CHANNEL = "CBENCH00001"
+# Fixed "today" so every run checks the same cohort
+REFERENCE_MOMENT = datetime(2025, 3, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _reset_caches():
+    """Drop process-level memoization so each size starts cold."""
+    from config import username_cache
+    from slack.client import invalidate_channel_members
+    from storage.birthdays import _invalidate_birthdays_cache
+    from storage.special_days import _invalidate_special_days_cache
+
+    _invalidate_birthdays_cache()
+    _invalidate_special_days_cache()
+    invalidate_channel_members()
+    username_cache.clear()
+
+
+def _benchmarks():
+    """(name, fn(ctx) -> item count) in run order."""
+    from handlers.app_home_handler import _get_birthday_statistics, _get_upcoming_birthdays
+    from services.birthday import _find_birthdays_today
+    from slack.canvas import _build_dashboard_markdown
+    from storage.birthdays import _invalidate_birthdays_cache, load_birthdays
+    from storage.special_days import get_special_days_for_date, get_upcoming_special_days
+
+    def bench_load_birthdays(ctx):
+        _invalidate_birthdays_cache()  # Measure the parse, not the mtime memo
+        return len(load_birthdays())
+
+    def bench_find_birthdays_today(ctx):
+        return len(
+            _find_birthdays_today(
+                ctx["app"], ctx["birthdays"], ctx["members"], REFERENCE_MOMENT, profile_cache={}
+            )
+        )
+
+    def bench_upcoming_birthdays(ctx):
+        return len(
+            _get_upcoming_birthdays(
+                ctx["birthdays"],
+                ctx["app"],
+                channel_member_set=ctx["members"],
+                reference_date=REFERENCE_MOMENT.replace(tzinfo=None),
+            )
+        )
+
+    def bench_birthday_statistics(ctx):
+        stats = _get_birthday_statistics(
+            ctx["birthdays"], ctx["members"], reference_date=REFERENCE_MOMENT.replace(tzinfo=None)
+        )
+        return len(stats) if stats else 0
+
+    def bench_special_days_for_date(ctx):
+        return len(get_special_days_for_date(REFERENCE_MOMENT))
+
+    def bench_upcoming_special_days(ctx):
+        return sum(len(days) for days in get_upcoming_special_days(30, REFERENCE_MOMENT).values())
+
+    def bench_dashboard_markdown(ctx):
+        return len(_build_dashboard_markdown(ctx["app"]))
+
+    return [
+        ("load_birthdays", bench_load_birthdays),
+        ("_find_birthdays_today", bench_find_birthdays_today),
+        ("_get_upcoming_birthdays", bench_upcoming_birthdays),
+        ("_get_birthday_statistics", bench_birthday_statistics),
+        ("get_special_days_for_date", bench_special_days_for_date),
+        ("get_upcoming_special_days", bench_upcoming_special_days),
+        ("_build_dashboard_markdown", bench_dashboard_markdown),
+    ]
+
+
+@contextmanager
+def _workspace(root):
+    """Run with root as cwd (DATA_DIR is relative) and network sources switched off."""
+    # Patch (and so import) before switching directory: sys.path may hold "" for cwd
+    with (
+        patch("config.BIRTHDAY_CHANNEL", BENCH_CHANNEL),
+        patch("storage.special_days.CALENDARIFIC_ENABLED", False),
+        patch("storage.special_days.ICS_SUBSCRIPTIONS_ENABLED", False),
+        patch("storage.special_days.UN_OBSERVANCES_ENABLED", True),
+        patch("storage.special_days.UNESCO_OBSERVANCES_ENABLED", True),
+        patch("storage.special_days.WHO_OBSERVANCES_ENABLED", True),
+    ):
+        previous = os.getcwd()
+        os.chdir(root)
+        try:
+            yield
+        finally:
+            os.chdir(previous)
+
+
+def _time(fn, ctx, repeat):
+    client = ctx["app"].client
+    client.calls.clear()
+    started = time.perf_counter()
+    items = fn(ctx)
+    cold = time.perf_counter() - started
+    slack_calls = dict(client.calls)
+
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(ctx)
+        warm.append(time.perf_counter() - started)
+
+    ms = lambda seconds: round(seconds * 1000, 3)  # noqa: E731
+    return {
+        "items": items,
+        "cold_ms": ms(cold),
+        "min_ms": ms(min(warm)) if warm else None,
+        "median_ms": ms(statistics.median(warm)) if warm else None,
+        "mean_ms": ms(statistics.fmean(warm)) if warm else None,
+        "slack_calls": slack_calls,
+    }
+
+
+def run_size(users, repeat=5, seed=42, only=None):
+    """
+    Benchmark every hot path against a generated workspace of `users` users.
+
+    Returns:
+        dict: {benchmark name: timing dict}
+    """
+    from storage.birthdays import load_birthdays
+
+    benchmarks = _benchmarks()
+    with tempfile.TemporaryDirectory(prefix=f"bench-{users}-") as root:
+        generated = generate_workspace(root, users, seed=seed)
+        with _workspace(root):
+            _reset_caches()
+            ctx = {
+                "app": StubSlackApp(generated["members"]),
+                "birthdays": load_birthdays(),
+                "members": set(generated["members"]),
+            }
+            results = {}
+            for name, fn in benchmarks:
+                if only and name not in only:
+                    continue
+                results[name] = _time(fn, ctx, repeat)
+            _reset_caches()
+    return results
+
+
+def run_suite(sizes=None, repeat=5, seed=42, only=None):
+    """Run every size; returns the JSON-ready results document."""
+    sizes = sizes or DEFAULT_SIZES
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": {
+            str(users): run_size(users, repeat=repeat, seed=seed, only=only) for users in sizes
+        },
+    }
+
+
+def compare(current, baseline, threshold=0.2):
+    """
+    Median-time ratios of current vs. baseline results.
+
+    Returns:
+        list: (size, benchmark, baseline_ms, current_ms, ratio, regressed) rows
+    """
+    rows = []
+    for size, benches in current["results"].items():
+        for name, result in benches.items():
+            old = baseline.get("results", {}).get(size, {}).get(name)
+            if not old or not old.get("median_ms") or result.get("median_ms") is None:
+                continue
+            ratio = result["median_ms"] / old["median_ms"]
+            rows.append(
+                (size, name, old["median_ms"], result["median_ms"], ratio, ratio > 1 + threshold)
+            )
+    return rows
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--repeat", type=int, default=5, help="Warm runs per benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="Comma-separated benchmark names")
+    parser.add_argument("--output", help="JSON path (default bench_results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare medians against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Slowdown ratio counted as a regression"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    only = set(args.only.split(",")) if args.only else None
+    document = run_suite(sizes, repeat=args.repeat, seed=args.seed, only=only)
+
+    output = args.output or os.path.join("bench_results", f"{document['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+    for size, benches in document["results"].items():
+        print(f"\n{size} users")
+        for name, r in benches.items():
+            print(
+                f"  {name:<28} cold {r['cold_ms']:>10.2f} ms  median {r['median_ms'] or 0:>10.2f} ms"
+                f"  items {r['items']:>6}  slack {sum(r['slack_calls'].values())}"
+            )
+    print(f"\nResults written to {output}")
+
+    if not args.compare:
+        return 0
+    with open(args.compare, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(document, baseline, args.threshold)
+    print(f"\nCompared with {baseline.get('meta', {}).get('commit', args.compare)}:")
+    for size, name, old, new, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"  {size:>7} {name:<28} {old:>10.2f} -> {new:>10.2f} ms  x{ratio:.2f}{flag}")
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,585 @@
+"""
+Local Slack Web API emulator for load tests and offline end-to-end runs.
+
+Serves the Web API methods the bot uses over real HTTP, so the unmodified
+slack_sdk WebClient (and its upload, pagination and error handling) talks to it:
+chat.postMessage, users.info, users.profile.get, users.list,
+conversations.members, files.getUploadURLExternal, the upload URL itself,
+files.completeUploadExternal, files.info, reactions.add, views.publish and
+canvases.* plus the lookups around them (auth.test, conversations.info, ...).
+Users come from the same synthetic IDs as the benchmark data (datagen.user_id),
+and posted messages, files, reactions, views and canvases are kept in memory.
+
+Each method is rate limited like Slack's tiers (token buckets per method, and
+per channel for chat.postMessage) and answers 429 with Retry-After when a bucket
+is empty; every response can be delayed by a fixed latency plus jitter.
+
+Run it and point the bot at it with SLACK_API_URL:
+
+    python -m tests.benchmarks.slack_emulator --port 8765 --users 5000 --latency-ms 80
+    SLACK_API_URL=http://127.0.0.1:8765/api/ python app.py
+
+Socket Mode is not emulated, so the bot runs its scheduled jobs only; events
+are exercised in-process by the replay harness.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from tests.benchmarks.datagen import user_id
+from tests.benchmarks.stub_slack import synthetic_user
+
+# Requests per minute for each Web API rate limit tier
+TIER_LIMITS_PER_MINUTE = {1: 1, 2: 20, 3: 50, 4: 100}
+# chat.postMessage is "special": about one message per second per channel,
+# with short bursts allowed
+CHAT_POST_PER_SECOND = 1
+CHAT_POST_BURST = 5
+
+METHOD_TIERS = {
+    "auth.test": 4,
+    "chat.delete": 3,
+    "chat.postEphemeral": 4,
+    "chat.postMessage": None,  # Special, see CHAT_POST_PER_SECOND
+    "conversations.canvases.create": 2,
+    "conversations.history": 3,
+    "conversations.info": 3,
+    "conversations.members": 4,
+    "conversations.open": 3,
+    "conversations.replies": 3,
+    "canvases.create": 2,
+    "canvases.delete": 3,
+    "canvases.edit": 3,
+    "canvases.sections.lookup": 3,
+    "emoji.list": 2,
+    "files.completeUploadExternal": 4,
+    "files.getUploadURLExternal": 4,
+    "files.info": 4,
+    "reactions.add": 3,
+    "users.info": 4,
+    "users.list": 2,
+    "users.profile.get": 4,
+    "views.publish": 4,
+}
+
+BOT_USER_ID = "UBOTEMULATOR"
+TEAM_ID = "TEMULATOR"
+
+
+class _Bucket:
+    """Token bucket: `capacity` requests at once, refilled at `rate` per second."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Consume a token; returns 0 or the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class _ApiError(Exception):
+    """A Web API error response ({"ok": false, "error": code})."""
+
+
+class SlackEmulator:
+    """
+    In-memory Slack workspace behind an HTTP server.
+
+    Args:
+        users: Synthetic users in the workspace (all of them channel members)
+        members: Explicit channel member IDs instead of the first `users` IDs
+        latency_ms: Delay added to every response
+        jitter_ms: Extra uniform random delay (0..jitter_ms) per response
+        rate_limit_scale: Multiplier on the tier limits; 0 disables rate limiting
+        host, port: Bind address (port 0 picks a free port)
+        seed: RNG seed for the jitter
+    """
+
+    def __init__(
+        self,
+        users=1000,
+        members=None,
+        latency_ms=0,
+        jitter_ms=0,
+        rate_limit_scale=1.0,
+        host="127.0.0.1",
+        port=0,
+        seed=42,
+    ):
+        self.members = list(members) if members is not None else [user_id(i) for i in range(users)]
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_scale = rate_limit_scale
+        self.calls = Counter()
+        self.rate_limited = Counter()
+        self.messages = {}  # channel -> [message]
+        self.files = {}  # file id -> file object
+        self.reactions = set()  # (channel, ts, name)
+        self.views = {}  # user id -> published home view
+        self.canvases = {}  # canvas id -> {"title", "changes"}
+        self._uploads = {}  # file id -> {"filename", "length", "data"}
+        self._buckets = {}
+        self._ids = itertools.count(1)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+        self._methods = {
+            "auth.test": self._auth_test,
+            "chat.delete": self._chat_delete,
+            "chat.postEphemeral": self._chat_post_ephemeral,
+            "chat.postMessage": self._chat_post_message,
+            "conversations.canvases.create": self._canvases_create,
+            "conversations.history": self._conversations_history,
+            "conversations.info": self._conversations_info,
+            "conversations.members": self._conversations_members,
+            "conversations.open": self._conversations_open,
+            "conversations.replies": self._conversations_replies,
+            "canvases.create": self._canvases_create,
+            "canvases.delete": self._canvases_delete,
+            "canvases.edit": self._canvases_edit,
+            "canvases.sections.lookup": self._canvases_sections_lookup,
+            "emoji.list": lambda args: {"emoji": {}},
+            "files.completeUploadExternal": self._files_complete_upload,
+            "files.getUploadURLExternal": self._files_get_upload_url,
+            "files.info": self._files_info,
+            "reactions.add": self._reactions_add,
+            "users.info": self._users_info,
+            "users.list": self._users_list,
+            "users.profile.get": self._users_profile_get,
+            "views.publish": self._views_publish,
+        }
+
+    # --- Server lifecycle ---
+
+    @property
+    def root_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url(self):
+        """Web API base URL (WebClient base_url / SLACK_API_URL)."""
+        return f"{self.root_url}/api/"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="slack-emulator", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stats(self):
+        """Calls and 429s per method, plus what the workspace now holds."""
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "rate_limited": dict(self.rate_limited),
+                "messages": sum(len(m) for m in self.messages.values()),
+                "files": len(self.files),
+                "reactions": len(self.reactions),
+                "views": len(self.views),
+                "canvases": len(self.canvases),
+            }
+
+    # --- Request handling ---
+
+    def _delay(self):
+        seconds = (self.latency_ms + self._rng.uniform(0, self.jitter_ms)) / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _retry_after(self, method, args):
+        """Seconds to wait if this call is over its tier limit, else 0."""
+        if not self.rate_limit_scale or method not in METHOD_TIERS:
+            return 0
+        tier = METHOD_TIERS[method]
+        if tier is None:
+            key = (method, args.get("channel"))
+            rate = CHAT_POST_PER_SECOND * self.rate_limit_scale
+            capacity = CHAT_POST_BURST * self.rate_limit_scale
+        else:
+            key = method
+            per_minute = TIER_LIMITS_PER_MINUTE[tier] * self.rate_limit_scale
+            rate, capacity = per_minute / 60, per_minute
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(rate, max(capacity, 1))
+            return bucket.take()
+
+    def handle(self, method, args, token):
+        """
+        Answer one Web API call.
+
+        Returns:
+            tuple: (HTTP status, headers dict, response dict)
+        """
+        self._delay()
+        with self._lock:
+            self.calls[method] += 1
+        if not token:
+            return 200, {}, {"ok": False, "error": "not_authed"}
+
+        retry_after = self._retry_after(method, args)
+        if retry_after:
+            with self._lock:
+                self.rate_limited[method] += 1
+            # Slack sends whole seconds; round up so clients never retry early
+            return (
+                429,
+                {"Retry-After": str(int(retry_after) + 1)},
+                {"ok": False, "error": "ratelimited"},
+            )
+
+        handler = self._methods.get(method)
+        if handler is None:
+            return 200, {}, {"ok": False, "error": "unknown_method"}
+        try:
+            with self._lock:
+                return 200, {}, {"ok": True, **handler(args)}
+        except _ApiError as e:
+            return 200, {}, {"ok": False, "error": str(e)}
+
+    def upload(self, file_id, data):
+        """Receive the bytes POSTed to an upload URL."""
+        self._delay()
+        with self._lock:
+            upload = self._uploads.get(file_id)
+            if upload is None:
+                return 404, "Not Found"
+            upload["data"] = data
+        return 200, f"OK - {len(data)}"
+
+    # --- Helpers (called with _lock held) ---
+
+    def _new_id(self, prefix):
+        return f"{prefix}{next(self._ids):09d}"
+
+    def _new_ts(self):
+        return f"{int(time.time())}.{next(self._ids):06d}"
+
+    def _require(self, args, *names):
+        for name in names:
+            if not args.get(name):
+                raise _ApiError(f"invalid_arguments: missing {name}")
+
+    def _user(self, user):
+        if user == BOT_USER_ID:
+            return {"id": user, "is_bot": True, "deleted": False, "profile": {"real_name": "Bot"}}
+        if not user or not user.startswith("U"):
+            raise _ApiError("user_not_found")
+        return synthetic_user(user)
+
+    def _post(self, channel, args, user=BOT_USER_ID, files=None):
+        message = {
+            "type": "message",
+            "ts": self._new_ts(),
+            "user": user,
+            "text": args.get("text", ""),
+        }
+        for key in ("blocks", "thread_ts"):
+            if args.get(key):
+                message[key] = args[key]
+        if files:
+            message["files"] = files
+        self.messages.setdefault(channel, []).append(message)
+        return message
+
+    def _page(self, items, args, default_limit):
+        start = int(args.get("cursor") or 0)
+        end = start + min(int(args.get("limit") or default_limit), 1000)
+        next_cursor = str(end) if end < len(items) else ""
+        return items[start:end], {"next_cursor": next_cursor}
+
+    # --- Methods ---
+
+    def _auth_test(self, args):
+        return {
+            "url": f"{self.root_url}/",
+            "team": "Emulated Workspace",
+            "team_id": TEAM_ID,
+            "user": "brightdaybot",
+            "user_id": BOT_USER_ID,
+            "bot_id": "BEMULATOR",
+        }
+
+    def _chat_post_message(self, args):
+        self._require(args, "channel")
+        if not args.get("text") and not args.get("blocks"):
+            raise _ApiError("no_text")
+        message = self._post(args["channel"], args)
+        return {"channel": args["channel"], "ts": message["ts"], "message": message}
+
+    def _chat_post_ephemeral(self, args):
+        self._require(args, "channel", "user")
+        return {"message_ts": self._new_ts()}
+
+    def _chat_delete(self, args):
+        self._require(args, "channel", "ts")
+        messages = self.messages.get(args["channel"], [])
+        kept = [m for m in messages if m["ts"] != args["ts"]]
+        if len(kept) == len(messages):
+            raise _ApiError("message_not_found")
+        self.messages[args["channel"]] = kept
+        return {"channel": args["channel"], "ts": args["ts"]}
+
+    def _conversations_info(self, args):
+        self._require(args, "channel")
+        return {
+            "channel": {
+                "id": args["channel"],
+                "name": "birthdays",
+                "is_member": True,
+                "num_members": len(self.members),
+                "topic": {"value": ""},
+                "purpose": {"value": ""},
+            }
+        }
+
+    def _conversations_members(self, args):
+        self._require(args, "channel")
+        members, metadata = self._page(self.members, args, 100)
+        return {"members": members, "response_metadata": metadata}
+
+    def _conversations_open(self, args):
+        self._require(args, "users")
+        return {"channel": {"id": "D" + args["users"].split(",")[0][1:]}}
+
+    def _conversations_history(self, args):
+        self._require(args, "channel")
+        messages = [m for m in self.messages.get(args["channel"], []) if "thread_ts" not in m]
+        return {"messages": messages[::-1], "has_more": False}
+
+    def _conversations_replies(self, args):
+        self._require(args, "channel", "ts")
+        messages = [
+            m
+            for m in self.messages.get(args["channel"], [])
+            if args["ts"] in (m["ts"], m.get("thread_ts"))
+        ]
+        return {"messages": messages, "has_more": False}
+
+    def _users_info(self, args):
+        return {"user": self._user(args.get("user"))}
+
+    def _users_profile_get(self, args):
+        profile = self._user(args.get("user"))["profile"]
+        return {"profile": {**profile, "title": "Engineer"}}
+
+    def _users_list(self, args):
+        members, metadata = self._page(self.members, args, 200)
+        return {"members": [synthetic_user(m) for m in members], "response_metadata": metadata}
+
+    def _files_get_upload_url(self, args):
+        self._require(args, "filename", "length")
+        file_id = self._new_id("F")
+        self._uploads[file_id] = {
+            "filename": args["filename"],
+            "length": int(args["length"]),
+            "data": None,
+        }
+        return {"file_id": file_id, "upload_url": f"{self.root_url}/upload/{file_id}"}
+
+    def _files_complete_upload(self, args):
+        self._require(args, "files")
+        completed = []
+        for entry in args["files"]:
+            upload = self._uploads.get(entry.get("id"))
+            if upload is None or upload["data"] is None:
+                raise _ApiError("file_not_found")
+            file = {
+                "id": entry["id"],
+                "name": upload["filename"],
+                "title": entry.get("title") or upload["filename"],
+                "size": len(upload["data"]),
+                "user": BOT_USER_ID,
+                "url_private": f"{self.root_url}/files/{entry['id']}",
+                "permalink": f"{self.root_url}/files/{entry['id']}",
+                "shares": {},
+            }
+            self.files[file["id"]] = file
+            completed.append(file)
+        channel = args.get("channel_id")
+        if channel:
+            for file in completed:
+                file["shares"] = {"public": {channel: [{"ts": self._new_ts()}]}}
+            self._post(channel, {**args, "text": args.get("initial_comment", "")}, files=completed)
+        return {"files": completed}
+
+    def _files_info(self, args):
+        file = self.files.get(args.get("file"))
+        if file is None:
+            raise _ApiError("file_not_found")
+        return {"file": file}
+
+    def _reactions_add(self, args):
+        self._require(args, "channel", "timestamp", "name")
+        key = (args["channel"], args["timestamp"], args["name"])
+        if key in self.reactions:
+            raise _ApiError("already_reacted")
+        self.reactions.add(key)
+        return {}
+
+    def _views_publish(self, args):
+        self._require(args, "user_id", "view")
+        view = {**args["view"], "id": self._new_id("V"), "team_id": TEAM_ID}
+        self.views[args["user_id"]] = view
+        return {"view": view}
+
+    def _canvases_create(self, args):
+        canvas_id = self._new_id("F")
+        self.canvases[canvas_id] = {
+            "title": args.get("title", ""),
+            "channel": args.get("channel_id"),
+            "changes": [args["document_content"]] if args.get("document_content") else [],
+        }
+        return {"canvas_id": canvas_id}
+
+    def _canvases_edit(self, args):
+        self._require(args, "canvas_id", "changes")
+        canvas = self.canvases.get(args["canvas_id"])
+        if canvas is None:
+            raise _ApiError("canvas_not_found")
+        canvas["changes"].extend(args["changes"])
+        return {}
+
+    def _canvases_delete(self, args):
+        if self.canvases.pop(args.get("canvas_id"), None) is None:
+            raise _ApiError("canvas_not_found")
+        return {}
+
+    def _canvases_sections_lookup(self, args):
+        if args.get("canvas_id") not in self.canvases:
+            raise _ApiError("canvas_not_found")
+        return {"sections": []}
+
+
+def _parse_args(handler, query):
+    """Web API arguments from the query string and a form or JSON body."""
+    args = dict(parse_qsl(query))
+    length = int(handler.headers.get("Content-Length") or 0)
+    body = handler.rfile.read(length) if length else b""
+    if body:
+        if handler.headers.get("Content-Type", "").startswith("application/json"):
+            args.update(json.loads(body))
+        else:
+            args.update(parse_qsl(body.decode("utf-8")))
+    # Form-encoded calls send lists and objects (blocks, files, view) as JSON strings
+    for key, value in args.items():
+        if isinstance(value, str) and value[:1] in ("[", "{"):
+            try:
+                args[key] = json.loads(value)
+            except ValueError:
+                pass
+    return args
+
+
+def _make_handler(emulator):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, body, headers=None, content_type="application/json"):
+            payload = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _dispatch(self):
+            url = urlsplit(self.path)
+            if url.path.startswith("/upload/"):
+                length = int(self.headers.get("Content-Length") or 0)
+                status, text = emulator.upload(url.path[len("/upload/") :], self.rfile.read(length))
+                self._send(status, text, content_type="text/plain")
+                return
+            if not url.path.startswith("/api/"):
+                self._send(404, "Not Found", content_type="text/plain")
+                return
+
+            args = _parse_args(self, url.query)
+            auth = self.headers.get("Authorization", "")
+            token = auth.removeprefix("Bearer ").strip() or args.pop("token", None)
+            status, headers, response = emulator.handle(url.path[len("/api/") :], args, token)
+            self._send(status, json.dumps(response), headers)
+
+        do_GET = do_POST = _dispatch
+
+        def log_message(self, format, *args):
+            pass  # One line per request would drown a load test
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local Slack Web API emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--users", type=int, default=1000, help="Synthetic channel members")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument(
+        "--rate-limit-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier on Slack's tier limits; 0 disables rate limiting",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    emulator = SlackEmulator(
+        users=args.users,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_scale=args.rate_limit_scale,
+        host=args.host,
+        port=args.port,
+        seed=args.seed,
+    ).start()
+    print(f"Slack Web API emulator on {emulator.url} ({len(emulator.members)} users)")
+    print(f"Run the bot with SLACK_API_URL={emulator.url}; Ctrl-C prints call counts")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+        print(json.dumps(emulator.stats(), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+In-process stand-in for the Slack Web API used by the benchmarks.
+
+Answers the read calls the hot paths make (users.info, users.profile.get,
+conversations.members with cursor pagination) from generated data without
+network I/O, and counts calls per method so results show API fan-out.
+"""
+
+from collections import Counter
+
+from tests.benchmarks.datagen import TIMEZONES
+
+
+def synthetic_user(user):
+    """users.info payload derived from the user ID (also used by slack_emulator)."""
+    n = int(user[1:]) if user[1:].isdigit() else 0
+    return {
+        "id": user,
+        "tz": TIMEZONES[n % len(TIMEZONES)],
+        "is_admin": False,
+        "is_bot": False,
+        "deleted": n % 97 == 0,  # ~1% deactivated accounts
+        "profile": {"display_name": f"user{n}", "real_name": f"User {n}"},
+    }
+
+
+class StubSlackClient:
+    def __init__(self, members, page_size_cap=1000):
+        self.members = members
+        self.page_size_cap = page_size_cap
+        self.calls = Counter()
+
+    def users_info(self, user, **kwargs):
+        self.calls["users.info"] += 1
+        return {"ok": True, "user": synthetic_user(user)}
+
+    def users_profile_get(self, user, **kwargs):
+        self.calls["users.profile.get"] += 1
+        return {"ok": True, "profile": {**synthetic_user(user)["profile"], "title": "Engineer"}}
+
+    def conversations_members(self, channel, cursor=None, limit=200, **kwargs):
+        self.calls["conversations.members"] += 1
+        start = int(cursor) if cursor else 0
+        end = start + min(limit, self.page_size_cap)
+        next_cursor = str(end) if end < len(self.members) else ""
+        return {
+            "ok": True,
+            "members": self.members[start:end],
+            "response_metadata": {"next_cursor": next_cursor},
+        }
+
+    def __getattr__(self, method):
+        # Any other Web API method succeeds with an empty payload
+        def call(*args, **kwargs):
+            self.calls[method] += 1
+            return {"ok": True}
+
+        return call
+
+
+class StubSlackApp:
+    """Just enough of a Bolt App for code that reads app.client."""
+
+    def __init__(self, members):
+        self.client = StubSlackClient(members)
@@ -8,6 +8,14 @@ from unittest.mock import MagicMock
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _isolated_trace_file(tmp_path, monkeypatch):
+    """Keep celebration traces out of data/logs/traces.jsonl (TRACING_ENABLED defaults on)."""
+    from utils import tracing
+
+    monkeypatch.setattr(tracing, "TRACE_FILE", str(tmp_path / "traces.jsonl"))
+
+
 @pytest.fixture
 def reference_date():
     """Fixed reference date for deterministic testing: March 15, 2025"""
@@ -0,0 +1,256 @@
+"""Tests for the async runtime: async listeners and the hybrid Socket Mode handler."""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from slack_sdk.socket_mode.request import SocketModeRequest  # noqa: E402
+
+from tests.benchmarks.slack_emulator import BOT_USER_ID, TEAM_ID, SlackEmulator  # noqa: E402
+
+CHANNEL = "CASYNC"
+USER = "U0000001"
+
+
+def _event(event):
+    return SocketModeRequest(
+        type="events_api",
+        envelope_id=f"env-{event['type']}",
+        payload={
+            "type": "event_callback",
+            "team_id": TEAM_ID,
+            "api_app_id": "AASYNC",
+            "event_id": f"Ev-{event['type']}",
+            "event_time": int(time.time()),
+            "event": event,
+        },
+    )
+
+
+def _requests():
+    return {
+        "mention": _event(
+            {
+                "type": "app_mention",
+                "user": USER,
+                "channel": CHANNEL,
+                "text": f"<@{BOT_USER_ID}> what's special today?",
+                "ts": "1700000000.000100",
+            }
+        ),
+        "thread_reply": _event(
+            {
+                "type": "message",
+                "user": USER,
+                "channel": CHANNEL,
+                "channel_type": "channel",
+                "text": "Why is this day celebrated?",
+                "ts": "1700000000.000300",
+                "thread_ts": "1700000000.000200",
+            }
+        ),
+        "details_button": SocketModeRequest(
+            type="interactive",
+            envelope_id="env-details",
+            payload={
+                "type": "block_actions",
+                "team": {"id": TEAM_ID},
+                "user": {"id": USER, "team_id": TEAM_ID},
+                "api_app_id": "AASYNC",
+                "trigger_id": "trigger-1",
+                "container": {"type": "message", "channel_id": CHANNEL},
+                "channel": {"id": CHANNEL},
+                "actions": [
+                    {
+                        "action_id": "special_day_details_0",
+                        "block_id": "details",
+                        "type": "button",
+                        "value": "pi-day",
+                        "action_ts": "1700000000.000400",
+                    }
+                ],
+            },
+        ),
+        "command": SocketModeRequest(
+            type="slash_commands",
+            envelope_id="env-command",
+            payload={
+                "command": "/birthday",
+                "text": "help",
+                "user_id": USER,
+                "channel_id": CHANNEL,
+                "team_id": TEAM_ID,
+                "api_app_id": "AASYNC",
+                "trigger_id": "trigger-2",
+            },
+        ),
+    }
+
+
+@pytest.fixture
+def emulator():
+    with SlackEmulator(members=[USER], rate_limit_scale=0) as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def sync_app(emulator):
+    """Sync App that counts every request reaching it."""
+    from slack_bolt import App
+    from slack_sdk import WebClient
+
+    app = App(
+        client=WebClient(token="xoxb-test", base_url=emulator.url),
+        request_verification_enabled=False,
+        logger=logging.getLogger("brightdaybot.test_sync_bolt"),
+    )
+    app.hits = Counter()
+
+    @app.event("app_mention")
+    def mention(event):
+        app.hits["mention"] += 1
+
+    @app.event("message")
+    def message(event):
+        app.hits["thread_reply"] += 1
+
+    @app.action("special_day_details_0")
+    def details(ack):
+        app.hits["details_button"] += 1
+        ack()
+
+    @app.command("/birthday")
+    def command(ack):
+        app.hits["command"] += 1
+        ack()
+
+    return app
+
+
+def _special_day_thread():
+    thread = MagicMock()
+    thread.is_birthday_thread.return_value = False
+    thread.is_special_day_thread.return_value = True
+    thread.get_user_response_count.return_value = 0
+    thread.personality = "chronicler"
+    thread.special_day_info = {
+        "days": [{"name": "Pi Day", "description": "Celebrates the constant pi."}]
+    }
+    return thread
+
+
+async def _until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.1)  # Let any duplicate delivery show up
+
+
+class TestHybridDispatch:
+    def test_each_request_reaches_one_app_once(self, emulator, sync_app):
+        from handlers.async_runtime import create_async_app, create_socket_mode_handler
+
+        tracker = MagicMock()
+        tracker.get_thread.return_value = _special_day_thread()
+        tracker.increment_responses.return_value = 1
+        show_details = MagicMock()
+        acomplete = AsyncMock(return_value="**Pi Day** is on March 14.")
+
+        async def scenario():
+            async_app = create_async_app(sync_app)
+            handler = create_socket_mode_handler(sync_app, async_app, app_token="xapp-test")
+            client = MagicMock(send_socket_mode_response=AsyncMock(), logger=logging.getLogger())
+            try:
+                for req in _requests().values():
+                    await handler.handle(client, req)
+                await _until(
+                    lambda: sync_app.hits["command"]
+                    and show_details.called
+                    and tracker.increment_responses.called
+                    and emulator.stats()["messages"] >= 2
+                )
+            finally:
+                await handler.client.close()
+            return client
+
+        with (
+            patch("handlers.event_handler._show_special_day_details", show_details),
+            patch("storage.thread_tracking.get_thread_tracker", return_value=tracker),
+            patch("services.mention_responder._build_context", return_value={}),
+            patch("integrations.openai.acomplete", acomplete),
+        ):
+            client = asyncio.run(scenario())
+
+        # Only the unmatched command falls back to the sync App
+        assert sync_app.hits == Counter({"command": 1})
+        # Mention and thread reply: one answer each, posted through the async client
+        assert acomplete.await_count == 2
+        assert emulator.stats()["calls"]["chat.postMessage"] == 2
+        replies = emulator.messages[CHANNEL]
+        assert {m["thread_ts"] for m in replies} == {"1700000000.000100", "1700000000.000200"}
+        assert any(m["text"].startswith(f"<@{USER}> *Pi Day*") for m in replies)
+        tracker.increment_responses.assert_called_once_with(CHANNEL, "1700000000.000200", USER)
+        # Detail button: the AsyncApp's listener runs the sync details view once
+        show_details.assert_called_once()
+        assert show_details.call_args.args[0] is sync_app
+        # Every envelope is acknowledged
+        assert client.send_socket_mode_response.await_count == 4
+
+
+class TestAsyncListeners:
+    def test_ahandle_mention_replies_in_thread(self):
+        from handlers.mention_handler import ahandle_mention
+
+        say = AsyncMock()
+        event = {"user": "U0000002", "channel": CHANNEL, "text": "<@UBOT> help", "ts": "1.5"}
+        with (
+            patch("services.mention_responder._build_context", return_value={}),
+            patch("integrations.openai.acomplete", AsyncMock(return_value="I can help!")),
+        ):
+            result = asyncio.run(ahandle_mention(MagicMock(), event, say))
+
+        assert result["responded"] and result["question_type"] == "help"
+        say.assert_awaited_once_with(text="I can help!", thread_ts="1.5")
+
+    def test_agenerate_mention_response_falls_back_when_llm_fails(self):
+        from services import mention_responder
+
+        with (
+            patch.object(mention_responder, "_build_context", return_value={}),
+            patch("integrations.openai.acomplete", AsyncMock(side_effect=RuntimeError("down"))),
+            patch.object(mention_responder, "_get_fallback_response", return_value="fallback"),
+        ):
+            response = asyncio.run(
+                mention_responder.agenerate_mention_response(
+                    app=MagicMock(), question_text="hi", question_type="general", user_id="U1"
+                )
+            )
+        assert response == "fallback"
+
+    def test_special_day_reply_skips_non_questions(self):
+        from handlers.thread_handler import ahandle_special_day_thread_reply
+
+        client = MagicMock(chat_postMessage=AsyncMock())
+        acomplete = AsyncMock()
+        with patch("integrations.openai.acomplete", acomplete):
+            result = asyncio.run(
+                ahandle_special_day_thread_reply(
+                    app=None,
+                    client=client,
+                    channel=CHANNEL,
+                    thread_ts="1.0",
+                    message_ts="1.1",
+                    user_id=USER,
+                    text="ok",
+                    tracked_thread=_special_day_thread(),
+                )
+            )
+        assert not result["response_sent"]
+        acomplete.assert_not_awaited()
+        client.chat_postMessage.assert_not_awaited()
@@ -0,0 +1,200 @@
+"""Smoke tests for the synthetic-scale benchmark suite (tiny sizes only)."""
+
+import base64
+import json
+import random
+import time
+
+import pytest
+
+from tests.benchmarks import run
+from tests.benchmarks.datagen import generate_workspace
+from tests.benchmarks.slack_emulator import SlackEmulator
+
+
+def test_generated_workspace_is_seeded(tmp_path):
+    first = generate_workspace(tmp_path / "a", 50, seed=7)
+    second = generate_workspace(tmp_path / "b", 50, seed=7)
+
+    assert first["members"] == second["members"]
+    assert 0 < len(first["members"]) <= 50
+    assert (tmp_path / "a" / "data" / "storage" / "birthdays.json").read_text() != ""
+
+
+def test_run_size_times_every_hot_path():
+    only = {name for name, _ in run._benchmarks()} - {"_build_dashboard_markdown"}
+    results = run.run_size(200, repeat=1, only=only)
+
+    assert set(results) == only
+    assert results["load_birthdays"]["items"] == 200
+    assert all(r["median_ms"] is not None for r in results.values())
+
+
+def test_main_writes_comparable_json(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    argv = ["--sizes", "100", "--repeat", "1", "--only", "load_birthdays"]
+
+    assert run.main(argv + ["--output", str(output)]) == 0
+    document = json.loads(output.read_text())
+    assert document["results"]["100"]["load_birthdays"]["items"] == 100
+
+    assert run.main(argv + ["--output", str(tmp_path / "b.json"), "--compare", str(output)]) in (
+        0,
+        1,
+    )
+    assert "Compared with" in capsys.readouterr().out
+
+
+def test_slack_emulator_serves_web_client_flows():
+    from slack_sdk import WebClient
+    from slack_sdk.errors import SlackApiError
+
+    with SlackEmulator(users=250, rate_limit_scale=0) as emulator:
+        client = WebClient(token="xoxb-test", base_url=emulator.url)
+
+        assert client.auth_test()["user_id"] == "UBOTEMULATOR"
+        members, cursor = [], None
+        while True:
+            page = client.conversations_members(channel="C1", limit=100, cursor=cursor)
+            members += page["members"]
+            cursor = page["response_metadata"]["next_cursor"]
+            if not cursor:
+                break
+        assert members == emulator.members
+        assert client.users_info(user=members[3])["user"]["tz"]
+
+        posted = client.chat_postMessage(channel="C1", text="Happy birthday!", blocks=[])
+        client.reactions_add(channel="C1", timestamp=posted["ts"], name="tada")
+        with pytest.raises(SlackApiError, match="already_reacted"):
+            client.reactions_add(channel="C1", timestamp=posted["ts"], name="tada")
+
+        upload = client.files_upload_v2(channel="C1", content=b"png-bytes", filename="card.png")
+        assert upload["file"]["size"] == len(b"png-bytes")
+        client.views_publish(user_id=members[0], view={"type": "home", "blocks": []})
+        canvas = client.canvases_create(
+            title="Dashboard", document_content={"type": "markdown", "markdown": "#"}
+        )["canvas_id"]
+        client.canvases_edit(canvas_id=canvas, changes=[{"operation": "replace"}])
+
+        stats = emulator.stats()
+        assert stats["messages"] == 2  # The post and the upload's share
+        assert (stats["files"], stats["views"], stats["canvases"]) == (1, 1, 1)
+
+
+def test_slack_emulator_enforces_tier_limits_and_latency():
+    from slack_sdk import WebClient
+    from slack_sdk.errors import SlackApiError
+
+    # Tier 2 at 1/20 scale: one users.list per minute
+    with SlackEmulator(users=10, rate_limit_scale=0.05, latency_ms=20) as emulator:
+        client = WebClient(token="xoxb-test", base_url=emulator.url)
+        started = time.perf_counter()
+        client.users_list()
+        assert time.perf_counter() - started >= 0.02
+
+        with pytest.raises(SlackApiError) as excinfo:
+            client.users_list()
+        assert excinfo.value.response.status_code == 429
+        assert int(excinfo.value.response.headers["Retry-After"]) >= 1
+        assert emulator.stats()["rate_limited"] == {"users.list": 1}
+
+
+def test_event_storm_measures_each_event_type(tmp_path):
+    from tests.benchmarks import event_storm
+
+    mix = {"message": 2, "app_home_opened": 1, "block_actions": 1}
+    document = event_storm.run_storm(
+        rates=[40], duration=0.5, concurrency=4, mix=mix, users=60, slack_latency_ms=0, drain=10
+    )
+
+    (step,) = document["steps"]
+    assert step["sent"] == 20 and step["completed"] == 20
+    assert set(step["by_type"]) <= set(mix)
+    assert step["by_type"]["message"]["errors"] == 0
+    assert step["ack_ms"]["p50"] is not None and step["completion_ms"]["p99"] is not None
+    assert document["slack"]["calls"].get("reactions.add")
+
+    # Replayed Socket Mode envelopes are unwrapped to their payloads
+    body = event_storm.PayloadGenerator(["U000000001"]).app_home_opened()
+    replay = tmp_path / "events.jsonl"
+    replay.write_text(json.dumps({"envelope_id": "e1", "type": "events_api", "payload": body}))
+    assert event_storm.load_replay(replay) == [body]
+
+
+def test_event_storm_async_runtime():
+    pytest.importorskip("aiohttp")
+    from tests.benchmarks import event_storm
+
+    mix = {"message": 2, "app_home_opened": 1, "block_actions": 1}
+    document = event_storm.run_storm(
+        rates=[40],
+        duration=0.5,
+        concurrency=4,
+        mix=mix,
+        users=60,
+        slack_latency_ms=0,
+        drain=10,
+        runtime="async",
+    )
+
+    (step,) = document["steps"]
+    assert document["meta"]["runtime"] == "async"
+    assert step["sent"] == 20 and step["completed"] == 20
+    assert step["by_type"]["message"]["errors"] == 0
+    # Channel messages get reactions from the AsyncApp; home views publish asynchronously
+    assert document["slack"]["calls"].get("reactions.add")
+    assert document["slack"]["calls"].get("views.publish")
+
+
+def test_openai_stub_serves_pipeline_calls(monkeypatch, tmp_path):
+    import integrations.openai as openai_api
+    from tests.benchmarks.openai_stub import OpenAIStub, _png
+
+    rules = [{"kind": "text", "match": "haiku", "text": "{mentions} scripted #{call}"}]
+    with OpenAIStub(rules=rules, latency={"text": "fixed:20"}) as stub:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+        monkeypatch.setattr(openai_api, "OPENAI_BASE_URL", stub.url)
+        monkeypatch.setattr(openai_api, "_client", None)
+
+        started = time.perf_counter()
+        assert openai_api.complete(input_text="Write a haiku for <@U1>") == "<@U1> scripted #1"
+        assert time.perf_counter() - started >= 0.02
+
+        batch = openai_api.complete_structured(
+            openai_api._batch_schema(["a", "b"], ("message",)), input_text="Greet <@U2>"
+        )
+        assert [r["id"] for r in batch["results"]] == ["a", "b"]
+
+        photo = tmp_path / "photo.png"
+        photo.write_bytes(_png(8, 8))
+        assert openai_api.analyze_image(str(photo), "Describe") is not None
+
+        image = openai_api.get_openai_client().images.generate(
+            model="gpt-image-1", prompt="cake", size="64x64", quality="low"
+        )
+        assert base64.b64decode(image.data[0].b64_json).startswith(b"\x89PNG")
+        assert image.usage.output_tokens > 0
+
+        stats = stub.stats()
+        assert stats["calls"] == {"text": 1, "structured": 1, "vision": 1, "image": 1}
+        assert stats["input_tokens"] > 0 and stats["output_tokens"] > 0
+
+
+def test_openai_stub_injects_rate_limits_and_timeouts():
+    from openai import APITimeoutError, OpenAI, RateLimitError
+
+    from tests.benchmarks.openai_stub import OpenAIStub, parse_latency
+
+    with OpenAIStub(rate_limit_rate=1.0) as stub:
+        client = OpenAI(api_key="sk-stub", base_url=stub.url, max_retries=0)
+        with pytest.raises(RateLimitError):
+            client.responses.create(model="m", input="hi")
+
+    with OpenAIStub(timeout_rate=1.0, hang_seconds=5) as stub:
+        client = OpenAI(api_key="sk-stub", base_url=stub.url, max_retries=0, timeout=0.2)
+        with pytest.raises(APITimeoutError):
+            client.responses.create(model="m", input="hi")
+        assert stub.stats()["faults"] == {"timeout": 1}
+
+    draws = [parse_latency("lognormal:800,0.4")(random.Random(7)) for _ in range(2)]
+    assert draws[0] == draws[1] > 0
@@ -204,3 +204,152 @@ class TestLoadAllSpecialDaysCache:
                     sd.load_all_special_days()
 
         assert dedup.call_count == 2
+
+
+# -----------------------------------------------------------------------------
+# web search facts cache
+# -----------------------------------------------------------------------------
+
+
+def _isolated_facts_db(ws, tmp_path):
+    """Point the facts cache at tmp_path and reset per-process state."""
+    ws._facts_db_ready = False
+    ws._facts_partition_year = None
+    return (
+        patch.object(ws, "CACHE_DIR", str(tmp_path)),
+        patch.object(ws, "FACTS_CACHE_FILE", str(tmp_path / "facts_cache.db")),
+        patch.object(ws, "_LEGACY_CLEANUP_LOG_FILE", str(tmp_path / "cleanup_log.json")),
+    )
+
+
+class TestFactsCache:
+    def test_keyed_roundtrip(self, tmp_path):
+        from integrations import web_search as ws
+
+        p1, p2, p3 = _isolated_facts_db(ws, tmp_path)
+        with p1, p2, p3:
+            assert ws._read_cached_facts("14/07", "standard", 2026) is None
+            assert ws._write_cached_facts("14/07", "standard", 2026, {"facts": "x"})
+            assert ws._read_cached_facts("14/07", "standard", 2026) == {"facts": "x"}
+            assert ws._read_cached_facts("14/07", "pirate", 2026) is None
+
+        # Single file instead of one JSON per date/personality
+        assert sorted(os.listdir(tmp_path)) == ["facts_cache.db"]
+
+    def test_new_year_partition_drops_previous(self, tmp_path):
+        from integrations import web_search as ws
+
+        p1, p2, p3 = _isolated_facts_db(ws, tmp_path)
+        with p1, p2, p3:
+            ws._write_cached_facts("01/01", "standard", 2025, {"facts": "old"})
+            ws._write_cached_facts("01/01", "standard", 2026, {"facts": "new"})
+            assert ws._read_cached_facts("01/01", "standard", 2025) is None
+            assert ws._read_cached_facts("01/01", "standard", 2026) == {"facts": "new"}
+
+    def test_legacy_files_migrated_once(self, tmp_path):
+        from datetime import datetime
+
+        from integrations import web_search as ws
+
+        year = datetime.now().year
+        (tmp_path / f"facts_14_07_mystic_dog_{year}.json").write_text(json.dumps({"facts": "a"}))
+        (tmp_path / f"facts_14_07_standard_{year - 1}.json").write_text(json.dumps({"facts": "b"}))
+        (tmp_path / "cleanup_log.json").write_text("{}")
+
+        p1, p2, p3 = _isolated_facts_db(ws, tmp_path)
+        with p1, p2, p3:
+            assert ws._read_cached_facts("14/07", "mystic_dog", year) == {"facts": "a"}
+
+        assert sorted(os.listdir(tmp_path)) == ["facts_cache.db"]
+
+    def test_clear_cache_for_date(self, tmp_path):
+        from integrations import web_search as ws
+
+        p1, p2, p3 = _isolated_facts_db(ws, tmp_path)
+        with p1, p2, p3:
+            ws._write_cached_facts("14/07", "standard", 2026, {"facts": "a"})
+            ws._write_cached_facts("15/07", "standard", 2026, {"facts": "b"})
+            assert ws.clear_cache("14/07") == 1
+            assert ws._read_cached_facts("14/07", "standard", 2026) is None
+            assert ws._read_cached_facts("15/07", "standard", 2026) == {"facts": "b"}
+            assert ws.clear_cache() == 1
+            assert ws._write_cached_facts("15/07", "standard", 2026, {"facts": "c"})
+
+
+# -----------------------------------------------------------------------------
+# special day "View Details" store
+# -----------------------------------------------------------------------------
+
+
+def _isolated_details_db(sd, tmp_path):
+    """Point the details store at tmp_path and reset per-process state."""
+    sd._details_db_ready = False
+    sd._details_lru.clear()
+    return (
+        patch.object(sd, "SPECIAL_DAY_DETAILS_DB_FILE", str(tmp_path / "details.db")),
+        patch.object(sd, "_LEGACY_DETAILS_CACHE_FILE", str(tmp_path / "details.json")),
+    )
+
+
+class TestSpecialDayDetailsStore:
+    def test_keyed_roundtrip_survives_lru_eviction(self, tmp_path):
+        from slack.blocks import special_day as sd
+
+        p1, p2 = _isolated_details_db(sd, tmp_path)
+        with p1, p2:
+            sd.store_special_day_details_batch(
+                {"a": {"content": "A", "name": "Day A"}, "b": {"content": "B"}}
+            )
+            sd._details_lru.clear()
+            entry = sd.get_special_day_details("a")
+            assert entry["content"] == "A"
+            assert entry["name"] == "Day A"
+            assert sd.get_special_day_details("missing") is None
+        sd._details_db_ready = False
+
+    def test_expired_entries_hidden_and_pruned(self, tmp_path):
+        from slack.blocks import special_day as sd
+
+        p1, p2 = _isolated_details_db(sd, tmp_path)
+        with p1, p2:
+            sd.store_special_day_details("old", "Old")
+            later = time.time() + sd._details_cache_ttl + 1
+            with patch.object(sd.time, "time", return_value=later):
+                assert sd.get_special_day_details("old") is None
+                sd.store_special_day_details("new", "New")
+            sd._details_lru.clear()
+            with sd._connect_details_db() as conn:
+                ids = [r[0] for r in conn.execute("SELECT action_id FROM details")]
+            assert ids == ["new"]
+        sd._details_db_ready = False
+
+    def test_size_bound_evicts_oldest(self, tmp_path):
+        from slack.blocks import special_day as sd
+
+        p1, p2 = _isolated_details_db(sd, tmp_path)
+        with p1, p2, patch.object(sd, "SPECIAL_DAY_DETAILS_MAX_ENTRIES", 2):
+            for i, action_id in enumerate(["x", "y", "z"]):
+                with patch.object(sd.time, "time", return_value=1_000_000 + i):
+                    sd.store_special_day_details(action_id, action_id)
+            with sd._connect_details_db() as conn:
+                ids = sorted(r[0] for r in conn.execute("SELECT action_id FROM details"))
+            assert ids == ["y", "z"]
+        sd._details_db_ready = False
+
+    def test_legacy_json_migrated_once(self, tmp_path):
+        from slack.blocks import special_day as sd
+
+        (tmp_path / "details.json").write_text(
+            json.dumps(
+                {
+                    "fresh": {"content": "F", "name": "Fresh", "stored_at": time.time()},
+                    "stale": {"content": "S", "stored_at": 0},
+                }
+            )
+        )
+        p1, p2 = _isolated_details_db(sd, tmp_path)
+        with p1, p2:
+            assert sd.get_special_day_details("fresh")["content"] == "F"
+            assert sd.get_special_day_details("stale") is None
+        assert not (tmp_path / "details.json").exists()
+        sd._details_db_ready = False
@@ -0,0 +1,123 @@
+"""Tests for durable celebration artifacts and pipeline resume."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from storage import celebration_artifacts as ca
+from utils.date_utils import nearest_birthday_occurrence
+
+PEOPLE = [
+    {"user_id": "U2", "username": "Bob", "date": "18/10"},
+    {"user_id": "U1", "username": "Alice", "date": "18/10"},
+]
+
+
+@pytest.fixture(autouse=True)
+def _artifacts_dir(tmp_path):
+    with patch.object(ca, "CELEBRATION_ARTIFACTS_DIR", str(tmp_path)):
+        yield tmp_path
+
+
+class TestCelebrationArtifacts:
+    def test_id_is_order_independent(self):
+        reversed_people = list(reversed(PEOPLE))
+        assert ca.celebration_id_for(PEOPLE, "2026-10-18") == ca.celebration_id_for(
+            reversed_people, "2026-10-18"
+        )
+        assert ca.celebration_id_for(PEOPLE, "2026-10-18").startswith("2026-10-18_")
+        assert ca.celebration_id_for(PEOPLE[:1], "2026-10-18") != ca.celebration_id_for(
+            PEOPLE, "2026-10-18"
+        )
+
+    def test_generation_roundtrip_restores_image_bytes(self):
+        store = ca.CelebrationArtifacts.for_cohort(PEOPLE)
+        images = [{"image_data": b"png-bytes", "image_base64": "x", "generated_for": "Alice"}]
+        store.save_generation("generated", "Happy birthday!", images, "pirate")
+
+        reopened = ca.CelebrationArtifacts.for_cohort(PEOPLE)
+        message, loaded, personality = reopened.load_generation("generated")
+
+        assert reopened.stage == "generated"
+        assert message == "Happy birthday!"
+        assert personality == "pirate"
+        assert loaded[0]["image_data"] == b"png-bytes"
+        assert loaded[0]["generated_for"] == "Alice"
+
+    def test_finalized_requires_same_user_ids(self):
+        store = ca.CelebrationArtifacts.for_cohort(PEOPLE)
+        store.save_generation("finalized", "msg", [], "standard", user_ids=["U1", "U2"])
+
+        assert store.load_generation("finalized", ["U2", "U1"]) is not None
+        assert store.load_generation("finalized", ["U1"]) is None
+
+    def test_progress_markers(self):
+        store = ca.CelebrationArtifacts.for_cohort(PEOPLE)
+        assert store.uploaded_file_ids() is None
+        store.mark_stage("uploaded", file_ids=[("F1", "Title")])
+        store.mark_stage("posted", ts="123.456")
+
+        reopened = ca.CelebrationArtifacts.for_cohort(PEOPLE)
+        assert reopened.uploaded_file_ids() == [("F1", "Title")]
+        assert reopened.posted_ts() == "123.456"
+
+    def test_cleanup_removes_old_dates_only(self, _artifacts_dir):
+        os.makedirs(_artifacts_dir / "2000-01-01_abc")
+        ca.CelebrationArtifacts.for_cohort(PEOPLE).mark_stage("generated")
+
+        assert ca.cleanup_old_artifacts(days_to_keep=7) == 1
+        assert len(os.listdir(_artifacts_dir)) == 1
+
+
+class TestPipelineResume:
+    def _run(self, create, send):
+        from services.celebration import BirthdayCelebrationPipeline
+
+        validation = {
+            "valid_people": PEOPLE,
+            "invalid_people": [],
+            "validation_summary": {"total": 2},
+        }
+        with (
+            patch("services.celebration.is_user_celebrated_today", return_value=False),
+            patch("services.celebration.create_consolidated_birthday_announcement", create),
+            patch(
+                "services.celebration.validate_birthday_people_for_posting",
+                return_value=validation,
+            ),
+            patch("services.celebration.send_message", send),
+            patch("services.celebration.mark_timezone_birthday_announced"),
+            patch.object(BirthdayCelebrationPipeline, "_track_thread_for_engagement"),
+            patch.object(BirthdayCelebrationPipeline, "_add_basic_reactions"),
+        ):
+            pipeline = BirthdayCelebrationPipeline(MagicMock(), birthday_channel="C1")
+            return pipeline.celebrate(PEOPLE, include_image=False)
+
+    def test_retry_reuses_generated_message(self):
+        create = MagicMock(return_value=("Generated once", [], "standard"))
+        failing_send = MagicMock(side_effect=RuntimeError("slack down"))
+
+        assert self._run(create, failing_send)["success"] is False
+
+        send = MagicMock(return_value={"success": True, "ts": "1.2"})
+        result = self._run(create, send)
+
+        assert result["success"] is True
+        assert create.call_count == 1
+
+    def test_retry_after_post_does_not_repost(self):
+        create = MagicMock(return_value=("Hello", [], "standard"))
+        send = MagicMock(return_value={"success": True, "ts": "1.2"})
+
+        # Stored under the birthday's date, whatever day (UTC) the retry runs on
+        birthday = nearest_birthday_occurrence("18/10").isoformat()
+        store = ca.CelebrationArtifacts.for_cohort(PEOPLE, birthday)
+        store.save_generation("generated", "Hello", [], "standard")
+        store.mark_stage("posted", ts="9.9")
+
+        result = self._run(create, send)
+
+        assert result["ts"] == "9.9"
+        create.assert_not_called()
+        send.assert_not_called()
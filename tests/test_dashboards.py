@@ -70,6 +70,22 @@ def _make_system_status(tmp_path):
                     "commands": {"exists": True, "size_kb": 256},
                 },
             },
+            "openai_traffic": {
+                "status": "ok",
+                "operations": {
+                    "image": {
+                        "state": "open",
+                        "consecutive_failures": 5,
+                        "open_count": 1,
+                        "limit": 2,
+                        "max_limit": 4,
+                        "in_flight": 0,
+                        "rate_limited": 3,
+                        "slow_calls": 0,
+                    },
+                },
+                "open_circuits": ["image"],
+            },
         },
     }
 
@@ -403,6 +419,30 @@ class TestHealthStatusBlocksDetailed:
         texts = _extract_section_texts(blocks)
         assert any("Scheduler:" in t for t in texts)
 
+    def test_has_openai_traffic(
+        self,
+        system_status,
+        mock_scheduler,
+        mock_model_info,
+        mock_timezone_settings,
+        mock_thread_tracker,
+        mock_bot_celebration,
+        backup_dir,
+    ):
+        blocks, _ = self._build(
+            system_status,
+            mock_scheduler,
+            mock_model_info,
+            mock_timezone_settings,
+            mock_thread_tracker,
+            mock_bot_celebration,
+            backup_dir,
+        )
+        texts = _extract_section_texts(blocks)
+        traffic = next(t for t in texts if "OpenAI Traffic:" in t)
+        assert "⚠️" in traffic
+        assert "image: circuit open, limit 2/4, 0 in flight, 3 rate-limited, 1 opens" in traffic
+
     def test_has_thread_tracking(
         self,
         system_status,
@@ -628,6 +668,12 @@ class TestCanvasHealthSection:
         assert "Ext. backups" in md
         assert "Custom emoji" in md
 
+    def test_shows_openai_traffic(
+        self, mock_model_info, mock_timezone_settings, mock_bot_celebration
+    ):
+        md = self._build(mock_model_info, mock_timezone_settings, mock_bot_celebration)
+        assert "**OpenAI:** ⚠️ image: circuit open, limit 2/4" in md
+
 
 class TestCanvasEngagementSection:
     """Tests for canvas _build_engagement_section()."""
@@ -11,7 +11,7 @@ Tests pure functions with complex logic:
 - is_celebration_time_for_user(): Timezone-aware celebration scheduling
 """
 
-from datetime import datetime, time, timezone
+from datetime import date, datetime, time, timezone
 
 from utils.date_utils import (
     _is_date_in_zodiac_range,
@@ -27,6 +27,7 @@ from utils.date_utils import (
     get_timezone_object,
     get_user_current_time,
     is_celebration_time_for_user,
+    nearest_birthday_occurrence,
 )
 
 
@@ -153,6 +154,25 @@ class TestCheckIfBirthdayToday:
         assert check_if_birthday_today("invalid", reference_date) is False
 
 
+class TestNearestBirthdayOccurrence:
+    """Tests for nearest_birthday_occurrence() (celebration IDs for late retries)"""
+
+    def test_retry_after_midnight_keeps_birthday(self):
+        """A retry the next UTC day maps back to yesterday's birthday"""
+        moment = datetime(2025, 3, 16, 1, 0, tzinfo=timezone.utc)
+        assert nearest_birthday_occurrence("15/03", moment) == date(2025, 3, 15)
+
+    def test_across_new_year(self):
+        """New Year's Eve birthday retried on January 1st"""
+        moment = datetime(2026, 1, 1, 2, 0, tzinfo=timezone.utc)
+        assert nearest_birthday_occurrence("31/12", moment) == date(2025, 12, 31)
+
+    def test_leap_day_and_invalid(self):
+        """29/02 resolves to a leap year; garbage returns None"""
+        assert nearest_birthday_occurrence("29/02", date(2028, 3, 1)) == date(2028, 2, 29)
+        assert nearest_birthday_occurrence("invalid", date(2028, 3, 1)) is None
+
+
 class TestCalculateDaysUntilBirthday:
     """Tests for calculate_days_until_birthday() year-boundary logic"""
 
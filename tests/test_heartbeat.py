@@ -0,0 +1,86 @@
+"""Tests for the heartbeat file, its healthcheck CLI and the liveness endpoints."""
+
+import json
+import logging
+import socket
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from config import get_logger
+from utils import heartbeat, log_setup, metrics
+
+
+def _status(age=0, scheduler="ok", socket_mode="connected"):
+    return {
+        "written_at": time.time() - age,
+        "scheduler": {"status": scheduler, "overdue_seconds": 0.0},
+        "socket_mode": socket_mode,
+    }
+
+
+@pytest.mark.parametrize(
+    "status, live, ready",
+    [
+        (_status(), True, True),
+        (_status(socket_mode="disconnected"), True, False),
+        (_status(socket_mode="not_applicable"), True, True),
+        (_status(age=300), False, False),
+        (_status(scheduler="error"), False, False),
+    ],
+)
+def test_evaluate_liveness_and_readiness(status, live, ready):
+    assert heartbeat.evaluate(status, max_age=60)[:2] == (live, ready)
+
+
+def test_check_reads_only_the_heartbeat_file(tmp_path):
+    path = tmp_path / "heartbeat.json"
+    assert heartbeat.main(["--file", str(path)]) == 1  # Not written yet
+
+    path.write_text(json.dumps(_status(socket_mode="disconnected")))
+    assert heartbeat.main(["--file", str(path)]) == 0
+    assert heartbeat.main(["--file", str(path), "--ready"]) == 1
+
+
+def test_emulator_runs_report_socket_mode_not_applicable(monkeypatch):
+    monkeypatch.setattr(heartbeat, "_connection_probe", lambda: False)
+    assert heartbeat._connection_state() == "disconnected"
+    monkeypatch.setattr(heartbeat, "_socket_mode", True)
+    heartbeat.disable_socket_mode()
+    assert heartbeat._connection_state() == "not_applicable"
+
+
+def test_last_error_is_tracked_across_component_loggers(monkeypatch):
+    handler = heartbeat._LastErrorHandler()
+    monkeypatch.setattr(heartbeat, "_last_error", None)
+    log_setup.add_component_handler(handler)
+    try:
+        get_logger("storage").warning("STORAGE: not an error")
+        get_logger("storage").error("STORAGE: Failed to save birthdays")
+    finally:
+        log_setup._extra_handlers.remove(handler)
+        for logger in logging.Logger.manager.loggerDict.values():
+            if isinstance(logger, logging.Logger) and handler in logger.handlers:
+                logger.removeHandler(handler)
+
+    assert heartbeat._last_error["message"] == "STORAGE: Failed to save birthdays"
+    assert heartbeat._last_error["component"] == "storage"
+
+
+def test_probe_endpoints_report_status(monkeypatch):
+    monkeypatch.setattr(heartbeat, "collect_status", lambda: _status(socket_mode="disconnected"))
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    assert metrics.start_metrics_server("127.0.0.1", port)
+    try:
+        live = urllib.request.urlopen(f"http://127.0.0.1:{port}/livez", timeout=5)
+        assert live.status == 200 and json.loads(live.read())["ok"] is True
+        with pytest.raises(urllib.error.HTTPError) as not_ready:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/readyz", timeout=5)
+        assert not_ready.value.code == 503
+    finally:
+        metrics.stop_metrics_server()
@@ -209,3 +209,132 @@ def test_admin_image_model_set_unknown_warns_but_persists(monkeypatch):
     assert "Unknown image model" in joined
     assert "✅" in joined and "gpt-image-99-future" in joined
     assert set_calls == ["gpt-image-99-future"]
+
+
+# -----------------------------------------------------------------------------
+# Profile photo conditional fetch and content-hash caches
+# -----------------------------------------------------------------------------
+
+
+def _png_bytes(color):
+    import io
+
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new("RGB", (8, 8), color).save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def photo_env(monkeypatch, tmp_path):
+    """Isolated profile cache plus a fake HTTP layer recording each request."""
+    from services import image_generator
+
+    monkeypatch.setattr(image_generator, "CACHE_DIR", str(tmp_path))
+    state = {"content": _png_bytes("red"), "etag": '"v1"', "requests": []}
+
+    def fake_get(url, headers=None, timeout=None):
+        state["requests"].append(dict(headers or {}))
+        response = MagicMock()
+        if headers and headers.get("If-None-Match") == state["etag"]:
+            response.status_code = 304
+            response.headers = {}
+        else:
+            response.status_code = 200
+            response.content = state["content"]
+            response.headers = {"ETag": state["etag"]}
+        return response
+
+    monkeypatch.setattr(image_generator.requests, "get", fake_get)
+    return state
+
+
+PROFILE = {
+    "user_id": "U1",
+    "is_custom_image": True,
+    "photo_original": "https://avatars.example/u1.png",
+}
+
+
+def _expire_check(tmp_path):
+    import json
+
+    meta_path = tmp_path / "profiles" / "profile_U1.json"
+    meta = json.loads(meta_path.read_text())
+    meta["checked_at"] = "2000-01-01T00:00:00"
+    meta_path.write_text(json.dumps(meta))
+
+
+def test_profile_photo_same_url_skips_network(photo_env):
+    from services.image_generator import download_and_prepare_profile_photo
+
+    first = download_and_prepare_profile_photo(PROFILE, "Alice")
+    second = download_and_prepare_profile_photo(PROFILE, "Alice")
+
+    assert first == second
+    assert len(photo_env["requests"]) == 1
+
+
+def test_profile_photo_revalidates_with_etag_after_ttl(photo_env, tmp_path, monkeypatch):
+    from services import image_generator
+
+    first = image_generator.download_and_prepare_profile_photo(PROFILE, "Alice")
+    _expire_check(tmp_path)
+
+    monkeypatch.setattr(
+        image_generator, "_process_profile_photo", MagicMock(side_effect=AssertionError)
+    )
+    second = image_generator.download_and_prepare_profile_photo(PROFILE, "Alice")
+
+    assert second == first
+    assert photo_env["requests"][-1] == {"If-None-Match": '"v1"'}
+
+
+def test_changed_photo_switches_image_and_analysis(photo_env, tmp_path, monkeypatch):
+    import os
+
+    from services import image_generator
+
+    analyze = MagicMock(side_effect=["red square", "blue square"])
+    monkeypatch.setattr(image_generator, "analyze_image", analyze)
+    monkeypatch.setattr(image_generator, "PROFILE_ANALYSIS_ENABLED", True)
+
+    first = image_generator.download_and_prepare_profile_photo(PROFILE, "Alice")
+    assert image_generator._analyze_profile_photo(first, PROFILE, "Alice") == "red square"
+    assert image_generator._analyze_profile_photo(first, PROFILE, "Alice") == "red square"
+    assert analyze.call_count == 1
+
+    photo_env["content"] = _png_bytes("blue")
+    photo_env["etag"] = '"v2"'
+    changed = dict(PROFILE, photo_original="https://avatars.example/u1-new.png")
+    second = image_generator.download_and_prepare_profile_photo(changed, "Alice")
+
+    assert second != first
+    assert image_generator._analyze_profile_photo(second, changed, "Alice") == "blue square"
+    assert analyze.call_count == 2
+
+    # Content-keyed files are shared: a user with Alice's old photo still hits the cache
+    assert os.path.exists(first)
+    photo_env["content"] = _png_bytes("red")
+    twin = dict(PROFILE, user_id="U2", photo_original="https://avatars.example/u2.png")
+    assert image_generator.download_and_prepare_profile_photo(twin, "Bob") == first
+    assert image_generator._analyze_profile_photo(first, twin, "Bob") == "red square"
+    assert analyze.call_count == 2
+
+
+def test_cleanup_drops_stale_photo_metadata(photo_env, tmp_path):
+    import os
+    import time
+
+    from services import image_generator
+
+    image_generator.download_and_prepare_profile_photo(PROFILE, "Alice")
+    meta_path = tmp_path / "profiles" / "profile_U1.json"
+    departed = tmp_path / "profiles" / "profile_U9.json"
+    departed.write_text("{}")
+    old = time.time() - 30 * 86400
+    os.utime(departed, (old, old))
+
+    assert image_generator.cleanup_old_profile_photos(days_to_keep=7) == 1
+    assert meta_path.exists() and not departed.exists()
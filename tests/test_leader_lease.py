@@ -0,0 +1,60 @@
+"""Tests for lease-based leader election over a shared lease file."""
+
+from utils.leader_lease import LeaderLease
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pair(tmp_path, clock, **callbacks):
+    path = str(tmp_path / "lease.json")
+    return LeaderLease(path, 30, clock=clock, **callbacks), LeaderLease(path, 30, clock=clock)
+
+
+def test_single_leader_and_failover_after_expiry(tmp_path):
+    clock = _Clock()
+    events = []
+    a, b = _pair(tmp_path, clock, on_demoted=lambda: events.append("a demoted"))
+
+    assert a.try_acquire()
+    assert not b.try_acquire()
+
+    clock.now += 20
+    assert a.try_acquire()  # Renewal extends the lease
+    clock.now += 20
+    assert not b.try_acquire()
+
+    clock.now += 31  # a stopped renewing
+    assert b.try_acquire()
+    assert not a.try_acquire()
+    assert events == ["a demoted"]
+    assert b.status()["leader"] == b.instance_id
+
+
+def test_release_hands_over_immediately(tmp_path):
+    clock = _Clock()
+    a, b = _pair(tmp_path, clock)
+
+    assert a.try_acquire()
+    a.release()
+    assert not a.is_leader
+    assert b.try_acquire()
+
+
+def test_signals_from_standby_reach_leader_once(tmp_path):
+    clock = _Clock()
+    received = []
+    a, b = _pair(tmp_path, clock, on_signal=received.append)
+
+    assert a.try_acquire()
+    clock.now += 1
+    b.post_signal("birthday_replan")
+    a.try_acquire()
+    a.try_acquire()
+
+    assert received == ["birthday_replan"]
@@ -0,0 +1,75 @@
+"""Tests for queued log routing and the JSON log formatter."""
+
+import json
+import logging
+import logging.handlers
+import queue
+
+from utils import log_setup
+
+
+def _record(message, **extra):
+    record = logging.makeLogRecord(
+        {"name": "birthday_bot.scheduler", "levelno": logging.INFO, "levelname": "INFO"}
+    )
+    record.msg = message
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_extracts_event_code_and_extras():
+    line = log_setup.JsonFormatter().format(
+        _record("SCHEDULER: Job daily finished in 1.20s", job="daily", duration_seconds=1.2)
+    )
+    entry = json.loads(line)
+
+    assert entry["component"] == "scheduler"
+    assert entry["event"] == "SCHEDULER"
+    assert entry["level"] == "INFO"
+    assert entry["job"] == "daily" and entry["duration_seconds"] == 1.2
+    assert json.loads(log_setup.JsonFormatter().format(_record("plain text")))["event"] is None
+
+
+def test_queued_records_reach_their_component_file(tmp_path, monkeypatch):
+    files = {}
+    for log_type in ("scheduler", "storage"):
+        handler = logging.FileHandler(tmp_path / f"{log_type}.log", encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        files[log_type] = handler
+    monkeypatch.setattr(log_setup, "_file_handlers", files)
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, log_setup._ComponentRouter())
+    listener.start()
+    log_setup._ComponentQueueHandler(log_queue, "scheduler").handle(_record("SCHEDULER: tick"))
+    log_setup._ComponentQueueHandler(log_queue, "storage").handle(_record("STORAGE: saved"))
+    listener.stop()  # Drains the queue
+    for handler in files.values():
+        handler.close()
+
+    assert (tmp_path / "scheduler.log").read_text().strip() == "SCHEDULER: tick"
+    assert (tmp_path / "storage.log").read_text().strip() == "STORAGE: saved"
+
+
+def test_queued_exception_keeps_json_exception_field(tmp_path, monkeypatch):
+    handler = logging.FileHandler(tmp_path / "main.log", encoding="utf-8")
+    handler.setFormatter(log_setup.JsonFormatter())
+    monkeypatch.setattr(log_setup, "_file_handlers", {"main": handler})
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, log_setup._ComponentRouter())
+    listener.start()
+    logger = logging.getLogger("birthday_bot.test_queued_exception")
+    logger.propagate = False
+    logger.addHandler(log_setup._ComponentQueueHandler(log_queue, "main"))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("MAIN: Failed for %s", "U1")
+    listener.stop()
+    handler.close()
+
+    entry = json.loads((tmp_path / "main.log").read_text())
+    assert entry["message"] == "MAIN: Failed for U1"
+    assert entry["event"] == "MAIN"
+    assert entry["exception"].startswith("Traceback") and "ValueError: boom" in entry["exception"]
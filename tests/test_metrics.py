@@ -0,0 +1,137 @@
+"""Tests for the in-process metrics registry and its instrumentation hooks."""
+
+import socket
+import threading
+import time
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+from filelock import Timeout
+
+from utils import metrics
+from utils.locks import file_lock
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    metrics.reset_metrics()
+    yield
+    metrics.reset_metrics()
+
+
+def test_timed_records_outcome_and_percentiles():
+    with metrics.timed("stage_seconds", stage="a"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.timed("stage_seconds", stage="a"):
+            raise ValueError
+
+    histograms = metrics.snapshot()["histograms"]
+    ok = histograms['stage_seconds{outcome="ok",stage="a"}']
+    assert ok["count"] == 1 and ok["p99"] is not None
+    assert histograms['stage_seconds{outcome="error",stage="a"}']["count"] == 1
+
+
+def test_timed_decorator_is_per_call_across_threads():
+    @metrics.timed("job_seconds")
+    def job():
+        time.sleep(0.2)
+
+    # The first call finishes while the second is still running
+    first = threading.Thread(target=job)
+    first.start()
+    time.sleep(0.1)
+    second = threading.Thread(target=job)
+    second.start()
+    first.join()
+    second.join()
+
+    samples = metrics.snapshot()["histograms"]['job_seconds{outcome="ok"}']
+    assert samples["count"] == 2
+    assert 0.15 < samples["p50"] and samples["max"] < 0.28
+
+
+def test_prometheus_rendering():
+    metrics.inc("rejected_total", operation="text")
+    metrics.observe("request_seconds", 0.3, method="chat.postMessage")
+
+    text = metrics.render_prometheus()
+    assert "# TYPE brightdaybot_rejected_total counter" in text
+    assert 'brightdaybot_rejected_total{operation="text"} 1' in text
+    assert 'brightdaybot_request_seconds_bucket{method="chat.postMessage",le="0.25"} 0' in text
+    assert 'brightdaybot_request_seconds_bucket{method="chat.postMessage",le="0.5"} 1' in text
+    assert 'brightdaybot_request_seconds_count{method="chat.postMessage"} 1' in text
+
+
+def test_metrics_endpoint_serves_text_format():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    metrics.inc("scrapes_total")
+    assert metrics.start_metrics_server("127.0.0.1", port)
+    try:
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read()
+        assert "brightdaybot_scrapes_total 1" in body.decode()
+    finally:
+        metrics.stop_metrics_server()
+
+
+def test_file_lock_records_waits_and_timeouts(tmp_path):
+    path = str(tmp_path / "data.json.lock")
+    with file_lock(path):
+        with pytest.raises(Timeout):
+            file_lock(path, timeout=0.05).acquire()
+
+    snap = metrics.snapshot()
+    assert snap["counters"]['file_lock_timeouts_total{lock="data.json"}'] == 1
+    assert snap["histograms"]['file_lock_wait_seconds{lock="data.json"}']["count"] == 2
+
+
+def test_instrumented_slack_client_times_each_method():
+    from slack_sdk import WebClient
+
+    from slack.client import instrument_client
+
+    client = WebClient(token="xoxb-test")
+    client.api_call = MagicMock(return_value={"ok": True})
+    instrument_client(client)
+    instrument_client(client)  # Idempotent
+
+    client.users_info(user="U1")
+    histograms = metrics.snapshot()["histograms"]
+    assert histograms['slack_api_seconds{method="users.info",outcome="ok"}']["count"] == 1
+
+
+def test_lock_stats_track_holds_call_sites_and_reentrancy(tmp_path):
+    from utils.locks import get_lock_stats, reset_lock_stats
+
+    reset_lock_stats()
+    lock = file_lock(str(tmp_path / "birthdays.json.lock"))
+    with lock:
+        with lock:  # Re-entrant: one hold, ended by the outer release
+            pass
+
+    stats = get_lock_stats()["birthdays.json"]
+    assert stats["acquisitions"] == 2
+    assert stats["hold_p99"] is not None
+    holds = [w for w in stats["worst"] if w["kind"] == "hold"]
+    assert len(holds) == 1
+    assert "test_metrics.py" in holds[0]["site"]
+    assert "test_lock_stats_track_holds" in holds[0]["site"]
+    reset_lock_stats()
+
+
+def test_long_hold_logged_with_stack(tmp_path):
+    from unittest.mock import patch
+
+    import utils.locks as locks
+
+    with patch.object(locks, "LOCK_HOLD_WARN_SECONDS", 1e-9), patch.object(locks, "logger") as log:
+        with file_lock(str(tmp_path / "slow.lock")):
+            pass
+
+    message = log.warning.call_args[0][0]
+    assert "slow held for" in message and "test_long_hold_logged_with_stack" in message
+    locks.reset_lock_stats()
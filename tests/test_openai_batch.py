@@ -0,0 +1,125 @@
+"""Tests for batched structured-output calls (complete_batch) and their callers."""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from integrations.openai import complete_batch
+from storage.special_days import SpecialDay
+
+
+def _response(payload):
+    return SimpleNamespace(output_text=json.dumps(payload), usage=None)
+
+
+def _client(*payloads):
+    client = MagicMock()
+    client.responses.create.side_effect = [_response(p) for p in payloads]
+    return client
+
+
+def _batch(client, items, fallback, **kwargs):
+    with patch("integrations.openai.get_openai_client", return_value=client):
+        return complete_batch(
+            items,
+            fields=("text",),
+            instructions="system",
+            task="Do each item.",
+            fallback=fallback,
+            max_tokens_per_item=100,
+            **kwargs,
+        )
+
+
+class TestCompleteBatch:
+    def test_packs_items_into_one_structured_call(self):
+        client = _client({"results": [{"id": "a", "text": "alpha"}, {"id": "b", "text": "beta"}]})
+        fallback = MagicMock()
+
+        results = _batch(client, {"a": "prompt a", "b": "prompt b"}, fallback)
+
+        assert results == {"a": {"text": "alpha"}, "b": {"text": "beta"}}
+        assert client.responses.create.call_count == 1
+        fallback.assert_not_called()
+        params = client.responses.create.call_args.kwargs
+        assert params["text"]["format"]["strict"] is True
+        item_schema = params["text"]["format"]["schema"]["properties"]["results"]["items"]
+        assert item_schema["properties"]["id"]["enum"] == ["a", "b"]
+
+    def test_missing_or_invalid_items_fall_back_individually(self):
+        client = _client({"results": [{"id": "a", "text": "alpha"}, {"id": "b", "text": "  "}]})
+        fallback = MagicMock(side_effect=lambda item_id: {"text": f"solo {item_id}"})
+
+        results = _batch(client, {"a": "pa", "b": "pb", "c": "pc"}, fallback)
+
+        assert results["a"] == {"text": "alpha"}
+        assert results["b"] == {"text": "solo b"}
+        assert results["c"] == {"text": "solo c"}
+        assert sorted(call.args[0] for call in fallback.call_args_list) == ["b", "c"]
+
+    def test_validate_rejects_items_into_fallback(self):
+        client = _client({"results": [{"id": "a", "text": "ok"}, {"id": "b", "text": "bad"}]})
+        fallback = MagicMock(return_value={"text": "fixed"})
+
+        results = _batch(
+            client,
+            {"a": "pa", "b": "pb"},
+            fallback,
+            validate=lambda item_id, result: result["text"] != "bad",
+        )
+
+        assert results == {"a": {"text": "ok"}, "b": {"text": "fixed"}}
+        fallback.assert_called_once_with("b")
+
+    def test_failed_request_falls_back_for_every_item(self):
+        client = MagicMock()
+        client.responses.create.return_value = SimpleNamespace(output_text="not json", usage=None)
+        fallback = MagicMock(side_effect=lambda item_id: {"text": item_id})
+
+        results = _batch(client, {"a": "pa", "b": "pb"}, fallback)
+
+        assert results == {"a": {"text": "a"}, "b": {"text": "b"}}
+
+    def test_chunks_by_max_items(self):
+        client = _client(
+            {"results": [{"id": "1", "text": "x"}, {"id": "2", "text": "y"}]},
+            {"results": [{"id": "3", "text": "z"}]},
+        )
+        with patch("integrations.openai.OPENAI_BATCH_MAX_ITEMS", 2):
+            results = _batch(client, {"1": "p", "2": "p", "3": "p"}, MagicMock())
+
+        assert client.responses.create.call_count == 2
+        assert set(results) == {"1", "2", "3"}
+
+
+class TestSpecialDayContentBatch:
+    def test_multiple_observances_share_one_call(self):
+        from services.special_day import generate_special_day_content
+
+        days = [
+            SpecialDay("18/10", "Day One", "Culture", "First"),
+            SpecialDay("18/10", "Day Two", "Tech", "Second"),
+        ]
+        client = _client(
+            {
+                "results": [
+                    {"id": "1", "teaser": "Teaser one", "details": "Details one"},
+                    {"id": "2", "teaser": "Teaser two", "details": "Details two"},
+                ]
+            }
+        )
+
+        with (
+            patch("integrations.openai.get_openai_client", return_value=client),
+            patch("services.special_day._fetch_facts_text", return_value=""),
+            patch(
+                "services.special_day.get_emoji_context_for_ai",
+                return_value={"emoji_examples": ""},
+            ),
+        ):
+            content = generate_special_day_content(days, test_date=datetime(2026, 10, 18))
+
+        assert client.responses.create.call_count == 1
+        assert content["Day One"] == ("Teaser one", "Details one")
+        assert content["Day Two"] == ("Teaser two", "Details two")
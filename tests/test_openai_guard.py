@@ -0,0 +1,203 @@
+"""Tests for the OpenAI circuit breaker and adaptive concurrency limit."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import APITimeoutError, BadRequestError, RateLimitError
+
+from integrations import openai_guard as g
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/responses")
+
+
+def _rate_limit_error():
+    return RateLimitError("slow down", response=httpx.Response(429, request=_REQUEST), body=None)
+
+
+def _bad_request_error():
+    return BadRequestError("bad", response=httpx.Response(400, request=_REQUEST), body=None)
+
+
+def _fail(operation, error):
+    with pytest.raises(type(error)):
+        with g.guard(operation):
+            raise error
+
+
+@pytest.fixture(autouse=True)
+def _fresh_controls():
+    g.reset_traffic_control()
+    with (
+        patch.object(g, "OPENAI_CIRCUIT_FAILURE_THRESHOLD", 3),
+        patch.object(g, "OPENAI_CIRCUIT_COOLDOWN_SECONDS", 60),
+        patch.object(g, "OPENAI_CONCURRENCY_MAX", 8),
+    ):
+        yield
+    g.reset_traffic_control()
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_transient_failures(self):
+        for _ in range(3):
+            _fail("text", APITimeoutError(request=_REQUEST))
+
+        assert not g.is_available("text")
+        with pytest.raises(g.OpenAIUnavailableError):
+            with g.guard("text"):
+                pytest.fail("request must not run while the circuit is open")
+
+        # Other operations are unaffected
+        assert g.is_available("image")
+
+    def test_client_errors_do_not_trip(self):
+        for _ in range(5):
+            _fail("text", _bad_request_error())
+        assert g.is_available("text")
+
+    def test_half_open_probe_success_closes(self):
+        for _ in range(3):
+            _fail("vision", APITimeoutError(request=_REQUEST))
+
+        breaker, _ = g._get_controls("vision")
+        breaker.opened_at -= 61  # cooldown elapsed
+
+        with g.guard("vision"):
+            pass
+
+        assert g.get_traffic_status()["vision"]["state"] == "closed"
+
+    def test_half_open_probe_failure_reopens(self):
+        for _ in range(3):
+            _fail("web_search", APITimeoutError(request=_REQUEST))
+
+        breaker, _ = g._get_controls("web_search")
+        breaker.opened_at -= 61
+        _fail("web_search", APITimeoutError(request=_REQUEST))
+
+        status = g.get_traffic_status()["web_search"]
+        assert status["state"] == "open"
+        assert status["open_count"] == 2
+
+
+class TestAdaptiveLimiter:
+    def test_rate_limit_halves_limit(self):
+        _fail("image", _rate_limit_error())
+        assert g.get_traffic_status()["image"]["limit"] == 4
+
+    def test_slow_success_halves_and_fast_success_recovers(self):
+        _, limiter = g._get_controls("text")
+        limiter.on_success(limiter.latency_target + 1)
+        assert limiter.snapshot()["limit"] == 4
+
+        for _ in range(40):
+            limiter.on_success(0.1)
+        assert limiter.snapshot()["limit"] == 8
+
+    def test_acquire_times_out_when_saturated(self):
+        _, limiter = g._get_controls("text")
+        limiter.limit = 1.0
+        assert limiter.acquire(timeout=0.01)
+        assert not limiter.acquire(timeout=0.01)
+        limiter.release()
+        assert limiter.acquire(timeout=0.01)
+
+
+class TestCallerFallback:
+    def test_complete_fails_fast_when_open(self):
+        from integrations.openai import complete
+
+        for _ in range(3):
+            _fail("text", APITimeoutError(request=_REQUEST))
+
+        client = MagicMock()
+        with patch("integrations.openai.get_openai_client", return_value=client):
+            with pytest.raises(g.OpenAIUnavailableError):
+                complete(input_text="hi", model="gpt-5.5")
+        client.responses.create.assert_not_called()
+
+    def test_image_generation_skipped_when_open(self):
+        from services import image_generator as ig
+
+        for _ in range(3):
+            _fail("image", APITimeoutError(request=_REQUEST))
+
+        with patch.object(ig, "download_and_prepare_profile_photo") as download:
+            assert ig.generate_birthday_image({"preferred_name": "Alice"}) is None
+        download.assert_not_called()
+
+
+class TestAsyncGuard:
+    def test_shares_breaker_with_sync_guard(self):
+        async def fail():
+            async with g.async_guard("text"):
+                raise APITimeoutError(request=_REQUEST)
+
+        for _ in range(3):
+            with pytest.raises(APITimeoutError):
+                asyncio.run(fail())
+
+        assert not g.is_available("text")
+        with pytest.raises(g.OpenAIUnavailableError):
+            with g.guard("text"):
+                pytest.fail("request must not run while the circuit is open")
+
+    def test_acomplete_returns_text(self):
+        from integrations.openai import acomplete
+
+        client = MagicMock()
+        client.responses.create = AsyncMock(
+            return_value=MagicMock(output_text="Hello!", usage=None)
+        )
+        with patch("integrations.openai.get_async_openai_client", return_value=client):
+            assert asyncio.run(acomplete(input_text="hi", model="gpt-5.5")) == "Hello!"
+        assert g.get_traffic_status()["text"]["in_flight"] == 0
+
+    def test_cancelled_half_open_probe_releases_breaker(self):
+        for _ in range(3):
+            _fail("text", APITimeoutError(request=_REQUEST))
+        breaker, _ = g._get_controls("text")
+        breaker.opened_at -= 61
+
+        async def probe_then_cancel():
+            started = asyncio.Event()
+
+            async def probe():
+                async with g.async_guard("text"):
+                    started.set()
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(probe())
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(probe_then_cancel())
+
+        status = g.get_traffic_status()["text"]
+        assert status["state"] == "half_open"
+        assert status["consecutive_failures"] == 3  # Cancellation is not a failure
+        assert status["in_flight"] == 0
+        with g.guard("text"):  # The next call may probe again
+            pass
+        assert g.get_traffic_status()["text"]["state"] == "closed"
+
+    def test_cancelled_slot_wait_returns_slot(self):
+        _, limiter = g._get_controls("image")
+        limiter.limit = 1.0
+        assert limiter.acquire(0)
+
+        async def wait_then_cancel():
+            task = asyncio.create_task(g._acquire_slot(limiter))
+            await asyncio.sleep(0.05)  # Thread is now blocked in acquire()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            limiter.release()  # The waiting thread wins the slot after cancellation
+            await asyncio.sleep(0.2)
+
+        with patch.object(g, "OPENAI_SLOT_WAIT_SECONDS", 5):
+            asyncio.run(wait_then_cancel())
+        assert limiter.snapshot()["in_flight"] == 0
@@ -0,0 +1,112 @@
+"""Tests for the OpenAI usage ledger (tokens, latency, cost, daily rollups)."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from integrations import openai_usage as u
+from integrations.openai_guard import OpenAIUnavailableError
+
+
+@pytest.fixture(autouse=True)
+def usage_file(tmp_path):
+    path = str(tmp_path / "openai_usage.json")
+    with (
+        patch.object(u, "OPENAI_USAGE_FILE", path),
+        patch.object(u, "OPENAI_USAGE_LOCK_FILE", path + ".lock"),
+    ):
+        u.reset_usage()
+        yield path
+        u.reset_usage()
+
+
+def _text_response(input_tokens, output_tokens):
+    usage = SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens)
+    return SimpleNamespace(usage=usage, output_text="ok")
+
+
+class TestTrackUsage:
+    def test_records_tokens_cost_and_latency_per_context(self):
+        with u.track_usage("BIRTHDAY_MESSAGE", "text", "gpt-4.1-mini") as call:
+            call.response = _text_response(1000, 500)
+
+        stats = u.get_usage_summary()["BIRTHDAY_MESSAGE"]
+        assert stats["calls"] == 1
+        assert stats["input_tokens"] == 1000
+        assert stats["output_tokens"] == 500
+        assert stats["cost_usd"] == pytest.approx((1000 * 0.40 + 500 * 1.60) / 1_000_000)
+        assert sum(stats["latency_buckets"]) == 1
+        assert stats["models"] == {"gpt-4.1-mini": 1}
+
+    def test_errors_counted_and_reraised(self):
+        with pytest.raises(RuntimeError):
+            with u.track_usage("IMAGE_TITLE_GEN", "text", "gpt-5"):
+                raise RuntimeError("boom")
+
+        stats = u.get_usage_summary()["IMAGE_TITLE_GEN"]
+        assert stats["calls"] == 1
+        assert stats["errors"] == 1
+
+    def test_open_circuit_counts_as_skipped_not_error(self):
+        with pytest.raises(OpenAIUnavailableError):
+            with u.track_usage("WEB_SEARCH_QUERY", "web_search", "gpt-5"):
+                raise OpenAIUnavailableError("web_search", "circuit open")
+
+        stats = u.get_usage_summary()["WEB_SEARCH_QUERY"]
+        assert stats["calls"] == 0
+        assert stats["skipped"] == 1
+        assert sum(stats["latency_buckets"]) == 0
+
+    def test_image_responses_count_images(self):
+        with u.track_usage("IMAGE_GENERATE_TEXT", "image", "gpt-image-1") as call:
+            call.response = SimpleNamespace(data=[object()], usage=None)
+
+        assert u.get_usage_summary()["IMAGE_GENERATE_TEXT"]["images"] == 1
+
+
+class TestRollups:
+    def test_flush_persists_and_merges_daily_rollups(self, usage_file):
+        u.record_call("BIRTHDAY_MESSAGE", "text", latency=1.5, input_tokens=10)
+        assert u.flush_usage()
+        u.record_call("BIRTHDAY_MESSAGE", "text", latency=3.0, input_tokens=5)
+        assert u.flush_usage()
+
+        with open(usage_file) as f:
+            days = json.load(f)["days"]
+        (day,) = days.values()
+        assert day["BIRTHDAY_MESSAGE"]["calls"] == 2
+        assert day["BIRTHDAY_MESSAGE"]["input_tokens"] == 15
+        assert day["BIRTHDAY_MESSAGE"]["latency_max"] == 3.0
+
+    def test_summary_includes_unflushed_counters(self):
+        u.record_call("BIRTHDAY_MESSAGE", "text", latency=1.0)
+        u.flush_usage()
+        u.record_call("BIRTHDAY_MESSAGE", "text", latency=1.0)
+
+        assert u.get_usage_summary()["BIRTHDAY_MESSAGE"]["calls"] == 2
+
+    def test_old_days_pruned_on_flush(self, usage_file):
+        with open(usage_file, "w") as f:
+            json.dump({"days": {"2000-01-01": {"OLD": u._empty_stats("text")}}}, f)
+        u.record_call("NEW", "text", latency=1.0)
+        u.flush_usage()
+
+        with open(usage_file) as f:
+            assert "2000-01-01" not in json.load(f)["days"]
+
+
+def test_latency_percentile_uses_bucket_bounds():
+    for latency in (0.2, 0.3, 0.4, 30.0):
+        u.record_call("CTX", "text", latency=latency)
+    stats = u.get_usage_summary()["CTX"]
+
+    assert u.latency_percentile(stats, 0.5) == 0.5
+    assert u.latency_percentile(stats, 0.95) == 30.0
+
+
+def test_estimate_cost_uses_longest_prefix():
+    assert u.estimate_cost("gpt-5-mini", 1_000_000, 0) == pytest.approx(0.25)
+    assert u.estimate_cost("gpt-5.5", 1_000_000, 0) == pytest.approx(1.25)
+    assert u.estimate_cost("unknown-model", 1_000_000, 1_000_000) == 0.0
@@ -275,3 +275,69 @@ class TestIsAdmin:
             result = is_admin(mock_slack_app, "U123456")
 
         assert result is False
+
+
+class TestSlackCallRecorder:
+    """Test record_slack_calls() tallies per job run."""
+
+    def _client(self, side_effect=None):
+        from unittest.mock import MagicMock
+
+        from slack_sdk import WebClient
+
+        from slack.client import instrument_client
+
+        client = WebClient(token="xoxb-test")
+        client.api_call = MagicMock(return_value={"ok": True}, side_effect=side_effect)
+        return instrument_client(client)
+
+    def test_counts_calls_by_method_and_nests(self):
+        from slack.client import record_slack_calls
+
+        client = self._client()
+        with record_slack_calls("outer") as outer:
+            client.users_info(user="U1")
+            with record_slack_calls("inner") as inner:
+                client.users_info(user="U2")
+                client.chat_postMessage(channel="C1", text="hi")
+
+        assert inner.summary()["total"] == 2
+        summary = outer.summary()
+        assert summary["total"] == 3
+        assert summary["methods"]["users.info"]["count"] == 2
+        assert not summary["over_budget"]
+
+    def test_budget_exceeded_logs_warning_and_errors_counted(self, slack_api_error):
+        from slack.client import record_slack_calls
+
+        client = self._client(side_effect=slack_api_error("ratelimited"))
+        with patch("slack.client.logger") as log:
+            with record_slack_calls("canvas_refresh", budget=1) as recorder:
+                for _ in range(2):
+                    try:
+                        client.users_info(user="U1")
+                    except Exception:
+                        pass
+
+        summary = recorder.summary()
+        assert summary["over_budget"] and summary["errors"] == 2
+        assert "over budget of 1" in log.warning.call_args[0][0]
+
+    def test_retries_counted_through_wrapped_handlers(self):
+        from unittest.mock import MagicMock
+
+        from slack.client import _CountingRetryHandler, instrument_client, record_slack_calls
+
+        client = MagicMock()
+        client._brightday_instrumented = False
+        inner = MagicMock(max_retry_count=2)
+        inner.can_retry.return_value = True
+        client.retry_handlers = [inner]
+        instrument_client(client)
+
+        handler = client.retry_handlers[0]
+        assert isinstance(handler, _CountingRetryHandler)
+        request = MagicMock(url="https://slack.com/api/users.info")
+        with record_slack_calls("job") as recorder:
+            assert handler.can_retry(state=MagicMock(), request=request)
+        assert recorder.summary()["retries"] == 1
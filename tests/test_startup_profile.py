@@ -0,0 +1,44 @@
+"""Tests for the --profile-startup import timer."""
+
+import builtins
+import sys
+
+import pytest
+
+from utils import startup_profile
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(startup_profile, "_records", {})
+    monkeypatch.setattr(startup_profile, "_phases", [])
+    monkeypatch.setattr(startup_profile, "_started", None)
+    yield startup_profile
+    startup_profile.stop()
+
+
+def test_imports_are_timed_with_self_time(profiler, tmp_path, monkeypatch):
+    (tmp_path / "slowpkg").mkdir()
+    (tmp_path / "slowpkg" / "__init__.py").write_text("from . import heavy\n")
+    (tmp_path / "slowpkg" / "heavy.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("slowpkg", "slowpkg.heavy"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    profiler.checkpoint("ignored before start")
+    profiler.start()
+    import slowpkg  # noqa: F401
+
+    profiler.checkpoint("imports")
+    profiler.stop()
+
+    modules = profiler.get_profile()["modules"]
+    package_total, package_self = modules["slowpkg"]
+    heavy_total, heavy_self = modules["slowpkg.heavy"]
+    assert heavy_self >= 0.05 and package_total >= heavy_total
+    assert package_self < 0.05  # The sleep is attributed to the submodule
+    assert [name for name, _ in profiler.get_profile()["phases"]] == ["imports"]
+    assert builtins.__import__ is startup_profile._original_import
+
+    report = profiler.report()
+    assert "slowpkg.heavy" in report and "imports" in report
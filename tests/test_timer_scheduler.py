@@ -0,0 +1,479 @@
+"""Tests for the timer-heap scheduler and scheduler job registration."""
+
+import threading
+from datetime import date, datetime, time, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from utils.date_utils import get_celebration_instant_utc
+from utils.timer_scheduler import (
+    JobExecutor,
+    TimerScheduler,
+    daily_at,
+    every_hour_at,
+    monthly_at,
+    once_at,
+    weekly_at,
+)
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestTriggers:
+    def test_every_hour_at_multiple_minutes(self):
+        trigger = every_hour_at(0, 30)
+        assert trigger(datetime(2026, 3, 1, 9, 10)) == datetime(2026, 3, 1, 9, 30)
+        assert trigger(datetime(2026, 3, 1, 9, 30)) == datetime(2026, 3, 1, 10, 0)
+        assert trigger(datetime(2026, 3, 1, 23, 45)) == datetime(2026, 3, 2, 0, 0)
+
+    def test_daily_at_rolls_over_after_fire_time(self):
+        trigger = daily_at(time(9, 0))
+        assert trigger(datetime(2026, 3, 1, 8, 59)) == datetime(2026, 3, 1, 9, 0)
+        assert trigger(datetime(2026, 3, 1, 9, 0)) == datetime(2026, 3, 2, 9, 0)
+
+    def test_weekly_at(self):
+        trigger = weekly_at(6, time(3, 0))  # Sunday
+        assert trigger(datetime(2026, 3, 4, 12, 0)) == datetime(2026, 3, 8, 3, 0)
+        assert trigger(datetime(2026, 3, 8, 3, 0)) == datetime(2026, 3, 15, 3, 0)
+
+    def test_monthly_at_rolls_into_next_month_and_year(self):
+        trigger = monthly_at(1, time(3, 0))
+        assert trigger(datetime(2026, 3, 1, 2, 0)) == datetime(2026, 3, 1, 3, 0)
+        assert trigger(datetime(2026, 3, 1, 3, 0)) == datetime(2026, 4, 1, 3, 0)
+        assert trigger(datetime(2026, 12, 15, 0, 0)) == datetime(2027, 1, 1, 3, 0)
+
+
+class TestTimerScheduler:
+    def test_runs_only_due_jobs_in_order_and_reschedules(self):
+        clock = FakeClock(datetime(2026, 3, 1, 8, 0))
+        ran = []
+        sched = TimerScheduler(clock=clock)
+        sched.add_job("late", lambda: ran.append("late"), daily_at(time(10, 0)))
+        sched.add_job("early", lambda: ran.append("early"), daily_at(time(9, 0)))
+
+        assert sched.run_pending() == 0
+        assert sched.seconds_until_next() == 3600
+
+        clock.now = datetime(2026, 3, 1, 10, 0)
+        assert sched.run_pending() == 2
+        assert ran == ["early", "late"]
+        jobs = {j["name"]: j for j in sched.jobs()}
+        assert jobs["early"]["next_run"] == "2026-03-02T09:00:00"
+        assert jobs["early"]["runs"] == 1
+
+    def test_failures_and_durations_recorded(self):
+        clock = FakeClock(datetime(2026, 3, 1, 9, 0))
+        done = []
+        sched = TimerScheduler(clock=clock, on_job_done=done.append)
+
+        def boom():
+            raise RuntimeError("nope")
+
+        job = sched.add_job("boom", boom, every_hour_at(0))
+        clock.now = datetime(2026, 3, 1, 10, 0)
+        sched.run_pending()
+
+        assert job.runs == 1
+        assert job.failures == 1
+        assert job.last_error == "nope"
+        assert job.last_duration is not None
+        assert done == [job]
+
+    def test_removed_and_replaced_jobs_do_not_fire_stale_entries(self):
+        clock = FakeClock(datetime(2026, 3, 1, 8, 0))
+        ran = []
+        sched = TimerScheduler(clock=clock)
+        sched.add_job("a", lambda: ran.append("a"), daily_at(time(9, 0)))
+        sched.add_job("b", lambda: ran.append("b"), daily_at(time(9, 0)))
+        sched.remove_job("a")
+        sched.add_job("b", lambda: ran.append("b2"), daily_at(time(11, 0)))
+
+        clock.now = datetime(2026, 3, 1, 10, 0)
+        assert sched.run_pending() == 0
+        clock.now = datetime(2026, 3, 1, 11, 0)
+        sched.run_pending()
+        assert ran == ["b2"]
+
+    def test_one_shot_job_removed_after_run(self):
+        clock = FakeClock(datetime(2026, 3, 1, 8, 0))
+        ran = []
+        sched = TimerScheduler(clock=clock)
+        sched.add_job("once", lambda: ran.append(1), once_at(datetime(2026, 3, 1, 9, 0)), True)
+
+        clock.now = datetime(2026, 3, 1, 9, 0)
+        assert sched.run_pending() == 1
+        assert sched.get_job("once") is None
+        assert sched.seconds_until_next() is None
+        assert ran == [1]
+
+    def test_one_shot_job_can_rearm_itself(self):
+        clock = FakeClock(datetime(2026, 3, 1, 9, 0))
+        sched = TimerScheduler(clock=clock)
+
+        def rearm():
+            sched.add_job("once", rearm, once_at(datetime(2026, 3, 1, 12, 0)), one_shot=True)
+
+        sched.add_job("once", rearm, once_at(datetime(2026, 3, 1, 8, 0)), one_shot=True)
+        assert sched.run_pending() == 1  # Past instant fires immediately
+        assert sched.get_job("once").next_run == datetime(2026, 3, 1, 12, 0)
+
+    def test_sleeping_loop_woken_by_new_due_job(self):
+        sched = TimerScheduler()
+        fired = threading.Event()
+        thread = threading.Thread(target=sched.run_forever, daemon=True)
+        thread.start()
+        # No jobs: the loop waits indefinitely until add_job() notifies it
+        sched.add_job("now", fired.set, lambda after: after)
+        assert fired.wait(2)
+        sched.stop()
+        thread.join(2)
+        assert not thread.is_alive()
+
+
+class TestRunJournal:
+    def test_success_journaled_and_restored(self):
+        clock = FakeClock(datetime(2026, 3, 1, 3, 0))
+        sched = TimerScheduler(clock=clock)
+        sched.add_job("ok", lambda: None, daily_at(time(3, 0)))
+        sched.add_job("bad", lambda: 1 / 0, daily_at(time(3, 0)))
+        sched.run_job(sched.get_job("ok"))
+        sched.run_job(sched.get_job("bad"))
+        saved = {j["name"]: j for j in sched.jobs()}
+        assert saved["ok"]["last_success"] == "2026-03-01T03:00:00"
+        assert saved["bad"]["last_success"] is None
+
+        restored = TimerScheduler(clock=clock)
+        restored.add_job("ok", lambda: None, daily_at(time(3, 0)))
+        restored.restore_stats(saved)
+        assert restored.get_job("ok").last_success == datetime(2026, 3, 1, 3, 0)
+
+    def test_missed_windows_replayed_staggered(self):
+        clock = FakeClock(datetime(2026, 3, 9, 12, 0))
+        sched = TimerScheduler(clock=clock)
+        # Sunday 03:00 window on Mar 8 passed since the last success on Mar 1
+        sched.add_job("weekly", lambda: None, weekly_at(6, time(3, 0)), catch_up=True)
+        sched.add_job("monthly", lambda: None, monthly_at(1, time(3, 0)), catch_up=True)
+        sched.add_job("daily", lambda: None, daily_at(time(3, 0)), catch_up=True)
+        sched.add_job("no_catch_up", lambda: None, daily_at(time(3, 0)))
+        sched.add_job("never_ran", lambda: None, daily_at(time(3, 0)), catch_up=True)
+        sched.restore_stats(
+            {
+                "weekly": {"last_success": "2026-03-01T03:00:00"},
+                "monthly": {"last_success": "2026-03-01T03:00:00"},
+                "daily": {"last_success": "2026-03-08T03:00:00"},
+                "no_catch_up": {"last_success": "2026-03-01T03:00:00"},
+            }
+        )
+
+        assert sched.schedule_missed_runs(60) == ["daily", "weekly"]
+        assert sched.get_job("daily").next_run == datetime(2026, 3, 9, 12, 1)
+        assert sched.get_job("weekly").next_run == datetime(2026, 3, 9, 12, 2)
+        assert sched.get_job("monthly").next_run == datetime(2026, 4, 1, 3, 0)
+
+        clock.now = datetime(2026, 3, 9, 12, 2)
+        assert sched.run_pending() == 2
+        # After the catch-up run the normal schedule resumes
+        assert sched.get_job("weekly").next_run == datetime(2026, 3, 15, 3, 0)
+
+
+class TestJobExecutor:
+    def _scheduler(self, clock, **kwargs):
+        executor = JobExecutor({"birthday": 1, "maintenance": 1}, default_pool="maintenance")
+        return TimerScheduler(clock=clock, executor=executor, **kwargs)
+
+    def test_slow_maintenance_job_does_not_delay_birthday_job(self):
+        clock = FakeClock(datetime(2026, 3, 1, 2, 59))
+        release, celebrated = threading.Event(), threading.Event()
+        sched = self._scheduler(clock)
+        sched.add_job("scrape", lambda: release.wait(5), daily_at(time(3, 0)), pool="maintenance")
+        sched.add_job("birthday", celebrated.set, daily_at(time(3, 0)), pool="birthday")
+
+        clock.now = datetime(2026, 3, 1, 3, 0)
+        assert sched.run_pending() == 2
+        assert celebrated.wait(2)
+        assert sched.get_job("scrape").in_flight
+        release.set()
+
+    def test_job_still_running_is_not_started_twice(self):
+        clock = FakeClock(datetime(2026, 3, 1, 9, 0))
+        release, started = threading.Event(), threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+
+        sched = self._scheduler(clock)
+        job = sched.add_job("slow", slow, every_hour_at(0))
+        clock.now = datetime(2026, 3, 1, 10, 0)
+        sched.run_pending()
+        assert started.wait(2)
+
+        clock.now = datetime(2026, 3, 1, 11, 0)
+        assert sched.run_pending() == 0
+        assert job.skipped == 1
+        assert job.next_run == datetime(2026, 3, 1, 12, 0)
+        release.set()
+        assert calls == [1]
+
+    def test_overrunning_job_reported_as_timed_out(self):
+        clock = FakeClock(datetime(2026, 3, 1, 9, 0))
+        release, reported = threading.Event(), threading.Event()
+        sched = self._scheduler(clock, on_job_done=lambda job: reported.set())
+        job = sched.add_job("hang", lambda: release.wait(5), every_hour_at(0), timeout=0.05)
+
+        clock.now = datetime(2026, 3, 1, 10, 0)
+        sched.run_pending()
+        assert reported.wait(2)
+        assert job.timeouts == 1 and job.failures == 1
+        assert job.last_error.startswith("Timed out")
+        assert job.in_flight  # Abandoned, but still not restartable
+        release.set()
+
+
+class TestRefreshSchedule:
+    def _jobs(self, timezone_enabled, mode):
+        from services import scheduler as s
+
+        with (
+            patch.object(s, "_scheduler", TimerScheduler()),
+            patch("storage.settings.load_timezone_settings", return_value=(timezone_enabled, 1)),
+            patch(
+                "storage.special_days.load_special_days_config",
+                return_value={"announcement_mode": mode},
+            ),
+        ):
+            s.refresh_schedule()
+            return {j["name"] for j in s._scheduler.jobs()}
+
+    def test_timezone_mode_selects_birthday_job(self):
+        jobs = self._jobs(True, "daily")
+        assert {"birthday_plan", "birthday_replan", "special_days_daily"} <= jobs
+        assert "birthday_daily" not in jobs and "special_days_weekly" not in jobs
+
+        jobs = self._jobs(False, "weekly")
+        assert "birthday_daily" in jobs and "special_days_weekly" in jobs
+        assert not jobs & {"birthday_plan", "birthday_replan", "birthday_trigger"}
+
+
+class _EndLoop(BaseException):
+    pass
+
+
+class TestLeadership:
+    def test_demoted_standby_still_runs_jobs_after_promotion(self):
+        from services import scheduler as s
+
+        sched = TimerScheduler()
+        run_forever = sched.run_forever
+        entered, returned = threading.Event(), threading.Event()
+
+        def tracked_run_forever():
+            entered.set()
+            run_forever()
+            returned.set()
+            raise _EndLoop  # Let the test end the otherwise endless loop
+
+        sched.run_forever = tracked_run_forever
+
+        def run():
+            try:
+                s.run_scheduler()
+            except _EndLoop:
+                pass
+
+        with (
+            patch.object(s, "_scheduler", sched),
+            patch.object(s, "_leader_event", threading.Event()),
+            patch.object(s, "_leading", False),
+            patch.object(s, "_elected_at_startup", False),
+            patch.object(s, "_scheduler_running", False),
+            patch.object(s, "_last_heartbeat", None),
+            patch.object(s, "_start_leading") as start_leading,
+        ):
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+
+            s._on_demoted()  # Standby loses a lease it never used
+            s._on_elected()
+            assert entered.wait(2)
+            start_leading.assert_called_once_with(True)
+            assert not returned.wait(0.2), "a stale stop() ended the loop at once"
+
+            s._on_demoted()  # Now leading: the loop stops
+            thread.join(2)
+            assert returned.is_set() and not thread.is_alive()
+
+
+class TestSchedulerSummary:
+    def _summary(self, **health):
+        from services import scheduler as s
+
+        health = {"status": "ok", "role": "leader", "scheduled_jobs": 4, **health}
+        with patch.object(s, "get_scheduler_health", return_value=health):
+            return s.get_scheduler_summary()
+
+    def test_zero_executions_reports_no_runs_yet(self):
+        summary = self._summary(total_executions=0, success_rate_percent=None)
+        assert summary == "✅ Scheduler healthy - 4 jobs, no runs yet"
+
+    def test_reports_success_rate(self):
+        summary = self._summary(total_executions=8, success_rate_percent=87.5)
+        assert summary == "✅ Scheduler healthy - 4 jobs, 87.5% success rate"
+
+
+class TestCelebrationPlanning:
+    def test_celebration_instant_per_timezone(self):
+        day = date(2026, 3, 10)
+        assert get_celebration_instant_utc("UTC", day, time(9, 0)) == datetime(
+            2026, 3, 10, 9, 0, tzinfo=timezone.utc
+        )
+        # UTC-5: local 09:00 is 14:00 UTC the same day
+        assert get_celebration_instant_utc("America/Bogota", day, time(9, 0)) == datetime(
+            2026, 3, 10, 14, 0, tzinfo=timezone.utc
+        )
+        # UTC+14 reached 09:00 on the 10th before the UTC day began: qualifies at midnight
+        assert get_celebration_instant_utc("Pacific/Kiritimati", day, time(9, 0)) == datetime(
+            2026, 3, 10, 0, 0, tzinfo=timezone.utc
+        )
+        # UTC-10 at 23:00 local is the next UTC day: never qualifies on the 10th
+        assert get_celebration_instant_utc("Pacific/Honolulu", day, time(23, 0)) is None
+
+    def test_plan_arms_one_shot_trigger_at_earliest_instant(self):
+        from services import scheduler as s
+
+        instant = datetime(2030, 3, 10, 14, 0, tzinfo=timezone.utc)
+        with (
+            patch.object(s, "_scheduler", TimerScheduler()),
+            patch.object(s, "_timezone_enabled", True),
+            patch.object(s, "_app_instance", MagicMock()),
+            patch("services.birthday.plan_timezone_celebration", return_value=instant),
+        ):
+            s.plan_birthday_trigger()
+            job = s._scheduler.get_job("birthday_trigger")
+            assert job.one_shot
+            assert job.next_run == instant.astimezone().replace(tzinfo=None)
+
+            with patch("services.birthday.plan_timezone_celebration", return_value=None):
+                s.plan_birthday_trigger()
+            assert s._scheduler.get_job("birthday_trigger") is None
+
+    def test_failed_trigger_is_rearmed_after_retry_interval(self):
+        from config import SCHEDULER_BIRTHDAY_RETRY_SECONDS
+        from services import scheduler as s
+
+        overdue = datetime.now(timezone.utc) - timedelta(hours=1)
+        callback = MagicMock(side_effect=RuntimeError("pipeline down"))
+        with (
+            patch.object(s, "_scheduler", TimerScheduler()),
+            patch.object(s, "_timezone_enabled", True),
+            patch.object(s, "_app_instance", MagicMock()),
+            patch.object(s, "_timezone_aware_callback", callback),
+            patch.object(s, "_trigger_not_before", None),
+            patch("storage.settings.load_timezone_settings", return_value=(True, None)),
+            patch("services.birthday.plan_timezone_celebration", return_value=overdue),
+        ):
+            s.plan_birthday_trigger()
+            assert s._scheduler.run_pending() == 1
+            assert s._scheduler.run_pending() == 0
+            assert callback.call_count == 1
+
+            job = s._scheduler.get_job("birthday_trigger")
+            retry_at = datetime.now() + timedelta(seconds=SCHEDULER_BIRTHDAY_RETRY_SECONDS)
+            assert retry_at - timedelta(seconds=5) <= job.next_run <= retry_at
+
+            # A replan in the meantime keeps the backoff; the next UTC day drops it
+            s.plan_birthday_trigger()
+            assert s._scheduler.get_job("birthday_trigger").next_run == job.next_run
+            s._plan_new_day()
+            assert s._scheduler.get_job("birthday_trigger").next_run <= datetime.now()
+
+    def test_invalidations_coalesce_into_one_pending_replan(self):
+        from services import scheduler as s
+
+        with (
+            patch.object(s, "_scheduler", TimerScheduler()),
+            patch.object(s, "_timezone_enabled", True),
+        ):
+            s.invalidate_birthday_plan("a")
+            first = s._scheduler.get_job("birthday_replan").next_run
+            s.invalidate_birthday_plan("b")
+            assert s._scheduler.get_job("birthday_replan").next_run == first
+            assert len(s._scheduler) == 1
+
+        with (
+            patch.object(s, "_scheduler", TimerScheduler()),
+            patch.object(s, "_timezone_enabled", False),
+        ):
+            s.invalidate_birthday_plan("ignored")
+            assert len(s._scheduler) == 0
+
+    def test_plan_records_cohort_timezones(self):
+        from services import birthday as b
+
+        cohort = [
+            {"user_id": "U1", "timezone": "Asia/Tokyo"},
+            {"user_id": "U2", "timezone": ""},
+        ]
+        with (
+            patch.object(b, "_planned_timezones", {"U9": "UTC"}),
+            patch.object(b, "get_channel_members", return_value=["U1", "U2"]),
+            patch.object(b, "load_birthdays", return_value={}),
+            patch.object(b, "_find_birthdays_today", return_value=cohort),
+        ):
+            b.plan_timezone_celebration(MagicMock(), datetime(2030, 3, 10, tzinfo=timezone.utc))
+            assert b.get_planned_timezone("U1") == "Asia/Tokyo"
+            assert b.get_planned_timezone("U2") == "UTC"
+            assert b.get_planned_timezone("U9") is None
+
+    def test_user_change_replans_only_when_planned_timezone_changes(self):
+        from handlers.event_handler import register_event_handlers
+        from services import birthday as b
+
+        app = MagicMock()
+        handlers = {}
+
+        def capture_event(name):
+            def decorator(func):
+                handlers[name] = func
+                return func
+
+            return decorator
+
+        app.event = capture_event
+        register_event_handlers(app)
+        handle_user_change = handlers["user_change"]
+
+        with (
+            patch.object(b, "_planned_timezones", {"U1": "Asia/Tokyo"}),
+            patch.object(b, "load_birthdays") as load_birthdays,
+            patch("services.scheduler.invalidate_birthday_plan") as invalidate,
+        ):
+            handle_user_change({"user": {"id": "U1", "tz": "Asia/Tokyo"}}, MagicMock())
+            handle_user_change({"user": {"id": "U2", "tz": "Europe/Paris"}}, MagicMock())
+            invalidate.assert_not_called()
+
+            handle_user_change({"user": {"id": "U1", "tz": "Europe/Paris"}}, MagicMock())
+            invalidate.assert_called_once()
+            load_birthdays.assert_not_called()
+
+    def test_saving_birthdays_runs_change_hooks(self, tmp_path):
+        from storage import birthdays as storage
+
+        hook = MagicMock(__name__="hook")
+        with (
+            patch.object(storage, "_change_hooks", []),
+            patch.object(storage, "BIRTHDAYS_JSON_FILE", str(tmp_path / "birthdays.json")),
+            patch.object(storage, "BIRTHDAYS_LOCK_FILE", str(tmp_path / "birthdays.json.lock")),
+            patch.object(storage, "create_backup"),
+        ):
+            storage.register_birthdays_change_hook(hook)
+            storage.register_birthdays_change_hook(hook)
+            storage.save_birthdays({"U1": {"date": "10/03"}})
+        hook.assert_called_once_with()
@@ -0,0 +1,76 @@
+"""Tests for celebration tracing and its OTLP-JSON trace file."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slack.blocks import build_trace_summary_blocks
+from utils import tracing
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(tracing, "TRACE_FILE", str(path))
+    monkeypatch.setattr(tracing, "TRACING_ENABLED", True)
+    return path
+
+
+def test_nested_spans_are_exported_as_otlp_json(trace_file):
+    def generate_image(user_id):
+        with tracing.span("image", user_id=user_id):
+            tracing.add_span("openai.image", 0.01)
+
+    with tracing.start_trace("celebration", mode="TIMEZONE", people=2) as root:
+        with tracing.span("generation"):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                for user_id in ("U1", "U2"):
+                    pool.submit(tracing.bind_context(generate_image), user_id)
+        with pytest.raises(ValueError):
+            with tracing.span("posting"):
+                raise ValueError("channel_not_found")
+        root.set(success=False)
+
+    request = json.loads(trace_file.read_text().strip())
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {s["name"]: s for s in spans}
+    images = [s for s in spans if s["name"] == "image"]
+
+    assert {s["traceId"] for s in spans} == {root.trace_id}
+    assert "parentSpanId" not in by_name["celebration"]
+    assert by_name["generation"]["parentSpanId"] == by_name["celebration"]["spanId"]
+    assert len(images) == 2
+    assert {s["parentSpanId"] for s in images} == {by_name["generation"]["spanId"]}
+    assert by_name["openai.image"]["parentSpanId"] in {s["spanId"] for s in images}
+    assert by_name["posting"]["status"]["code"] == 2
+    assert {"key": "people", "value": {"intValue": "2"}} in by_name["celebration"]["attributes"]
+
+
+def test_spans_outside_a_trace_are_noops(trace_file):
+    with tracing.span("orphan") as orphan:
+        tracing.add_span("slack.chat_postMessage", 0.1)
+    assert orphan is None
+    assert not trace_file.exists()
+
+
+def test_recent_traces_summarize_stages_newest_first(trace_file):
+    for mode in ("SIMPLE", "TIMEZONE"):
+        with tracing.start_trace("celebration", mode=mode, people=1, success=True):
+            with tracing.span("generation"):
+                tracing.add_span("openai.text", 2.0)
+                tracing.add_span("openai.text", 1.0)
+            with tracing.span("posting"):
+                pass
+    with tracing.start_trace("other"):
+        pass
+
+    traces = tracing.get_recent_traces(limit=5)
+
+    assert [t["attributes"]["mode"] for t in traces] == ["TIMEZONE", "SIMPLE"]
+    assert [s["name"] for s in traces[0]["stages"]] == ["generation", "posting"]
+    assert traces[0]["calls"][0] == {"name": "openai.text", "count": 2, "seconds": 3.0}
+
+    blocks, fallback = build_trace_summary_blocks(traces)
+    assert "2 recent" in fallback
+    assert "generation" in blocks[1]["text"]["text"]
@@ -0,0 +1,68 @@
+"""Tests for the ack-first bounded work queue (lanes, shedding, metrics)."""
+
+import asyncio
+import threading
+
+from utils.work_queue import WorkQueue, run_blocking
+
+
+def _queue(workers=1, max_depth=2):
+    return WorkQueue({"interactive": {"workers": workers, "max_depth": max_depth}})
+
+
+def test_runs_submitted_work_and_records_metrics():
+    wq = _queue()
+    done = []
+
+    assert wq.submit("interactive", done.append, "a")
+    assert wq.submit("interactive", done.append, "b")
+    wq.join("interactive")
+
+    stats = wq.stats()["interactive"]
+    assert done == ["a", "b"]
+    assert stats["submitted"] == 2
+    assert stats["completed"] == 2
+    assert stats["depth"] == 0
+    assert stats["wait_max"] >= 0
+    assert stats["wait_p95"] is not None
+
+
+def test_full_lane_sheds_with_fallback():
+    wq = _queue(workers=1, max_depth=1)
+    release, started = threading.Event(), threading.Event()
+    fallback = []
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    wq.submit("interactive", block)
+    assert started.wait(2)  # Worker busy, queue empty
+    assert wq.submit("interactive", lambda: None)  # Fills the queue
+    assert not wq.submit("interactive", lambda: None, on_overflow=lambda: fallback.append(1))
+
+    stats = wq.stats()["interactive"]
+    assert fallback == [1]
+    assert stats["shed"] == 1
+    assert stats["busy"] == 1 and stats["depth"] == 1 and stats["high_water"] == 1
+    release.set()
+    wq.join("interactive")
+
+
+def test_failures_counted_without_killing_worker():
+    wq = _queue()
+    done = []
+
+    wq.submit("interactive", lambda: 1 / 0)
+    wq.submit("interactive", done.append, "after")
+    wq.join("interactive")
+
+    assert done == ["after"]
+    assert wq.stats()["interactive"]["failed"] == 1
+
+
+def test_run_blocking_awaits_work_on_pool_thread():
+    async def main():
+        return await run_blocking(lambda: threading.current_thread().name)
+
+    assert asyncio.run(main()).startswith("blocking")
@@ -8,6 +8,7 @@ Key functions: extract_date(), calculate_age(), get_star_sign(),
 is_celebration_time_for_user(), format_timezone_schedule().
 """
 
+import logging
 import re
 from calendar import month_name
 from datetime import date, datetime, timedelta, timezone
@@ -174,6 +175,40 @@ def check_if_birthday_today(date_str, reference_date=None):
         return False
 
 
+def nearest_birthday_occurrence(date_str, reference_date=None):
+    """
+    Calendar date of a DD/MM birthday closest to a reference moment
+
+    A celebration that finishes late (e.g. a retry after midnight UTC) still
+    maps to the birthday it belongs to, including across New Year.
+
+    Args:
+        date_str: Date in DD/MM format
+        reference_date: Optional reference date or datetime, defaults to now in UTC
+
+    Returns:
+        datetime.date, or None if date_str is not a valid DD/MM date
+    """
+    if not reference_date:
+        reference_date = datetime.now(timezone.utc)
+    if isinstance(reference_date, datetime):
+        reference_date = reference_date.date()
+
+    try:
+        # Parse against a leap year so 29/02 is accepted
+        parsed = datetime.strptime(f"{date_str}/2000", DATE_WITH_YEAR_FORMAT)
+    except ValueError:
+        return None
+
+    occurrences = []
+    for year in (reference_date.year - 1, reference_date.year, reference_date.year + 1):
+        try:
+            occurrences.append(date(year, parsed.month, parsed.day))
+        except ValueError:
+            continue  # 29/02 outside a leap year
+    return min(occurrences, key=lambda d: abs(d - reference_date))
+
+
 def check_if_birthday_today_in_user_timezone(date_str, user_timezone_str):
     """
     Check if a date string in DD/MM format matches today's date in the user's timezone
@@ -455,10 +490,12 @@ def is_celebration_time_for_user(user_timezone_str, target_time=None, utc_moment
 
         is_celebration_time = hour_check and date_check
 
-        logger.debug(
-            f"TIMEZONE: User timezone {user_timezone_str}, current time: {current_user_time.strftime('%Y-%m-%d %H:%M')}, "
-            f"target: {target_time.hour:02d}:00, hour_check: {hour_check}, date_check: {date_check}, result: {is_celebration_time}"
-        )
+        # Called per birthday person every tick; skip building the string unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"TIMEZONE: User timezone {user_timezone_str}, current time: {current_user_time.strftime('%Y-%m-%d %H:%M')}, "
+                f"target: {target_time.hour:02d}:00, hour_check: {hour_check}, date_check: {date_check}, result: {is_celebration_time}"
+            )
 
         return is_celebration_time
 
@@ -469,6 +506,37 @@ def is_celebration_time_for_user(user_timezone_str, target_time=None, utc_moment
         return False
 
 
+def get_celebration_instant_utc(user_timezone_str, utc_date, target_time=None):
+    """
+    Earliest UTC instant on a UTC day at which it is celebration time for a user
+
+    Mirrors is_celebration_time_for_user(): the user's local date must equal the
+    UTC date and the local time must have reached the target time.
+
+    Args:
+        user_timezone_str: User's timezone string (e.g., "America/New_York")
+        utc_date: The UTC calendar date (datetime.date) being celebrated
+        target_time: Time to celebrate as datetime.time object (default: TIMEZONE_CELEBRATION_TIME)
+
+    Returns:
+        Aware UTC datetime, or None if the user never qualifies during that UTC day
+    """
+    if target_time is None:
+        target_time = TIMEZONE_CELEBRATION_TIME
+
+    user_tz = get_timezone_object(user_timezone_str)
+    day_start = datetime.combine(utc_date, datetime.min.time(), tzinfo=timezone.utc)
+    day_end = day_start + timedelta(days=1)
+
+    local_target = datetime.combine(utc_date, target_time, tzinfo=user_tz)
+    local_day_end = datetime.combine(utc_date + timedelta(days=1), datetime.min.time(), user_tz)
+
+    earliest = max(local_target.astimezone(timezone.utc), day_start)
+    if earliest >= min(local_day_end.astimezone(timezone.utc), day_end):
+        return None
+    return earliest
+
+
 def get_user_current_time(user_timezone_str):
     """
     Get current time in user's timezone
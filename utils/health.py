@@ -1,7 +1,8 @@
 """
 System health monitoring for BrightDayBot.
 
-Essential health checks: directories, files, API connectivity.
+Essential health checks: directories, files, API connectivity, storage lock contention,
+OpenAI circuit breaker and concurrency limits.
 Main functions: get_system_status(), get_status_summary().
 """
 
@@ -25,6 +26,8 @@ from config import (
     TRACKING_DIR,
     get_logger,
 )
+from integrations.openai_guard import get_traffic_status
+from utils.locks import get_lock_stats
 from utils.log_setup import LOG_FILE_NAMES
 
 logger = get_logger("system")
@@ -239,6 +242,74 @@ def check_log_files():
         return {"status": STATUS_ERROR, "path": LOGS_DIR, "error": str(e)}
 
 
+def check_file_locks():
+    """Lock wait/hold percentiles and worst offenders since startup (utils/locks.py)."""
+    locks = get_lock_stats()
+    return {
+        "status": STATUS_OK,
+        "locks": locks,
+        "timeouts": sum(lock["timeouts"] for lock in locks.values()),
+    }
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:.0f}ms" if seconds is not None else "?"
+
+
+def format_lock_contention(locks, limit=3):
+    """
+    One line per most-contended lock, plus the single worst wait/hold seen.
+
+    Args:
+        locks: get_lock_stats() output (most contended first)
+        limit: Locks to list
+
+    Returns:
+        list: Lines of plain text (empty when no lock was taken yet)
+    """
+    lines = [
+        f"{name}: wait p50 {_ms(lock['wait_p50'])} / p99 {_ms(lock['wait_p99'])}, "
+        f"hold p99 {_ms(lock['hold_p99'])}, {lock['timeouts']} timeouts"
+        for name, lock in list(locks.items())[:limit]
+    ]
+    worst = max(
+        ((entry, name) for name, lock in locks.items() for entry in lock["worst"]),
+        key=lambda pair: pair[0]["seconds"],
+        default=None,
+    )
+    if worst:
+        entry, name = worst
+        lines.append(f"worst: {entry['seconds']:.2f}s {entry['kind']} on {name} at {entry['site']}")
+    return lines
+
+
+def check_openai_traffic():
+    """Circuit breaker and adaptive limit per OpenAI operation (integrations/openai_guard.py)."""
+    operations = get_traffic_status()
+    return {
+        "status": STATUS_OK,
+        "operations": operations,
+        "open_circuits": [name for name, op in operations.items() if op["state"] != "closed"],
+    }
+
+
+def format_openai_traffic(operations):
+    """
+    One line per OpenAI operation: circuit state, current limit and pressure counters.
+
+    Args:
+        operations: get_traffic_status() output
+
+    Returns:
+        list: Lines of plain text (empty when no OpenAI call was made yet)
+    """
+    return [
+        f"{name}: circuit {op['state'].replace('_', '-')}, limit {op['limit']}/{op['max_limit']}, "
+        f"{op['in_flight']} in flight, {op['rate_limited']} rate-limited, {op['open_count']} opens"
+        for name, op in sorted(operations.items())
+    ]
+
+
 def check_live_slack_connectivity(app=None):
     """Test live Slack API connectivity."""
     if app is None:
@@ -335,6 +406,8 @@ def get_system_status(app=None, include_live_checks=False):
     status["components"]["personality"] = check_personality_config()
     status["components"]["special_days"] = check_special_days()
     status["components"]["logs"] = check_log_files()
+    status["components"]["file_locks"] = check_file_locks()
+    status["components"]["openai_traffic"] = check_openai_traffic()
 
     # Check birthday channel config
     if BIRTHDAY_CHANNEL:
@@ -440,6 +513,22 @@ def get_status_summary(app=None, include_live_checks=True):
     else:
         lines.append(f"ℹ️ *Logs*: {logs.get('status', 'Unknown')}")
 
+    # Storage lock contention
+    locks = status["components"].get("file_locks", {})
+    lock_lines = format_lock_contention(locks.get("locks", {}))
+    if lock_lines:
+        emoji = "⚠️" if locks.get("timeouts") else "✅"
+        lines.append(f"{emoji} *File locks*: {lock_lines[0]}")
+        lines.extend(f"    {line}" for line in lock_lines[1:])
+
+    # OpenAI breaker/limiter state
+    traffic = status["components"].get("openai_traffic", {})
+    traffic_lines = format_openai_traffic(traffic.get("operations", {}))
+    if traffic_lines:
+        emoji = "⚠️" if traffic.get("open_circuits") else "✅"
+        lines.append(f"{emoji} *OpenAI traffic*: {traffic_lines[0]}")
+        lines.extend(f"    {line}" for line in traffic_lines[1:])
+
     # Live API checks
     if include_live_checks:
         lines.append("")
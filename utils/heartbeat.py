@@ -0,0 +1,242 @@
+"""
+Process heartbeat for liveness and readiness checks.
+
+The running bot rewrites HEARTBEAT_FILE every HEARTBEAT_INTERVAL_SECONDS with
+its scheduler state, Socket Mode connection state and the last error logged.
+The Docker healthcheck runs `python -m utils.heartbeat`, which only reads that
+file: this module imports nothing but the standard library at module level,
+so the check takes milliseconds instead of importing config and the app.
+
+- Live: the heartbeat is fresh and the scheduler thread is healthy (jobs are
+  not overdue; a standby replica only needs its thread alive).
+- Ready: live and the Socket Mode connection is up (or, against the Slack
+  emulator under SLACK_API_URL, Socket Mode is not applicable).
+
+With METRICS_PORT set, utils/metrics.py serves the same checks computed in
+process at /livez and /readyz (200 or 503 with the status as JSON).
+
+Key functions: start_heartbeat(), set_connection_probe(), disable_socket_mode(),
+collect_status(), evaluate(), check_heartbeat()
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+# Same path as config.HEARTBEAT_FILE; kept literal so the check never imports config
+DEFAULT_HEARTBEAT_FILE = os.path.join("data", "heartbeat.json")
+DEFAULT_MAX_AGE_SECONDS = 60
+
+_started_at = time.time()
+_connection_probe = None
+_socket_mode = True  # False when the process serves no Socket Mode connection
+_last_error = None  # {"message", "component", "at"}
+_stop = threading.Event()
+_thread = None
+
+
+class _LastErrorHandler(logging.Handler):
+    """Remembers the most recent ERROR (or worse) record from any component."""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+
+    def emit(self, record):
+        global _last_error
+        _last_error = {
+            "message": record.getMessage()[:300],
+            "component": record.name.removeprefix("birthday_bot."),
+            "at": record.created,
+        }
+
+
+def set_connection_probe(probe):
+    """
+    Register how to ask the Socket Mode client whether it is connected.
+
+    Args:
+        probe: Callable returning bool, safe to call from another thread
+    """
+    global _connection_probe
+    _connection_probe = probe
+
+
+def disable_socket_mode():
+    """Report Socket Mode as not applicable (SLACK_API_URL runs have no connection)."""
+    global _socket_mode
+    _socket_mode = False
+
+
+def _connection_state():
+    if not _socket_mode:
+        return "not_applicable"
+    if _connection_probe is None:
+        return "unknown"
+    try:
+        return "connected" if _connection_probe() else "disconnected"
+    except Exception:
+        return "disconnected"
+
+
+def collect_status():
+    """
+    Current process state as written to the heartbeat file.
+
+    Returns:
+        dict: {"pid", "started_at", "written_at", "scheduler": {...},
+               "socket_mode": "connected"/"disconnected"/"unknown"/"not_applicable",
+               "last_error"}
+    """
+    from services.scheduler import get_scheduler_health
+
+    try:
+        health = get_scheduler_health()
+        scheduler = {
+            "status": health["status"],
+            "role": health["role"],
+            "thread_alive": health["thread_alive"],
+            "overdue_seconds": round(health["overdue_seconds"], 1),
+            "last_heartbeat": health["last_heartbeat"],
+        }
+    except Exception as e:
+        scheduler = {"status": "error", "error": str(e)}
+
+    return {
+        "pid": os.getpid(),
+        "started_at": _started_at,
+        "written_at": time.time(),
+        "scheduler": scheduler,
+        "socket_mode": _connection_state(),
+        "last_error": _last_error,
+    }
+
+
+def evaluate(status, max_age=DEFAULT_MAX_AGE_SECONDS, now=None):
+    """
+    Decide liveness and readiness from a heartbeat status.
+
+    Args:
+        status: Dict from collect_status() (or the heartbeat file)
+        max_age: Seconds after which a heartbeat counts as stale
+        now: Current epoch seconds (default: time.time())
+
+    Returns:
+        tuple: (live, ready, reasons) where reasons lists what failed
+    """
+    now = time.time() if now is None else now
+    reasons = []
+    age = now - status.get("written_at", 0)
+    if age > max_age:
+        reasons.append(f"heartbeat is {age:.0f}s old")
+    scheduler = status.get("scheduler") or {}
+    if scheduler.get("status") != "ok":
+        reasons.append(
+            f"scheduler {scheduler.get('status', 'unknown')}"
+            + (
+                f" (overdue {scheduler['overdue_seconds']}s)"
+                if scheduler.get("overdue_seconds")
+                else ""
+            )
+        )
+    live = not reasons
+    if status.get("socket_mode") not in ("connected", "not_applicable"):
+        reasons.append(f"socket mode {status.get('socket_mode', 'unknown')}")
+    return live, not reasons, reasons
+
+
+def write_heartbeat(path):
+    """Write the current status to path atomically."""
+    status = collect_status()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f)
+    os.replace(tmp_path, path)
+    return status
+
+
+def _run(path, interval):
+    from config import get_logger
+
+    logger = get_logger("main")
+    failing = False
+    while True:
+        try:
+            write_heartbeat(path)
+            failing = False
+        except Exception as e:
+            if not failing:  # Once per outage, not every interval
+                logger.error(f"HEARTBEAT: Could not write {path}: {e}")
+            failing = True
+        if _stop.wait(interval):
+            return
+
+
+def start_heartbeat(path=None, interval=None):
+    """
+    Track the last error and rewrite the heartbeat file on a daemon thread.
+
+    Args:
+        path: Heartbeat file (default: HEARTBEAT_FILE)
+        interval: Seconds between writes (default: HEARTBEAT_INTERVAL_SECONDS)
+    """
+    global _thread
+    from config import HEARTBEAT_FILE, HEARTBEAT_INTERVAL_SECONDS, get_logger
+    from utils.log_setup import add_component_handler
+
+    if _thread is not None:
+        return
+    path = path or HEARTBEAT_FILE
+    interval = interval or HEARTBEAT_INTERVAL_SECONDS
+    add_component_handler(_LastErrorHandler())
+    _stop.clear()
+    _thread = threading.Thread(target=_run, args=(path, interval), name="heartbeat", daemon=True)
+    _thread.start()
+    get_logger("main").info(f"HEARTBEAT: Writing {path} every {interval}s")
+
+
+def stop_heartbeat():
+    """Stop the writer thread (tests, clean shutdown)."""
+    global _thread
+    _stop.set()
+    if _thread is not None:
+        _thread.join(timeout=5)
+        _thread = None
+
+
+def check_heartbeat(path=DEFAULT_HEARTBEAT_FILE, max_age=DEFAULT_MAX_AGE_SECONDS, ready=False):
+    """
+    Healthcheck entry point: read the heartbeat file, never the app.
+
+    Returns:
+        tuple: (ok, message)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            status = json.load(f)
+    except (OSError, ValueError) as e:
+        return False, f"no heartbeat: {e}"
+    live, is_ready, reasons = evaluate(status, max_age)
+    ok = is_ready if ready else live
+    return ok, "ok" if ok else "; ".join(reasons)
+
+
+def main(argv=None):
+    """`python -m utils.heartbeat [--ready] [--max-age SECONDS] [--file PATH]`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check the BrightDayBot heartbeat file")
+    parser.add_argument("--file", default=DEFAULT_HEARTBEAT_FILE)
+    parser.add_argument("--max-age", type=float, default=DEFAULT_MAX_AGE_SECONDS)
+    parser.add_argument("--ready", action="store_true", help="also require Socket Mode")
+    args = parser.parse_args(argv)
+
+    ok, message = check_heartbeat(args.file, args.max_age, args.ready)
+    print(message)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,12 @@
 ICS calendar generation for BrightDayBot.
 
 Generates RFC 5545 compliant ICS files for birthday and special day
-calendar exports using the icalendar library.
+calendar exports using the icalendar library (imported on first export).
 """
 
 import hashlib
 from datetime import date, datetime, timezone
 
-from icalendar import Calendar, Event, vRecur
-
 
 def generate_birthday_ics(birthdays):
     """
@@ -24,6 +22,8 @@ def generate_birthday_ics(birthdays):
     Returns:
         str: ICS format calendar content
     """
+    from icalendar import Calendar, Event, vRecur
+
     cal = Calendar()
     cal.add("prodid", "-//BrightDayBot//Birthday Calendar//EN")
     cal.add("version", "2.0")
@@ -73,6 +73,8 @@ def generate_special_days_ics(days, source_label=None):
     Returns:
         str: ICS format calendar content
     """
+    from icalendar import Calendar, Event, vRecur
+
     cal_name = f"Special Days ({source_label})" if source_label else "Special Days"
 
     cal = Calendar()
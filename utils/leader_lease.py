@@ -0,0 +1,213 @@
+"""
+Lease-based leader election over the shared data volume.
+
+Replicas compete for a lease stored in a JSON file guarded by a FileLock. The
+holder renews it every lease/3 seconds; if it stops renewing (crash, hang,
+network partition from the volume), another replica takes over once the lease
+expires. Expiry uses wall-clock time, so replicas need roughly synchronized
+clocks (NTP) - skew eats into the lease.
+
+Replicas that are not the leader can post named signals into the lease file
+(post_signal); the leader picks them up on its next renewal. This lets an event
+handled by any replica (Socket Mode spreads events across connections) reach
+the replica that runs the scheduled jobs.
+
+Key class: LeaderLease
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+
+from config import get_logger
+from utils.locks import file_lock
+
+logger = get_logger("scheduler")
+
+
+class LeaderLease:
+    """
+    One replica's view of the shared leader lease.
+
+    Args:
+        path: Lease file on the shared volume
+        lease_seconds: How long a lease stays valid without renewal
+        on_elected: Optional callback() when this replica becomes leader
+        on_demoted: Optional callback() when it loses the lease
+        on_signal: Optional callback(name) for signals posted by other replicas
+        clock: Wall-clock seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        path,
+        lease_seconds,
+        on_elected=None,
+        on_demoted=None,
+        on_signal=None,
+        clock=time.time,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._on_signal = on_signal
+        self._clock = clock
+        self._lock = file_lock(path + ".lock")
+        self._stop = threading.Event()
+        self._thread = None
+        self._signals_seen = {}
+        self.is_leader = False
+        self.leader_since = None
+        self.last_renewal = None
+
+    # --- lease file ---
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"LEADER: Unreadable lease file, treating as free: {e}")
+            return {}
+
+    def _write(self, data):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    # --- election ---
+
+    def try_acquire(self):
+        """
+        Acquire the lease if it is free or expired, or renew it if we hold it.
+
+        Returns:
+            bool: True if this replica is the leader afterwards
+        """
+        signals = {}
+        try:
+            with self._lock:
+                data = self._read()
+                now = self._clock()
+                holder = data.get("holder")
+                expired = data.get("expires_at", 0) <= now
+                if holder == self.instance_id or not holder or expired:
+                    if holder != self.instance_id:
+                        data["acquired_at"] = now
+                        if holder:
+                            logger.info(f"LEADER: Lease held by {holder} expired, taking over")
+                    data["holder"] = self.instance_id
+                    data["expires_at"] = now + self.lease_seconds
+                    data["renewed_at"] = now
+                    self._write(data)
+                    leader = True
+                    signals = dict(data.get("signals", {}))
+                else:
+                    leader = False
+        except Exception as e:
+            # Can't prove we still hold the lease: step down rather than risk two leaders
+            logger.error(f"LEADER: Lease check failed: {e}")
+            leader = False
+
+        self._transition(leader)
+        if leader:
+            self.last_renewal = self._clock()
+            self._deliver_signals(signals)
+        return leader
+
+    def _transition(self, leader):
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        if leader:
+            self.leader_since = self._clock()
+            logger.info(f"LEADER: {self.instance_id} elected leader")
+            callback = self._on_elected
+        else:
+            self.leader_since = None
+            logger.warning(f"LEADER: {self.instance_id} lost leadership")
+            callback = self._on_demoted
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"LEADER: Leadership callback failed: {e}")
+
+    def _deliver_signals(self, signals):
+        for name, posted_at in signals.items():
+            if posted_at <= self._signals_seen.get(name, 0):
+                continue
+            first_sight = name not in self._signals_seen
+            self._signals_seen[name] = posted_at
+            # Signals posted before we became leader were handled by the previous
+            # holder (or are covered by the election catch-up)
+            if first_sight and self.leader_since and posted_at < self.leader_since:
+                continue
+            if self._on_signal:
+                try:
+                    self._on_signal(name)
+                except Exception as e:
+                    logger.error(f"LEADER: Signal handler for {name} failed: {e}")
+
+    def post_signal(self, name):
+        """Ask the leader (possibly another replica) to handle a named signal."""
+        try:
+            with self._lock:
+                data = self._read()
+                data.setdefault("signals", {})[name] = self._clock()
+                self._write(data)
+        except Exception as e:
+            logger.warning(f"LEADER: Failed to post signal {name}: {e}")
+
+    def release(self):
+        """Give up the lease (clean shutdown) so another replica takes over at once."""
+        self._stop.set()
+        if not self.is_leader:
+            return
+        try:
+            with self._lock:
+                data = self._read()
+                if data.get("holder") == self.instance_id:
+                    data["holder"] = None
+                    data["expires_at"] = 0
+                    self._write(data)
+        except Exception as e:
+            logger.warning(f"LEADER: Failed to release lease: {e}")
+        self._transition(False)
+
+    # --- heartbeat ---
+
+    def start(self):
+        """Start the background heartbeat that renews or competes for the lease."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="leader-lease", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        interval = max(1.0, self.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            self.try_acquire()
+
+    def status(self):
+        """Leadership details for health checks and the dashboard."""
+        lease = self._read()
+        return {
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader,
+            "leader": lease.get("holder"),
+            "lease_expires_in": (
+                round(lease["expires_at"] - self._clock(), 1) if lease.get("expires_at") else None
+            ),
+            "leader_since": self.leader_since,
+            "lease_seconds": self.lease_seconds,
+        }
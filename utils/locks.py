@@ -0,0 +1,195 @@
+"""
+Shared factory for the FileLocks that guard JSON storage, with contention telemetry.
+
+Every storage module takes its locks through file_lock(). Per lock file it
+records acquisition wait, hold time (outermost acquire to final release),
+timeouts and the call site of the slowest waits and holds, so a lock creeping
+toward TIMEOUTS["file_lock"] shows up in the health command and canvas before
+handlers start stalling. Waits and holds also go to utils/metrics
+(file_lock_wait_seconds, file_lock_hold_seconds, file_lock_timeouts_total).
+
+With LOCK_HOLD_WARN_SECONDS > 0, a hold longer than that is logged with the
+stack that acquired the lock.
+
+Key functions: file_lock(), get_lock_stats()
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from filelock import FileLock, Timeout
+
+from config import LOCK_HOLD_WARN_SECONDS, TIMEOUTS, get_logger
+from utils.metrics import inc, observe
+
+logger = get_logger("storage")
+
+# Recent samples kept per lock for the percentile estimates
+_SAMPLES = 512
+# Slowest waits/holds remembered per lock (with call site)
+_WORST_KEPT = 5
+
+_THIS_FILE = os.path.normcase(os.path.abspath(__file__))
+_FILELOCK_DIR = os.path.normcase(
+    os.path.dirname(os.path.abspath(sys.modules[FileLock.__module__].__file__))
+)
+
+
+class _LockStats:
+    def __init__(self):
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.waits = deque(maxlen=_SAMPLES)
+        self.holds = deque(maxlen=_SAMPLES)
+        self.worst = []  # (seconds, kind, site), slowest first
+
+
+_stats_lock = threading.Lock()
+_stats = {}  # lock name -> _LockStats
+
+
+def _lock_name(path):
+    name = os.path.basename(path)
+    return name[: -len(".lock")] if name.endswith(".lock") else name
+
+
+def _call_site():
+    """First frame outside this module and filelock, as 'path:line function'."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.normcase(os.path.abspath(frame.f_code.co_filename))
+        if filename != _THIS_FILE and not filename.startswith(_FILELOCK_DIR):
+            path = os.path.relpath(frame.f_code.co_filename)
+            return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _record(name, kind, seconds, site):
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = _LockStats()
+        if kind == "wait":
+            stats.acquisitions += 1
+            stats.waits.append(seconds)
+        elif kind == "hold":
+            stats.holds.append(seconds)
+        else:  # timeout
+            stats.timeouts += 1
+            stats.waits.append(seconds)
+        if len(stats.worst) < _WORST_KEPT or seconds > stats.worst[-1][0]:
+            stats.worst.append((seconds, kind, site))
+            stats.worst.sort(key=lambda entry: -entry[0])
+            del stats.worst[_WORST_KEPT:]
+
+
+class InstrumentedFileLock(FileLock):
+    """FileLock that records waits, holds and timeouts for its lock file."""
+
+    def acquire(self, *args, **kwargs):
+        name = _lock_name(self.lock_file)
+        site = _call_site()
+        started = time.perf_counter()
+        try:
+            proxy = super().acquire(*args, **kwargs)
+        except Timeout:
+            waited = time.perf_counter() - started
+            observe("file_lock_wait_seconds", waited, lock=name)
+            inc("file_lock_timeouts_total", lock=name)
+            _record(name, "timeout", waited, site)
+            logger.warning(f"LOCK: Timed out after {waited:.1f}s waiting for {name} at {site}")
+            raise
+
+        waited = time.perf_counter() - started
+        observe("file_lock_wait_seconds", waited, lock=name)
+        _record(name, "wait", waited, site)
+        if self.lock_counter == 1:  # Outermost acquire: the hold starts now
+            self._held_since = time.perf_counter()
+            self._held_at = site
+            self._held_stack = (
+                "".join(traceback.format_stack(limit=12)) if LOCK_HOLD_WARN_SECONDS > 0 else None
+            )
+        return proxy
+
+    def release(self, force=False):
+        releasing = self.is_locked and (force or self.lock_counter == 1)
+        super().release(force=force)
+        if not releasing or getattr(self, "_held_since", None) is None:
+            return
+
+        held = time.perf_counter() - self._held_since
+        self._held_since = None
+        name = _lock_name(self.lock_file)
+        observe("file_lock_hold_seconds", held, lock=name)
+        _record(name, "hold", held, self._held_at)
+        if 0 < LOCK_HOLD_WARN_SECONDS < held:
+            logger.warning(
+                f"LOCK: {name} held for {held:.2f}s by {self._held_at}; "
+                f"acquired at:\n{self._held_stack or ''}"
+            )
+
+
+def file_lock(path, timeout=None):
+    """
+    Create the lock for a storage file.
+
+    Args:
+        path: Lock file path (e.g. BIRTHDAYS_LOCK_FILE)
+        timeout: Seconds to wait before filelock.Timeout (default TIMEOUTS["file_lock"])
+
+    Returns:
+        InstrumentedFileLock
+    """
+    return InstrumentedFileLock(path, timeout=TIMEOUTS["file_lock"] if timeout is None else timeout)
+
+
+def _percentile(samples, fraction):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[int(fraction * (len(ordered) - 1))], 4)
+
+
+def get_lock_stats():
+    """
+    Contention summary per lock file, most contended (highest p99 wait) first.
+
+    Returns:
+        dict: {lock name: {"acquisitions", "timeouts", "wait_p50", "wait_p99",
+               "wait_max", "hold_p50", "hold_p99", "hold_max",
+               "worst": [{"kind", "seconds", "site"}]}}
+    """
+    with _stats_lock:
+        snapshot = {
+            name: (s.acquisitions, s.timeouts, list(s.waits), list(s.holds), list(s.worst))
+            for name, s in _stats.items()
+        }
+    result = {
+        name: {
+            "acquisitions": acquisitions,
+            "timeouts": timeouts,
+            "wait_p50": _percentile(waits, 0.5),
+            "wait_p99": _percentile(waits, 0.99),
+            "wait_max": round(max(waits), 4) if waits else None,
+            "hold_p50": _percentile(holds, 0.5),
+            "hold_p99": _percentile(holds, 0.99),
+            "hold_max": round(max(holds), 4) if holds else None,
+            "worst": [
+                {"kind": kind, "seconds": round(seconds, 4), "site": site}
+                for seconds, kind, site in worst
+            ],
+        }
+        for name, (acquisitions, timeouts, waits, holds, worst) in snapshot.items()
+    }
+    return dict(sorted(result.items(), key=lambda kv: -(kv[1]["wait_p99"] or 0)))
+
+
+def reset_lock_stats():
+    """Drop collected lock telemetry (used by tests)."""
+    with _stats_lock:
+        _stats.clear()
@@ -4,12 +4,23 @@ Multi-component logging configuration for BrightDayBot.
 Sets up component-specific log files with automatic rotation to organize
 logs by functionality: commands, events, AI operations, Slack API, etc.
 
+By default component loggers only enqueue records (QueueHandler); a single
+QueueListener thread does the file writes and rotation checks, so logging in
+hot loops never blocks on disk. Set LOG_FORMAT=json for one JSON object per
+line (timestamp, level, component, event code, message and any extra fields
+such as duration_seconds) instead of the plain text format.
+
 Key functions: setup_logging(), get_logger() with 9 specialized log files.
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
 import os
+import queue
+import re
 
 # Enhanced logging with separate files for different components
 # Use relative paths to avoid circular import, construct full paths when needed
@@ -71,18 +82,118 @@ COMPONENT_LOG_MAPPING = {
 }
 
 # Global variables for logging system
-log_handlers = {}
+log_handlers = {}  # log type -> handler attached to component loggers
+_file_handlers = {}  # log type -> RotatingFileHandler (written by the listener when queued)
+_listener = None
+_extra_handlers = []  # Added to every component logger (add_component_handler)
 _logging_initialized = False
 
+# "SCHEDULER: Job done" -> event code "SCHEDULER"
+_EVENT_CODE = re.compile(r"^([A-Z][A-Z0-9_]*):\s")
+# Attributes every LogRecord has; anything else was passed via extra={...}
+_STANDARD_ATTRS = set(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "log_type"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line for machine analysis of the component logs."""
+
+    def format(self, record):
+        message = record.getMessage()
+        event = _EVENT_CODE.match(message)
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "component": record.name.removeprefix("birthday_bot."),
+            "event": event.group(1) if event else None,
+            "message": message,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        # Queued records arrive with the traceback pre-rendered in exc_text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _ComponentQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records tagged with the log file they belong in."""
+
+    def __init__(self, log_queue, log_type):
+        super().__init__(log_queue)
+        self.log_type = log_type
+
+    def prepare(self, record):
+        # QueueHandler.prepare() would format the record and fold the traceback
+        # into the message; keep them apart so JsonFormatter can emit "exception"
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None  # Tracebacks pin frames; only the text crosses the queue
+        record.log_type = self.log_type
+        return record
+
+
+class _ComponentRouter(logging.Handler):
+    """Listener-side handler that writes each record to its component's file."""
+
+    def handle(self, record):
+        handler = _file_handlers.get(getattr(record, "log_type", None))
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
 
-def setup_logging(logs_dir):
+def add_component_handler(handler):
+    """
+    Attach an extra handler to every component logger, current and future.
+
+    Component loggers don't propagate, so process-wide observers (such as the
+    heartbeat's last-error tracker) register here instead of on the root logger.
+    """
+    _extra_handlers.append(handler)
+    for name, logger in logging.Logger.manager.loggerDict.items():
+        if name.startswith("birthday_bot.") and isinstance(logger, logging.Logger):
+            if handler not in logger.handlers:
+                logger.addHandler(handler)
+
+
+def remove_component_handler(handler):
+    """Detach a handler added with add_component_handler()."""
+    if handler in _extra_handlers:
+        _extra_handlers.remove(handler)
+    for name, logger in logging.Logger.manager.loggerDict.items():
+        if name.startswith("birthday_bot.") and isinstance(logger, logging.Logger):
+            logger.removeHandler(handler)
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread (registered with atexit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging(logs_dir, queued=True, json_format=False):
     """
     Set up the enhanced logging system with component-specific file routing
 
     Args:
         logs_dir: Directory where log files should be stored
+        queued: Write files on a QueueListener thread instead of the logging thread
+        json_format: Write JSON lines instead of the plain text format
     """
-    global log_handlers, _logging_initialized
+    global log_handlers, _listener, _logging_initialized
 
     if _logging_initialized:
         return  # Already initialized
@@ -91,10 +202,15 @@ def setup_logging(logs_dir):
     os.makedirs(logs_dir, exist_ok=True)
 
     # Set up logging formatter with more detailed info
-    log_formatter = logging.Formatter(
-        "%(asctime)s - [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    if json_format:
+        log_formatter = JsonFormatter()
+    else:
+        log_formatter = logging.Formatter(
+            "%(asctime)s - [%(levelname)s] %(name)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+    log_queue = queue.Queue(-1) if queued else None
 
     # Set up file handlers with rotation for each log file
     for log_type, log_file in LOG_FILE_NAMES.items():
@@ -107,7 +223,13 @@ def setup_logging(logs_dir):
             encoding="utf-8",
         )
         handler.setFormatter(log_formatter)
-        log_handlers[log_type] = handler
+        _file_handlers[log_type] = handler
+        log_handlers[log_type] = _ComponentQueueHandler(log_queue, log_type) if queued else handler
+
+    if queued:
+        _listener = logging.handlers.QueueListener(log_queue, _ComponentRouter())
+        _listener.start()
+        atexit.register(stop_logging)
 
     # Configure root logger
     root_logger = logging.getLogger("birthday_bot")
@@ -162,6 +284,8 @@ def get_logger(name):
     # Add only the specific handler for this component
     if log_type in log_handlers:
         logger.addHandler(log_handlers[log_type])
+        for handler in _extra_handlers:
+            logger.addHandler(handler)
         logger.setLevel(logging.INFO)
         logger.propagate = False  # Don't propagate to parent to avoid duplicate logs
 
@@ -0,0 +1,272 @@
+"""
+In-process metrics: counters and latency histograms with Prometheus text output.
+
+Hot paths record into a process-wide registry:
+
+- slack_api_seconds{method, outcome}: every Slack Web API call (slack/client.py
+  instruments each request's client via Bolt middleware)
+- openai_request_seconds{operation, outcome} and openai_rejected_total: every
+  OpenAI call made through integrations/openai_guard.py
+- file_lock_wait_seconds{lock} and file_lock_timeouts_total: every lock taken
+  through utils/locks.py
+- celebration_stage_seconds{stage, outcome}: BirthdayCelebrationPipeline stages
+
+render_prometheus() produces the text exposition format. With METRICS_PORT set,
+start_metrics_server() serves it on http://METRICS_HOST:METRICS_PORT/metrics
+(loopback by default) for a local Prometheus scrape, along with /livez and
+/readyz probes (utils/heartbeat.py). Recording is a dict lookup plus a lock per
+sample, so it stays on even without the endpoint.
+
+Key functions: timed(), inc(), observe(), snapshot(), render_prometheus(),
+start_metrics_server()
+"""
+
+import bisect
+import json
+import threading
+import time
+from collections import deque
+from contextlib import ContextDecorator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import get_logger
+
+logger = get_logger("main")
+
+METRIC_PREFIX = "brightdaybot_"
+
+# Upper bounds (seconds) spanning lock waits (ms) to image generation (minutes)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# Recent samples kept per series for the percentile estimates in snapshot()
+_RECENT_SAMPLES = 512
+
+
+class _Histogram:
+    """Cumulative bucket counts plus a window of recent samples."""
+
+    __slots__ = ("counts", "count", "total", "recent")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=_RECENT_SAMPLES)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.recent.append(value)
+
+
+_lock = threading.Lock()
+_counters = {}  # (name, labels) -> float
+_histograms = {}  # (name, labels) -> _Histogram
+_server = None
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def inc(name, value=1, **labels):
+    """Add to a counter, e.g. inc("openai_rejected_total", operation="text")."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name, seconds, **labels):
+    """Record one duration sample into a histogram."""
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = _Histogram()
+        histogram.observe(seconds)
+
+
+class timed(ContextDecorator):
+    """
+    Time a block or function into a histogram, labelled with outcome="ok"/"error".
+
+    Usage:
+        with timed("celebration_stage_seconds", stage="generation"):
+            ...
+
+        @timed("canvas_update_seconds")
+        def update_canvas(app): ...
+    """
+
+    def __init__(self, name, **labels):
+        self.name = name
+        self.labels = labels
+        self._started = None
+
+    def _recreate_cm(self):
+        # As a decorator, each call times with its own instance (threads, recursion)
+        return timed(self.name, **self.labels)
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._started
+        observe(self.name, elapsed, **self.labels, outcome="error" if exc_type else "ok")
+        return False
+
+
+def _percentile(ordered, fraction):
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+def snapshot():
+    """
+    Current values for health output and tests.
+
+    Returns:
+        dict: {"counters": {series: value},
+               "histograms": {series: {count, sum, p50, p95, p99, max}}}
+              where series is 'name{label="value",...}'
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: (h.count, h.total, sorted(h.recent)) for key, h in _histograms.items()}
+    return {
+        "counters": {_series(*key): value for key, value in counters.items()},
+        "histograms": {
+            _series(*key): {
+                "count": count,
+                "sum": round(total, 6),
+                "p50": round(_percentile(recent, 0.5), 6) if recent else None,
+                "p95": round(_percentile(recent, 0.95), 6) if recent else None,
+                "p99": round(_percentile(recent, 0.99), 6) if recent else None,
+                "max": round(recent[-1], 6) if recent else None,
+            }
+            for key, (count, total, recent) in histograms.items()
+        },
+    }
+
+
+def reset_metrics():
+    """Drop every series (used by tests)."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+# --- Prometheus text format ---
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _series(name, labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return name
+    return name + "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _bound(value):
+    return f"{value:g}"
+
+
+def render_prometheus():
+    """Render every series in the Prometheus text exposition format (version 0.0.4)."""
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted(
+            (key, (list(h.counts), h.count, h.total)) for key, h in _histograms.items()
+        )
+
+    lines = []
+    declared = set()
+    for (name, labels), value in counters:
+        full = METRIC_PREFIX + name
+        if full not in declared:
+            declared.add(full)
+            lines.append(f"# TYPE {full} counter")
+        lines.append(f"{_series(full, labels)} {_bound(value)}")
+
+    for (name, labels), (counts, count, total) in histograms:
+        full = METRIC_PREFIX + name
+        if full not in declared:
+            declared.add(full)
+            lines.append(f"# TYPE {full} histogram")
+        cumulative = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, counts):
+            cumulative += bucket_count
+            lines.append(
+                f"{_series(full + '_bucket', labels, [('le', _bound(bound))])} {cumulative}"
+            )
+        lines.append(f"{_series(full + '_bucket', labels, [('le', '+Inf')])} {count}")
+        lines.append(f"{_series(full + '_sum', labels)} {total:.6f}")
+        lines.append(f"{_series(full + '_count', labels)} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            self._respond(200, render_prometheus(), "text/plain; version=0.0.4; charset=utf-8")
+        elif path in ("/livez", "/readyz"):
+            from utils.heartbeat import collect_status, evaluate
+
+            status = collect_status()
+            live, ready, reasons = evaluate(status)
+            ok = live if path == "/livez" else ready
+            body = json.dumps({"ok": ok, "reasons": reasons, **status}, default=str)
+            self._respond(200 if ok else 503, body, "application/json")
+        else:
+            self.send_error(404)
+
+    def _respond(self, code, text, content_type):
+        body = text.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the logs
+
+
+def start_metrics_server(host, port):
+    """
+    Serve /metrics, /livez and /readyz on a daemon thread.
+
+    No-op if port is 0 or already serving.
+
+    Returns:
+        ThreadingHTTPServer or None
+    """
+    global _server
+    if not port or _server is not None:
+        return _server
+    try:
+        _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.error(f"METRICS: Could not bind {host}:{port}: {e}")
+        return None
+    _server.daemon_threads = True
+    threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(
+        f"METRICS: Serving Prometheus metrics on http://{host}:{_server.server_port}/metrics"
+    )
+    return _server
+
+
+def stop_metrics_server():
+    """Shut the endpoint down (tests, clean shutdown)."""
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
@@ -0,0 +1,138 @@
+"""
+Startup-time profiling for `python app.py --profile-startup`.
+
+start() hooks the import statement so every module first imported afterwards
+is timed (inclusive and self time, the same split as `python -X importtime`),
+and checkpoint() times named startup steps such as building the Slack app
+(it is a no-op unless profiling was started, so app.py calls it always). report()
+renders the slowest modules, the heaviest top-level packages and the phases,
+so a regression in cold start shows up as a named module instead of a slower
+restart.
+
+Only imports on the thread that called start() are timed.
+
+Key functions: start(), checkpoint(), report(), stop()
+"""
+
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+
+_original_import = builtins.__import__
+_records = {}  # module -> (inclusive seconds, self seconds), in import order
+_child_time = []  # Per in-progress import: seconds spent in nested imports
+_phases = []  # (name, seconds)
+_started = None
+_last_checkpoint = None
+_thread_id = None
+
+
+def _resolve(name, globals_, level):
+    if not level:
+        return name
+    try:
+        return importlib.util.resolve_name("." * level + name, (globals_ or {}).get("__package__"))
+    except (ImportError, ValueError):
+        return name
+
+
+def _time(module, load):
+    _child_time.append(0.0)
+    started = time.perf_counter()
+    try:
+        return load()
+    finally:
+        elapsed = time.perf_counter() - started
+        nested = _child_time.pop()
+        if _child_time:
+            _child_time[-1] += elapsed
+        _records.setdefault(module, (elapsed, elapsed - nested))
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if threading.get_ident() != _thread_id:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    module = _resolve(name, globals, level)
+    if module not in sys.modules:
+        return _time(module, lambda: _original_import(name, globals, locals, fromlist, level))
+
+    # `from package import submodule` loads the submodule without another __import__
+    parent = sys.modules[module]
+    for item in fromlist or ():
+        submodule = f"{module}.{item}"
+        if item != "*" and submodule not in sys.modules and not hasattr(parent, item):
+            _time(submodule, lambda: _original_import(name, globals, locals, (item,), level))
+    return _original_import(name, globals, locals, fromlist, level)
+
+
+def start():
+    """Begin timing imports on the current thread (idempotent)."""
+    global _started, _last_checkpoint, _thread_id
+    if builtins.__import__ is _timed_import:
+        return
+    _started = _last_checkpoint = time.perf_counter()
+    _thread_id = threading.get_ident()
+    builtins.__import__ = _timed_import
+
+
+def stop():
+    """Restore the normal import statement."""
+    if builtins.__import__ is _timed_import:
+        builtins.__import__ = _original_import
+
+
+def checkpoint(name):
+    """Record the time since the previous checkpoint (or start()) as phase `name`."""
+    global _last_checkpoint
+    if _started is None:
+        return
+    now = time.perf_counter()
+    _phases.append((name, now - _last_checkpoint))
+    _last_checkpoint = now
+
+
+def get_profile():
+    """
+    Collected timings.
+
+    Returns:
+        dict: {"total": seconds since start(), "modules": {name: (inclusive, self)},
+               "phases": [(name, seconds)]}
+    """
+    total = time.perf_counter() - _started if _started is not None else 0.0
+    return {"total": total, "modules": dict(_records), "phases": list(_phases)}
+
+
+def report(limit=25):
+    """
+    Render the profile as plain text.
+
+    Args:
+        limit: Rows shown in each module table
+
+    Returns:
+        str: Report with total, phases, slowest modules and heaviest packages
+    """
+    profile = get_profile()
+    modules = profile["modules"]
+    packages = {}
+    for name, (_, self_time) in modules.items():
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0.0) + self_time
+
+    lines = [f"Startup profile: {profile['total'] * 1000:.0f} ms total, {len(modules)} modules"]
+    if profile["phases"]:
+        lines.append("\nPhases:")
+        lines += [f"  {seconds * 1000:9.1f} ms  {name}" for name, seconds in profile["phases"]]
+
+    lines.append(f"\nSlowest imports (inclusive / self, top {limit}):")
+    for name, (inclusive, self_time) in sorted(modules.items(), key=lambda kv: -kv[1][0])[:limit]:
+        lines.append(f"  {inclusive * 1000:9.1f} ms {self_time * 1000:9.1f} ms  {name}")
+
+    lines.append(f"\nHeaviest top-level packages (self time summed, top {limit}):")
+    for name, seconds in sorted(packages.items(), key=lambda kv: -kv[1])[:limit]:
+        lines.append(f"  {seconds * 1000:9.1f} ms  {name}")
+    return "\n".join(lines)
@@ -0,0 +1,594 @@
+"""
+Event-driven timer-heap scheduler.
+
+Jobs sit in a min-heap keyed by their next fire time. The scheduler thread sleeps
+on a condition variable exactly until the earliest job is due (no polling), and
+is woken early whenever jobs are added, removed or rescheduled. Each job keeps
+true run counts, failures and durations.
+
+Triggers are callables mapping "the last fire time" to the next fire time (naive
+local datetimes, matching the server-time semantics of DAILY_CHECK_TIME etc.):
+every_hour_at(), daily_at(), weekly_at(), monthly_at(), daily_at_utc(), and
+once_at() for one-shot jobs (add_job(..., one_shot=True)) that are dropped after they run.
+
+With a JobExecutor the scheduler thread only dispatches: due jobs go to bounded
+worker pools in priority order, each with an optional timeout, and a job that is
+still running when it comes due again is skipped rather than run twice.
+
+Each job's last successful completion is kept as a run journal (persisted by
+the caller via jobs()/restore_stats()); schedule_missed_runs() replays catch-up
+jobs whose window passed while the process was down.
+
+Key classes: TimerScheduler, JobExecutor, Job
+"""
+
+import heapq
+import itertools
+import queue
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from config import get_logger
+
+logger = get_logger("scheduler")
+
+
+# =============================================================================
+# Triggers
+# =============================================================================
+
+
+def every_hour_at(*minutes):
+    """Trigger firing every hour at each of the given minutes (e.g. 0, 30)."""
+    minutes = sorted(minutes)
+
+    def trigger(after):
+        base = after.replace(second=0, microsecond=0)
+        for minute in minutes:
+            nxt = base.replace(minute=minute)
+            if nxt > after:
+                return nxt
+        return base.replace(minute=minutes[0]) + timedelta(hours=1)
+
+    trigger.description = "hourly at " + ", ".join(f":{m:02d}" for m in minutes)
+    return trigger
+
+
+def daily_at(at_time):
+    """Trigger firing once a day at a datetime.time."""
+
+    def trigger(after):
+        nxt = after.replace(hour=at_time.hour, minute=at_time.minute, second=0, microsecond=0)
+        return nxt if nxt > after else nxt + timedelta(days=1)
+
+    trigger.description = f"daily at {at_time.strftime('%H:%M')}"
+    return trigger
+
+
+def weekly_at(weekday, at_time):
+    """Trigger firing once a week on weekday (0=Monday) at a datetime.time."""
+
+    def trigger(after):
+        nxt = after.replace(hour=at_time.hour, minute=at_time.minute, second=0, microsecond=0)
+        nxt += timedelta(days=(weekday - after.weekday()) % 7)
+        return nxt if nxt > after else nxt + timedelta(days=7)
+
+    trigger.description = f"weekly on day {weekday} at {at_time.strftime('%H:%M')}"
+    return trigger
+
+
+def monthly_at(day, at_time):
+    """Trigger firing once a month on a day (1-28) at a datetime.time."""
+
+    def trigger(after):
+        nxt = after.replace(
+            day=day, hour=at_time.hour, minute=at_time.minute, second=0, microsecond=0
+        )
+        if nxt <= after:
+            if nxt.month == 12:
+                nxt = nxt.replace(year=nxt.year + 1, month=1)
+            else:
+                nxt = nxt.replace(month=nxt.month + 1)
+        return nxt
+
+    trigger.description = f"monthly on day {day} at {at_time.strftime('%H:%M')}"
+    return trigger
+
+
+def daily_at_utc(at_time):
+    """Trigger firing once a day at a datetime.time in UTC (e.g. UTC midnight)."""
+
+    def trigger(after):
+        after_utc = after.astimezone(timezone.utc)
+        nxt = after_utc.replace(hour=at_time.hour, minute=at_time.minute, second=0, microsecond=0)
+        if nxt <= after_utc:
+            nxt += timedelta(days=1)
+        return nxt.astimezone().replace(tzinfo=None)
+
+    trigger.description = f"daily at {at_time.strftime('%H:%M')} UTC"
+    return trigger
+
+
+def once_at(when):
+    """Trigger for a one-shot job: fires at `when`, or immediately if that has passed."""
+
+    def trigger(after):
+        return max(when, after)
+
+    trigger.description = f"once at {when.strftime('%Y-%m-%d %H:%M:%S')}"
+    return trigger
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+
+class JobExecutor:
+    """
+    Bounded worker pools for scheduled jobs.
+
+    Each pool has a fixed number of worker threads pulling from a priority queue
+    (lower value first). A worker runs each job in its own daemon thread and waits
+    at most the job's timeout; an overrunning job is reported and abandoned so
+    the pool moves on. Python threads cannot be killed, so an abandoned job keeps
+    running in the background until it returns, and the scheduler does not start
+    it again until then.
+
+    Args:
+        pools: {pool name: worker count}
+        default_pool: Pool for jobs that name none (or an unknown one); defaults
+            to the first pool
+    """
+
+    def __init__(self, pools, default_pool=None):
+        self._sizes = dict(pools)
+        self.default_pool = default_pool or next(iter(self._sizes))
+        self._queues = {name: queue.PriorityQueue() for name in self._sizes}
+        self._busy = dict.fromkeys(self._sizes, 0)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _start(self):
+        """Start the worker threads on first use (importing the module spawns nothing)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for name, size in self._sizes.items():
+            for i in range(size):
+                threading.Thread(
+                    target=self._worker, args=(name,), name=f"scheduler-{name}-{i}", daemon=True
+                ).start()
+
+    def submit(self, pool, priority, timeout, run, on_timeout):
+        """Queue run() on a pool; on_timeout() is called if it exceeds timeout seconds."""
+        self._start()
+        pool = pool if pool in self._queues else self.default_pool
+        self._queues[pool].put((priority, next(self._seq), timeout, run, on_timeout))
+
+    def _worker(self, pool):
+        work = self._queues[pool]
+        while True:
+            _, _, timeout, run, on_timeout = work.get()
+            with self._lock:
+                self._busy[pool] += 1
+            try:
+                runner = threading.Thread(target=run, daemon=True)
+                runner.start()
+                runner.join(timeout)
+                if runner.is_alive():
+                    on_timeout()
+            except Exception as e:
+                logger.error(f"SCHEDULER: Worker in pool {pool} failed: {e}")
+            finally:
+                with self._lock:
+                    self._busy[pool] -= 1
+
+    def status(self):
+        """Per-pool worker count, busy workers and queued jobs."""
+        with self._lock:
+            return {
+                name: {
+                    "workers": size,
+                    "busy": self._busy[name],
+                    "queued": self._queues[name].qsize(),
+                }
+                for name, size in self._sizes.items()
+            }
+
+
+class Job:
+    """A named callable with a trigger, dispatch options and its run statistics."""
+
+    def __init__(
+        self,
+        name,
+        fn,
+        trigger,
+        one_shot=False,
+        pool=None,
+        priority=0,
+        timeout=None,
+        catch_up=False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.trigger = trigger
+        self.one_shot = one_shot  # Removed after its run instead of rescheduled
+        self.pool = pool  # Executor pool (None = the executor's default)
+        self.priority = priority  # Lower runs first when several jobs are due together
+        self.timeout = timeout  # Seconds before an executor run is abandoned (None = no limit)
+        self.catch_up = catch_up  # Replay a window missed while the process was down
+        self.next_run = None  # datetime
+        self.version = 0  # Bumped on reschedule; stale heap entries are skipped
+        self.runs = 0
+        self.failures = 0
+        self.total_duration = 0.0
+        self.last_run = None
+        self.last_duration = None
+        self.last_error = None
+        self.last_success = None  # Run journal: last completion without error or timeout
+        self.running = False
+        self.in_flight = False  # Queued or running on the executor
+        self.deferred = False  # One-shot came due while in flight; run after it ends
+        self.timed_out = False  # Current run overran its timeout
+        self.skipped = 0  # Occurrences dropped because the previous run was still going
+        self.timeouts = 0
+
+    def snapshot(self):
+        return {
+            "name": self.name,
+            "trigger": getattr(self.trigger, "description", ""),
+            "one_shot": self.one_shot,
+            "pool": self.pool,
+            "priority": self.priority,
+            "timeout": self.timeout,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "runs": self.runs,
+            "failures": self.failures,
+            "total_duration": round(self.total_duration, 3),
+            "avg_duration": round(self.total_duration / self.runs, 3) if self.runs else None,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_duration": (
+                round(self.last_duration, 3) if self.last_duration is not None else None
+            ),
+            "last_error": self.last_error,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "running": self.running,
+            "in_flight": self.in_flight,
+            "skipped": self.skipped,
+            "timeouts": self.timeouts,
+        }
+
+
+class TimerScheduler:
+    """
+    Min-heap of jobs ordered by next fire time, run by one thread that sleeps
+    until the earliest is due.
+
+    Args:
+        clock: Returns the current naive local datetime (injectable for tests)
+        on_job_done: Optional callback(job) after every run (e.g. persist stats)
+        max_sleep: Optional cap (seconds) on one sleep, to re-check the wall clock
+            after clock adjustments; None sleeps until the next job is due
+        executor: Optional JobExecutor; without one, due jobs run inline on the
+            scheduler thread
+    """
+
+    def __init__(self, clock=datetime.now, on_job_done=None, max_sleep=None, executor=None):
+        self._clock = clock
+        self._on_job_done = on_job_done
+        self._max_sleep = max_sleep
+        self._executor = executor
+        self._jobs = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self.last_wake = None
+
+    # --- job management (all wake the scheduler thread) ---
+
+    def add_job(
+        self,
+        name,
+        fn,
+        trigger,
+        one_shot=False,
+        pool=None,
+        priority=0,
+        timeout=None,
+        catch_up=False,
+    ):
+        """Add or replace a job and schedule its first run."""
+        with self._cond:
+            job = self._jobs.get(name)
+            if job is None:
+                job = Job(name, fn, trigger, one_shot, pool, priority, timeout, catch_up)
+                self._jobs[name] = job
+            else:
+                job.fn, job.trigger, job.one_shot = fn, trigger, one_shot
+                job.pool, job.priority, job.timeout = pool, priority, timeout
+                job.catch_up = catch_up
+            self._schedule(job, self._clock())
+            self._cond.notify_all()
+        return job
+
+    def remove_job(self, name):
+        """Remove a job; its pending heap entry is discarded lazily."""
+        with self._cond:
+            job = self._jobs.pop(name, None)
+            if job:
+                job.version += 1
+                self._cond.notify_all()
+            return job is not None
+
+    def get_job(self, name):
+        """Return the job registered under name, or None."""
+        with self._cond:
+            return self._jobs.get(name)
+
+    def reschedule(self, name=None):
+        """Recompute the next fire time of one job (or all) and wake the thread."""
+        with self._cond:
+            now = self._clock()
+            for job in [self._jobs[name]] if name else list(self._jobs.values()):
+                self._schedule(job, now)
+            self._cond.notify_all()
+
+    def _schedule(self, job, after):
+        job.version += 1
+        job.next_run = job.trigger(after)
+        heapq.heappush(self._heap, (job.next_run, next(self._seq), job.version, job))
+
+    # --- execution ---
+
+    def _pop_due(self, now):
+        """Pop every job due at `now` (skipping stale entries). Caller holds the lock."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, version, job = heapq.heappop(self._heap)
+            if version == job.version and self._jobs.get(job.name) is job:
+                due.append(job)
+        return due
+
+    def _discard_stale(self):
+        while self._heap:
+            _, _, version, job = self._heap[0]
+            if version == job.version and self._jobs.get(job.name) is job:
+                return
+            heapq.heappop(self._heap)
+
+    def seconds_until_next(self):
+        """Seconds until the earliest job is due (negative when overdue), None if no jobs."""
+        with self._cond:
+            self._discard_stale()
+            if not self._heap:
+                return None
+            return (self._heap[0][0] - self._clock()).total_seconds()
+
+    def run_job(self, job, version=None, dispatched=False):
+        """
+        Run one job, record its stats, and schedule its next fire time.
+
+        Args:
+            job: The job to run
+            version: Job version when it was dispatched (a one-shot re-added since
+                then is kept); defaults to the current version
+            dispatched: True when run_pending() already rescheduled it for the executor
+        """
+        with self._cond:
+            if version is None:
+                version = job.version
+            job.in_flight = True
+        job.running = True
+        started = time.monotonic()
+        job.last_run = self._clock()
+        try:
+            job.fn()
+            if not job.timed_out:
+                job.last_error = None
+                job.last_success = self._clock()
+        except Exception as e:
+            if not job.timed_out:
+                job.failures += 1
+                job.last_error = str(e)
+            logger.error(f"SCHEDULER: Job {job.name} failed: {e}")
+        finally:
+            job.running = False
+            job.runs += 1
+            job.last_duration = time.monotonic() - started
+            job.total_duration += job.last_duration
+            timed_out = job.timed_out
+            with self._cond:
+                job.in_flight = False
+                job.timed_out = False
+                if self._jobs.get(job.name) is job:
+                    if job.deferred:
+                        job.deferred = False
+                        self._schedule(job, self._clock())
+                        self._cond.notify_all()
+                    elif job.one_shot:
+                        if job.version == version:
+                            # One-shot done (unless it was re-added while running)
+                            del self._jobs[job.name]
+                            job.next_run = None
+                    elif not dispatched:
+                        self._schedule(job, max(self._clock(), job.last_run))
+            logger.debug(
+                f"SCHEDULER: Job {job.name} finished in {job.last_duration:.2f}s",
+                extra={"job": job.name, "duration_seconds": round(job.last_duration, 3)},
+            )
+        if timed_out:
+            # Already reported when the timeout fired
+            logger.warning(
+                f"SCHEDULER: Job {job.name} finished {job.last_duration:.0f}s after starting "
+                f"(timeout {job.timeout}s)"
+            )
+            return
+        self._notify_done(job)
+
+    def _notify_done(self, job):
+        if self._on_job_done:
+            try:
+                self._on_job_done(job)
+            except Exception as e:
+                logger.warning(f"SCHEDULER: on_job_done failed for {job.name}: {e}")
+
+    def _job_timed_out(self, job):
+        """Executor callback: the job overran its timeout and was abandoned."""
+        job.timed_out = True
+        job.timeouts += 1
+        job.failures += 1
+        job.last_error = f"Timed out after {job.timeout}s"
+        logger.error(
+            f"SCHEDULER: Job {job.name} exceeded its {job.timeout}s timeout, "
+            f"abandoning it (it will not start again until it returns)"
+        )
+        self._notify_done(job)
+
+    def _dispatch(self, due, now):
+        """Hand due jobs to the executor. Caller holds the lock."""
+        dispatch = []
+        for job in due:
+            if job.in_flight:
+                if job.one_shot:
+                    job.deferred = True
+                else:
+                    job.skipped += 1
+                    self._schedule(job, now)
+                    logger.warning(
+                        f"SCHEDULER: Job {job.name} still running, skipping this occurrence"
+                    )
+                continue
+            job.in_flight = True
+            if not job.one_shot:
+                self._schedule(job, now)
+            dispatch.append((job, job.version))
+        return dispatch
+
+    def run_pending(self):
+        """Run (or dispatch to the executor) every job that is due now. Returns the count."""
+        with self._cond:
+            now = self._clock()
+            due = sorted(self._pop_due(now), key=lambda job: job.priority)
+            if self._executor is not None:
+                dispatch = self._dispatch(due, now)
+        if self._executor is None:
+            for job in due:
+                self.run_job(job)
+            return len(due)
+        for job, version in dispatch:
+            self._executor.submit(
+                job.pool,
+                job.priority,
+                job.timeout,
+                lambda job=job, version=version: self.run_job(job, version, dispatched=True),
+                lambda job=job: self._job_timed_out(job),
+            )
+        return len(dispatch)
+
+    def run_forever(self):
+        """
+        Scheduler loop: sleep until the next job is due (or a wake-up), run, repeat.
+
+        Returns after stop(); calling run_forever() again resumes the loop.
+        """
+        while True:
+            with self._cond:
+                if self._stopped:
+                    self._stopped = False
+                    return
+                self.last_wake = self._clock()
+                self._discard_stale()
+                timeout = None
+                if self._heap:
+                    timeout = max(0.0, (self._heap[0][0] - self._clock()).total_seconds())
+                if timeout is None or timeout > 0:
+                    if self._max_sleep is not None:
+                        timeout = min(timeout or self._max_sleep, self._max_sleep)
+                    self._cond.wait(timeout)
+                    continue  # Re-evaluate: woken early by a change, or the job is now due
+            self.run_pending()
+
+    def stop(self):
+        """Make run_forever() return; jobs stay registered."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    # --- introspection ---
+
+    def jobs(self):
+        """Snapshot of every job (sorted by next fire time)."""
+        with self._cond:
+            jobs = list(self._jobs.values())
+        return sorted((job.snapshot() for job in jobs), key=lambda j: j["next_run"] or "9999-12-31")
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def executor_status(self):
+        """Per-pool executor status, or None when jobs run inline."""
+        return self._executor.status() if self._executor is not None else None
+
+    def restore_stats(self, stats):
+        """Seed per-job counters from persisted stats ({name: snapshot dict})."""
+        with self._cond:
+            for name, saved in (stats or {}).items():
+                job = self._jobs.get(name)
+                if job is None:
+                    continue
+                job.runs = saved.get("runs", 0)
+                job.failures = saved.get("failures", 0)
+                job.total_duration = saved.get("total_duration", 0.0)
+                if saved.get("last_run"):
+                    try:
+                        job.last_run = datetime.fromisoformat(saved["last_run"])
+                    except ValueError:
+                        pass
+                job.last_duration = saved.get("last_duration")
+                if saved.get("last_success"):
+                    try:
+                        job.last_success = datetime.fromisoformat(saved["last_success"])
+                    except ValueError:
+                        pass
+
+    def schedule_missed_runs(self, stagger_seconds):
+        """
+        Replay catch-up jobs whose scheduled window passed since their last success.
+
+        A job is missed when its trigger would have fired between its journaled
+        last success and now. Missed jobs are queued stagger_seconds apart (the
+        first one stagger_seconds from now) and then resume their normal schedule.
+        Jobs with no journal entry yet are left alone.
+
+        Returns:
+            list: Names of the jobs queued for catch-up, in run order
+        """
+        with self._cond:
+            now = self._clock()
+            missed = [
+                job
+                for job in self._jobs.values()
+                if job.catch_up
+                and job.last_success is not None
+                and job.trigger(job.last_success) <= now
+            ]
+            missed.sort(key=lambda job: (job.priority, job.name))
+            for i, job in enumerate(missed, start=1):
+                job.version += 1
+                job.next_run = now + timedelta(seconds=stagger_seconds * i)
+                heapq.heappush(self._heap, (job.next_run, next(self._seq), job.version, job))
+            if missed:
+                self._cond.notify_all()
+        for job in missed:
+            logger.info(
+                f"SCHEDULER: Job {job.name} missed its window since "
+                f"{job.last_success.isoformat(timespec='minutes')}, catch-up at "
+                f"{job.next_run.strftime('%H:%M:%S')}"
+            )
+        return [job.name for job in missed]
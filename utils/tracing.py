@@ -0,0 +1,324 @@
+"""
+Lightweight tracing for the celebration pipeline, exported as OTLP-JSON.
+
+start_trace() opens a root span with a new trace ID; span() opens a child of
+whatever span is current (a ContextVar, so nesting follows the call stack) and
+is a no-op outside a trace, so hot paths can call it unconditionally. Slack
+calls and OpenAI requests made during a celebration are attached as child
+spans by slack/client.py and integrations/openai_guard.py. Work handed to a
+thread pool keeps its parent when submitted through bind_context().
+
+Each finished trace is appended to TRACE_FILE as one OTLP/JSON
+ExportTraceServiceRequest per line (the OpenTelemetry file exporter layout),
+so it can be loaded into any OTLP-compatible viewer. get_recent_traces()
+summarizes the last few for `admin traces`.
+
+Key functions: start_trace(), span(), add_span(), bind_context(), get_recent_traces()
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from config import TRACE_FILE, TRACE_FILE_MAX_BYTES, TRACING_ENABLED, get_logger
+
+logger = get_logger("main")
+
+# OTLP SpanKind / StatusCode values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+_SERVICE_NAME = "brightdaybot"
+# Lines read from the end of TRACE_FILE when summarizing
+_TAIL_LINES = 200
+
+_current = contextvars.ContextVar("trace_span", default=None)
+_write_lock = threading.Lock()
+
+
+class _Trace:
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self.lock = threading.Lock()
+
+
+class Span:
+    """One timed operation inside a trace."""
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+    )
+
+    def __init__(self, trace, name, parent_id, kind, attributes, start_ns=None):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns = None
+        self.error = None
+        with trace.lock:
+            trace.spans.append(self)
+
+    @property
+    def trace_id(self):
+        return self.trace.trace_id
+
+    def set(self, **attributes):
+        """Add attributes (e.g. celebration_id once it is known)."""
+        self.attributes.update(attributes)
+
+
+@contextmanager
+def _activate(current):
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current.reset(token)
+
+
+@contextmanager
+def start_trace(name, **attributes):
+    """
+    Open a new trace whose root span covers the block; exported when it ends.
+
+    Yields:
+        Span (root) or None when TRACING_ENABLED is off
+    """
+    if not TRACING_ENABLED:
+        yield None
+        return
+    trace = _Trace()
+    try:
+        with _activate(Span(trace, name, None, SPAN_KIND_INTERNAL, attributes)) as root:
+            yield root
+    finally:
+        _export(trace)
+
+
+@contextmanager
+def span(name, kind=SPAN_KIND_INTERNAL, **attributes):
+    """
+    Open a child of the current span for the block (no-op outside a trace).
+
+    Yields:
+        Span or None
+    """
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    with _activate(Span(parent.trace, name, parent.span_id, kind, attributes)) as child:
+        yield child
+
+
+def add_span(name, seconds, error=None, kind=SPAN_KIND_CLIENT, **attributes):
+    """Attach an already finished operation that ended just now to the current span."""
+    parent = _current.get()
+    if parent is None:
+        return
+    end_ns = time.time_ns()
+    child = Span(parent.trace, name, parent.span_id, kind, attributes, end_ns - int(seconds * 1e9))
+    child.end_ns = end_ns
+    child.error = error
+
+
+def current_span():
+    """The innermost open span, or None outside a trace."""
+    return _current.get()
+
+
+def bind_context(fn):
+    """
+    Wrap fn to run in a copy of the caller's context, keeping the current span.
+
+    Use one wrapper per submission: executor.submit(bind_context(fn), arg).
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+# --- OTLP-JSON export ---
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span_, fallback_end_ns):
+    entry = {
+        "traceId": span_.trace_id,
+        "spanId": span_.span_id,
+        "name": span_.name,
+        "kind": span_.kind,
+        "startTimeUnixNano": str(span_.start_ns),
+        # A span still running on another thread ends with the trace
+        "endTimeUnixNano": str(span_.end_ns or fallback_end_ns),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)} for key, value in span_.attributes.items()
+        ],
+        "status": (
+            {"code": _STATUS_ERROR, "message": span_.error} if span_.error else {"code": _STATUS_OK}
+        ),
+    }
+    if span_.parent_id:
+        entry["parentSpanId"] = span_.parent_id
+    return entry
+
+
+def _export(trace):
+    with trace.lock:
+        spans = list(trace.spans)
+    end_ns = spans[0].end_ns or time.time_ns()
+    request = {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": _SERVICE_NAME}}]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": f"{_SERVICE_NAME}.tracing"},
+                        "spans": [_otlp_span(s, end_ns) for s in spans],
+                    }
+                ],
+            }
+        ]
+    }
+    line = json.dumps(request, separators=(",", ":"), default=str) + "\n"
+    try:
+        with _write_lock:
+            if (
+                os.path.exists(TRACE_FILE)
+                and os.path.getsize(TRACE_FILE) + len(line) > TRACE_FILE_MAX_BYTES
+            ):
+                os.replace(TRACE_FILE, TRACE_FILE + ".1")
+            with open(TRACE_FILE, "a", encoding="utf-8") as f:
+                f.write(line)
+    except OSError as e:
+        logger.warning(f"TRACING: Could not write trace {trace.trace_id}: {e}")
+
+
+# --- Summaries ---
+
+
+def _plain_value(value):
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("boolValue", "doubleValue", "stringValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+def _seconds(entry):
+    return (int(entry["endTimeUnixNano"]) - int(entry["startTimeUnixNano"])) / 1e9
+
+
+def _summarize(spans):
+    root = next((s for s in spans if "parentSpanId" not in s), None)
+    if root is None:
+        return None
+    children = {}
+    for entry in spans:
+        children.setdefault(entry.get("parentSpanId"), []).append(entry)
+
+    stages = sorted(children.get(root["spanId"], []), key=lambda s: int(s["startTimeUnixNano"]))
+    calls = {}  # Everything below the stages, aggregated by span name
+    pending = [s["spanId"] for s in stages]
+    while pending:
+        for entry in children.get(pending.pop(), []):
+            stats = calls.setdefault(entry["name"], {"name": entry["name"], "count": 0})
+            stats["count"] += 1
+            stats["seconds"] = stats.get("seconds", 0.0) + _seconds(entry)
+            pending.append(entry["spanId"])
+
+    started = datetime.fromtimestamp(int(root["startTimeUnixNano"]) / 1e9, tz=timezone.utc)
+    return {
+        "trace_id": root["traceId"],
+        "name": root["name"],
+        "started": started.isoformat(),
+        "duration": round(_seconds(root), 3),
+        "error": root.get("status", {}).get("message"),
+        "attributes": {a["key"]: _plain_value(a["value"]) for a in root.get("attributes", [])},
+        "stages": [
+            {
+                "name": s["name"],
+                "seconds": round(_seconds(s), 3),
+                "error": s.get("status", {}).get("message"),
+            }
+            for s in stages
+        ],
+        "calls": [
+            {**c, "seconds": round(c["seconds"], 3)}
+            for c in sorted(calls.values(), key=lambda c: -c["seconds"])
+        ],
+    }
+
+
+def get_recent_traces(limit=5, name="celebration"):
+    """
+    Stage timings of the most recent traces in TRACE_FILE.
+
+    Args:
+        limit: Number of traces to return
+        name: Root span name to include
+
+    Returns:
+        list: Newest first, each {"trace_id", "name", "started", "duration", "error",
+              "attributes", "stages": [{"name", "seconds", "error"}],
+              "calls": [{"name", "count", "seconds"}] slowest first}
+    """
+    try:
+        with open(TRACE_FILE, encoding="utf-8") as f:
+            lines = deque(f, maxlen=_TAIL_LINES)
+    except FileNotFoundError:
+        return []
+
+    traces = []
+    for line in reversed(lines):
+        try:
+            request = json.loads(line)
+            spans = [
+                s
+                for resource in request["resourceSpans"]
+                for scope in resource["scopeSpans"]
+                for s in scope["spans"]
+            ]
+        except (ValueError, KeyError, TypeError):
+            continue
+        summary = _summarize(spans)
+        if summary and summary["name"] == name:
+            traces.append(summary)
+            if len(traces) >= limit:
+                break
+    return traces
@@ -0,0 +1,225 @@
+"""
+Bounded work queue for slow Slack handler work.
+
+Bolt runs listeners on a small shared thread pool, so a burst of LLM-backed
+handlers (mentions, special-day thread replies, detail buttons, modals) can
+starve unrelated events. Handlers instead ack and submit their work to a named
+lane; each lane has its own worker threads and a bounded queue. When a lane is
+full the work is shed and the caller's on_overflow fallback runs (e.g. a polite
+"busy, try again" reply) instead of queueing without limit.
+
+Lanes and their sizes come from WORK_QUEUE_LANES. Per-lane metrics (depth,
+high-water mark, wait and run times, shed count) are exposed via stats().
+
+The async runtime (SLACK_RUNTIME=async) awaits blocking calls with run_blocking()
+instead: they share ASYNC_BLOCKING_WORKERS threads however many events are in flight.
+
+Key functions: submit(), run_blocking(), get_work_queue(), WorkQueue.stats()
+"""
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import ASYNC_BLOCKING_WORKERS, WORK_QUEUE_LANES, get_logger
+
+logger = get_logger("events")
+
+# Recent wait times kept per lane for the p95 estimate
+_WAIT_SAMPLES = 200
+
+
+class _Lane:
+    """One named lane: bounded queue, worker threads and metrics."""
+
+    def __init__(self, name, workers, max_depth):
+        self.name = name
+        self.workers = workers
+        self.max_depth = max_depth
+        self.queue = queue.Queue(maxsize=max_depth)
+        self.busy = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.shed = 0
+        self.high_water = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.run_total = 0.0
+        self.waits = deque(maxlen=_WAIT_SAMPLES)
+
+
+class WorkQueue:
+    """
+    Named lanes of bounded worker pools.
+
+    Args:
+        lanes: {lane name: {"workers": int, "max_depth": int}}
+    """
+
+    def __init__(self, lanes):
+        self._lanes = {
+            name: _Lane(name, cfg["workers"], cfg["max_depth"]) for name, cfg in lanes.items()
+        }
+        self._lock = threading.Lock()
+        self._started = False
+        self._seq = itertools.count()
+
+    def _start(self):
+        """Start worker threads on first submit (importing spawns nothing)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for lane in self._lanes.values():
+            for i in range(lane.workers):
+                threading.Thread(
+                    target=self._worker, args=(lane,), name=f"work-{lane.name}-{i}", daemon=True
+                ).start()
+
+    def submit(self, lane_name, fn, *args, on_overflow=None, label=None, **kwargs):
+        """
+        Queue fn(*args, **kwargs) on a lane.
+
+        Args:
+            lane_name: Lane to run on (e.g. "interactive", "background")
+            fn: Callable to run on a lane worker
+            on_overflow: Optional fallback called (in the caller's thread) when
+                the lane is full and the work is shed
+            label: Name for logs (defaults to fn.__name__)
+
+        Returns:
+            bool: True if queued, False if shed
+        """
+        lane = self._lanes[lane_name]
+        label = label or getattr(fn, "__name__", "work")
+        self._start()
+        try:
+            lane.queue.put_nowait((time.monotonic(), next(self._seq), label, fn, args, kwargs))
+        except queue.Full:
+            with self._lock:
+                lane.shed += 1
+            logger.warning(
+                f"WORK_QUEUE: {lane_name} lane full ({lane.max_depth} queued), shedding {label}"
+            )
+            if on_overflow:
+                try:
+                    on_overflow()
+                except Exception as e:
+                    logger.error(f"WORK_QUEUE: Overflow fallback for {label} failed: {e}")
+            return False
+
+        with self._lock:
+            lane.submitted += 1
+            lane.high_water = max(lane.high_water, lane.queue.qsize())
+        return True
+
+    def _worker(self, lane):
+        while True:
+            enqueued, _, label, fn, args, kwargs = lane.queue.get()
+            waited = time.monotonic() - enqueued
+            with self._lock:
+                lane.busy += 1
+                lane.wait_total += waited
+                lane.wait_max = max(lane.wait_max, waited)
+                lane.waits.append(waited)
+            started = time.monotonic()
+            failed = False
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                failed = True
+                logger.error(f"WORK_QUEUE: {label} failed on {lane.name} lane: {e}")
+            finally:
+                with self._lock:
+                    lane.busy -= 1
+                    lane.completed += 1
+                    lane.failed += int(failed)
+                    lane.run_total += time.monotonic() - started
+                lane.queue.task_done()
+
+    def join(self, lane_name):
+        """Block until everything queued on a lane has run (used by tests)."""
+        self._lanes[lane_name].queue.join()
+
+    def stats(self):
+        """
+        Per-lane metrics.
+
+        Returns:
+            dict: {lane: {workers, busy, depth, max_depth, high_water, submitted,
+                   completed, failed, shed, wait_avg, wait_p95, wait_max, run_avg}}
+        """
+        result = {}
+        with self._lock:
+            for name, lane in self._lanes.items():
+                started = lane.completed + lane.busy
+                waits = sorted(lane.waits)
+                result[name] = {
+                    "workers": lane.workers,
+                    "busy": lane.busy,
+                    "depth": lane.queue.qsize(),
+                    "max_depth": lane.max_depth,
+                    "high_water": lane.high_water,
+                    "submitted": lane.submitted,
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "shed": lane.shed,
+                    "wait_avg": round(lane.wait_total / started, 3) if started else None,
+                    "wait_p95": round(waits[int(0.95 * (len(waits) - 1))], 3) if waits else None,
+                    "wait_max": round(lane.wait_max, 3),
+                    "run_avg": (
+                        round(lane.run_total / lane.completed, 3) if lane.completed else None
+                    ),
+                }
+        return result
+
+
+_work_queue = None
+_work_queue_lock = threading.Lock()
+
+
+def get_work_queue():
+    """Shared WorkQueue configured from WORK_QUEUE_LANES."""
+    global _work_queue
+    with _work_queue_lock:
+        if _work_queue is None:
+            _work_queue = WorkQueue(WORK_QUEUE_LANES)
+        return _work_queue
+
+
+def submit(lane_name, fn, *args, on_overflow=None, label=None, **kwargs):
+    """Queue work on the shared queue (see WorkQueue.submit)."""
+    return get_work_queue().submit(
+        lane_name, fn, *args, on_overflow=on_overflow, label=label, **kwargs
+    )
+
+
+_blocking_pool = None
+
+
+async def run_blocking(fn, *args, **kwargs):
+    """
+    Await fn(*args, **kwargs) on the shared blocking pool (async runtime only).
+
+    Coroutines waiting here cost no thread; at most ASYNC_BLOCKING_WORKERS calls
+    run at once. Like asyncio.to_thread(), fn runs in a copy of the caller's
+    context, so the current trace span and Slack call recorder carry over.
+    """
+    global _blocking_pool
+    with _work_queue_lock:
+        if _blocking_pool is None:
+            _blocking_pool = ThreadPoolExecutor(
+                max_workers=ASYNC_BLOCKING_WORKERS, thread_name_prefix="blocking"
+            )
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _blocking_pool, functools.partial(context.run, fn, *args, **kwargs)
+    )